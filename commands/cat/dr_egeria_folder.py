@@ -193,16 +193,20 @@ def dr_egeria_folder(folder: str, directive: str, do_validate: bool, do_process:
     client = EgeriaTech(server, url, userid, user_pass)
     client.create_egeria_bearer_token()
 
+    # One element dictionary for the whole batch, so later files can refer to elements
+    # created by earlier ones without a round-trip.
+    from md_processing.md_processing_utils.element_index import element_dictionary_scope
     results = []
-    for name in md_files:
-        input_path = folder_path / name
-        result = asyncio.run(run_one_file(
-            input_path, directive, client, parse_summary, attribute_logs, usage_level, debug
-        ))
-        results.append(result)
-        fname, s, f, w, _tail = result
-        status = "[red]FAILED[/red]" if f else "[green]ok[/green]"
-        console.print(f"  {status}  {fname}  ({s} success, {f} failure, {w} warning)")
+    with element_dictionary_scope():
+        for name in md_files:
+            input_path = folder_path / name
+            result = asyncio.run(run_one_file(
+                input_path, directive, client, parse_summary, attribute_logs, usage_level, debug
+            ))
+            results.append(result)
+            fname, s, f, w, _tail = result
+            status = "[red]FAILED[/red]" if f else "[green]ok[/green]"
+            console.print(f"  {status}  {fname}  ({s} success, {f} failure, {w} warning)")
 
     table = Table(title="Dr.Egeria Folder Batch Summary")
     table.add_column("File")
@@ -51,56 +51,52 @@ def collection_viewer(
 ):
     """A simple collection viewer"""
 
-    def walk_collection_hierarchy(
-        tree: Tree,
-        collection_client: CollectionManager,
-        root_collection_guid: str = None,
-        root_collection_name: str = None,
-        root_collection_qname: str = None,
-    ) -> None:
-        """Recursively build a Tree with collection contents."""
-        members = collection_client.get_member_list(
-            root_collection_guid, root_collection_name, root_collection_qname
-        )
-        if type(members) is list:
-            for member in members:
-                style = "bold white on black"
-                text_collection_name = Text(
-                    f"[bold white on black]Name: {member['name']}", style=style
-                )
-                text_qualified_name = Text(
-                    f"* QualifiedName: {member['qualifiedName']}"
-                )
-                text_guid = Text(f"* GUID: {member['guid']}", "green")
-                text_collection_type = Text(
-                    f"* Collection Type: {member.get('typeName','')}"
-                )
-                text_description = Text(f"* Description: {member.get('description','')}")
-                p = Panel.fit(
-                    f"{text_collection_name}[green]\n{text_qualified_name}\n{text_guid}\n"
-                    f"{text_collection_type}\n{text_description}"
+    expanded = set()
+
+    def add_members(tree: Tree, hierarchy: dict, guid: str) -> None:
+        """Add the members of collection `guid` from a walk_collection_hierarchy() result to the Tree."""
+        members = hierarchy["children"].get(guid) or []
+        if not members:
+            tree.add("[bold magenta on black]No Members found")
+            return
+        for member_guid in members:
+            member = hierarchy["nodes"][member_guid]
+            style = "bold white on black"
+            text_collection_name = Text(
+                f"[bold white on black]Name: {member['displayName']}", style=style
+            )
+            text_qualified_name = Text(
+                f"* QualifiedName: {member['qualifiedName']}"
+            )
+            text_guid = Text(f"* GUID: {member['guid']}", "green")
+            text_collection_type = Text(
+                f"* Collection Type: {member.get('type','')}"
+            )
+            text_description = Text(f"* Description: {member.get('description','')}")
+            p = Panel.fit(
+                f"{text_collection_name}[green]\n{text_qualified_name}\n{text_guid}\n"
+                f"{text_collection_type}\n{text_description}"
+            )
+            tt = tree.add(p, style=style)
+
+            # A member shared between collections (or reached via a cycle) is only expanded once.
+            if hierarchy["children"].get(member_guid) and member_guid not in expanded:
+                expanded.add(member_guid)
+                branch = tt.add(
+                    f"[bold magenta on black]Members",
+                    style=style,
+                    guide_style=style,
                 )
-                tt = tree.add(p, style=style)
-
-                children = collection_client.get_collection_members(
-                    collection_guid=member["guid"]
-                )
-                if type(children) is list:
-                    branch = tt.add(
-                        f"[bold magenta on black]Members",
-                        style=style,
-                        guide_style=style,
-                    )
-                    walk_collection_hierarchy(branch, collection_client, member["guid"])
-        else:
-            tt = tree.add("[bold magenta on black]No Members found")
+                add_members(branch, hierarchy, member_guid)
 
     try:
         tree = Tree(f"[bold bright green]{root}", guide_style="bold bright_blue")
         c_client = CollectionManager(server_name, platform_url, user_id=user)
 
         token = c_client.create_egeria_bearer_token(user, user_password)
-        walk_collection_hierarchy(tree, c_client, None, root)
+        hierarchy = c_client.walk_collection_hierarchy(collection_name=root)
+        expanded.add(hierarchy["root"])
+        add_members(tree, hierarchy, hierarchy["root"])
         print(tree)
 
     except (PyegeriaAPIException, PyegeriaClientException) as e:
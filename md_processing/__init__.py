@@ -13,6 +13,7 @@ from md_processing.md_processing_utils.common_md_utils import (render_markdown,
                                                                set_gov_prop_body, set_element_prop_body, set_create_body,
                                                                GOVERNANCE_POLICIES, GOVERNANCE_CONTROLS, GOVERNANCE_DRIVERS
                                                                )
+from md_processing.md_processing_utils.element_index import ElementIndex, element_dictionary_scope
 from md_processing.md_processing_utils.extraction_utils import (extract_command_plus, extract_command,
                                                                 extract_attribute, process_simple_attribute,
                                                                 process_name_list, process_element_identifiers,
@@ -28,6 +28,7 @@ import asyncio
 from md_processing import (process_provenance_command, get_current_datetime_string)
 from md_processing.md_processing_utils.common_md_proc_utils import set_parse_summary_mode, set_usage_level
 from md_processing.md_processing_utils.common_md_utils import set_attribute_log_level
+from md_processing.md_processing_utils.element_index import element_dictionary_scope
 from md_processing.md_processing_utils.md_processing_constants import PROJECT_SUBTYPES, COLLECTION_SUBTYPES
 from md_processing.v2 import (
     UniversalExtractor, V2Dispatcher, AsyncBaseCommandProcessor,
@@ -507,7 +508,18 @@ async def process_md_file_v2(input_file: str, output_folder: str, directive: str
                             debug: bool = False) -> None:
     """
     Async processing path for Dr.Egeria v2.
+
+    Runs inside an element dictionary scope, so elements remembered while processing are
+    private to this run; a directory (or any caller already holding a scope) shares one.
     """
+    with element_dictionary_scope():
+        await _process_md_file_v2(input_file, output_folder, directive, client, parse_summary,
+                                  attribute_logs, usage_level, summary_only, debug)
+
+
+async def _process_md_file_v2(input_file: str, output_folder: str, directive: str, client: EgeriaTech,
+                              parse_summary: str, attribute_logs: str, usage_level: str | None,
+                              summary_only: bool, debug: bool) -> None:
     if usage_level:
         set_usage_level(usage_level)
     set_parse_summary_mode(parse_summary)
@@ -521,7 +533,7 @@ async def process_md_file_v2(input_file: str, output_folder: str, directive: str
         _orig_make_request = BaseServerClient._async_make_request
 
         async def _debug_make_request(self_inner, request_type, endpoint,
-                                      payload=None, is_json=True, params=None, *, timeout=30):
+                                      payload=None, is_json=True, params=None, *, timeout=30, **kwargs):
             import inspect as _inspect
 
             _url_str = endpoint
@@ -563,7 +575,7 @@ async def process_md_file_v2(input_file: str, output_folder: str, directive: str
                     except Exception:
                         console.print(f"[dark_orange][DEBUG] Body: {payload}[/dark_orange]")
             return await _orig_make_request(self_inner, request_type, endpoint,
-                                            payload, is_json, params, timeout=timeout)
+                                            payload, is_json, params, timeout=timeout, **kwargs)
 
         BaseServerClient._async_make_request = _debug_make_request
         console.print(
@@ -637,9 +649,8 @@ async def process_md_file_v2(input_file: str, output_folder: str, directive: str
     }
     
     # 3. Execution (Parallel)
-    # We dispatch all commands in the document concurrently.
-    # Note: Complex documents with inter-command dependencies may require a more 
-    # sophisticated strategy in the future.
+    # Commands that don't name each other's elements run concurrently; dependent
+    # ones run in file order (see V2Dispatcher.dispatch_batch).
     try:
         results = await dispatcher.dispatch_batch(commands, context)
     except Exception as e:
@@ -808,6 +819,19 @@ async def process_md_file_v2(input_file: str, output_folder: str, directive: str
     logger.info("v2: Processing complete")
 
 
+def _run_v2(coro) -> None:
+    """Run the v2 engine with asyncio.run(). Called from a running loop (a Jupyter cell),
+    that needs nest_asyncio, which is applied here only -- importing pyegeria never does."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    import nest_asyncio
+
+    nest_asyncio.apply()
+    return asyncio.run(coro)
+
+
 @logger.catch
 def process_md_file(input_file: str, output_folder: str, directive: str, server: str, url: str, userid: str,
                           user_pass: str, parse_summary: str = "none",
@@ -822,8 +846,8 @@ def process_md_file(input_file: str, output_folder: str, directive: str, server:
         set_usage_level(usage_level)
     client = EgeriaTech(server, url, user_id=userid)
     client.create_egeria_bearer_token(userid, user_pass)
-    asyncio.run(process_md_file_v2(input_file, output_folder, directive, client, parse_summary, attribute_logs,
-                                   usage_level, summary_only, debug=debug))
+    _run_v2(process_md_file_v2(input_file, output_folder, directive, client, parse_summary, attribute_logs,
+                               usage_level, summary_only, debug=debug))
 
 if __name__ == "__main__":
     import argparse
@@ -0,0 +1,124 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Build-once cache of Dr.Egeria's command specifications.
+
+`md_processing_constants.load_commands()` parses the compact command JSON files, expands
+their bundles and attribute definitions and derives every command variant - the same work on
+every `dr_egeria` / `hey_egeria` start, and again on each call within a process. This module
+keeps the result:
+
+* in memory, as pickled bytes, so repeated `load_commands()` calls in a process only unpickle
+  a fresh copy (callers may modify the specs they get), and
+* on disk (`command_spec_cache_path`, PYEGERIA_COMMAND_SPEC_CACHE_PATH) as JSON, so a new
+  process skips the compact-spec expansion. Off by default. The file is JSON rather than a
+  pickle so that a tampered cache can at worst yield wrong specs, never run code.
+
+The cached payload is keyed by the size and modification time of every source the specs are
+built from - the base commands file, each compact JSON file, and the loader modules
+themselves - so editing any of them rebuilds it on next use.
+"""
+
+import json
+import os
+import pickle
+import threading
+from typing import Iterable, Optional
+
+from loguru import logger
+
+from pyegeria.core.config import runtime_setting
+
+# Bump when the payload layout changes.
+CACHE_FORMAT = 2
+
+# The modules whose code shapes the payload - a change to them invalidates the cache too.
+_LOADER_MODULES = ("compact_loader.py", "parse_compact_export.py", "md_processing_constants.py")
+
+_memory: dict[tuple, bytes] = {}
+_lock = threading.Lock()
+
+
+def cache_path() -> str:
+    """The cache file, or "" when the on-disk cache is disabled."""
+    path = runtime_setting("command_spec_cache_path", "")
+    return os.path.expanduser(path) if path else ""
+
+
+def _stamp(path: str) -> tuple:
+    try:
+        st = os.stat(path)
+        return os.path.basename(path), st.st_size, st.st_mtime_ns
+    except OSError:
+        return os.path.basename(path), None, None
+
+
+def source_key(base_file: Optional[str], compact_dir: Optional[str],
+               families: Optional[Iterable[str]] = None) -> tuple:
+    """Cache key for specs built from `base_file` plus the compact JSON files in `compact_dir`."""
+    sources = [_stamp(base_file)] if base_file else []
+    if compact_dir and os.path.isdir(compact_dir):
+        sources += [_stamp(os.path.join(compact_dir, f)) for f in sorted(os.listdir(compact_dir))
+                    if f.endswith(".json")]
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = [_stamp(os.path.join(here, m)) for m in _LOADER_MODULES]
+    return (CACHE_FORMAT, compact_dir or "", tuple(sorted(families or ())), tuple(sources), tuple(code))
+
+
+def load(key: tuple) -> Optional[dict]:
+    """Return a fresh copy of the payload cached for `key`, or None if it has to be built."""
+    with _lock:
+        data = _memory.get(key)
+    if data is None:
+        data = _read_file(key)
+        if data is None:
+            return None
+        with _lock:
+            _memory[key] = data
+    return pickle.loads(data)
+
+
+def store(key: tuple, payload: dict) -> None:
+    """Cache `payload` for `key` in memory and, if enabled, in the cache file."""
+    with _lock:
+        _memory.clear()
+        _memory[key] = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    path = cache_path()
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "payload": payload}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.debug(f"Command spec cache '{path}' not written: {e}")
+
+
+def clear() -> None:
+    """Forget the in-memory copy (the cache file is left in place; it is rebuilt when stale)."""
+    with _lock:
+        _memory.clear()
+
+
+def _read_file(key: tuple) -> Optional[bytes]:
+    path = cache_path()
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached["key"] != json.loads(json.dumps(key)):    # JSON keeps the key's tuples as lists
+            return None
+        return pickle.dumps(cached["payload"], protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:  # noqa: BLE001 -- unreadable or old-format cache: rebuild it
+        logger.debug(f"Command spec cache '{path}' ignored: {e}")
+        return None
+
+
+def persistent() -> bool:
+    """True when payloads outlive the process (so eager precomputation pays off)."""
+    return bool(cache_path())
+
@@ -14,6 +14,8 @@ from pyegeria import settings, ServerClient, PyegeriaException
 from pyegeria.core.utils import (camel_to_title_case)
 from pyegeria.core._globals import DEBUG_LEVEL, GovernanceDomains, resolve_enum
 from md_processing.md_processing_utils.message_constants import message_types
+from md_processing.md_processing_utils.element_index import (ElementIndex, current_element_index,
+                                                             element_dictionary_scope)
 
 # Constants
 EGERIA_METADATA_STORE = os.environ.get("EGERIA_METADATA_STORE", "active-metadata-store")
@@ -183,49 +185,44 @@ def process_provenance_command(file_path: str, txt: [str]) -> str:
     return provenance
 
 
-# Dictionary to store element information to avoid redundant API calls
-element_dictionary = {}
+# Dictionary to store element information to avoid redundant API calls. Each Dr.Egeria run gets
+# its own index (see element_dictionary_scope); this is the default used outside a run.
+element_dictionary = current_element_index()
 
 
-def get_element_dictionary():
+def get_element_dictionary() -> ElementIndex:
     """
-    Get the shared element dictionary.
+    Get the element dictionary for the current run.
 
     Returns:
-        dict: The shared element dictionary
+        ElementIndex: dict-like mapping of qualified name -> element info
     """
-    global element_dictionary
-    return element_dictionary
+    return current_element_index()
 
 
 def update_element_dictionary(key, value):
     """
-    Update the shared element dictionary with a new key-value pair.
+    Update the current run's element dictionary with a new key-value pair.
 
     Args:
         key (str): The key to update
         value (dict): The value to associate with the key
     """
-    global element_dictionary
     if (key is None or value is None):
         print(f"===>ERROR Key is {key} and value is {value}")
         return
-    element_dictionary[key] = value
+    current_element_index()[key] = value
 
 
 def clear_element_dictionary():
     """
-    Clear the shared element dictionary.
+    Clear the current run's element dictionary.
     """
-    global element_dictionary
-    element_dictionary.clear()
+    current_element_index().clear()
 
 
 def is_present(value: str) -> bool:
-    global element_dictionary
-    present = value in element_dictionary.keys() or any(
-        value in inner_dict.values() for inner_dict in element_dictionary.values())
-    return present
+    return current_element_index().contains(value)
 
 
 def find_key_with_value(value: str) -> str | None:
@@ -233,23 +230,12 @@ def find_key_with_value(value: str) -> str | None:
     Finds the top-level key whose nested dictionary contains the given value.
 
     Args:
-        data (dict): A dictionary where keys map to nested dictionaries.
         value (str): The value to search for.
 
     Returns:
         str | None: The top-level key that contains the value, or None if not found.
     """
-    global element_dictionary
-    # Check if the value matches a top-level key
-    if value in element_dictionary.keys():
-        return value
-
-    # Check if the value exists in any of the nested dictionaries
-    for key, inner_dict in element_dictionary.items():
-        if value in inner_dict.values():
-            return key
-
-    return None  # If value not found
+    return current_element_index().find_key(value)
 
 
 def set_find_body(object_type: str, attributes: dict)->dict:
@@ -0,0 +1,136 @@
+"""
+Indexed element dictionary used by Dr.Egeria to remember elements it has already resolved
+or created during a run.
+
+The dictionary maps a qualified name to a small dict of facts about the element (`guid`,
+`display_name`, ...). Name resolution asks the reverse question - "which qualified name has
+this display name / GUID?" - for every referenced name in every command, which used to be a
+scan of every entry. ElementIndex keeps a reverse index from each inner value to the keys
+holding it, so those lookups are O(1). When several keys hold the same value, the earliest
+inserted key wins, exactly as the old scan did.
+
+The dictionary is scoped per run: `element_dictionary_scope()` installs a fresh index for the
+duration of a Dr.Egeria run (nested scopes, e.g. a folder of files processed together, share
+the outermost one). Outside any scope the process-wide default index is used.
+"""
+
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from typing import Any
+
+
+class ElementIndex(MutableMapping):
+    """
+    Qualified name -> element info mapping with reverse lookup by any inner value.
+
+    Behaves like the plain dict it replaces (`get`, `[]`, `in`, `items`, ...); values are
+    re-indexed whenever an entry is set, so update entries by assigning a new dict rather than
+    mutating one in place.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._entries: dict[str, dict] = {}
+        self._order: dict[str, int] = {}
+        self._by_value: dict[Any, dict[str, int]] = {}
+        self._seq = count()
+        self.update(*args, **kwargs)
+
+    def __getitem__(self, key: str) -> dict:
+        return self._entries[key]
+
+    def __setitem__(self, key: str, value: dict) -> None:
+        if key in self._entries:
+            self._unindex(key)
+        else:
+            self._order[key] = next(self._seq)
+        self._entries[key] = value
+        for inner in self._hashable_values(value):
+            self._by_value.setdefault(inner, {})[key] = self._order[key]
+
+    def __delitem__(self, key: str) -> None:
+        self._unindex(key)
+        del self._entries[key]
+        del self._order[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ElementIndex({self._entries!r})"
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._order.clear()
+        self._by_value.clear()
+
+    def find_key(self, value: Any) -> str | None:
+        """Return `value` if it is a key, else the earliest key whose info contains `value`."""
+        try:
+            if value in self._entries:
+                return value
+            holders = self._by_value.get(value)
+        except TypeError:  # unhashable - fall back to a scan
+            return next((k for k, info in self._entries.items() if value in info.values()), None)
+        if not holders:
+            return None
+        return min(holders, key=holders.__getitem__)
+
+    def contains(self, value: Any) -> bool:
+        """Whether `value` is a key or a value held in any entry."""
+        return self.find_key(value) is not None
+
+    @staticmethod
+    def _hashable_values(info: Any) -> list:
+        if not isinstance(info, dict):
+            return []
+        out = []
+        for inner in info.values():
+            try:
+                hash(inner)
+            except TypeError:
+                continue
+            out.append(inner)
+        return out
+
+    def _unindex(self, key: str) -> None:
+        for inner in self._hashable_values(self._entries[key]):
+            holders = self._by_value.get(inner)
+            if holders is not None:
+                holders.pop(key, None)
+                if not holders:
+                    del self._by_value[inner]
+
+
+_default_index = ElementIndex()
+_current_index: ContextVar[ElementIndex | None] = ContextVar("dr_egeria_element_index", default=None)
+
+
+def current_element_index() -> ElementIndex:
+    """Return the element index for the current run, or the process-wide default outside a run."""
+    index = _current_index.get()
+    return _default_index if index is None else index
+
+
+@contextmanager
+def element_dictionary_scope():
+    """
+    Give the enclosed Dr.Egeria run its own element dictionary.
+
+    Re-entrant: inside an existing scope the outer index is reused, so a folder of files
+    processed as one batch still sees each other's elements. The context variable is
+    inherited by asyncio tasks (and asyncio.run) started inside the block.
+    """
+    if _current_index.get() is not None:
+        yield _current_index.get()
+        return
+    index = ElementIndex()
+    token = _current_index.set(index)
+    try:
+        yield index
+    finally:
+        _current_index.reset(token)
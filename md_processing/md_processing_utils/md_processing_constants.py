@@ -160,6 +160,9 @@ pre_command = "\n---\n==> Processing object_action:"
 command_seperator = Markdown("\n---\n")
 EXISTS_REQUIRED = "Exists Required"
 COMMAND_DEFINITIONS = {}
+# command -> canonical spec name, for commands that are not themselves spec names; paired with
+# the specs dict it was built from so a replaced COMMAND_DEFINITIONS never uses a stale index.
+_alias_index: tuple[dict, dict] = ({}, {})
 
 def _normalize_command(text: str) -> str:
     return " ".join(text.split())
@@ -277,19 +280,45 @@ debug_level = DEBUG_LEVEL
 #         print(ERROR, msg, debug_level)
 
 def load_commands(filename: str = "commands.json") -> None:
-    global COMMAND_DEFINITIONS, command_list
+    """Load the command specifications into COMMAND_DEFINITIONS and command_list.
+
+    The expanded specs, command variants and alternate-name index come from the command spec
+    cache when their source files are unchanged (see command_spec_cache); otherwise they are
+    built from the JSON files and cached.
+    """
+    global COMMAND_DEFINITIONS, command_list, _alias_index
+    from md_processing.md_processing_utils import command_spec_cache
+
+    config_path = importlib.resources.files("md_processing") / "data" / filename
+    key = command_spec_cache.source_key(
+        str(config_path), COMPACT_RESOURCE_DIR if USE_COMPACT_RESOURCES else None, COMPACT_FAMILIES)
+    payload = command_spec_cache.load(key)
+    if payload is None:
+        payload = _build_command_payload(config_path, filename)
+        command_spec_cache.store(key, payload)
+    else:
+        logger.debug("Loaded command specifications from the command spec cache")
+
+    COMMAND_DEFINITIONS = payload["definitions"]
+    command_list = payload["command_list"]
+    _alias_index = (COMMAND_DEFINITIONS.get("Command Specifications", {}), payload["alias_index"])
+    msg = f"Command loading complete. Total commands: {len(command_list)}"
+    logger.debug(msg)
+
+
+def _build_command_payload(config_path, filename: str) -> dict:
+    from md_processing.md_processing_utils import command_spec_cache
 
     # Initialize empty base
-    COMMAND_DEFINITIONS = {"Command Specifications": {}}
+    definitions = {"Command Specifications": {}}
 
     # Try loading the provided filename (e.g. commands.json)
     try:
-        config_path = importlib.resources.files("md_processing") / "data" / filename
         if config_path.is_file():
             config_str = config_path.read_text(encoding="utf-8")
             try:
                 base_data = json.loads(config_str)
-                COMMAND_DEFINITIONS.update(base_data)
+                definitions.update(base_data)
                 logger.debug(f"Loaded base commands from {filename}")
             except json.JSONDecodeError as json_err:
                 logger.error(f"Invalid JSON in {filename}: {json_err.msg}")
@@ -310,18 +339,21 @@ def load_commands(filename: str = "commands.json") -> None:
                 )
                 if overlay_specs:
                     # Merge/overlay into base specs
-                    COMMAND_DEFINITIONS["Command Specifications"].update(overlay_specs)
+                    definitions["Command Specifications"].update(overlay_specs)
                     logger.debug(
                         f"Loaded {len(overlay_specs)} compact commands from {COMPACT_RESOURCE_DIR}"
                     )
         except Exception as merge_err:
             logger.warning(f"Compact commands merge skipped due to error: {merge_err}")
 
-    command_list = build_command_list_from_specs(
-        COMMAND_DEFINITIONS.get("Command Specifications", {})
-    )
-    msg = f"Command loading complete. Total commands: {len(command_list)}"
-    logger.debug(msg)
+    specs = definitions.get("Command Specifications", {})
+    commands = build_command_list_from_specs(specs)
+    alias_index = {}
+    if command_spec_cache.persistent():
+        # Resolving every variant costs a scan of all specs each; worth it only when the result
+        # is kept for later processes - otherwise resolve_command_spec fills the index as it goes.
+        alias_index = {cmd: find_alternate_names(cmd, specs) for cmd in commands if cmd not in specs}
+    return {"definitions": definitions, "command_list": commands, "alias_index": alias_index}
 
 
 def validate_json_file(filename: str) -> tuple[bool, str]:
@@ -395,7 +427,7 @@ def get_command_spec(command: str, body_type: str = None) -> dict | None:
 
 def resolve_command_spec(command: str) -> tuple[str | None, dict | None]:
     """Resolve a user command (including aliases) to canonical command name + spec."""
-    global COMMAND_DEFINITIONS
+    global COMMAND_DEFINITIONS, _alias_index
 
     normalized_command = " ".join((command or "").split())
     if not normalized_command:
@@ -406,7 +438,14 @@ def resolve_command_spec(command: str) -> tuple[str | None, dict | None]:
     if isinstance(direct, dict):
         return normalized_command, direct
 
-    canonical_name = find_alternate_names(normalized_command)
+    indexed_specs, index = _alias_index
+    if indexed_specs is not specs:
+        index = {}
+        _alias_index = (specs, index)
+    if normalized_command in index:
+        canonical_name = index[normalized_command]
+    else:
+        canonical_name = index[normalized_command] = find_alternate_names(normalized_command, specs)
     if canonical_name:
         resolved = specs.get(canonical_name)
         if isinstance(resolved, dict):
@@ -444,10 +483,11 @@ def does_command_match(command: str, alt_names: list[str]) -> bool:
     return False
 
 
-def find_alternate_names(command: str) -> str | None:
+def find_alternate_names(command: str, specs: dict | None = None) -> str | None:
+    """Find the spec `command` is an alternate name of, in `specs` (default: the loaded specs)."""
     global COMMAND_DEFINITIONS
 
-    comm_spec = COMMAND_DEFINITIONS.get('Command Specifications', {})
+    comm_spec = specs if specs is not None else COMMAND_DEFINITIONS.get('Command Specifications', {})
     normalized_command = " ".join(command.split())
     if not normalized_command:
         return None
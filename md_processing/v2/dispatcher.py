@@ -3,10 +3,14 @@ v2 Dispatcher for Dr.Egeria.
 Routes commands to their respective AsyncBaseCommandProcessor subclasses.
 """
 
-from typing import Dict, Type, Optional, Any, List, Set
+import asyncio
+import re
+from dataclasses import dataclass
+from typing import Dict, Type, Optional, Any, List, Set, FrozenSet
 from loguru import logger
 
 from pyegeria import EgeriaTech, PyegeriaException, print_basic_exception
+from pyegeria.core.config import runtime_setting
 from md_processing.v2.extraction import DrECommand
 from md_processing.v2.processors import AsyncBaseCommandProcessor
 from md_processing.md_processing_utils.md_processing_constants import COLLECTION_SUBTYPES, PROJECT_SUBTYPES, find_alternate_names
@@ -15,6 +19,25 @@ from md_processing.v2.project import ProjectProcessor
 from md_processing.v2.view import ViewProcessor
 from md_processing.v2.rewriters import CommandRewriter
 
+# Verbs whose command creates or updates its own target element.
+UPSERT_VERBS = {"Create", "Define", "Register", "Add", "Update", "Modify", "Upsert"}
+# Verbs that only change the elements a command names. Any other verb (View, Run,
+# Find, Initiate, Cancel, ...) is a barrier in dispatch_batch's dependency graph.
+WRITE_VERBS = UPSERT_VERBS | {"Delete", "Link", "Attach", "Unlink", "Detach", "Remove",
+                              "Classify", "Reclassify", "Declassify"}
+
+# Attribute values that cannot name an element (flags, numbers).
+_SCALAR_RX = re.compile(r"^(true|false|yes|no|none|null|-?\d+(\.\d+)?)$", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class CommandFootprint:
+    """The names a batch command targets and mentions - see V2Dispatcher.command_footprint()."""
+    targets: FrozenSet[str] = frozenset()
+    names: FrozenSet[str] = frozenset()
+    barrier: bool = False
+
+
 class V2Dispatcher:
     """
     Registry and router for v2 command processors.
@@ -86,41 +109,123 @@ class V2Dispatcher:
         Value" network validation calls; derive_qualified_name() only ever reads
         attributes.get(key, {}).get("value"), so the shim is sufficient.
         """
-        upsert_verbs = {"Create", "Define", "Register", "Add", "Update", "Modify", "Upsert"}
         target_qns: Set[str] = set()
         for command in commands:
-            if not command.is_command or command.verb not in upsert_verbs:
-                continue
-            processor_cls = self.resolve_processor_class(command)
-            if not processor_cls:
+            target_qns |= self.command_target_names(command)
+        return target_qns
+
+    def command_target_names(self, command: DrECommand) -> Set[str]:
+        """
+        The names (qualified name and Display Name) by which later or earlier
+        commands can refer to the element this command creates or updates.
+        Empty for commands with no target element of their own. See
+        prescan_batch_target_qns().
+        """
+        names: Set[str] = set()
+        if not command.is_command or command.verb not in UPSERT_VERBS:
+            return names
+        processor_cls = self.resolve_processor_class(command)
+        if not processor_cls:
+            return names
+        processor = processor_cls(self.client, command, {})
+        if not processor.supports_target_element_lookup():
+            return names
+        raw_shim = {k: {"value": v} for k, v in command.attributes.items()}
+        # An explicit user-supplied "Qualified Name" must take priority over
+        # auto-derivation here, exactly as it does in the real execution path
+        # (AsyncBaseCommandProcessor.execute(), which only calls
+        # derive_qualified_name() when parsed_output["qualified_name"] isn't
+        # already set from an explicit value). derive_qualified_name() always
+        # auto-generates from Display Name and has no knowledge of an explicit
+        # override, so calling it unconditionally here silently registers the
+        # wrong name for any command using an explicit Qualified Name - making
+        # a forward reference *by that explicit name* invisible to the pre-scan.
+        qn = raw_shim.get("Qualified Name", {}).get("value") or processor.derive_qualified_name(raw_shim)
+        if qn:
+            names.add(qn)
+        # A forward reference is typically typed as the raw Display Name,
+        # not the fully-derived qualified name (e.g. a "Sub-Projects" entry
+        # naming a project by its display name) - this is exactly how a
+        # *backward* reference already resolves too, via
+        # find_key_with_value() matching the display_name value stored
+        # alongside a cached qn. Register it here so a forward reference
+        # gets the same recognition.
+        display_name = command.attributes.get("Display Name")
+        if display_name:
+            names.add(display_name)
+        return names
+
+    def command_footprint(self, command: DrECommand, targets: Optional[Set[str]] = None) -> CommandFootprint:
+        """
+        Summarize what a command touches, for dispatch_batch()'s dependency graph:
+        its own target names, every name it mentions (each attribute value whole
+        and split on commas/newlines, as Reference Name List values are), and
+        whether it must act as a barrier. Commands whose verb is not a
+        create/update/link/delete-style write (View, Run, Find, Initiate, ...)
+        read or act on whatever state the commands before them left behind, so
+        they are barriers.
+        """
+        if not command.is_command:
+            return CommandFootprint()
+        if targets is None:
+            targets = self.command_target_names(command)
+        names: Set[str] = set(targets)
+        for value in command.attributes.values():
+            if not isinstance(value, str):
                 continue
-            processor = processor_cls(self.client, command, {})
-            if not processor.supports_target_element_lookup():
+            for item in [value, *re.split(r"[,\n]", value)]:
+                item = item.strip().lstrip("-*").strip()
+                if item and not _SCALAR_RX.match(item):
+                    names.add(item)
+        return CommandFootprint(
+            targets=frozenset(targets),
+            names=frozenset(names),
+            barrier=command.verb not in WRITE_VERBS,
+        )
+
+    @staticmethod
+    def dependency_graph(indices: List[int], footprints: List[CommandFootprint]) -> Dict[int, Set[int]]:
+        """
+        Map each index in `indices` (in file order) to the earlier indices it must wait for.
+
+        A command follows an earlier one when either creates or updates an element the
+        other names, when both are target-less writes (links, deletes) naming a common
+        element, or when either is a barrier. Everything else - e.g. 500 Create Term
+        blocks filing terms into one glossary - is independent. Edges only ever point to
+        earlier commands, so two related commands run in file order exactly as they did
+        sequentially, including the deferral of a forward reference.
+        """
+        graph: Dict[int, Set[int]] = {}
+        owners: Dict[str, Set[int]] = {}        # name -> commands targeting it
+        mentions: Dict[str, Set[int]] = {}      # name -> commands naming it
+        link_mentions: Dict[str, Set[int]] = {} # name -> target-less writes naming it
+        since_barrier: Set[int] = set()
+        last_barrier: Optional[int] = None
+        for i in indices:
+            fp = footprints[i]
+            if fp.barrier:
+                deps = set(since_barrier)
+                if last_barrier is not None:
+                    deps.add(last_barrier)
+                graph[i] = deps
+                last_barrier, since_barrier = i, set()
                 continue
-            raw_shim = {k: {"value": v} for k, v in command.attributes.items()}
-            # An explicit user-supplied "Qualified Name" must take priority over
-            # auto-derivation here, exactly as it does in the real execution path
-            # (AsyncBaseCommandProcessor.execute(), which only calls
-            # derive_qualified_name() when parsed_output["qualified_name"] isn't
-            # already set from an explicit value). derive_qualified_name() always
-            # auto-generates from Display Name and has no knowledge of an explicit
-            # override, so calling it unconditionally here silently registers the
-            # wrong name for any command using an explicit Qualified Name - making
-            # a forward reference *by that explicit name* invisible to the pre-scan.
-            qn = raw_shim.get("Qualified Name", {}).get("value") or processor.derive_qualified_name(raw_shim)
-            if qn:
-                target_qns.add(qn)
-            # A forward reference is typically typed as the raw Display Name,
-            # not the fully-derived qualified name (e.g. a "Sub-Projects" entry
-            # naming a project by its display name) - this is exactly how a
-            # *backward* reference already resolves too, via
-            # find_key_with_value() matching the display_name value stored
-            # alongside a cached qn. Register it here so a forward reference
-            # gets the same recognition.
-            display_name = command.attributes.get("Display Name")
-            if display_name:
-                target_qns.add(display_name)
-        return target_qns
+            deps = {last_barrier} if last_barrier is not None else set()
+            for name in fp.targets:
+                deps |= mentions.get(name, set())
+            for name in fp.names:
+                deps |= owners.get(name, set())
+                if not fp.targets:
+                    deps |= link_mentions.get(name, set())
+            graph[i] = deps
+            since_barrier.add(i)
+            for name in fp.targets:
+                owners.setdefault(name, set()).add(i)
+            for name in fp.names:
+                mentions.setdefault(name, set()).add(i)
+                if not fp.targets:
+                    link_mentions.setdefault(name, set()).add(i)
+        return graph
 
     async def dispatch(self, command: DrECommand, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -173,18 +278,27 @@ class V2Dispatcher:
                 "error": str(e)
             }
 
-    async def dispatch_batch(self, commands: List[DrECommand], context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def dispatch_batch(self, commands: List[DrECommand], context: Optional[Dict[str, Any]] = None,
+                             max_concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Execute a batch of commands, in rounds, so a command referencing an
         element defined LATER in the same file (a forward reference) can defer
         instead of failing outright on its first attempt.
 
-        Sequential execution within a round allows inter-command dependencies to
-        be tracked via a shared context. A command whose result comes back with
-        `deferred: True` (see processors.py) is retried in the next round rather
-        than treated as failed. Rounds continue until nothing is deferred, or -
-        once a round makes no further progress - one final forced pass is run
-        with context["final_round"] = True so genuinely-unresolvable references
+        Within a round, commands run concurrently (up to `max_concurrency`, by
+        default the dr_egeria_max_concurrency setting) as far as the batch's
+        dependency graph allows - see dependency_graph(). Commands that name
+        each other's elements still run one after the other in file order,
+        sharing the batch context, so inter-command dependencies are tracked
+        exactly as before. With a limit of 1, or in --debug runs (whose
+        per-command request tracing would otherwise interleave), a round runs
+        strictly sequentially.
+
+        A command whose result comes back with `deferred: True` (see
+        processors.py) is retried in the next round rather than treated as
+        failed. Rounds continue until nothing is deferred, or - once a round
+        makes no further progress - one final forced pass is run with
+        context["final_round"] = True so genuinely-unresolvable references
         still produce today's exact clear failure message, just correctly scoped
         to real problems instead of every forward reference.
 
@@ -203,7 +317,16 @@ class V2Dispatcher:
         # Pre-scan the full, original batch once, before any command executes,
         # so forward references are recognized as "will exist" rather than
         # "not found at all" from round 1 onward.
-        context["batch_target_qns"] = self.prescan_batch_target_qns(commands)
+        targets = [self.command_target_names(command) for command in commands]
+        context["batch_target_qns"] = set().union(*targets)
+
+        if max_concurrency is None:
+            max_concurrency = int(runtime_setting("dr_egeria_max_concurrency", 8))
+        if context.get("debug"):
+            max_concurrency = 1
+        footprints = None
+        if max_concurrency > 1:
+            footprints = [self.command_footprint(command, names) for command, names in zip(commands, targets)]
 
         n = len(commands)
         results: List[Optional[Dict[str, Any]]] = [None] * n
@@ -213,21 +336,46 @@ class V2Dispatcher:
         round_num = 0
         while pending and round_num < max_rounds:
             round_num += 1
-            still_pending = []
-            for i in pending:
-                result = await self.dispatch(commands[i], context)
-                results[i] = result
-                if result.get("deferred"):
-                    still_pending.append(i)
+            await self._run_round(commands, pending, context, results, footprints, max_concurrency)
+            still_pending = [i for i in pending if results[i].get("deferred")]
 
             if len(still_pending) == len(pending):
                 # No progress this round - force one more pass, treating any
                 # still-unresolved reference as a genuine, final failure.
                 context["final_round"] = True
-                for i in still_pending:
-                    results[i] = await self.dispatch(commands[i], context)
+                await self._run_round(commands, still_pending, context, results, footprints, max_concurrency)
                 break
 
             pending = still_pending
 
         return results  # type: ignore[return-value]
+
+    async def _run_round(self, commands: List[DrECommand], indices: List[int], context: Dict[str, Any],
+                         results: List[Optional[Dict[str, Any]]], footprints: Optional[List[CommandFootprint]],
+                         max_concurrency: int) -> None:
+        """Dispatch commands[i] for each i in `indices`, storing each result at results[i]."""
+        if footprints is None or max_concurrency <= 1 or len(indices) < 2:
+            for i in indices:
+                results[i] = await self.dispatch(commands[i], context)
+            return
+
+        graph = self.dependency_graph(indices, footprints)
+        finished = {i: asyncio.Event() for i in indices}
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def run(i: int) -> None:
+            try:
+                for dep in graph[i]:
+                    await finished[dep].wait()
+                async with slots:
+                    results[i] = await self.dispatch(commands[i], context)
+            finally:
+                finished[i].set()
+
+        tasks = [asyncio.create_task(run(i)) for i in indices]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
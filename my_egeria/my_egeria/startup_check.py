@@ -59,10 +59,8 @@ def check_connection() -> Tuple[bool, str]:
         # Create client and run a lightweight call to verify connectivity.
         # We use find_glossaries if available; any light call will suffice.
         client = EgeriaCat(EGERIA_SERVER, EGERIA_BASE_URL, EGERIA_USER, EGERIA_USER_PASSWORD)
-        # Attempt to call a simple method; adapt if your pyegeria version exposes a ping/status method.
-        # We don't actually call it here to avoid network wait in some contexts, 
-        # but the constructor check is already something.
-        # getattr(client, "find_glossaries", lambda: None)()
+        # Clients check connectivity lazily (on first request) by default, so probe explicitly here.
+        client.check_connection()
         return True, "Connected to Egeria"
     except Exception as e:
         return False, f"Failed to connect to Egeria: {e}"
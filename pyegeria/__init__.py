@@ -1,5 +1,8 @@
 """
 pyegeria: A Python SDK for ODPi Egeria.
+
+Client classes, view helpers and the combined clients are imported the first time they are
+used (see pyegeria._lazy), so `import pyegeria` stays cheap.
 """
 from pyegeria.core.config import load_app_config, get_app_config, pretty_print_config
 from pyegeria.core.logging_configuration import config_logging, init_logging
@@ -35,88 +38,110 @@ if disable_ssl_warnings:
 
     disable_warnings(InsecureRequestWarning)
 from pyegeria.core._globals import (GovernanceDomains)
-from pyegeria.core._server_client import ServerClient
-from pyegeria.core._exceptions import (
-    PyegeriaException,
-    PyegeriaAPIException,
-    PyegeriaConnectionException,
-    PyegeriaTimeoutException,
-    PyegeriaNotFoundException,
-    PyegeriaUnauthorizedException,
-    PyegeriaInvalidParameterException,
-    PyegeriaClientException,
-    PyegeriaUnknownException,
-    print_exception_table,
-    print_basic_exception,
-    print_validation_error,
-)
 from pyegeria.core.config import settings
 
-from pyegeria.core.utils import body_slimmer
-from pyegeria.core.clipboard import copy_to_clipboard, get_from_clipboard
-# OMVS Clients - Promoted to package level for ease of use
-from pyegeria.omvs.action_author import ActionAuthor
-from pyegeria.omvs.actor_manager import ActorManager
-from pyegeria.omvs.asset_catalog import AssetCatalog
-from pyegeria.omvs.asset_maker import AssetMaker
-from pyegeria.omvs.automated_curation import AutomatedCuration
-from pyegeria.omvs.classification_explorer import ClassificationExplorer
-from pyegeria.omvs.collection_manager import CollectionManager
-from pyegeria.omvs.community_matters_omvs import CommunityMatters
-from pyegeria.omvs.connection_maker import ConnectionMaker
-from pyegeria.omvs.data_designer import DataDesigner
-from pyegeria.omvs.data_discovery import DataDiscovery
-from pyegeria.omvs.data_engineer import DataEngineer
-from pyegeria.omvs.digital_business import DigitalBusiness
-from pyegeria.omvs.external_links import ExternalReferences
-from pyegeria.omvs.full_omag_server_config import FullServerConfig
-from pyegeria.omvs.glossary_manager import GlossaryManager
-from pyegeria.omvs.governance_officer import GovernanceOfficer
-from pyegeria.omvs.lineage_linker import LineageLinker
-from pyegeria.omvs.location_arena import LocationArena
-from pyegeria.omvs.metadata_expert import MetadataExpert
-from pyegeria.omvs.my_profile import MyProfile
-from pyegeria.omvs.notification_manager import NotificationManager
-from pyegeria.omvs.people_organizer import PeopleOrganizer
-from pyegeria.omvs.product_manager import ProductManager
-from pyegeria.omvs.project_manager import ProjectManager
-from pyegeria.omvs.reference_data import ReferenceDataManager
-from pyegeria.omvs.registered_info import RegisteredInfo
-from pyegeria.omvs.runtime_manager import RuntimeManager
-from pyegeria.omvs.schema_maker import SchemaMaker
-from pyegeria.omvs.server_operations import ServerOps
-from pyegeria.omvs.solution_architect import SolutionArchitect
-from pyegeria.omvs.specification_properties import SpecificationProperties
-from pyegeria.omvs.subject_area import SubjectArea
-from pyegeria.omvs.template_manager_omvs import TemplateManager
-from pyegeria.omvs.time_keeper import TimeKeeper
-from pyegeria.omvs.valid_metadata import ValidMetadataManager
-from pyegeria.omvs.valid_metadata_lists import ValidMetadataLists
-from pyegeria.omvs.valid_type_lists import ValidTypeLists
+from pyegeria._lazy import lazy_exports
 
-# View Utilities
-from pyegeria.view.mermaid_utilities import (
-    construct_mermaid_web,
-    construct_mermaid_jup,
-    load_mermaid,
-    render_mermaid,
-    save_mermaid_html,
-    save_mermaid_graph,
-)
-from pyegeria.view.output_formatter import (
-    generate_output,
-    resolve_output_formats,
-    populate_common_columns,
-)
-from pyegeria.view.format_set_executor import (
-    exec_report_spec
-)
+# Public name -> defining module, imported on first use.
+_LAZY_EXPORTS = {
+    "ServerClient": "pyegeria.core._server_client",
+    "CircuitBreaker": "pyegeria.core._retry",
+    "RetryPolicy": "pyegeria.core._retry",
+    "GuidCache": "pyegeria.core._guid_cache",
+    "ClientPool": "pyegeria.core._client_pool",
+    "get_client_pool": "pyegeria.core._client_pool",
+    "set_client_pool": "pyegeria.core._client_pool",
+    "SessionPool": "pyegeria.core._session_pool",
+    "get_session_pool": "pyegeria.core._session_pool",
+    "set_session_pool": "pyegeria.core._session_pool",
+    "SyncRuntime": "pyegeria.core._sync_runtime",
+    "get_sync_runtime": "pyegeria.core._sync_runtime",
+    "set_sync_runtime": "pyegeria.core._sync_runtime",
+    "PyegeriaException": "pyegeria.core._exceptions",
+    "PyegeriaAPIException": "pyegeria.core._exceptions",
+    "PyegeriaConnectionException": "pyegeria.core._exceptions",
+    "PyegeriaTimeoutException": "pyegeria.core._exceptions",
+    "PyegeriaNotFoundException": "pyegeria.core._exceptions",
+    "PyegeriaUnauthorizedException": "pyegeria.core._exceptions",
+    "PyegeriaInvalidParameterException": "pyegeria.core._exceptions",
+    "PyegeriaClientException": "pyegeria.core._exceptions",
+    "PyegeriaUnknownException": "pyegeria.core._exceptions",
+    "print_exception_table": "pyegeria.core._exceptions",
+    "print_basic_exception": "pyegeria.core._exceptions",
+    "print_validation_error": "pyegeria.core._exceptions",
+    "body_slimmer": "pyegeria.core.utils",
+    "copy_to_clipboard": "pyegeria.core.clipboard",
+    "get_from_clipboard": "pyegeria.core.clipboard",
+    # OMVS Clients - promoted to package level for ease of use
+    "ActionAuthor": "pyegeria.omvs.action_author",
+    "ActorManager": "pyegeria.omvs.actor_manager",
+    "AssetCatalog": "pyegeria.omvs.asset_catalog",
+    "AssetMaker": "pyegeria.omvs.asset_maker",
+    "AutomatedCuration": "pyegeria.omvs.automated_curation",
+    "ClassificationExplorer": "pyegeria.omvs.classification_explorer",
+    "CollectionManager": "pyegeria.omvs.collection_manager",
+    "CommunityMatters": "pyegeria.omvs.community_matters_omvs",
+    "ConnectionMaker": "pyegeria.omvs.connection_maker",
+    "DataDesigner": "pyegeria.omvs.data_designer",
+    "DataDiscovery": "pyegeria.omvs.data_discovery",
+    "DataEngineer": "pyegeria.omvs.data_engineer",
+    "DigitalBusiness": "pyegeria.omvs.digital_business",
+    "ExternalReferences": "pyegeria.omvs.external_links",
+    "FullServerConfig": "pyegeria.omvs.full_omag_server_config",
+    "GlossaryManager": "pyegeria.omvs.glossary_manager",
+    "GovernanceOfficer": "pyegeria.omvs.governance_officer",
+    "LineageLinker": "pyegeria.omvs.lineage_linker",
+    "LocationArena": "pyegeria.omvs.location_arena",
+    "MetadataExpert": "pyegeria.omvs.metadata_expert",
+    "MyProfile": "pyegeria.omvs.my_profile",
+    "NotificationManager": "pyegeria.omvs.notification_manager",
+    "PeopleOrganizer": "pyegeria.omvs.people_organizer",
+    "ProductManager": "pyegeria.omvs.product_manager",
+    "ProjectManager": "pyegeria.omvs.project_manager",
+    "ReferenceDataManager": "pyegeria.omvs.reference_data",
+    "RegisteredInfo": "pyegeria.omvs.registered_info",
+    "RuntimeManager": "pyegeria.omvs.runtime_manager",
+    "SchemaMaker": "pyegeria.omvs.schema_maker",
+    "ServerOps": "pyegeria.omvs.server_operations",
+    "SolutionArchitect": "pyegeria.omvs.solution_architect",
+    "SpecificationProperties": "pyegeria.omvs.specification_properties",
+    "SubjectArea": "pyegeria.omvs.subject_area",
+    "TemplateManager": "pyegeria.omvs.template_manager_omvs",
+    "TimeKeeper": "pyegeria.omvs.time_keeper",
+    "ValidMetadataManager": "pyegeria.omvs.valid_metadata",
+    "ValidMetadataLists": "pyegeria.omvs.valid_metadata_lists",
+    "ValidTypeLists": "pyegeria.omvs.valid_type_lists",
+    # View Utilities
+    "construct_mermaid_web": "pyegeria.view.mermaid_utilities",
+    "construct_mermaid_jup": "pyegeria.view.mermaid_utilities",
+    "load_mermaid": "pyegeria.view.mermaid_utilities",
+    "render_mermaid": "pyegeria.view.mermaid_utilities",
+    "save_mermaid_html": "pyegeria.view.mermaid_utilities",
+    "save_mermaid_graph": "pyegeria.view.mermaid_utilities",
+    "generate_output": "pyegeria.view.output_formatter",
+    "iter_output": "pyegeria.view.output_formatter",
+    "aiter_output": "pyegeria.view.output_formatter",
+    "write_output": "pyegeria.view.output_formatter",
+    "async_write_output": "pyegeria.view.output_formatter",
+    "resolve_output_formats": "pyegeria.view.output_formatter",
+    "populate_common_columns": "pyegeria.view.output_formatter",
+    "exec_report_spec": "pyegeria.view.format_set_executor",
+    "ReportResultCache": "pyegeria.view._report_cache",
+    "get_report_cache": "pyegeria.view._report_cache",
+    "invalidate_report_cache": "pyegeria.view._report_cache",
+    "MetricPointCache": "pyegeria.view._metric_point_cache",
+    "get_metric_point_cache": "pyegeria.view._metric_point_cache",
+    "MetricSnapshotStore": "pyegeria.view._metric_snapshot_store",
+    "get_metric_snapshot_store": "pyegeria.view._metric_snapshot_store",
+    # Combined Clients
+    "Egeria": "pyegeria.egeria_client",
+    "EgeriaTech": "pyegeria.egeria_tech_client",
+    "EgeriaConfig": "pyegeria.egeria_config_client",
+    "EgeriaCat": "pyegeria.egeria_cat_client",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-# Combined Clients
-from pyegeria.egeria_client import Egeria
-from pyegeria.egeria_tech_client import EgeriaTech
-from pyegeria.egeria_config_client import EgeriaConfig
-from pyegeria.egeria_cat_client import EgeriaCat
 
 __all__ = [
     # Main Clients
@@ -125,6 +150,18 @@ __all__ = [
     "EgeriaConfig",
     "EgeriaCat",
     "ServerClient",
+    "SessionPool",
+    "get_session_pool",
+    "set_session_pool",
+    "SyncRuntime",
+    "get_sync_runtime",
+    "set_sync_runtime",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "GuidCache",
+    "ClientPool",
+    "get_client_pool",
+    "set_client_pool",
     # Exceptions
     "PyegeriaException",
     "PyegeriaAPIException",
@@ -207,6 +244,10 @@ __all__ = [
     "save_mermaid_html",
     "save_mermaid_graph",
     "generate_output",
+    "iter_output",
+    "aiter_output",
+    "write_output",
+    "async_write_output",
     "resolve_output_formats",
     "populate_common_columns",
     # Config Utilities
@@ -217,6 +258,13 @@ __all__ = [
     "config_logging",
     "init_logging",
     "exec_report_spec",
+    "ReportResultCache",
+    "get_report_cache",
+    "invalidate_report_cache",
+    "MetricPointCache",
+    "get_metric_point_cache",
+    "MetricSnapshotStore",
+    "get_metric_snapshot_store",
     "body_slimmer",
     "copy_to_clipboard",
     "get_from_clipboard",
@@ -0,0 +1,59 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Deferred imports for the pyegeria packages (PEP 562).
+
+Importing `pyegeria` used to import every OMVS client, the report-spec catalog and the view
+helpers up front - about two seconds before a script could do anything, even one that needs a
+single client. The package `__init__` modules now map each public name to the module that
+defines it and import that module the first time the name is used:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"CollectionManager": "pyegeria.omvs.collection_manager"})
+
+`from pyegeria import CollectionManager`, `pyegeria.CollectionManager` and `from pyegeria import *`
+behave as before; only the import cost moves to first use. `resolve()` does the same for the
+dotted class paths the combined clients keep in their sub-client maps.
+"""
+
+import importlib
+import importlib.util
+import sys
+from typing import Any, Callable
+
+
+def resolve(path: str) -> Any:
+    """Import and return the object named by a dotted path such as "pyegeria.omvs.time_keeper.TimeKeeper"."""
+    module, _, name = path.rpartition(".")
+    return getattr(importlib.import_module(module), name)
+
+
+def lazy_exports(package: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level `__getattr__` and `__dir__` for a package with deferred exports.
+
+    Parameters
+    ----------
+    package : str
+        The package's `__name__`.
+    exports : dict
+        Public name -> module that defines it. Names that are submodules of `package` (for
+        example `pyegeria.omvs`) are imported on attribute access as well.
+    """
+
+    def __getattr__(name: str) -> Any:
+        namespace = sys.modules[package].__dict__
+        module = exports.get(name)
+        if module is not None:
+            value = getattr(importlib.import_module(module), name)
+        elif not name.startswith("__") and importlib.util.find_spec(f"{package}.{name}") is not None:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value        # later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(sys.modules[package].__dict__) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,18 +1,8 @@
 """
 Core module for pyegeria.
+
+Names are imported from their modules the first time they are used (see pyegeria._lazy).
 """
-from pyegeria.core._server_client import ServerClient
-from pyegeria.core._exceptions import (
-    PyegeriaException,
-    PyegeriaAPIException,
-    PyegeriaConnectionException,
-    PyegeriaTimeoutException,
-    PyegeriaNotFoundException,
-    PyegeriaUnauthorizedException,
-    PyegeriaInvalidParameterException,
-    PyegeriaClientException,
-    PyegeriaUnknownException,
-)
 from pyegeria.core._globals import (
     default_timeout,
     disable_ssl_warnings,
@@ -22,9 +12,51 @@ from pyegeria.core._globals import (
     NO_ELEMENTS_FOUND,
     ACTIVITY_STATUS, GovernanceDomains,
 )
+from pyegeria._lazy import lazy_exports
+
+# Public name -> defining module, imported on first use.
+_LAZY_EXPORTS = {
+    "ServerClient": "pyegeria.core._server_client",
+    "CircuitBreaker": "pyegeria.core._retry",
+    "RetryPolicy": "pyegeria.core._retry",
+    "GuidCache": "pyegeria.core._guid_cache",
+    "ClientPool": "pyegeria.core._client_pool",
+    "get_client_pool": "pyegeria.core._client_pool",
+    "set_client_pool": "pyegeria.core._client_pool",
+    "SessionPool": "pyegeria.core._session_pool",
+    "get_session_pool": "pyegeria.core._session_pool",
+    "set_session_pool": "pyegeria.core._session_pool",
+    "SyncRuntime": "pyegeria.core._sync_runtime",
+    "get_sync_runtime": "pyegeria.core._sync_runtime",
+    "set_sync_runtime": "pyegeria.core._sync_runtime",
+    "PyegeriaException": "pyegeria.core._exceptions",
+    "PyegeriaAPIException": "pyegeria.core._exceptions",
+    "PyegeriaConnectionException": "pyegeria.core._exceptions",
+    "PyegeriaTimeoutException": "pyegeria.core._exceptions",
+    "PyegeriaNotFoundException": "pyegeria.core._exceptions",
+    "PyegeriaUnauthorizedException": "pyegeria.core._exceptions",
+    "PyegeriaInvalidParameterException": "pyegeria.core._exceptions",
+    "PyegeriaClientException": "pyegeria.core._exceptions",
+    "PyegeriaUnknownException": "pyegeria.core._exceptions",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "ServerClient",
+    "SessionPool",
+    "get_session_pool",
+    "set_session_pool",
+    "SyncRuntime",
+    "get_sync_runtime",
+    "set_sync_runtime",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "GuidCache",
+    "ClientPool",
+    "get_client_pool",
+    "set_client_pool",
     "PyegeriaException",
     "PyegeriaAPIException",
     "PyegeriaConnectionException",
@@ -11,6 +11,8 @@ import asyncio
 import inspect
 import json
 import os
+from collections.abc import Awaitable
+from typing import Any
 
 import httpcore
 import httpx
@@ -18,12 +20,15 @@ from httpx import AsyncClient, Response, HTTPStatusError
 # from venv import logger
 from loguru import logger
 
-from pyegeria.core.config import settings
+from pyegeria.core.config import runtime_setting, settings
 from pyegeria.core._exceptions import (
     PyegeriaAPIException, PyegeriaConnectionException, PyegeriaInvalidParameterException,
-    PyegeriaUnknownException, PyegeriaClientException, PyegeriaTimeoutException
+    PyegeriaUnknownException, PyegeriaClientException, PyegeriaTimeoutException, PyegeriaException
 )
 from pyegeria.core._globals import enable_ssl_check, max_paging_size
+from pyegeria.core._retry import RetryPolicy, send_with_retry
+from pyegeria.core._session_pool import SessionPool, get_session_pool
+from pyegeria.core._sync_runtime import SyncRuntime, get_sync_runtime
 from pyegeria.core._validators import (
     validate_name,
     validate_server_name,
@@ -59,10 +64,22 @@ class BasePlatformClient:
         The source of the bearer token (e.g., 'Egeria').
     api_key : str
         An optional API key for authentication.
+    session_pool : SessionPool
+        The pool this client borrows its HTTP session from. Defaults to the process-wide pool
+        (pyegeria.core._session_pool.get_session_pool()).
+    connection_check : str
+        When to verify the platform is reachable: "eager" probes during construction, "lazy"
+        (the default) lets the first real request do it, "off" never probes. Defaults to the
+        `connection_check` Runtime setting (PYEGERIA_CONNECTION_CHECK).
+    retry_policy : RetryPolicy
+        How transient failures (timeouts, connection errors, 429/502/503/504) are retried.
+        Defaults to RetryPolicy.from_settings() (PYEGERIA_RETRY_* env vars). Requests to the
+        platform also share a circuit breaker held by the session pool.
 
     """
 
     json_header = {"Content-Type": "application/json"}
+    _sync_runtime: SyncRuntime | None = None
 
     def __init__(
             self,
@@ -75,6 +92,9 @@ class BasePlatformClient:
             api_key: str = None,
             page_size: int = None,
             timeout: int = None,
+            session_pool: SessionPool = None,
+            connection_check: str = None,
+            retry_policy: RetryPolicy = None,
     ):
         server_name = server_name or settings.Environment.egeria_view_server
         platform_url = platform_url or settings.Environment.egeria_platform_url
@@ -125,26 +145,28 @@ class BasePlatformClient:
             self.headers["Authorization"] = f"Bearer {self.token}"
             self.text_headers["Authorization"] = f"Bearer {self.token}"
 
-        self.session = AsyncClient(
-            verify=enable_ssl_check,
-            timeout=httpx.Timeout(timeout=float(self.timeout), connect=10.0),
-            limits=httpx.Limits(
-                max_connections=10,
-                max_keepalive_connections=5,
-                keepalive_expiry=20.0,  # stay under typical reverse-proxy idle timeout (60-75 s)
-            ),
-        )
+        if getattr(self, "_session_key", None) is None:
+            self._session_pool = session_pool or get_session_pool()
+            self._session_key = self._session_pool.acquire(self.platform_url, verify=enable_ssl_check)
         self.command_root: str = f"{self.platform_url}/servers/{self.server_name}/api/open-metadata/"
 
-        try:
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
+        self.connection_check = (connection_check or runtime_setting("connection_check", "lazy") or "lazy").lower()
+        if self.connection_check == "eager":
             result = self.check_connection()
             logger.debug(f"client initialized, platform origin is: {result}")
-        except PyegeriaConnectionException as e:
-            raise
 
-    async def _async_check_connection(self) -> str:
+    async def _async_check_connection(self, force: bool = False) -> str:
         """Check if the connection is working. Async version.
 
+        A platform that answered a probe or a real request within the pool's
+        `connection_check_ttl` is not probed again unless `force` is set.
+
+        Parameters
+        ----------
+        force : bool, default False
+            Probe the platform even if it is already known to be reachable.
+
         Returns
         -------
         str
@@ -155,8 +177,13 @@ class BasePlatformClient:
         PyegeriaConnectionException
             If the connection to the platform fails.
         """
+        if not force:
+            cached = self._session_pool.reachable(self._session_key)
+            if cached is not None:
+                return cached
         try:
             response = await self.async_get_platform_origin()
+            self._session_pool.mark_reachable(self._session_key, response)
             return response
 
         except (PyegeriaConnectionException, PyegeriaTimeoutException):
@@ -164,6 +191,27 @@ class BasePlatformClient:
         except Exception as e:
             logger.debug(f"Connection check returned an exception (server is active but check failed): {e}")
             return ""
+
+    async def aconnect(self, force: bool = False) -> str:
+        """Eagerly verify that the platform is reachable - for callers using the default lazy check.
+
+        Parameters
+        ----------
+        force : bool, default False
+            Probe the platform even if it answered within the connection-check TTL.
+
+        Returns
+        -------
+        str
+            The platform origin string if reachable, otherwise an empty string.
+
+        Raises
+        ------
+        PyegeriaConnectionException
+            If the connection to the platform fails.
+        """
+        return await self._async_check_connection(force=force)
+
     def check_connection(self) -> str:
         """Check if the connection is working.
 
@@ -177,16 +225,39 @@ class BasePlatformClient:
         PyegeriaConnectionException
             If the connection to the platform fails.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_check_connection())
+        response = self._run_sync(self._async_check_connection())
         return response
 
+    @property
+    def session(self) -> AsyncClient:
+        """The shared httpx session for this client's platform on the current event loop."""
+        if self._session_key is None:  # re-opened after close_session()
+            self._session_key = self._session_pool.acquire(self.platform_url, verify=enable_ssl_check)
+        return self._session_pool.get_session(self._session_key)
+
+    def use_session_pool(self, pool: SessionPool) -> None:
+        """Move this client onto a different SessionPool, releasing its hold on the current one."""
+        if pool is self._session_pool:
+            return
+        old_pool, old_key = self._session_pool, self._session_key
+        self._session_pool = pool
+        self._session_key = pool.acquire(self.platform_url, verify=enable_ssl_check)
+        if old_key is not None:
+            old_pool.release(old_key)
+
+    def use_sync_runtime(self, runtime: SyncRuntime | None) -> None:
+        """Run this client's sync methods on `runtime` (None: the process-wide SyncRuntime)."""
+        self._sync_runtime = runtime
+
+    def _run_sync(self, coro: Awaitable[Any]) -> Any:
+        """Run one of this client's coroutines for a sync method (see pyegeria.core._sync_runtime)."""
+        return (self._sync_runtime or get_sync_runtime()).run(coro)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self.session.aclose())
+        self.close_session()
         if exc_type is not None:
             self.exc_type = exc_type
             self.exc_val = exc_val
@@ -199,13 +270,18 @@ class BasePlatformClient:
                 f"user_id={self.user_id}, page_size={self.page_size})")
 
     async def _async_close_session(self) -> None:
-        """Close the session"""
-        await self.session.aclose()
+        """Release this client's hold on its pooled session; the last client out closes it."""
+        if getattr(self, "_session_key", None) is None:
+            return
+        key, self._session_key = self._session_key, None
+        await self._session_pool.arelease(key)
 
     def close_session(self) -> None:
-        """Close the session"""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_close_session())
+        """Release this client's hold on its pooled session; the last client out closes it."""
+        if getattr(self, "_session_key", None) is None:
+            return
+        key, self._session_key = self._session_key, None
+        self._session_pool.release(key)
         return
 
     async def _async_create_egeria_bearer_token(
@@ -250,18 +326,17 @@ class BasePlatformClient:
         data = {"userId": user_id, "password": password}
         if new_password:
             data["newPassword"] = new_password
-        async with AsyncClient(verify=enable_ssl_check) as client:
-            try:
-                # Deliberately not self.headers: it may still carry a stale/expired
-                # Authorization header (that's exactly what we're refreshing), and
-                # this endpoint authenticates via the body credentials, not a bearer
-                # token - sending a bad Authorization header here gets this request
-                # itself rejected with 401, defeating the whole refresh.
-                response = await client.post(url, json=data, headers=self.json_header)
-                token = response.text
-            except httpx.HTTPError as e:
-                print(e)
-                return "FAILED"
+        try:
+            # Deliberately not self.headers: it may still carry a stale/expired
+            # Authorization header (that's exactly what we're refreshing), and
+            # this endpoint authenticates via the body credentials, not a bearer
+            # token - sending a bad Authorization header here gets this request
+            # itself rejected with 401, defeating the whole refresh.
+            response = await self.session.post(url, json=data, headers=self.json_header)
+            token = response.text
+        except httpx.HTTPError as e:
+            print(e)
+            return "FAILED"
 
         if token:
             self.token_src = "Egeria"
@@ -303,8 +378,7 @@ class BasePlatformClient:
         A bearer token from another source can be set with the set_bearer_token() method.
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_egeria_bearer_token(user_id, password)
         )
         return response
@@ -362,8 +436,7 @@ class BasePlatformClient:
         PyegeriaNotAuthorizedException
             The principle specified by the user_id does not have authorization for the requested action
         """
-        loop = asyncio.get_event_loop()
-        token = loop.run_until_complete(self._async_refresh_egeria_bearer_token())
+        token = self._run_sync(self._async_refresh_egeria_bearer_token())
         return token
 
     def set_bearer_token(self, token: str) -> None:
@@ -419,8 +492,7 @@ class BasePlatformClient:
         str
             The platform origin string if reachable, otherwise an empty string.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self.async_get_platform_origin())
+        response = self._run_sync(self.async_get_platform_origin())
         return response
 
     # @logger.catch
@@ -463,17 +535,8 @@ class BasePlatformClient:
         """
         if timeout is None:
             timeout = self.timeout
-        try:
-            loop = asyncio.get_running_loop()
-            if loop.is_running():
-                coro = self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout)
-                return asyncio.run_coroutine_threadsafe(coro, loop).result()
-            else:
-                return loop.run_until_complete(
-                    self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout))
-        except RuntimeError:
-            # No running loop exists; run the coroutine
-            return asyncio.run(self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout))
+        return self._run_sync(
+            self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout))
 
 
     async def _async_make_request(
@@ -485,6 +548,7 @@ class BasePlatformClient:
             params: dict | None = None,
             *,
             timeout: int = None,
+            idempotent: bool = None,
             _retrying: bool = False,
     ) -> Response | str:
         """Make an asynchronous request to the Egeria API.
@@ -503,6 +567,10 @@ class BasePlatformClient:
             Query parameters for the request.
         timeout : int, optional
             The timeout for the request in seconds.
+        idempotent : bool, optional
+            Whether re-sending the request is harmless. Defaults to True for GET/DELETE and
+            False otherwise; read-only POSTs (finds, lookups) pass True so that timeouts and
+            502/504 responses are retried under the client's `retry_policy`.
 
         Returns
         -------
@@ -525,23 +593,26 @@ class BasePlatformClient:
         context['caller method'] = inspect.currentframe().f_back.f_code.co_name
         response: Response = None  # Initialize to None to avoid UnboundLocalError
 
-        try:
+        # Reading the session first re-acquires this client's platform key after close_session().
+        session = self.session
+        breaker = self._session_pool.circuit_breaker(self._session_key)
+
+        async def send() -> Response:
             if request_type == "GET":
-                response = await self.session.get(
+                return await session.get(
                     endpoint, params=params, headers=self.headers, timeout=timeout,
                 )
-
             elif request_type == "POST":
                 if payload is None:
-                    response = await self.session.post(
+                    return await session.post(
                         endpoint, headers=self.headers, timeout=timeout, params = params
                     )
                 elif type(payload) is dict:
-                    response = await self.session.post(
+                    return await session.post(
                         endpoint, json=payload, headers=self.headers, timeout=timeout
                     )
                 elif type(payload) is str:
-                    response = await self.session.post(
+                    return await session.post(
                         endpoint,
                         headers=self.headers,
                         content=payload,
@@ -550,28 +621,36 @@ class BasePlatformClient:
                     )
                 else:
                     raise TypeError(f"Invalid payload type {type(payload)}")
-
-
             elif request_type == "POST-DATA":
-                if True:
-                    response = await self.session.post(
-                        endpoint, headers=self.headers, data=payload, timeout=timeout
-                    )
+                return await session.post(
+                    endpoint, headers=self.headers, data=payload, timeout=timeout
+                )
             elif request_type == "DELETE":
-                if True:
-                    response = await self.session.delete(
-                        endpoint, headers=self.headers, timeout=timeout
-                    )
+                return await session.delete(
+                    endpoint, headers=self.headers, timeout=timeout
+                )
+            raise TypeError(f"Invalid request type {request_type}")
+
+        try:
+            # Transient failures (see _retry.py) are retried here; the handlers below see the last attempt.
+            response = await send_with_retry(
+                send, self.retry_policy, breaker,
+                idempotent=self.retry_policy.is_idempotent(request_type, idempotent),
+                endpoint=endpoint, context=context,
+            )
             # Attempt a single token refresh on 401/403 before raising.
             if response.status_code in (401, 403) and not _retrying and self.token_src == "Egeria":
                 try:
                     await self._async_refresh_egeria_bearer_token()
                     return await self._async_make_request(
-                        request_type, endpoint, payload, is_json, params, timeout=timeout, _retrying=True
+                        request_type, endpoint, payload, is_json, params, timeout=timeout,
+                        idempotent=idempotent, _retrying=True
                     )
                 except Exception:
                     pass  # fall through to raise_for_status
 
+            # Any HTTP response proves the platform is up - lets lazy/eager checks skip the probe.
+            self._session_pool.mark_reachable(self._session_key)
             response.raise_for_status()
 
             status_code = response.status_code
@@ -595,6 +674,9 @@ class BasePlatformClient:
 
             raise PyegeriaClientException(response, context, additional_info, e)
 
+        except PyegeriaException:
+            raise
+
         except Exception as e:
             additional_info = {"userid": self.user_id}
             if response is not None:
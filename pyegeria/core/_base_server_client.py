@@ -11,19 +11,25 @@ import asyncio
 import inspect
 import json
 import os
+from collections.abc import Awaitable
+from typing import Any
 
 import httpcore
 import httpx
 from httpx import AsyncClient, Response, HTTPStatusError
 from loguru import logger
 
-from pyegeria.core.config import settings
+from pyegeria.core import _json
+from pyegeria.core.config import runtime_setting, settings
 from pyegeria.core._exceptions import (
     PyegeriaAPIException, PyegeriaConnectionException, PyegeriaInvalidParameterException,
-    PyegeriaUnknownException, PyegeriaClientException, PyegeriaTimeoutException,
+    PyegeriaUnknownException, PyegeriaClientException, PyegeriaTimeoutException, PyegeriaException,
     PyegeriaNotFoundException, PyegeriaUnauthorizedException
 )
 from pyegeria.core._globals import enable_ssl_check, max_paging_size
+from pyegeria.core._retry import RetryPolicy, send_with_retry
+from pyegeria.core._session_pool import SessionPool, get_session_pool
+from pyegeria.core._sync_runtime import SyncRuntime, get_sync_runtime
 from pyegeria.core._validators import (
     validate_name,
     validate_server_name,
@@ -59,10 +65,24 @@ class BaseServerClient:
         The source of the bearer token (e.g., 'Egeria').
     api_key : str
         An optional API key for authentication.
+    session_pool : SessionPool
+        The pool this client borrows its HTTP session from. Defaults to the process-wide pool
+        (pyegeria.core._session_pool.get_session_pool()), so all clients talking to the same
+        platform share keep-alive connections.
+    connection_check : str
+        When to verify the platform is reachable: "eager" probes during construction, "lazy"
+        (the default) lets the first real request do it, "off" never probes. Defaults to the
+        `connection_check` Runtime setting (PYEGERIA_CONNECTION_CHECK). Use `await aconnect()`
+        for an explicit check in lazy mode.
+    retry_policy : RetryPolicy
+        How transient failures (timeouts, connection errors, 429/502/503/504) are retried.
+        Defaults to RetryPolicy.from_settings() (PYEGERIA_RETRY_* env vars). Requests to the
+        platform also share a circuit breaker held by the session pool.
 
     """
 
     json_header = {"Content-Type": "application/json"}
+    _sync_runtime: SyncRuntime | None = None
 
     def __init__(
             self,
@@ -77,6 +97,9 @@ class BaseServerClient:
             local_qualifier: str = None,
             organization_name: str = None,
             timeout: int = None,
+            session_pool: SessionPool = None,
+            connection_check: str = None,
+            retry_policy: RetryPolicy = None,
             **kwargs
     ):
         server_name = server_name or settings.Environment.egeria_view_server
@@ -124,21 +147,30 @@ class BaseServerClient:
             self.headers["Authorization"] = f"Bearer {self.token}"
             self.text_headers["Authorization"] = f"Bearer {self.token}"
 
-        self.session = AsyncClient(
-            verify=enable_ssl_check,
-            timeout=httpx.Timeout(timeout=float(self.timeout), connect=10.0),
-        )
+        # Subclasses combining several OMVS parents (e.g. EgeriaCat) run this __init__ once per
+        # parent - only the first run registers with the pool.
+        if getattr(self, "_session_key", None) is None:
+            self._session_pool = session_pool or get_session_pool()
+            self._session_key = self._session_pool.acquire(self.platform_url, verify=enable_ssl_check)
         self.command_root: str = f"{self.platform_url}/servers/{self.server_name}/api/open-metadata/"
 
-        try:
+        self.retry_policy = retry_policy or RetryPolicy.from_settings()
+        self.connection_check = (connection_check or runtime_setting("connection_check", "lazy") or "lazy").lower()
+        if self.connection_check == "eager":
             result = self.check_connection()
             logger.debug(f"client initialized, platform origin is: {result}")
-        except PyegeriaConnectionException:
-            raise
 
-    async def _async_check_connection(self) -> str:
+    async def _async_check_connection(self, force: bool = False) -> str:
         """Check if the connection is working. Async version.
 
+        A platform that answered a probe or a real request within the pool's
+        `connection_check_ttl` is not probed again unless `force` is set.
+
+        Parameters
+        ----------
+        force : bool, default False
+            Probe the platform even if it is already known to be reachable.
+
         Returns
         -------
         str
@@ -149,8 +181,13 @@ class BaseServerClient:
         PyegeriaConnectionException
             If the connection to the platform fails.
         """
+        if not force:
+            cached = self._session_pool.reachable(self._session_key)
+            if cached is not None:
+                return cached
         try:
             response = await self.async_get_platform_origin()
+            self._session_pool.mark_reachable(self._session_key, response)
             return response
 
         except (PyegeriaConnectionException, PyegeriaTimeoutException):
@@ -158,6 +195,27 @@ class BaseServerClient:
         except Exception as e:
             logger.debug(f"Connection check returned an exception (server is active but check failed): {e}")
             return ""
+
+    async def aconnect(self, force: bool = False) -> str:
+        """Eagerly verify that the platform is reachable - for callers using the default lazy check.
+
+        Parameters
+        ----------
+        force : bool, default False
+            Probe the platform even if it answered within the connection-check TTL.
+
+        Returns
+        -------
+        str
+            The platform origin string if reachable, otherwise an empty string.
+
+        Raises
+        ------
+        PyegeriaConnectionException
+            If the connection to the platform fails.
+        """
+        return await self._async_check_connection(force=force)
+
     def check_connection(self) -> str:
         """Check if the connection is working.
 
@@ -171,15 +229,39 @@ class BaseServerClient:
         PyegeriaConnectionException
             If the connection to the platform fails.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_check_connection())
+        response = self._run_sync(self._async_check_connection())
         return response
 
+    @property
+    def session(self) -> AsyncClient:
+        """The shared httpx session for this client's platform on the current event loop."""
+        if self._session_key is None:  # re-opened after close_session()
+            self._session_key = self._session_pool.acquire(self.platform_url, verify=enable_ssl_check)
+        return self._session_pool.get_session(self._session_key)
+
+    def use_session_pool(self, pool: SessionPool) -> None:
+        """Move this client onto a different SessionPool, releasing its hold on the current one."""
+        if pool is self._session_pool:
+            return
+        old_pool, old_key = self._session_pool, self._session_key
+        self._session_pool = pool
+        self._session_key = pool.acquire(self.platform_url, verify=enable_ssl_check)
+        if old_key is not None:
+            old_pool.release(old_key)
+
+    def use_sync_runtime(self, runtime: SyncRuntime | None) -> None:
+        """Run this client's sync methods on `runtime` (None: the process-wide SyncRuntime)."""
+        self._sync_runtime = runtime
+
+    def _run_sync(self, coro: Awaitable[Any]) -> Any:
+        """Run one of this client's coroutines for a sync method (see pyegeria.core._sync_runtime)."""
+        return (self._sync_runtime or get_sync_runtime()).run(coro)
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.aclose()
+        self.close_session()
         if exc_type is not None:
             self.exc_type = exc_type
             self.exc_val = exc_val
@@ -191,14 +273,23 @@ class BaseServerClient:
         return (f"EgeriaClient(server_name={self.server_name}, platform_url={self.platform_url}, "
                 f"user_id={self.user_id}, page_size={self.page_size})")
 
+    def _after_write(self, endpoint: str) -> None:
+        """Called after every successful request that may have changed metadata (see
+        `_async_make_request`); subclasses holding cached lookups override it to drop stale entries."""
+
     async def _async_close_session(self) -> None:
-        """Close the session"""
-        await self.session.aclose()
+        """Release this client's hold on its pooled session; the last client out closes it."""
+        if getattr(self, "_session_key", None) is None:
+            return
+        key, self._session_key = self._session_key, None
+        await self._session_pool.arelease(key)
 
     def close_session(self) -> None:
-        """Close the session"""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_close_session())
+        """Release this client's hold on its pooled session; the last client out closes it."""
+        if getattr(self, "_session_key", None) is None:
+            return
+        key, self._session_key = self._session_key, None
+        self._session_pool.release(key)
         return
 
     async def _async_create_egeria_bearer_token(
@@ -241,18 +332,17 @@ class BaseServerClient:
         data = {"userId": user_id, "password": password}
         if new_password:
             data["newPassword"] = new_password
-        async with AsyncClient(verify=enable_ssl_check) as client:
-            try:
-                # Deliberately not self.headers: it may still carry a stale/expired
-                # Authorization header (that's exactly what we're refreshing), and
-                # this endpoint authenticates via the body credentials, not a bearer
-                # token - sending a bad Authorization header here gets this request
-                # itself rejected with 401, defeating the whole refresh.
-                response = await client.post(url, json=data, headers=self.json_header)
-                token = response.text
-            except httpx.HTTPError as e:
-                print(e)
-                return "FAILED"
+        try:
+            # Deliberately not self.headers: it may still carry a stale/expired
+            # Authorization header (that's exactly what we're refreshing), and
+            # this endpoint authenticates via the body credentials, not a bearer
+            # token - sending a bad Authorization header here gets this request
+            # itself rejected with 401, defeating the whole refresh.
+            response = await self.session.post(url, json=data, headers=self.json_header)
+            token = response.text
+        except httpx.HTTPError as e:
+            print(e)
+            return "FAILED"
 
         if token:
             self.token_src = "Egeria"
@@ -294,8 +384,7 @@ class BaseServerClient:
         A bearer token from another source can be set with the set_bearer_token() method.
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_egeria_bearer_token(user_id, password, new_password)
         )
         return response
@@ -353,8 +442,7 @@ class BaseServerClient:
         PyegeriaNotAuthorizedException
             The principle specified by the user_id does not have authorization for the requested action
         """
-        loop = asyncio.get_event_loop()
-        token = loop.run_until_complete(self._async_refresh_egeria_bearer_token())
+        token = self._run_sync(self._async_refresh_egeria_bearer_token())
         return token
 
     def set_bearer_token(self, token: str, source: str="Egeria") -> None:
@@ -412,8 +500,7 @@ class BaseServerClient:
         str
             The platform origin string if reachable, otherwise an empty string.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self.async_get_platform_origin())
+        response = self._run_sync(self.async_get_platform_origin())
         return response
 
     def make_request(
@@ -455,17 +542,8 @@ class BaseServerClient:
         """
         if timeout is None:
             timeout = self.timeout
-        try:
-            loop = asyncio.get_running_loop()
-            if loop.is_running():
-                coro = self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout)
-                return asyncio.run_coroutine_threadsafe(coro, loop).result()
-            else:
-                return loop.run_until_complete(
-                    self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout))
-        except RuntimeError:
-            # No running loop exists; run the coroutine
-            return asyncio.run(self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout))
+        return self._run_sync(
+            self._async_make_request(request_type, endpoint, payload, is_json, params, timeout=timeout))
 
 
     async def _async_make_request(
@@ -477,6 +555,8 @@ class BaseServerClient:
             params: dict | None = None,
             *,
             timeout: int = None,
+            idempotent: bool = None,
+            json_subtree: tuple[str, ...] = None,
             _retry_on_auth: bool = True,
     ) -> Response | str:
         """Make an asynchronous request to the Egeria API.
@@ -495,6 +575,14 @@ class BaseServerClient:
             Query parameters for the request.
         timeout : int, optional
             The timeout for the request in seconds.
+        idempotent : bool, optional
+            Whether re-sending the request is harmless. Defaults to True for GET/DELETE and
+            False otherwise; read-only POSTs (finds, lookups) pass True so that timeouts and
+            502/504 responses are retried under the client's `retry_policy`.
+        json_subtree : tuple[str, ...], optional
+            Decode only these members of a successful JSON response (plus relatedHTTPCode) -
+            e.g. `_json.RESULT_KEYS` for callers that read just the elements. `response.json()`
+            then returns the trimmed document. Default: the whole body.
         _retry_on_auth : bool, internal use only
             Whether a 401 response is eligible for one transparent
             re-authenticate-and-retry attempt using this client's stored
@@ -528,24 +616,29 @@ class BaseServerClient:
         context['class name'] = __class__.__name__
         context['caller method'] = inspect.currentframe().f_back.f_code.co_name
         response: Response = None  # Initialize to None to avoid UnboundLocalError
+        # Read-only POSTs pass idempotent=True; anything else that is not a GET may change metadata.
+        is_write = request_type != "GET" and not idempotent
 
-        try:
+        # Reading the session first re-acquires this client's platform key after close_session().
+        session = self.session
+        breaker = self._session_pool.circuit_breaker(self._session_key)
+
+        async def send() -> Response:
             if request_type == "GET":
-                response = await self.session.get(
+                return await session.get(
                     endpoint, params=params, headers=self.headers, timeout=timeout,
                 )
-
             elif request_type == "POST":
                 if payload is None:
-                    response = await self.session.post(
+                    return await session.post(
                         endpoint, headers=self.headers, timeout=timeout, params = params
                     )
                 elif type(payload) is dict:
-                    response = await self.session.post(
-                        endpoint, json=payload, headers=self.headers, timeout=timeout
+                    return await session.post(
+                        endpoint, content=_json.dumps(payload), headers=self.headers, timeout=timeout
                     )
                 elif type(payload) is str:
-                    response = await self.session.post(
+                    return await session.post(
                         endpoint,
                         headers=self.headers,
                         content=payload,
@@ -554,18 +647,25 @@ class BaseServerClient:
                     )
                 else:
                     raise TypeError(f"Invalid payload type {type(payload)}")
-
-
             elif request_type == "POST-DATA":
-                if True:
-                    response = await self.session.post(
-                        endpoint, headers=self.headers, data=payload, timeout=timeout
-                    )
+                return await session.post(
+                    endpoint, headers=self.headers, data=payload, timeout=timeout
+                )
             elif request_type == "DELETE":
-                if True:
-                    response = await self.session.delete(
-                        endpoint, headers=self.headers, timeout=timeout
-                    )
+                return await session.delete(
+                    endpoint, headers=self.headers, timeout=timeout
+                )
+            raise TypeError(f"Invalid request type {request_type}")
+
+        try:
+            # Transient failures (see _retry.py) are retried here; the handlers below see the last attempt.
+            response = await send_with_retry(
+                send, self.retry_policy, breaker,
+                idempotent=self.retry_policy.is_idempotent(request_type, idempotent),
+                endpoint=endpoint, context=context,
+            )
+            # Any HTTP response proves the platform is up - lets lazy/eager checks skip the probe.
+            self._session_pool.mark_reachable(self._session_key)
             response.raise_for_status()
 
             status_code = response.status_code
@@ -601,7 +701,8 @@ class BaseServerClient:
                 if new_token and new_token != "FAILED":
                     return await self._async_make_request(
                         request_type, endpoint, payload, is_json, params,
-                        timeout=timeout, _retry_on_auth=False,
+                        timeout=timeout, idempotent=idempotent, json_subtree=json_subtree,
+                        _retry_on_auth=False,
                     )
 
             additional_info = {"userid": self.user_id}
@@ -612,6 +713,9 @@ class BaseServerClient:
                 raise PyegeriaUnauthorizedException(response, context, additional_info, e)
             raise PyegeriaClientException(response, context, additional_info, e)
 
+        except PyegeriaException:
+            raise
+
         except Exception as e:
             additional_info = {"userid": self.user_id}
             if response is not None:
@@ -623,11 +727,16 @@ class BaseServerClient:
         if status_code in (200, 201):
             try:
                 if is_json:
-                    json_response = response.json()
+                    # Decoded once; the caller's response.json() reuses the result.
+                    json_response = _json.decode_response(response, json_subtree)
                     related_http_code = json_response.get("relatedHTTPCode", 0)
                     if related_http_code == 200:
+                        if is_write:
+                            self._after_write(endpoint)
                         return response
-                    elif related_http_code == 404:
+                    if json_subtree is not None:
+                        json_response = _json.decode_response(response)    # errors report the whole body
+                    if related_http_code == 404:
                         raise PyegeriaNotFoundException(response, context, additional_info=json_response)
                     elif related_http_code in (401, 403):
                         raise PyegeriaUnauthorizedException(response, context, additional_info=json_response)
@@ -635,6 +744,8 @@ class BaseServerClient:
                         raise PyegeriaAPIException(response, context, additional_info=json_response)
 
                 else:  # Not JSON - Text?
+                    if is_write:
+                        self._after_write(endpoint)
                     return response
 
 
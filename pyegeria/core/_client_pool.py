@@ -0,0 +1,159 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Pool of authenticated clients for repeated report execution.
+
+exec_report_spec() and the analytic report paths used to construct a new client, log in
+for a fresh bearer token and close the client again for every report run - so a dashboard
+rendering a dozen report panels paid a dozen client constructions and token logins. A
+ClientPool keeps one ready client per (client class, view server, platform URL, user) and
+remembers when its token was issued:
+
+* a pooled client is reused while its token is younger than `token_ttl`; after that the token
+  is re-created before the client is handed out again (clients also refresh transparently
+  on a 401, so the TTL only needs to be a conservative estimate of the server's lifetime);
+* a different password for the same user replaces the pooled client - credentials are checked,
+  never assumed;
+* at most `max_clients` clients are kept; the least recently used one is closed to make room.
+
+HTTP connections are already shared per platform by the SessionPool, so a pooled client is
+cheap to keep and safe to use from any event loop.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+from pyegeria.core.config import runtime_setting
+
+PoolKey = tuple[type, str, str, str]
+
+
+@dataclass
+class _Entry:
+    client: Any
+    user_pwd: str
+    token_issued: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class ClientPool:
+    """
+    Reusable, authenticated clients keyed by (client class, view server, platform URL, user).
+
+    Parameters
+    ----------
+    token_ttl : float, optional
+        Seconds a bearer token is reused before it is re-created. Defaults to the
+        `client_pool_token_ttl` Runtime setting (PYEGERIA_CLIENT_POOL_TOKEN_TTL).
+    max_clients : int, optional
+        Clients kept at once. Defaults to `client_pool_size` (PYEGERIA_CLIENT_POOL_SIZE).
+    """
+
+    def __init__(self, token_ttl: float = None, max_clients: int = None):
+        self.token_ttl = float(runtime_setting("client_pool_token_ttl", 1800.0) if token_ttl is None else token_ttl)
+        self.max_clients = max(1, int(max_clients or runtime_setting("client_pool_size", 16)))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[PoolKey, _Entry] = OrderedDict()
+
+    def __repr__(self):
+        return f"ClientPool(clients={len(self._entries)}, max_clients={self.max_clients}, token_ttl={self.token_ttl})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, client_class: type, view_server: str, platform_url: str, user_id: str, user_pwd: str) -> Any:
+        """Return a pooled `client_class` instance holding a live bearer token, logging in if needed."""
+        entry = self._entry(client_class, view_server, platform_url, user_id, user_pwd)
+        with entry.lock:
+            if self._token_stale(entry):
+                self._issued(entry, entry.client.create_egeria_bearer_token(user_id, user_pwd))
+        return entry.client
+
+    async def aget(self, client_class: type, view_server: str, platform_url: str, user_id: str,
+                   user_pwd: str) -> Any:
+        """Return a pooled `client_class` instance holding a live bearer token. Async version."""
+        entry = self._entry(client_class, view_server, platform_url, user_id, user_pwd)
+        if self._token_stale(entry):
+            self._issued(entry, await entry.client._async_create_egeria_bearer_token(user_id, user_pwd))
+        return entry.client
+
+    def discard(self, client: Any) -> None:
+        """Drop `client` from the pool (e.g. after its credentials were rejected) and close it."""
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.client is client]
+            entries = [self._entries.pop(key) for key in keys]
+        for entry in entries:
+            self._close(entry)
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            self._close(entry)
+
+    #
+    #   Internals
+    #
+
+    def _entry(self, client_class: type, view_server: str, platform_url: str, user_id: str,
+               user_pwd: str) -> _Entry:
+        key = (client_class, view_server, platform_url, user_id)
+        evicted = []
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.user_pwd != user_pwd:
+                evicted.append(self._entries.pop(key))
+                entry = None
+            if entry is None:
+                client = client_class(view_server, platform_url, user_id=user_id, user_pwd=user_pwd)
+                entry = self._entries[key] = _Entry(client, user_pwd)
+                while len(self._entries) > self.max_clients:
+                    evicted.append(self._entries.popitem(last=False)[1])
+            else:
+                self._entries.move_to_end(key)
+        for old in evicted:
+            self._close(old)
+        return entry
+
+    @staticmethod
+    def _issued(entry: _Entry, token: str) -> None:
+        # The token helpers report transport failures as "FAILED" rather than raising; retry next time.
+        entry.token_issued = time.monotonic() if token and token != "FAILED" else 0.0
+
+    def _token_stale(self, entry: _Entry) -> bool:
+        return not entry.token_issued or time.monotonic() - entry.token_issued >= self.token_ttl
+
+    @staticmethod
+    def _close(entry: _Entry) -> None:
+        try:
+            entry.client.close_session()
+        except Exception as e:  # noqa: BLE001 -- best effort; connections belong to the SessionPool anyway
+            logger.debug(f"Could not close pooled client cleanly: {e}")
+
+
+_default_client_pool: ClientPool | None = None
+_default_client_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide ClientPool, creating it on first use."""
+    global _default_client_pool
+    with _default_client_pool_lock:
+        if _default_client_pool is None:
+            _default_client_pool = ClientPool()
+        return _default_client_pool
+
+
+def set_client_pool(pool: ClientPool | None) -> None:
+    """Replace the process-wide ClientPool (None resets it to a fresh default on next use)."""
+    global _default_client_pool
+    with _default_client_pool_lock:
+        _default_client_pool = pool
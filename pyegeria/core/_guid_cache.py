@@ -0,0 +1,206 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Name -> GUID resolution cache for ServerClient.__async_get_guid__.
+
+Resolving a name costs a round-trip to `classification-explorer/elements/guid-by-unique-name`,
+and Dr.Egeria resolves every referenced name in every command - often twice (a typed lookup,
+then an untyped one) and again when a validated file is re-run with `process`. A GuidCache
+remembers each answer, keyed by (view server, user, property name, type name, property value) -
+what a name resolves to depends on what the requesting user may see:
+
+* an in-memory LRU bounded by `maxsize`, with entries expiring after `ttl` seconds;
+* negative results ("no element with that name") are cached too, but only for the much
+  shorter `negative_ttl`, so a name created elsewhere soon becomes resolvable;
+* optionally an SQLite file (`path`) backs the positive entries, so resolved GUIDs are shared
+  between runs and processes. Negative entries are never persisted.
+
+The SessionPool holds one cache shared by every client using it, so an element created or
+deleted through one client is seen by all of them: every successful write made through
+`_async_make_request` (any request that is neither a GET nor marked idempotent) drops the
+cached negative results for that server, and every name cached for a GUID in its URL.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from loguru import logger
+
+from pyegeria.core._globals import NO_ELEMENTS_FOUND
+from pyegeria.core.config import runtime_setting
+
+# (view server, user id, property name, type name, property value)
+GuidKey = tuple[str, str, str, str, str]
+
+
+class GuidCache:
+    """
+    LRU + TTL cache of name -> GUID resolutions, optionally backed by SQLite.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Entries kept in memory. Defaults to `guid_cache_size` (PYEGERIA_GUID_CACHE_SIZE).
+    ttl : float, optional
+        Seconds a resolved GUID is trusted. Defaults to `guid_cache_ttl`.
+    negative_ttl : float, optional
+        Seconds a "not found" result is trusted. Defaults to `guid_cache_negative_ttl`.
+    path : str, optional
+        SQLite file for sharing resolved GUIDs between runs. Defaults to `guid_cache_path`;
+        empty keeps the cache in memory only.
+    """
+
+    def __init__(self, maxsize: int = None, ttl: float = None, negative_ttl: float = None, path: str = None):
+        self.maxsize = max(1, int(maxsize or runtime_setting("guid_cache_size", 4096)))
+        self.ttl = float(runtime_setting("guid_cache_ttl", 600.0) if ttl is None else ttl)
+        self.negative_ttl = float(runtime_setting("guid_cache_negative_ttl", 30.0) if negative_ttl is None else negative_ttl)
+        self.path = runtime_setting("guid_cache_path", "") if path is None else path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[GuidKey, tuple[str | None, float]] = OrderedDict()
+        self._by_guid: dict[str, set[GuidKey]] = {}
+        self._db: sqlite3.Connection | None = None
+        if self.path:
+            self._db = self._open_db(os.path.expanduser(self.path))
+
+    def __repr__(self):
+        return (f"GuidCache(size={len(self._entries)}, maxsize={self.maxsize}, ttl={self.ttl}, "
+                f"negative_ttl={self.negative_ttl}, path={self.path!r})")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: GuidKey) -> str | None:
+        """
+        Return the cached GUID for `key`, NO_ELEMENTS_FOUND for a cached miss, or None if the
+        cache has no live answer.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                self._drop(key)
+                entry = None
+            if entry is None and self._db is not None:
+                entry = self._db_lookup(key, now)
+                if entry is not None:
+                    self._put(key, *entry)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0] or NO_ELEMENTS_FOUND
+
+    def store(self, key: GuidKey, guid: str | None) -> None:
+        """Remember the answer for `key`; a falsy guid or NO_ELEMENTS_FOUND is cached as a miss."""
+        if not guid or guid == NO_ELEMENTS_FOUND:
+            guid, expires = None, time.time() + self.negative_ttl
+        else:
+            expires = time.time() + self.ttl
+        with self._lock:
+            self._put(key, guid, expires)
+            if guid is not None and self._db is not None:
+                self._db_execute("INSERT OR REPLACE INTO guid_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                 (*key, guid, expires))
+
+    def invalidate_guid(self, *guids: str) -> None:
+        """Forget every name cached as resolving to any of `guids` (the element was deleted or renamed)."""
+        guids = tuple(guid for guid in guids if guid)
+        if not guids:
+            return
+        with self._lock:
+            for guid in guids:
+                for key in list(self._by_guid.get(guid, ())):
+                    self._drop(key)
+            if self._db is not None:
+                self._db_execute(f"DELETE FROM guid_cache WHERE guid IN ({', '.join('?' * len(guids))})", guids)
+
+    def invalidate_guids_in(self, url: str) -> None:
+        """Forget names cached for any GUID appearing as a path segment of `url`."""
+        self.invalidate_guid(*url.split("?", 1)[0].split("/"))
+
+    def invalidate_negative(self, server: str = None) -> None:
+        """Forget cached misses - for `server` only, if given - since a new element may now match."""
+        with self._lock:
+            stale = [key for key, (guid, _) in self._entries.items()
+                     if guid is None and (server is None or key[0] == server)]
+            for key in stale:
+                self._drop(key)
+
+    def clear(self) -> None:
+        """Empty the cache, including its SQLite backing."""
+        with self._lock:
+            self._entries.clear()
+            self._by_guid.clear()
+            if self._db is not None:
+                self._db_execute("DELETE FROM guid_cache", ())
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size, for diagnostics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    #
+    #   Internals - callers hold the lock
+    #
+
+    def _put(self, key: GuidKey, guid: str | None, expires: float) -> None:
+        if key in self._entries:
+            self._drop(key)
+        self._entries[key] = (guid, expires)
+        if guid is not None:
+            self._by_guid.setdefault(guid, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: GuidKey) -> None:
+        guid, _ = self._entries.pop(key)
+        if guid is not None:
+            keys = self._by_guid.get(guid)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_guid[guid]
+
+    @staticmethod
+    def _open_db(path: str) -> sqlite3.Connection | None:
+        try:
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            columns = [row[1] for row in db.execute("PRAGMA table_info(guid_cache)")]
+            if columns and "user_id" not in columns:    # written before entries were scoped by user
+                db.execute("DROP TABLE guid_cache")
+            db.execute("CREATE TABLE IF NOT EXISTS guid_cache (server TEXT, user_id TEXT, property_name TEXT, "
+                       "type_name TEXT, value TEXT, guid TEXT, expires REAL, "
+                       "PRIMARY KEY (server, user_id, property_name, type_name, value))")
+            db.execute("CREATE INDEX IF NOT EXISTS guid_cache_guid ON guid_cache (guid)")
+            db.execute("DELETE FROM guid_cache WHERE expires <= ?", (time.time(),))
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"GUID cache file '{path}' unavailable ({e}); caching in memory only")
+            return None
+
+    def _db_lookup(self, key: GuidKey, now: float) -> tuple[str, float] | None:
+        try:
+            row = self._db.execute("SELECT guid, expires FROM guid_cache WHERE server = ? AND user_id = ? "
+                                   "AND property_name = ? AND type_name = ? AND value = ? AND expires > ?", (*key, now)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"GUID cache read failed: {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def _db_execute(self, sql: str, params: tuple) -> None:
+        try:
+            self._db.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.debug(f"GUID cache write failed: {e}")
@@ -0,0 +1,164 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+JSON encoding and decoding of request and response bodies.
+
+Large find responses (tens of MB) used to spend more time in JSON handling than on the
+wire: dict payloads went through httpx's stdlib `json=` encoding, and each response was
+decoded by `_async_make_request` (to check `relatedHTTPCode`) and then again by every
+`response.json()` the caller made. This module gives one pluggable path for both:
+
+* the backend is orjson or msgspec when installed, else the standard library
+  (`json_backend` / PYEGERIA_JSON_BACKEND: "auto", "orjson", "msgspec" or "json");
+* `dumps()` writes compact UTF-8 bytes - no pretty-printing;
+* `decode_response()` decodes a response body once and hands the result to later
+  `response.json()` calls; and
+* `loads_subtree()` keeps only `relatedHTTPCode` and the result keys (`elements`,
+  `element`, `elementGraph`). With msgspec the other members are skipped without being
+  built at all; the other backends drop them straight after decoding.
+"""
+
+import functools
+import json
+import threading
+from collections.abc import Iterable
+from typing import Any, Callable
+
+from loguru import logger
+
+from pyegeria.core.config import runtime_setting
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+# The members of a response envelope that find/get helpers actually read.
+RESULT_KEYS = ("elements", "element", "elementGraph")
+
+_codec: tuple[str, Callable[[Any], bytes], Callable[[bytes | str], Any]] | None = None
+_lock = threading.Lock()
+
+
+def _decode_error(e: Exception, data: bytes | str) -> json.JSONDecodeError:
+    text = data.decode("utf-8", "replace") if isinstance(data, (bytes, bytearray)) else str(data)
+    return json.JSONDecodeError(str(e), text, 0)
+
+
+def _stdlib_codec():
+    def dumps(obj: Any) -> bytes:
+        # Same output as httpx's `json=` encoding.
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    return dumps, json.loads
+
+
+def _orjson_codec():
+    import orjson
+
+    # orjson.JSONDecodeError is a json.JSONDecodeError already.
+    return orjson.dumps, orjson.loads
+
+
+def _msgspec_codec():
+    import msgspec
+
+    encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise _decode_error(e, data) from e
+
+    return encoder.encode, loads
+
+
+_FACTORIES = {"orjson": _orjson_codec, "msgspec": _msgspec_codec, "json": _stdlib_codec}
+
+
+def _load_codec() -> tuple[str, Callable, Callable]:
+    global _codec
+    with _lock:
+        if _codec is None:
+            wanted = str(runtime_setting("json_backend", "auto") or "auto").lower()
+            candidates = BACKENDS if wanted == "auto" else (wanted, "json")
+            for name in candidates:
+                factory = _FACTORIES.get(name)
+                if factory is None:
+                    logger.warning(f"Unknown json_backend {name!r}; expected auto or one of {', '.join(BACKENDS)}")
+                    continue
+                try:
+                    _codec = (name, *factory())
+                    break
+                except ImportError:
+                    if wanted != "auto":
+                        logger.warning(f"json_backend {name!r} is not installed; using the standard library")
+        return _codec
+
+
+def backend() -> str:
+    """Name of the JSON backend in use ("orjson", "msgspec" or "json")."""
+    return _load_codec()[0]
+
+
+def reset() -> None:
+    """Choose the backend again on next use (after changing `json_backend`)."""
+    global _codec
+    with _lock:
+        _codec = None
+    _subtree_decoder.cache_clear()
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode `obj` as compact UTF-8 JSON."""
+    return _load_codec()[1](obj)
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document. Malformed input raises json.JSONDecodeError whatever the backend."""
+    return _load_codec()[2](data)
+
+
+@functools.lru_cache(maxsize=16)
+def _subtree_decoder(keys: tuple[str, ...]) -> Callable[[bytes | str], Any]:
+    import msgspec
+
+    names = tuple(dict.fromkeys(("relatedHTTPCode", *keys)))
+    envelope = msgspec.defstruct("Envelope", [(name, Any, msgspec.UNSET) for name in names])
+    decoder = msgspec.json.Decoder(envelope)
+
+    def decode(data: bytes | str) -> Any:
+        try:
+            doc = decoder.decode(data)
+        except msgspec.ValidationError:
+            return loads(data)              # not an object - nothing to trim
+        except msgspec.DecodeError as e:
+            raise _decode_error(e, data) from e
+        return {name: value for name in names if (value := getattr(doc, name)) is not msgspec.UNSET}
+
+    return decode
+
+
+def loads_subtree(data: bytes | str, keys: Iterable[str] = RESULT_KEYS) -> Any:
+    """
+    Decode a response envelope keeping only `relatedHTTPCode` and the members named in `keys`.
+
+    Members that are absent stay absent, so `doc.get("elements", NO_ELEMENTS_FOUND)` behaves as
+    on the full document. A body that is not a JSON object is returned whole.
+    """
+    keys = tuple(keys)
+    if backend() == "msgspec":
+        return _subtree_decoder(keys)(data)
+    doc = loads(data)
+    if not isinstance(doc, dict):
+        return doc
+    return {name: doc[name] for name in ("relatedHTTPCode", *keys) if name in doc}
+
+
+def decode_response(response, subtree: Iterable[str] | None = None) -> Any:
+    """
+    Decode an httpx response body (whole, or only `subtree` - see loads_subtree) and make
+    `response.json()` return that document instead of decoding the body again.
+    """
+    data = loads(response.content) if subtree is None else loads_subtree(response.content, subtree)
+    response.json = lambda **kwargs: data
+    return data
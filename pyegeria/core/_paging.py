@@ -0,0 +1,281 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Generic paging over pyegeria's find/get request helpers.
+
+Every `_async_find_*` / `_async_get_*` method returns a single page; callers that need the
+whole result set used to write their own `while True` loops. `aiter_find()` streams the
+elements of any such method page by page instead, holding at most two pages in memory
+(the one being consumed and, with `prefetch`, the next one in flight).
+
+Paging follows Egeria's contract
+(https://egeria-project.org/guides/developer/finding-metadata/overview/#paging): a short
+but non-empty page does NOT mean the result set is exhausted - server-side filtering can
+shorten any page - so the offset always advances by the requested page size and only an
+empty page (or NO_ELEMENTS_FOUND) ends the iteration.
+
+Two paging channels are supported, matching the two conventions in the client:
+
+* methods taking `start_from` / `page_size` keyword arguments (most find/get helpers), and
+* methods whose request body carries `startFrom` / `pageSize` (a `body` dict or
+  ResultsRequestBody-derived model, e.g. MetadataExpert.find_metadata_elements). When a body
+  is supplied it always wins, because the helpers send a caller's body as-is.
+
+For large result sets `concurrency` keeps several consecutive pages in flight so a full
+export is bound by server throughput rather than round-trip latency; find methods decorated
+with `concurrent_pageable` expose this as an opt-in `concurrent_pages=N` keyword.
+"""
+
+import asyncio
+import functools
+import inspect
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+from loguru import logger
+from pydantic import BaseModel
+
+from pyegeria.core._exceptions import PyegeriaInvalidParameterException
+from pyegeria.core._globals import NO_ELEMENTS_FOUND, max_paging_size
+from pyegeria.core._sync_runtime import run_sync
+
+FetchPage = Callable[[int, int], Awaitable[Any]]
+
+
+def _page_elements(page: Any) -> list:
+    """Normalise one page result to a list; anything that isn't a non-empty list ends paging."""
+    if isinstance(page, list):
+        return page
+    if isinstance(page, dict):
+        elements = page.get("elements")
+        if isinstance(elements, list):
+            return elements
+    return []
+
+
+def _guid_of(element: Any) -> Any:
+    if isinstance(element, dict):
+        return (element.get("elementHeader") or {}).get("guid") or element.get("guid")
+    return None
+
+
+def _with_paging(body: Any, start_from: int, page_size: int) -> Any:
+    if isinstance(body, BaseModel):
+        fields = type(body).model_fields
+        if "start_from" in fields and "page_size" in fields:
+            return body.model_copy(update={"start_from": start_from, "page_size": page_size})
+        raise TypeError(f"{type(body).__name__} has no start_from/page_size fields to page with")
+    return {**body, "startFrom": start_from, "pageSize": page_size}
+
+
+def page_fetcher(find: Callable[..., Awaitable[Any]], *args, **kwargs) -> FetchPage:
+    """
+    Adapt an async find/get method and its arguments into a `fetch(start_from, page_size)` coroutine.
+
+    Parameters
+    ----------
+    find : Callable
+        An async client method such as `client._async_find_collections`.
+    *args, **kwargs
+        Arguments for `find`, other than the paging ones.
+
+    Returns
+    -------
+    Callable[[int, int], Awaitable]
+        Coroutine function returning one raw page.
+
+    Raises
+    ------
+    TypeError
+        If `find` accepts neither `start_from`/`page_size` nor a request `body`.
+    """
+    params = inspect.signature(find).parameters
+    bound = inspect.signature(find).bind_partial(*args, **kwargs).arguments
+    body = bound.get("body")
+    if "output_format" in params and "output_format" not in bound:
+        kwargs["output_format"] = "JSON"
+
+    if isinstance(body, (dict, BaseModel)):
+        # The body may have been given positionally; re-bind so it can be replaced by name.
+        positional = list(params)[:len(args)]
+
+        async def fetch(start_from: int, page_size: int) -> Any:
+            call = dict(zip(positional, args), **kwargs)
+            call["body"] = _with_paging(body, start_from, page_size)
+            return await find(**call)
+
+        return fetch
+
+    if "start_from" in params and "page_size" in params:
+        async def fetch(start_from: int, page_size: int) -> Any:
+            return await find(*args, **kwargs, start_from=start_from, page_size=page_size)
+
+        return fetch
+
+    raise TypeError(f"{getattr(find, '__qualname__', find)} does not support paging "
+                    f"(no start_from/page_size parameters and no request body given)")
+
+
+async def aiter_pages(fetch: FetchPage, *, page_size: int = None, start_from: int = 0,
+                      prefetch: bool = True, concurrency: int = 1) -> AsyncIterator[list]:
+    """
+    Yield successive non-empty pages from `fetch(start_from, page_size)` until an empty page.
+
+    With `prefetch`, the request for page N+1 is issued before page N is handed to the caller,
+    so the caller's processing overlaps the next round-trip. With `concurrency` > 1, that many
+    consecutive offsets are kept in flight at once - a sliding window, so at most `concurrency`
+    requests are ever outstanding - and pages are still yielded in offset order. The first
+    empty page ends the iteration and cancels the requests queued beyond it, as does the caller
+    stopping early.
+    """
+    page_size = min(page_size or max_paging_size, max_paging_size)
+    ahead = concurrency if concurrency > 1 else int(prefetch)
+    window: deque[tuple[int, asyncio.Task]] = deque()
+    next_offset = start_from
+
+    def launch() -> None:
+        nonlocal next_offset
+        window.append((next_offset, asyncio.ensure_future(fetch(next_offset, page_size))))
+        next_offset += page_size
+
+    previous_guids = None
+    try:
+        for _ in range(max(1, ahead)):
+            launch()
+        while window:
+            offset, task = window.popleft()
+            page = _page_elements(await task)
+            if not page:
+                return
+            guids = [_guid_of(el) for el in page]
+            if guids == previous_guids and any(guids):
+                # A server ignoring startFrom would otherwise loop forever.
+                logger.warning(f"Paging stopped at startFrom={offset}: the server returned the previous page again")
+                return
+            previous_guids = guids
+            while len(window) < ahead:
+                launch()
+            yield page
+            if not window:
+                launch()
+    finally:
+        unfinished = [task for _, task in window if not task.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+
+async def aiter_find(find: Callable[..., Awaitable[Any]], *args, page_size: int = None, start_from: int = 0,
+                     prefetch: bool = True, concurrency: int = 1, max_elements: int = None,
+                     **kwargs) -> AsyncIterator[Any]:
+    """
+    Stream every element returned by an async find/get method, page by page.
+
+    Parameters
+    ----------
+    find : Callable
+        An async client method such as `client._async_find_collections`.
+    *args, **kwargs
+        Passed to `find` on every call, apart from the paging parameters.
+    page_size : int, optional
+        Elements per request; defaults to and is capped at `max_paging_size`.
+    start_from : int, default 0
+        Offset of the first element.
+    prefetch : bool, default True
+        Request the next page while the current one is being consumed.
+    concurrency : int, default 1
+        Number of page requests kept in flight at once; pages are still yielded in order.
+    max_elements : int, optional
+        Stop after yielding this many elements.
+    """
+    count = 0
+    pages = aiter_pages(page_fetcher(find, *args, **kwargs), page_size=page_size,
+                        start_from=start_from, prefetch=prefetch, concurrency=concurrency)
+    try:
+        async for page in pages:
+            for element in page:
+                yield element
+                count += 1
+                if max_elements is not None and count >= max_elements:
+                    return
+    finally:
+        await pages.aclose()
+
+
+def iter_find(find: Callable[..., Awaitable[Any]], *args, **kwargs) -> Iterator[Any]:
+    """Synchronous version of aiter_find(), advanced one element at a time on the SyncRuntime."""
+    elements = aiter_find(find, *args, **kwargs)
+    try:
+        while True:
+            try:
+                yield run_sync(elements.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(elements.aclose())
+
+
+def _named_arguments(find: Callable[..., Any], args: tuple, kwargs: dict) -> dict:
+    bound = inspect.signature(find).bind_partial(*args, **kwargs)
+    named = {}
+    for name, value in bound.arguments.items():
+        if bound.signature.parameters[name].kind is inspect.Parameter.VAR_KEYWORD:
+            named.update(value)
+        else:
+            named[name] = value
+    return named
+
+
+async def find_all_concurrent(find: Callable[..., Awaitable[Any]], *args, concurrency: int = 4,
+                              **kwargs) -> list | str:
+    """
+    Fetch a complete result set with `concurrency` page requests in flight, reassembled in order.
+
+    The caller's `start_from` / `page_size` (or the request body's startFrom/pageSize) give the
+    first offset and the size of each page request. Returns the JSON elements, or
+    NO_ELEMENTS_FOUND if there are none.
+
+    Raises
+    ------
+    PyegeriaInvalidParameterException
+        If an output format other than JSON is requested - pages are assembled from raw elements.
+    """
+    named = _named_arguments(find, args, kwargs)
+    output_format = named.get("output_format") or "JSON"
+    if output_format.upper() != "JSON":
+        raise PyegeriaInvalidParameterException(
+            additional_info={"reason": f"concurrent_pages requires output_format='JSON', not '{output_format}'"})
+
+    # Finders such as find_collections take a body and start_from/page_size together; the
+    # body's values win when set, and the keywords must not reach aiter_find a second time.
+    start_from, page_size = named.pop("start_from", 0), named.pop("page_size", 0)
+    body = named.get("body")
+    if isinstance(body, BaseModel) and "start_from" in type(body).model_fields:
+        start_from = start_from if body.start_from is None else body.start_from
+        page_size = page_size if body.page_size is None else body.page_size
+    elif isinstance(body, dict):
+        start_from, page_size = body.get("startFrom", start_from), body.get("pageSize", page_size)
+
+    elements = [el async for el in aiter_find(find, page_size=page_size, start_from=start_from or 0,
+                                              concurrency=concurrency, **named)]
+    return elements or NO_ELEMENTS_FOUND
+
+
+def concurrent_pageable(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Decorator giving an async find method an opt-in `concurrent_pages=N` keyword.
+
+    When N > 1 the method returns the complete result set, fetched by find_all_concurrent() with
+    N page requests in flight; otherwise the call is passed through unchanged.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args, concurrent_pages: int = 0, **kwargs):
+        if not concurrent_pages or concurrent_pages < 2:
+            return await func(self, *args, **kwargs)
+        return await find_all_concurrent(functools.partial(func, self), *args,
+                                         concurrency=concurrent_pages, **kwargs)
+
+    return wrapper
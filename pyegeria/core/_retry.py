@@ -0,0 +1,242 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Retry policy and circuit breaker used by the base clients' _async_make_request.
+
+A RetryPolicy decides whether a failed attempt may be re-sent and how long to wait first:
+exponential backoff with full jitter, honouring a server's Retry-After header. It is
+idempotence aware - a request the server may already have acted on (a read timeout or a
+502/504 on a create/update POST) is only retried when the caller marks it idempotent, while
+failures that prove the request never reached Egeria (connect errors, pool timeouts, 429,
+503) are safe to retry for any method.
+
+A CircuitBreaker is kept per platform by the SessionPool, so every client talking to the same
+view server shares it. After `failure_threshold` consecutive transport failures or overload
+responses it opens and requests fail fast with a PyegeriaConnectionException for
+`reset_timeout` seconds; then a single trial request is let through (half-open) and its
+outcome closes or re-opens the circuit. Ordinary Egeria errors (4xx, 500) count as the
+server being alive.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+
+import httpcore
+import httpx
+from httpx import Response
+from loguru import logger
+
+from pyegeria.core._exceptions import PyegeriaConnectionException
+from pyegeria.core.config import runtime_setting
+
+
+# Failures where the request provably never reached the server.
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpcore.ConnectError)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How _async_make_request retries transient failures.
+
+    Parameters
+    ----------
+    max_attempts : int
+        Total attempts including the first; 1 disables retries.
+    backoff_base : float
+        Seconds; the cap of the jittered delay doubles from this on every attempt.
+    backoff_max : float
+        Upper bound in seconds on any single delay, including one taken from Retry-After.
+    retry_statuses : frozenset[int]
+        HTTP statuses treated as transient overload.
+    always_safe_statuses : frozenset[int]
+        Subset of `retry_statuses` meaning the server refused the request unprocessed,
+        so it is retried even for non-idempotent calls.
+    idempotent_methods : frozenset[str]
+        Request types assumed idempotent when the caller doesn't say.
+    """
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    retry_statuses: frozenset = field(default_factory=lambda: frozenset({429, 502, 503, 504}))
+    always_safe_statuses: frozenset = field(default_factory=lambda: frozenset({429, 503}))
+    idempotent_methods: frozenset = field(default_factory=lambda: frozenset({"GET", "DELETE"}))
+
+    @classmethod
+    def from_settings(cls) -> "RetryPolicy":
+        """Build a policy from the `retry_*` Runtime settings (PYEGERIA_RETRY_* env vars)."""
+        return cls(
+            max_attempts=max(1, int(runtime_setting("retry_max_attempts", 3))),
+            backoff_base=float(runtime_setting("retry_backoff_base", 0.5)),
+            backoff_max=float(runtime_setting("retry_backoff_max", 10.0)),
+        )
+
+    def is_idempotent(self, request_type: str, idempotent: bool | None) -> bool:
+        return request_type in self.idempotent_methods if idempotent is None else idempotent
+
+    def should_retry_error(self, e: Exception, attempt: int, idempotent: bool) -> bool:
+        """Whether a transport error on `attempt` (0-based) may be retried."""
+        if attempt + 1 >= self.max_attempts:
+            return False
+        return isinstance(e, _NOT_SENT_ERRORS) or idempotent
+
+    def should_retry_status(self, status_code: int, attempt: int, idempotent: bool) -> bool:
+        """Whether an HTTP status on `attempt` (0-based) may be retried."""
+        if attempt + 1 >= self.max_attempts or status_code not in self.retry_statuses:
+            return False
+        return status_code in self.always_safe_statuses or idempotent
+
+    def backoff(self, attempt: int, retry_after: str | None = None) -> float:
+        """Seconds to wait before the retry following `attempt`; Retry-After wins when present."""
+        hinted = _parse_retry_after(retry_after)
+        if hinted is not None:
+            return min(hinted, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one platform.
+
+    Parameters
+    ----------
+    failure_threshold : int
+        Consecutive failures that open the circuit. Defaults to `circuit_failure_threshold`.
+    reset_timeout : float
+        Seconds the circuit stays open before a trial request. Defaults to `circuit_reset_timeout`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = None, reset_timeout: float = None):
+        self.failure_threshold = max(1, int(failure_threshold or runtime_setting("circuit_failure_threshold", 5)))
+        self.reset_timeout = float(runtime_setting("circuit_reset_timeout", 30.0) if reset_timeout is None else reset_timeout)
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    def __repr__(self):
+        return f"CircuitBreaker(state={self.state}, failures={self._failures})"
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a trial request through (0 when not open)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now. In half-open state only one trial is admitted."""
+        with self._lock:
+            state = self.state
+            if state == self.CLOSED:
+                return True
+            if state == self.OPEN or self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def release_trial(self) -> None:
+        """Give back a half-open trial that ended without a verdict (cancelled, or a non-transport error)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"Circuit opened after {self._failures} consecutive failures; "
+                                   f"failing fast for {self.reset_timeout:.0f}s")
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+async def send_with_retry(
+        send: Callable[[], Awaitable[Response]],
+        policy: RetryPolicy,
+        breaker: CircuitBreaker,
+        *,
+        idempotent: bool,
+        endpoint: str,
+        context: dict,
+) -> Response:
+    """
+    Call `send` until it yields a response worth returning, applying `policy` and `breaker`.
+
+    Transport errors are re-raised once retries are exhausted, and a retryable status is
+    returned as-is, so the caller's normal exception mapping still applies to the final attempt.
+
+    Raises
+    ------
+    PyegeriaConnectionException
+        If the platform's circuit is open.
+    """
+    attempt = 0
+    while True:
+        if not breaker.allow():
+            additional_info = {
+                "endpoint": endpoint,
+                "error_kind": "circuit_open",
+                "reason": f"platform is failing; requests are suspended for another "
+                          f"{breaker.retry_in():.1f}s",
+            }
+            raise PyegeriaConnectionException(context, additional_info)
+        try:
+            response = await send()
+        except (httpx.TransportError, httpcore.ConnectError) as e:
+            breaker.record_failure()
+            if not policy.should_retry_error(e, attempt, idempotent):
+                raise
+            delay = policy.backoff(attempt)
+            reason = type(e).__name__
+        except BaseException:
+            breaker.release_trial()
+            raise
+        else:
+            if response.status_code not in policy.retry_statuses:
+                breaker.record_success()
+                return response
+            breaker.record_failure()
+            if not policy.should_retry_status(response.status_code, attempt, idempotent):
+                return response
+            delay = policy.backoff(attempt, response.headers.get("Retry-After"))
+            reason = f"HTTP {response.status_code}"
+        attempt += 1
+        logger.debug(f"{reason} from {endpoint}; retry {attempt}/{policy.max_attempts - 1} in {delay:.2f}s")
+        await asyncio.sleep(delay)
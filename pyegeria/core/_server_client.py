@@ -10,8 +10,9 @@ different client capabilities. It also provides the common methods used to make
 import asyncio
 import os
 import re
+import threading
 import time
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterator
 from datetime import datetime
 from typing import Any, Optional
 
@@ -19,11 +20,15 @@ from httpx import Response
 from loguru import logger
 from pydantic import TypeAdapter, ValidationError
 
+from pyegeria.core import _json
 from pyegeria.core._base_server_client import BaseServerClient
 from pyegeria.core._exceptions import (
     PyegeriaConnectionException, PyegeriaInvalidParameterException, PyegeriaException, PyegeriaErrorCode
 )
 from pyegeria.core._globals import max_paging_size, NO_ELEMENTS_FOUND, default_timeout, COMMENT_TYPES
+from pyegeria.core._guid_cache import GuidCache
+from pyegeria.core._paging import aiter_find, concurrent_pageable, iter_find
+from pyegeria.core.config import runtime_setting
 from pyegeria.view.base_report_formats import get_report_spec_match
 from pyegeria.view.base_report_formats import select_report_spec
 from pyegeria.models import (SearchStringRequestBody, FilterRequestBody, GetRequestBody, NewElementRequestBody,
@@ -114,6 +119,32 @@ __all__ = [
     # Exceptions
 
 
+class _SharedTypeAdapter:
+    """
+    Class attribute holding a pydantic TypeAdapter for `model`.
+
+    The adapter is built the first time it is read and then replaces this descriptor on the
+    owning class, so every client instance (and every EgeriaTech sub-client) shares one
+    adapter per process instead of compiling its own in `__init__`.
+    """
+
+    def __init__(self, model: type):
+        self.model = model
+        self.owner, self.name = None, None
+        self._lock = threading.Lock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.owner, self.name = owner, name
+
+    def __get__(self, instance, owner=None) -> TypeAdapter:
+        with self._lock:
+            adapter = self.owner.__dict__.get(self.name)
+            if isinstance(adapter, _SharedTypeAdapter):
+                adapter = TypeAdapter(self.model)
+                setattr(self.owner, self.name, adapter)
+        return adapter
+
+
 class ServerClient(BaseServerClient):
     """
     An abstract class used to establish connectivity for an Egeria Client
@@ -130,6 +161,9 @@ class ServerClient(BaseServerClient):
             when the user doesn't pass the user_id on a method call.
         user_pwd : str
             The password used to authenticate the server identity
+        guid_cache : GuidCache | bool
+            Cache for name -> GUID resolution. Defaults to the cache shared through the session pool
+            (see the guid_cache_* settings); pass False to disable caching for this client.
 
     Methods
     -------
@@ -154,6 +188,42 @@ class ServerClient(BaseServerClient):
 
     json_header = {"Content-Type": "application/json"}
 
+    # Request-body validators, built on first use and shared by every client instance.
+    _search_string_request_adapter = _SharedTypeAdapter(SearchStringRequestBody)
+    _filter_request_adapter = _SharedTypeAdapter(FilterRequestBody)
+    _get_request_adapter = _SharedTypeAdapter(GetRequestBody)
+    _new_element_request_adapter = _SharedTypeAdapter(NewElementRequestBody)
+    _new_attachment_request_adapter = _SharedTypeAdapter(NewAttachmentRequestBody)
+    _update_element_request_adapter = _SharedTypeAdapter(UpdateElementRequestBody)
+    # _update_status_request_adapter = _SharedTypeAdapter(UpdateStatusRequestBody)
+    _new_relationship_request_adapter = _SharedTypeAdapter(NewRelationshipRequestBody)
+    _new_classification_request_adapter = _SharedTypeAdapter(NewClassificationRequestBody)
+    _new_external_id_request_adapter = _SharedTypeAdapter(NewExternalIdRequestBody)
+    _delete_element_request_adapter = _SharedTypeAdapter(DeleteElementRequestBody)
+    _delete_relationship_request_adapter = _SharedTypeAdapter(DeleteRelationshipRequestBody)
+    _delete_classification_request_adapter = _SharedTypeAdapter(DeleteClassificationRequestBody)
+    _template_request_adapter = _SharedTypeAdapter(TemplateRequestBody)
+    _update_relationship_request_adapter = _SharedTypeAdapter(UpdateRelationshipRequestBody)
+    _results_request_adapter = _SharedTypeAdapter(ResultsRequestBody)
+    _level_identifier_query_body = _SharedTypeAdapter(LevelIdentifierQueryBody)
+    _update_properties_request_adapter = _SharedTypeAdapter(UpdatePropertiesRequestBody)
+    _metadata_source_request_adapter = _SharedTypeAdapter(MetadataSourceRequestBody)
+    _update_effectivity_dates_request_adapter = _SharedTypeAdapter(UpdateEffectivityDatesRequestBody)
+    _open_metadata_delete_request_adapter = _SharedTypeAdapter(OpenMetadataDeleteRequestBody)
+    _archive_request_adapter = _SharedTypeAdapter(ArchiveRequestBody)
+    _new_open_metadata_element_request_adapter = _SharedTypeAdapter(NewOpenMetadataElementRequestBody)
+    _new_related_elements_request_adapter = _SharedTypeAdapter(NewRelatedElementsRequestBody)
+    _find_property_names_request_adapter = _SharedTypeAdapter(FindPropertyNamesRequestBody)
+    _find_request_adapter = _SharedTypeAdapter(FindRequestBody)
+    _deployment_status_search_request_adapter = _SharedTypeAdapter(DeploymentStatusSearchString)
+    _deployment_status_filter_request_adapter = _SharedTypeAdapter(DeploymentStatusFilterRequestBody)
+    _content_status_search_request_adapter = _SharedTypeAdapter(ContentStatusSearchString)
+    _content_status_filter_request_adapter = _SharedTypeAdapter(ContentStatusFilterRequestBody)
+    _activity_status_search_request_adapter = _SharedTypeAdapter(ActivityStatusSearchString)
+    _activity_status_filter_request_adapter = _SharedTypeAdapter(ActivityStatusFilterRequestBody)
+    _activity_status_request_adapter = _SharedTypeAdapter(ActivityStatusRequestBody)
+    _action_request_adapter = _SharedTypeAdapter(ActionRequestBody)
+
     def __init__(
             self,
             server_name: str = None,
@@ -167,54 +237,19 @@ class ServerClient(BaseServerClient):
             local_qualifier: str = None,
             organization_name: str = None,
             timeout: int = None,
+            guid_cache: GuidCache | bool = None,
             **kwargs
     ):
 
         super().__init__(server_name, platform_url, user_id, user_pwd, token,
                          token_src, api_key, page_size, local_qualifier, organization_name, timeout=timeout, **kwargs)
+        # None -> the session pool's shared cache (if guid_cache_enabled), False -> no caching.
+        self._guid_cache = guid_cache
 
         self.command_root: str = f"{self.platform_url}/servers/{self.server_name}/api/open-metadata/"
-        self._search_string_request_adapter = TypeAdapter(SearchStringRequestBody)
-        self._filter_request_adapter = TypeAdapter(FilterRequestBody)
-        self._get_request_adapter = TypeAdapter(GetRequestBody)
-        self._new_element_request_adapter = TypeAdapter(NewElementRequestBody)
-        self._new_attachment_request_adapter = TypeAdapter(NewAttachmentRequestBody)
-        self._update_element_request_adapter = TypeAdapter(UpdateElementRequestBody)
-        # self._update_status_request_adapter = TypeAdapter(UpdateStatusRequestBody)
-        self._new_relationship_request_adapter = TypeAdapter(NewRelationshipRequestBody)
-        self._new_classification_request_adapter = TypeAdapter(NewClassificationRequestBody)
-        self._new_external_id_request_adapter = TypeAdapter(NewExternalIdRequestBody)
-        self._delete_element_request_adapter = TypeAdapter(DeleteElementRequestBody)
-        self._delete_relationship_request_adapter = TypeAdapter(DeleteRelationshipRequestBody)
-        self._delete_classification_request_adapter = TypeAdapter(DeleteClassificationRequestBody)
-        self._template_request_adapter = TypeAdapter(TemplateRequestBody)
-        self._update_relationship_request_adapter = TypeAdapter(UpdateRelationshipRequestBody)
-        self._results_request_adapter = TypeAdapter(ResultsRequestBody)
-        self._level_identifier_query_body = TypeAdapter(LevelIdentifierQueryBody)
-        self._update_properties_request_adapter = TypeAdapter(UpdatePropertiesRequestBody)
-        self._metadata_source_request_adapter = TypeAdapter(MetadataSourceRequestBody)
-        self._update_effectivity_dates_request_adapter = TypeAdapter(UpdateEffectivityDatesRequestBody)
-        self._open_metadata_delete_request_adapter = TypeAdapter(OpenMetadataDeleteRequestBody)
-        self._archive_request_adapter = TypeAdapter(ArchiveRequestBody)
-        self._new_open_metadata_element_request_adapter = TypeAdapter(NewOpenMetadataElementRequestBody)
-        self._new_related_elements_request_adapter = TypeAdapter(NewRelatedElementsRequestBody)
-        self._find_property_names_request_adapter = TypeAdapter(FindPropertyNamesRequestBody)
-        self._find_request_adapter = TypeAdapter(FindRequestBody)
-        self._deployment_status_search_request_adapter = TypeAdapter(DeploymentStatusSearchString)
-        self._deployment_status_filter_request_adapter = TypeAdapter(DeploymentStatusFilterRequestBody)
-        self._content_status_search_request_adapter = TypeAdapter(ContentStatusSearchString)
-        self._content_status_filter_request_adapter = TypeAdapter(ContentStatusFilterRequestBody)
-        self._activity_status_search_request_adapter = TypeAdapter(ActivityStatusSearchString)
-        self._activity_status_filter_request_adapter = TypeAdapter(ActivityStatusFilterRequestBody)
-        self._activity_status_request_adapter = TypeAdapter(ActivityStatusRequestBody)
-        self._action_request_adapter = TypeAdapter(ActionRequestBody)
         self._request_id: str = None
-
-        try:
-            result = self.check_connection()
-            logger.debug(f"client initialized, platform origin is: {result}")
-        except PyegeriaConnectionException as e:
-            raise PyegeriaConnectionException(e)
+        # Connectivity is checked (at most once) by BaseServerClient.__init__ according to
+        # `connection_check` - see BaseServerClient.
 
     # @logger.catch
     async def __async_get_guid__(
@@ -248,22 +283,8 @@ class ServerClient(BaseServerClient):
             return guid
 
         if qualified_name:
-            body = {
-                "class": "FindPropertyNameProperties",
-                "propertyValue": qualified_name,
-                "propertyName": "qualifiedName",
-                "forLineage": False,
-                "forDuplicateProcessing": False,
-                "effectiveTime": None,
-            }
-            url = (
-                f"{self.platform_url}/servers/{self.server_name}/api/open-metadata/classification-explorer/"
-                f"elements/guid-by-unique-name"
-            )
-
             try:
-                result = await self._async_make_request("POST", url, body_slimmer(body))
-                guid_found = result.json().get("guid", NO_ELEMENTS_FOUND)
+                guid_found = await self._async_guid_by_unique_name(view_server, "qualifiedName", qualified_name)
                 if guid_found != NO_ELEMENTS_FOUND:
                     return guid_found
             except Exception:
@@ -276,38 +297,10 @@ class ServerClient(BaseServerClient):
                     display_name = f"{org}.{display_name}"
 
             if tech_type and property_name == "qualifiedName":
-                name = f"{tech_type}::{display_name}"
-                body = {
-                    "class": "FindPropertyNameProperties",
-                    "propertyValue": name,
-                    "propertyName": property_name,
-                    "forLineage": False,
-                    "forDuplicateProcessing": False,
-                    "effectiveTime": None,
-                }
-                url = (
-                    f"{self.platform_url}/servers/{view_server}/api/open-metadata/classification-explorer/"
-                    f"elements/guid-by-unique-name"
-                )
-
-                result = await self._async_make_request("POST", url, body_slimmer(body))
-                return result.json().get("guid", NO_ELEMENTS_FOUND)
+                return await self._async_guid_by_unique_name(view_server, property_name,
+                                                             f"{tech_type}::{display_name}", tech_type)
             else:
-                body = {
-                    "class": "FindPropertyNameProperties",
-                    "propertyValue": display_name,
-                    "propertyName": property_name,
-                    "forLineage": False,
-                    "forDuplicateProcessing": False,
-                    "effectiveTime": None,
-                }
-                url = (
-                    f"{self.platform_url}/servers/{view_server}/api/open-metadata/classification-explorer/"
-                    f"elements/guid-by-unique-name"
-                )
-
-                result = await self._async_make_request("POST", url, body_slimmer(body))
-                return result.json().get("guid", NO_ELEMENTS_FOUND)
+                return await self._async_guid_by_unique_name(view_server, property_name, display_name)
         else:
             additional_info = {
                 "reason": "Neither server_guid nor server_name were provided - please provide.",
@@ -316,6 +309,55 @@ class ServerClient(BaseServerClient):
             }
             raise PyegeriaInvalidParameterException(None, None, additional_info)
 
+    async def _async_guid_by_unique_name(self, view_server: str, property_name: str, property_value: str,
+                                         type_name: str = None) -> str:
+        """Look up the GUID of the element whose `property_name` is `property_value`, through the
+        client's guid_cache. Returns NO_ELEMENTS_FOUND if there is no such element. Async version."""
+        cache = self.guid_cache
+        key = (f"{self.platform_url}/servers/{view_server}", self.user_id, property_name, type_name or "",
+               property_value)
+        if cache is not None:
+            cached = cache.lookup(key)
+            if cached is not None:
+                return cached
+
+        body = {
+            "class": "FindPropertyNameProperties",
+            "propertyValue": property_value,
+            "propertyName": property_name,
+            "forLineage": False,
+            "forDuplicateProcessing": False,
+            "effectiveTime": None,
+        }
+        url = (
+            f"{self.platform_url}/servers/{view_server}/api/open-metadata/classification-explorer/"
+            f"elements/guid-by-unique-name"
+        )
+        result = await self._async_make_request("POST", url, body_slimmer(body), idempotent=True)
+        guid = result.json().get("guid", NO_ELEMENTS_FOUND)
+        if cache is not None:
+            cache.store(key, guid)
+        return guid
+
+    @property
+    def guid_cache(self) -> Optional[GuidCache]:
+        """The name -> GUID cache used by __async_get_guid__, or None when caching is disabled.
+        Unless one was passed to the constructor, this is the cache shared through the session pool."""
+        if self._guid_cache is False:
+            return None
+        if self._guid_cache is None:
+            return self._session_pool.guid_cache() if runtime_setting("guid_cache_enabled", True) else None
+        return self._guid_cache
+
+    def _after_write(self, endpoint: str) -> None:
+        """Keep the guid_cache consistent after any write: a create may make a cached miss
+        resolvable, while a delete or update may remove or rename the element whose GUID is in `endpoint`."""
+        cache = self.guid_cache
+        if cache is None:
+            return
+        cache.invalidate_negative(f"{self.platform_url}/servers/{self.server_name}")
+        cache.invalidate_guids_in(endpoint)
+
     #
     # Include basic functions for finding elements and relationships.
     #
@@ -339,8 +381,7 @@ class ServerClient(BaseServerClient):
         Egeria resource name convention. The organization_name falls back to self.organization_name if not supplied.
         Sync version.
         """
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(
+        result = self._run_sync(
             self.__async_get_guid__(
                 guid, display_name, property_name, qualified_name, tech_type, organization_name
             )
@@ -387,8 +428,7 @@ class ServerClient(BaseServerClient):
         """
         Synchronous version of _async_get_valid_metadata_values.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_valid_metadata_values(property_name, type_name)
         )
 
@@ -554,8 +594,7 @@ class ServerClient(BaseServerClient):
             The requesting user is not authorized to issue this request.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_relationships_with_property_value(
                 relationship_type,
                 property_value,
@@ -719,8 +758,7 @@ class ServerClient(BaseServerClient):
         PyegeriaException.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_by_property_value(property_value, property_names, metadata_element_type,
                                                        effective_time, for_lineage, for_duplicate_processing,
                                                        start_from, page_size, output_format, report_spec, timeout, **kwargs)
@@ -793,8 +831,7 @@ class ServerClient(BaseServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_guid_for_name(name, property_name, type_name)
         )
         return response
@@ -832,7 +869,7 @@ class ServerClient(BaseServerClient):
         url = (f"{self.platform_url}/servers/{self.server_name}/api/open-metadata/classification-explorer/elements/"
                f"{element_guid}?forLineage=false&forDuplicateProcessing=false")
 
-        response: Response = await self._async_make_request("POST", url, body_slimmer(body))
+        response: Response = await self._async_make_request("POST", url, body_slimmer(body), idempotent=True)
 
         elements = response.json().get("element", NO_ELEMENTS_FOUND)
 
@@ -862,8 +899,7 @@ class ServerClient(BaseServerClient):
         PyegeriaUnauthorizedException
             the requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(
+        result = self._run_sync(
             self._async_get_element_by_guid_(
                 element_guid
             )
@@ -990,8 +1026,7 @@ class ServerClient(BaseServerClient):
                 str: The guid of the connector.
         """
 
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(
+        result = self._run_sync(
             self._async_get_connector_guid(
                 connector_name
             )
@@ -1039,7 +1074,7 @@ class ServerClient(BaseServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1095,8 +1130,7 @@ class ServerClient(BaseServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_archive_file(
                 archive_file, server_guid, display_name, qualified_name, timeout, organization_name
             )
@@ -1198,8 +1232,7 @@ class ServerClient(BaseServerClient):
         PyEgeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_comment_to_element(element_guid, comment, comment_type, body)
         )
         return response
@@ -1315,8 +1348,7 @@ class ServerClient(BaseServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_comment(comment_guid, comment, comment_type, body, merge_update)
         )
 
@@ -1377,8 +1409,7 @@ class ServerClient(BaseServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_setup_accepted_answer(question_comment_guid, answer_comment_guid)
         )
 
@@ -1435,8 +1466,7 @@ class ServerClient(BaseServerClient):
         PyEgeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_accepted_answer(question_comment_guid, answer_comment_guid)
         )
 
@@ -1505,8 +1535,7 @@ class ServerClient(BaseServerClient):
         ------
         PyEgeriaException
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_comment_from_element(comment_guid, body, cascade_delete=cascade_delete)
         )
 
@@ -1577,8 +1606,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_comment_by_guid(guid, graph_query_depth, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -1663,8 +1691,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_attached_comments(element_guid, metadata_element_type_name, graph_query_depth,
                                               start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -1841,8 +1868,7 @@ class ServerClient(BaseServerClient):
 
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_find_comments(search_string, classification_names, metadata_element_subtypes, starts_with,
                                       ends_with, ignore_case, start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -2165,8 +2191,7 @@ class ServerClient(BaseServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_note_log(element_guid, display_name, description, body)
         )
         return response
@@ -2301,8 +2326,7 @@ class ServerClient(BaseServerClient):
             description ():
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_update_note_log(note_log_guid, display_name, description, body, merge_update)
         )
         return response
@@ -2367,8 +2391,7 @@ class ServerClient(BaseServerClient):
         ------
         PyEgeriaException
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_note_log(note_log_guid, body, cascade_delete)
         )
 
@@ -2562,8 +2585,7 @@ class ServerClient(BaseServerClient):
 
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_find_note_logs(search_string, classification_names, metadata_element_subtypes, starts_with,
                                        ends_with, ignore_case, start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -2651,8 +2673,7 @@ class ServerClient(BaseServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_note_logs_by_name(name, metadata_element_type_name, metadata_element_subtypes,
                                              graph_query_depth, start_from, page_size, output_format,
                                              report_spec, body, **kwargs)
@@ -2726,8 +2747,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_note_log_by_guid(guid, graph_query_depth, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -2812,8 +2832,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_attached_note_logs(element_guid, metadata_element_type_name, graph_query_depth,
                                                start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -2998,8 +3017,7 @@ class ServerClient(BaseServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_note(note_log_guid, display_name, description, associated_element, body)
         )
         return response
@@ -3181,8 +3199,7 @@ class ServerClient(BaseServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_journal_entry(note_log_qn, element_qn, note_log_display_name, journal_entry_display_name, note_entry, body)
         )
         return response
@@ -3336,8 +3353,7 @@ class ServerClient(BaseServerClient):
             merge_update ():
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_note(note_guid, display_name, description, body, merge_update)
         )
 
@@ -3400,8 +3416,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_note(
                 note_guid,
                 body
@@ -3604,8 +3619,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_notes(search_string=search_string, body=body, starts_with=starts_with,
                                    ends_with=ends_with, ignore_case=ignore_case, start_from=start_from,
                                    page_size=page_size, output_format=output_format,
@@ -3689,8 +3703,7 @@ class ServerClient(BaseServerClient):
          ------
          PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_note_by_guid(guid, metadata_element_type_name, graph_query_depth, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -3776,8 +3789,7 @@ class ServerClient(BaseServerClient):
           PyegeriaException
 
          """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_notes_for_note_log(note_log_guid, metadata_element_type_name, graph_query_depth,
                                               start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -3869,8 +3881,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_informal_tag(display_name, description, qualified_name, body)
         )
         return response
@@ -3947,8 +3958,7 @@ class ServerClient(BaseServerClient):
         Args:
             body ():
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_update_tag_description(tag_guid, description)
         )
         return response
@@ -4010,8 +4020,7 @@ class ServerClient(BaseServerClient):
          ------
          PyegeriaException
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_delete_tag(tag_guid)
         )
 
@@ -4122,8 +4131,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_tag_by_guid(guid, graph_query_depth, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -4215,8 +4223,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_tags_by_name(name, metadata_element_type_name, metadata_element_subtypes,
                                          graph_query_depth, start_from, page_size, output_format,
                                          report_spec, body, **kwargs)
@@ -4379,8 +4386,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_tags(search_string, body, starts_with, ends_with, ignore_case,
                                   start_from, page_size, output_format, report_spec, **kwargs)
         )
@@ -4500,8 +4506,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_my_tags(
                 search_string,
                 body,
@@ -4584,8 +4589,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_tag_to_element(
                 element_guid,
                 tag_guid,
@@ -4671,8 +4675,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_by_tag(tag_guid, graph_query_depth, start_from, page_size,
                                            output_format, report_spec, body, **kwargs)
         )
@@ -4759,8 +4762,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_attached_tags(element_guid, metadata_element_type_name, graph_query_depth,
                                           start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -4839,8 +4841,7 @@ class ServerClient(BaseServerClient):
         PyegeriaUnauthorizedException
             the requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_remove_tag_from_element(
                 element_guid,
                 tag_guid,
@@ -4969,8 +4970,7 @@ class ServerClient(BaseServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_like_to_element(element_guid, emoji, body)
         )
         return response
@@ -5064,8 +5064,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_attached_likes(element_guid, metadata_element_type_name, graph_query_depth,
                                            start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -5135,8 +5134,7 @@ class ServerClient(BaseServerClient):
         PyegeriaUnauthorizedException
             The requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_remove_like_from_element(element_guid, body)
         )
         return response
@@ -5240,8 +5238,7 @@ class ServerClient(BaseServerClient):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_rating_to_element(element_guid, is_public, body)
         )
         return response
@@ -5335,8 +5332,7 @@ class ServerClient(BaseServerClient):
         ------
         PyegeriaException
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_attached_ratings(element_guid, metadata_element_type_name, graph_query_depth,
                                              start_from, page_size, output_format, report_spec, body, **kwargs)
         )
@@ -5406,8 +5402,7 @@ class ServerClient(BaseServerClient):
         PyegeriaUnauthorizedException
             The requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_remove_rating_from_element(element_guid, body)
         )
         return response
@@ -5515,8 +5510,7 @@ class ServerClient(BaseServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_search_keyword_to_element(element_guid, keyword, body)
         )
         return response
@@ -5603,8 +5597,7 @@ class ServerClient(BaseServerClient):
 
          """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_search_keyword(keyword_guid, body)
         )
 
@@ -5657,8 +5650,7 @@ class ServerClient(BaseServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_search_keyword(keyword_guid )
         )
 
@@ -5732,8 +5724,7 @@ class ServerClient(BaseServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_search_keyword_by_guid(guid, graph_query_depth, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -5831,8 +5822,7 @@ class ServerClient(BaseServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_search_keyword_by_keyword(name, metadata_element_type_name, metadata_element_subtypes,
                                                      graph_query_depth, start_from, page_size,
                                                      output_format, report_spec, body, **kwargs)
@@ -5993,8 +5983,7 @@ class ServerClient(BaseServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_search_keywords(search_string, body, start_from=start_from, page_size=page_size,
                                              output_format=output_format, report_spec=report_spec, **kwargs)
         )
@@ -6398,6 +6387,81 @@ class ServerClient(BaseServerClient):
             validated_body = None
         return validated_body
 
+    def _paged_method(self, find: str | Callable[..., Any]) -> Callable[..., Any]:
+        if callable(find):
+            return find
+        name = find if find.startswith("_async_") else f"_async_{find}"
+        method = getattr(self, name, None)
+        if method is None:
+            raise TypeError(f"{type(self).__name__} has no async method '{name}' to page through")
+        return method
+
+    def aiter_find(self, find: str | Callable[..., Any], *args, page_size: int = None, start_from: int = 0,
+                   prefetch: bool = True, concurrency: int = 1, max_elements: int = None,
+                   **kwargs) -> AsyncIterator[Any]:
+        """Stream every element of a find/get request, page by page. Async version.
+
+        Parameters
+        ----------
+        find : str | Callable
+            The method to page through: a name such as "find_collections" (resolved to this
+            client's `_async_find_collections`) or an async bound method.
+        *args, **kwargs
+            Passed to the method on every call, apart from the paging parameters. If a request
+            `body` is given, paging is applied to its startFrom/pageSize instead.
+        page_size : int, optional
+            Elements per request; defaults to and is capped at `max_paging_size`.
+        start_from : int, default 0
+            Offset of the first element.
+        prefetch : bool, default True
+            Request the next page while the current one is being consumed.
+        concurrency : int, default 1
+            Number of page requests kept in flight at once; elements still arrive in order.
+        max_elements : int, optional
+            Stop after this many elements.
+
+        Returns
+        -------
+        AsyncIterator
+            The elements (JSON dicts), ending at the first empty page - a short page is not
+            treated as the last one.
+        """
+        return aiter_find(self._paged_method(find), *args, page_size=page_size, start_from=start_from,
+                          prefetch=prefetch, concurrency=concurrency, max_elements=max_elements, **kwargs)
+
+    def iter_find(self, find: str | Callable[..., Any], *args, page_size: int = None, start_from: int = 0,
+                  prefetch: bool = True, concurrency: int = 1, max_elements: int = None,
+                  **kwargs) -> Iterator[Any]:
+        """Stream every element of a find/get request, page by page.
+
+        Parameters
+        ----------
+        find : str | Callable
+            The method to page through: a name such as "find_collections" (resolved to this
+            client's `_async_find_collections`) or an async bound method.
+        *args, **kwargs
+            Passed to the method on every call, apart from the paging parameters. If a request
+            `body` is given, paging is applied to its startFrom/pageSize instead.
+        page_size : int, optional
+            Elements per request; defaults to and is capped at `max_paging_size`.
+        start_from : int, default 0
+            Offset of the first element.
+        prefetch : bool, default True
+            Request the next page while the current one is being consumed.
+        concurrency : int, default 1
+            Number of page requests kept in flight at once; elements still arrive in order.
+        max_elements : int, optional
+            Stop after this many elements.
+
+        Returns
+        -------
+        Iterator
+            The elements (JSON dicts), ending at the first empty page - a short page is not
+            treated as the last one.
+        """
+        return iter_find(self._paged_method(find), *args, page_size=page_size, start_from=start_from,
+                         prefetch=prefetch, concurrency=concurrency, max_elements=max_elements, **kwargs)
+
     @dynamic_catch
     async def _async_find_request(self, url: str, _type: str, _gen_output: Callable[..., Any], search_string: str = "*",
                                   starts_with: bool = True, ends_with: bool = False, ignore_case: bool = True,
@@ -6499,9 +6563,10 @@ class ServerClient(BaseServerClient):
                     body.pop("metadataElementTypeName", None)
                 validated_body = self._validate_body(SearchStringRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
 
-        response = await self._async_make_request("POST", url, json_body, timeout = 90)
+        response = await self._async_make_request("POST", url, json_body, timeout = 90, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str:
             logger.info(NO_ELEMENTS_FOUND)
@@ -6553,9 +6618,10 @@ class ServerClient(BaseServerClient):
         # classification_names = validated_body.include_only_classified_elements
         # element_type_name = classification_names[0] if classification_names else _type
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
 
-        response = await self._async_make_request("POST", url, json_body)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str or len(elements) == 0:
             logger.info(NO_ELEMENTS_FOUND)
@@ -6606,9 +6672,10 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(body_model.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
 
-        response = await self._async_make_request("POST", url, json_body)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         resp_json = response.json()
         elements = resp_json.get("element", NO_ELEMENTS_FOUND)
         if type(elements) is str:
@@ -6662,9 +6729,10 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(GetRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
 
-        response = await self._async_make_request("POST", url, json_body)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", None)
         if elements is None:
             elements = response.json().get("element", NO_ELEMENTS_FOUND)
@@ -6749,8 +6817,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(ActivityStatusSearchString.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body, timeout=90)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, timeout=90, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str:
             logger.info(NO_ELEMENTS_FOUND)
@@ -6792,8 +6861,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(ActivityStatusFilterRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str or len(elements) == 0:
             logger.info(NO_ELEMENTS_FOUND)
@@ -6838,8 +6908,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(ActivityStatusRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str:
             logger.info(NO_ELEMENTS_FOUND)
@@ -6921,8 +6992,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(ContentStatusSearchString.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body, timeout=90)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, timeout=90, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str:
             logger.info(NO_ELEMENTS_FOUND)
@@ -6964,8 +7036,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(ContentStatusFilterRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str or len(elements) == 0:
             logger.info(NO_ELEMENTS_FOUND)
@@ -7047,8 +7120,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(DeploymentStatusSearchString.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body, timeout=90)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, timeout=90, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str:
             logger.info(NO_ELEMENTS_FOUND)
@@ -7090,8 +7164,9 @@ class ServerClient(BaseServerClient):
             }
             validated_body = self._validate_body(DeploymentStatusFilterRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
-        response = await self._async_make_request("POST", url, json_body)
+        json_body = validated_body.model_dump_json(exclude_none=True)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
         if type(elements) is str or len(elements) == 0:
             logger.info(NO_ELEMENTS_FOUND)
@@ -7137,9 +7212,10 @@ class ServerClient(BaseServerClient):
                 body["metadataElementTypeName"] = _type
             validated_body = self._validate_body(ResultsRequestBody.model_validate, body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
 
-        response = await self._async_make_request("POST", url, json_body)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", None)
         if elements is None:
             elements = response.json().get("element", NO_ELEMENTS_FOUND)
@@ -7167,9 +7243,10 @@ class ServerClient(BaseServerClient):
         else:
             return None
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
 
-        response = await self._async_make_request("POST", url, json_body)
+        response = await self._async_make_request("POST", url, json_body, idempotent=True,
+                                                  json_subtree=_json.RESULT_KEYS)
         elements = response.json().get("elements", None)
         if elements is None:
             elements = response.json().get("element", NO_ELEMENTS_FOUND)
@@ -7188,7 +7265,7 @@ class ServerClient(BaseServerClient):
     async def _async_create_attachment_body_request(self, url: str, prop: Optional[list[str]] = None,
                                                     body: Optional[dict | NewAttachmentRequestBody] = None) -> str:
         validated_body = self.validate_new_attachment_request(body, prop)
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
         logger.info(json_body)
         response = await self._async_make_request("POST", url, json_body)
         logger.info(response.json())
@@ -7198,7 +7275,7 @@ class ServerClient(BaseServerClient):
     async def _async_create_element_body_request(self, url: str, prop: Optional[list[str]] = None,
                                                  body: Optional[dict | NewElementRequestBody] = None) -> str:
         validated_body = self.validate_new_element_request(body, prop)
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
         logger.info(json_body)
         response = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(response.json())
@@ -7208,7 +7285,7 @@ class ServerClient(BaseServerClient):
     async def _async_add_external_id_body_request(self, url: str, prop: Optional[list[str]] = None,
                                                   body: Optional[dict | NewExternalIdRequestBody] = None) -> str:
         validated_body = self.validate_add_external_id_request(body, prop)
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
         logger.info(json_body)
         response = await self._async_make_request("POST", url, json_body, is_json=True)
         resp_json = response.json()
@@ -7221,7 +7298,7 @@ class ServerClient(BaseServerClient):
     @dynamic_catch
     async def _async_create_element_from_template(self, url: str, body: Optional[dict | TemplateRequestBody] = None) -> str:
         validated_body = self.validate_new_element_from_template_request(body)
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+        json_body = validated_body.model_dump_json(exclude_none=True)
         logger.info(json_body)
         response = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(response.json())
@@ -7234,7 +7311,7 @@ class ServerClient(BaseServerClient):
             json_body = body_slimmer(body)
         else:
             validated_body = self.validate_update_element_request(body, prop)
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
         logger.info(json_body)
         response = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(response.json())
@@ -7243,7 +7320,7 @@ class ServerClient(BaseServerClient):
     # async def _async_update_status_request(self, url: str, status: Optional[str] = None,
     #                                        body: Optional[dict | UpdateStatusRequestBody] = None) -> None:
     #     validated_body = self.validate_update_status_request(status, body)
-    #     json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+    #     json_body = validated_body.model_dump_json(exclude_none=True)
     #     logger.info(json_body)
     #     response = await self._async_make_request("POST", url, json_body)
     #     logger.info(response.json())
@@ -7272,7 +7349,7 @@ class ServerClient(BaseServerClient):
         """
         validated_body = self.validate_new_relationship_request(body, prop)
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             logger.info(json_body)
             response = await self._async_make_request("POST", url, json_body)
             return response.json().get("guid")
@@ -7296,7 +7373,7 @@ class ServerClient(BaseServerClient):
                                                 body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         validated_body = self.validate_new_classification_request(body, prop)
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             logger.info(json_body)
             await self._async_make_request("POST", url, json_body)
         else:
@@ -7307,7 +7384,7 @@ class ServerClient(BaseServerClient):
                                             cascade_delete: bool = False) -> None:
         validated_body = self.validate_delete_element_request(body, cascade_delete)
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             logger.info(json_body)
             await self._async_make_request("POST", url, json_body)
         else:
@@ -7319,7 +7396,7 @@ class ServerClient(BaseServerClient):
         if body:
             validated_body = self.validate_delete_relationship_request(body, cascade_delete)
             if validated_body:
-                json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+                json_body = validated_body.model_dump_json(exclude_none=True)
                 logger.info(json_body)
                 await self._async_make_request("POST", url, json_body)
         else:
@@ -7330,7 +7407,7 @@ class ServerClient(BaseServerClient):
                                                    cascade_delete: bool = False) -> None:
         validated_body = self.validate_delete_classification_request(body, cascade_delete)
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             logger.info(json_body)
             await self._async_make_request("POST", url, json_body)
         else:
@@ -7341,7 +7418,7 @@ class ServerClient(BaseServerClient):
                                                  body: Optional[dict | UpdateRelationshipRequestBody] = None) -> None:
         validated_body = self.validate_update_relationship_request(body, prop)
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             logger.info(json_body)
             await self._async_make_request("POST", url, json_body)
         else:
@@ -7427,7 +7504,7 @@ class ServerClient(BaseServerClient):
     #        }
     #        """
     #     loop = asyncio.get_event_loop()
-    #     loop.run_until_complete(self._async_update_element_status(guid, status, body))
+    #     self._run_sync(self._async_update_element_status(guid, status, body))
 
     @dynamic_catch
     async def _async_update_element_effectivity(self, guid: str, effectivity_time: Optional[str] = None,
@@ -7515,8 +7592,7 @@ class ServerClient(BaseServerClient):
               "effectiveTime" : "{{$isoTimestamp}}"
             }
            """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_element_status(guid, status, body))
+        self._run_sync(self._async_update_element_status(guid, status, body))
 
 
     @dynamic_catch
@@ -7578,8 +7654,7 @@ class ServerClient(BaseServerClient):
         -----
         See: https://egeria-project.org/concepts/asset
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_asset(asset_type, body))
+        return self._run_sync(self._async_create_asset(asset_type, body))
 
     @dynamic_catch
     async def _async_create_asset_from_template(
@@ -7631,8 +7706,7 @@ class ServerClient(BaseServerClient):
         ValidationError
             Pydantic validation errors are raised if the body does not conform to the TemplateRequestBody.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_asset_from_template(body))
+        return self._run_sync(self._async_create_asset_from_template(body))
 
     @dynamic_catch
     async def _async_update_asset(
@@ -7687,8 +7761,7 @@ class ServerClient(BaseServerClient):
         ValidationError
             Pydantic validation errors are raised if the body does not conform to the UpdateElementRequestBody.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_asset(asset_guid, body))
+        self._run_sync(self._async_update_asset(asset_guid, body))
 
     @dynamic_catch
     async def _async_delete_asset(
@@ -7739,10 +7812,10 @@ class ServerClient(BaseServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_asset(asset_guid, body))
+        self._run_sync(self._async_delete_asset(asset_guid, body))
 
     @dynamic_catch
+    @concurrent_pageable
     async def _async_find_assets(
             self,
             search_string: str = "*",
@@ -7769,6 +7842,9 @@ class ServerClient(BaseServerClient):
             String to search for in asset properties.
         body : dict | SearchStringRequestBody, optional
             Details of the request. If provided, overrides other parameters.
+        concurrent_pages : int, default 0
+            When > 1, return the complete result set (JSON only), fetched with this many page
+            requests in flight from `start_from` in pages of `page_size`.
         starts_with : bool, default False
             Whether to match only at the start of the string.
         ends_with : bool, default False
@@ -7898,6 +7974,9 @@ class ServerClient(BaseServerClient):
             Specification for report formatting.
         body: dict | SearchStringRequestBody, optional
             Additional search parameters.
+        concurrent_pages: int, optional
+            When > 1, return the complete result set (JSON only), fetched with this many page
+            requests in flight from `start_from` in pages of `page_size`. Default is 0.
 
         Returns
         -------
@@ -7911,8 +7990,7 @@ class ServerClient(BaseServerClient):
             Egeria errors.
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_assets(search_string=search_string, starts_with=starts_with, ends_with=ends_with,
                                     ignore_case=ignore_case, anchor_domain=anchor_domain,
                                     metadata_element_type=metadata_element_type,
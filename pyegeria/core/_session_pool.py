@@ -0,0 +1,289 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Shared httpx connection pools for pyegeria clients.
+
+Every BaseServerClient / BasePlatformClient used to build its own httpx.AsyncClient in
+__init__, so a process touching ten OMVS facades (e.g. through EgeriaTech) held ten
+independent connection pools - and paid ten TCP/TLS handshakes - against the same view
+server. Clients now borrow their session from a SessionPool, keyed by the platform origin
+(scheme://host:port) and TLS/HTTP-version settings, so every client talking to the same
+platform shares one set of keep-alive connections.
+
+httpx connections are bound to the event loop they were opened on, so the pool hands out
+one AsyncClient per (key, event loop). In the common cases (a sync CLI driving the default
+loop, or an async app with a single loop) that is exactly one session per platform.
+
+Lifecycle is reference counted: a client acquires its key on construction and releases it
+in close_session(); when the last client for a key releases it, the sessions for that key
+are closed. SessionPool.aclose()/close() closes everything explicitly.
+
+The pool also remembers which platforms have recently been reachable (from an explicit
+connectivity probe or from any response to a real request), so clients constructed with
+connection_check="eager" only probe a platform once per `connection_check_ttl` seconds
+rather than once per client.
+
+It also owns one CircuitBreaker per platform (see _retry.py), so when a view server is
+overloaded every client pointed at it backs off together, and the GuidCache (see
+_guid_cache.py) through which those clients share name -> GUID resolutions.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import httpx
+from httpx import AsyncClient
+from loguru import logger
+
+from pyegeria.core._globals import default_timeout
+from pyegeria.core._guid_cache import GuidCache
+from pyegeria.core._retry import CircuitBreaker
+from pyegeria.core.config import runtime_setting
+
+
+@dataclass(frozen=True)
+class SessionKey:
+    """Identifies a shareable set of connections: same origin, same TLS and HTTP settings."""
+    origin: str
+    verify: bool
+    http2: bool
+
+
+def _origin_of(platform_url: str) -> str:
+    parts = urlsplit(platform_url)
+    if not parts.scheme or not parts.netloc:
+        return platform_url.rstrip("/")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _current_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class SessionPool:
+    """
+    Registry of shared httpx.AsyncClient sessions, keyed by platform origin and TLS settings.
+
+    Parameters
+    ----------
+    max_connections : int, optional
+        Upper bound on concurrent connections per session. Defaults to the
+        `http_max_connections` Runtime setting (PYEGERIA_HTTP_MAX_CONNECTIONS).
+    max_keepalive_connections : int, optional
+        Idle connections kept open per session. Defaults to `http_max_keepalive_connections`.
+    keepalive_expiry : float, optional
+        Seconds an idle connection is kept. Defaults to `http_keepalive_expiry` - keep it under
+        the idle timeout of any reverse proxy in front of the platform (typically 60-75 s).
+    http2 : bool, optional
+        Opt in to HTTP/2 (requires the optional `h2` package; falls back to HTTP/1.1 with a
+        warning if it is not installed). Defaults to `http2_enabled`.
+    connection_check_ttl : float, optional
+        Seconds a platform stays "known reachable" after a successful probe or request.
+        Defaults to `connection_check_ttl`.
+    """
+
+    def __init__(
+            self,
+            max_connections: int = None,
+            max_keepalive_connections: int = None,
+            keepalive_expiry: float = None,
+            http2: bool = None,
+            connection_check_ttl: float = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections or runtime_setting("http_max_connections", 100),
+            max_keepalive_connections=max_keepalive_connections or runtime_setting("http_max_keepalive_connections", 20),
+            keepalive_expiry=keepalive_expiry or runtime_setting("http_keepalive_expiry", 20.0),
+        )
+        self.http2 = bool(runtime_setting("http2_enabled", False) if http2 is None else http2)
+        self.connection_check_ttl = float(
+            runtime_setting("connection_check_ttl", 300) if connection_check_ttl is None else connection_check_ttl)
+        self._lock = threading.Lock()
+        self._reachable: dict[SessionKey, tuple[str, float]] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._guid_cache: GuidCache | None = None
+        self._refcounts: dict[SessionKey, int] = {}
+        self._sessions: dict[tuple[SessionKey, int], tuple[AsyncClient, asyncio.AbstractEventLoop | None]] = {}
+
+    def __repr__(self):
+        return (f"SessionPool(keys={len(self._refcounts)}, sessions={len(self._sessions)}, "
+                f"http2={self.http2}, limits={self.limits})")
+
+    def acquire(self, platform_url: str, verify: bool = False) -> SessionKey:
+        """Register interest in sessions for `platform_url`; returns the key to pass to get_session()."""
+        key = SessionKey(origin=_origin_of(platform_url), verify=bool(verify), http2=self.http2)
+        with self._lock:
+            self._refcounts[key] = self._refcounts.get(key, 0) + 1
+        return key
+
+    def get_session(self, key: SessionKey) -> AsyncClient:
+        """Return the shared AsyncClient for `key` on the current event loop, creating it on first use."""
+        loop = _current_loop()
+        slot = (key, id(loop))
+        with self._lock:
+            entry = self._sessions.get(slot)
+            if entry is not None and not entry[0].is_closed and (loop is None or entry[1] is loop):
+                return entry[0]
+            self._purge_closed_loops()
+            session = self._new_session(key)
+            self._sessions[slot] = (session, loop)
+            return session
+
+    def release(self, key: SessionKey) -> None:
+        """Drop one reference to `key`; the last release closes that key's sessions. Sync version."""
+        sessions = self._release(key)
+        for session, loop in sessions:
+            self._close_sync(session, loop)
+
+    async def arelease(self, key: SessionKey) -> None:
+        """Drop one reference to `key`; the last release closes that key's sessions. Async version."""
+        sessions = self._release(key)
+        for session, loop in sessions:
+            await self._close_async(session, loop)
+
+    def close(self) -> None:
+        """Close every session in the pool, regardless of outstanding references."""
+        for session, loop in self._drain():
+            self._close_sync(session, loop)
+
+    async def aclose(self) -> None:
+        """Close every session in the pool, regardless of outstanding references. Async version."""
+        for session, loop in self._drain():
+            await self._close_async(session, loop)
+
+    def mark_reachable(self, key: SessionKey, origin: str = None) -> None:
+        """Record that the platform for `key` answered just now; `origin` keeps any previously seen value."""
+        previous = self._reachable.get(key)
+        if origin is None:
+            origin = previous[0] if previous else ""
+        self._reachable[key] = (origin, time.monotonic() + self.connection_check_ttl)
+
+    def reachable(self, key: SessionKey) -> str | None:
+        """Return the cached platform origin if the platform answered within the TTL, else None."""
+        entry = self._reachable.get(key)
+        if entry is None or entry[1] < time.monotonic():
+            return None
+        return entry[0]
+
+    def circuit_breaker(self, key: SessionKey) -> CircuitBreaker:
+        """Return the circuit breaker shared by every client talking to the platform for `key`."""
+        with self._lock:
+            breaker = self._breakers.get(key.origin)
+            if breaker is None:
+                breaker = self._breakers[key.origin] = CircuitBreaker()
+            return breaker
+
+    def guid_cache(self) -> GuidCache:
+        """Return the name -> GUID cache shared by every client using this pool, creating it on first use."""
+        with self._lock:
+            if self._guid_cache is None:
+                self._guid_cache = GuidCache()
+            return self._guid_cache
+
+    def stats(self) -> dict:
+        """Return a snapshot of reference counts and live sessions per origin, for diagnostics."""
+        with self._lock:
+            out: dict[str, dict] = {}
+            for key, count in self._refcounts.items():
+                out.setdefault(key.origin, {"clients": 0, "sessions": 0})["clients"] += count
+            for (key, _), (session, _) in self._sessions.items():
+                if not session.is_closed:
+                    out.setdefault(key.origin, {"clients": 0, "sessions": 0})["sessions"] += 1
+            return out
+
+    #
+    #   Internals
+    #
+
+    def _new_session(self, key: SessionKey) -> AsyncClient:
+        timeout = httpx.Timeout(timeout=float(default_timeout), connect=10.0)
+        if key.http2:
+            try:
+                return AsyncClient(verify=key.verify, timeout=timeout, limits=self.limits, http2=True)
+            except ImportError:
+                logger.warning("HTTP/2 requested but the 'h2' package is not installed - using HTTP/1.1")
+        return AsyncClient(verify=key.verify, timeout=timeout, limits=self.limits)
+
+    def _purge_closed_loops(self) -> None:
+        # Caller holds the lock. Sessions bound to a closed loop can never be used again.
+        stale = [slot for slot, (_, loop) in self._sessions.items() if loop is not None and loop.is_closed()]
+        for slot in stale:
+            self._sessions.pop(slot, None)
+
+    def _release(self, key: SessionKey) -> list:
+        with self._lock:
+            count = self._refcounts.get(key, 0) - 1
+            if count > 0:
+                self._refcounts[key] = count
+                return []
+            self._refcounts.pop(key, None)
+            slots = [slot for slot in self._sessions if slot[0] == key]
+            return [self._sessions.pop(slot) for slot in slots]
+
+    def _drain(self) -> list:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            self._refcounts.clear()
+            self._reachable.clear()
+            return sessions
+
+    @staticmethod
+    def _close_sync(session: AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        if session.is_closed:
+            return
+        if loop is None or loop.is_closed():
+            loop = None
+        if loop is not None and loop.is_running():
+            # Can't block on a running loop; let it close the session itself.
+            loop.call_soon_threadsafe(lambda: loop.create_task(session.aclose()))
+            return
+        try:
+            if loop is None:
+                loop = asyncio.get_event_loop()
+            loop.run_until_complete(session.aclose())
+        except Exception as e:  # noqa: BLE001 -- best effort; connections are dropped on GC anyway
+            logger.debug(f"Could not close pooled session cleanly: {e}")
+
+    @staticmethod
+    async def _close_async(session: AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+        if session.is_closed:
+            return
+        current = _current_loop()
+        if loop is None or loop is current:
+            await session.aclose()
+        elif not loop.is_closed() and loop.is_running():
+            loop.call_soon_threadsafe(lambda: loop.create_task(session.aclose()))
+        # Otherwise the owning loop is gone; its connections are unusable and dropped on GC.
+
+
+_default_pool: SessionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> SessionPool:
+    """Return the process-wide SessionPool shared by all clients that aren't given their own."""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = SessionPool()
+    return _default_pool
+
+
+def set_session_pool(pool: SessionPool | None) -> None:
+    """Replace the process-wide SessionPool (e.g. to change limits or enable HTTP/2).
+
+    Clients created before the call keep the pool they were constructed with.
+    Passing None resets to a freshly-configured default on next use.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        _default_pool = pool
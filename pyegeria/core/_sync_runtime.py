@@ -0,0 +1,169 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+The event loop behind pyegeria's synchronous client methods.
+
+Each sync wrapper used to call `asyncio.get_event_loop().run_until_complete(...)`. That fails
+when the caller already has a running loop (Jupyter, Textual, FastAPI - hence nest_asyncio),
+warns or creates a throwaway loop in threads without one, and leaves the httpx sessions the
+SessionPool opens for the caller's loop behind whenever that loop changes.
+
+A SyncRuntime instead owns one event loop running on a daemon thread. `run(coro)` submits
+the coroutine to that loop from any thread - with or without a running loop of its own -
+and blocks until it finishes, so every sync call in the process reuses one warm loop and
+therefore one pooled session per platform. The caller's context variables travel with the
+coroutine, and interrupting the wait (Ctrl-C) cancels it.
+
+Clients use the process-wide runtime (`get_sync_runtime()`) unless given their own with
+`client.use_sync_runtime(runtime)`. A coroutine running on the runtime's loop must not call a
+sync client method: it would block the loop every other thread's sync calls share while waiting
+on it, so `run()` raises RuntimeError instead. Await the async version, or move sync-only code
+off the loop with `asyncio.to_thread`.
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import os
+import threading
+from collections.abc import Awaitable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class SyncRuntime:
+    """An event loop on a background thread that runs coroutines for synchronous callers."""
+
+    def __init__(self, name: str = "pyegeria-sync"):
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        state = "running" if self.is_running() else "stopped"
+        return f"SyncRuntime(name={self.name!r}, {state})"
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and self._pid == os.getpid()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runtime's event loop, started on first use (and again after a fork)."""
+        if not self.is_running():
+            with self._lock:
+                if not self.is_running():
+                    self._start()
+        return self._loop
+
+    def _start(self) -> None:
+        # Caller holds the lock.
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def serve():
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=serve, name=self.name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop, self._thread, self._pid = loop, thread, os.getpid()
+
+    def in_runtime_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run `coro` on the runtime's loop and return its result (or raise its exception)."""
+        if not asyncio.iscoroutine(coro):
+            coro = _await(coro)             # e.g. an async generator's __anext__()
+        if self.in_runtime_thread():
+            coro.close()
+            raise RuntimeError(
+                f"A sync pyegeria call was made from a coroutine running on the {self.name!r} loop, which "
+                f"would block it; await the async version or run the sync code with asyncio.to_thread()")
+        loop = self.loop
+        context = contextvars.copy_context()
+        result: concurrent.futures.Future = concurrent.futures.Future()
+        task_ref: list[asyncio.Task] = []
+
+        def start():
+            if not result.set_running_or_notify_cancel():
+                coro.close()
+                return
+            task = loop.create_task(coro, context=context)
+            task_ref.append(task)
+            task.add_done_callback(lambda t: _copy_outcome(t, result))
+
+        loop.call_soon_threadsafe(start)
+        try:
+            return result.result()
+        except BaseException:
+            if not result.done():
+                result.cancel()
+                loop.call_soon_threadsafe(lambda: task_ref and task_ref[0].cancel())
+            raise
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the loop and its thread. The runtime starts again if it is used afterwards."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = self._pid = None
+        if loop is None or thread is None or not thread.is_alive():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+def _copy_outcome(task: asyncio.Task, result: concurrent.futures.Future) -> None:
+    if result.done():
+        return
+    if task.cancelled():
+        result.cancel()
+    elif task.exception() is not None:
+        result.set_exception(task.exception())
+    else:
+        result.set_result(task.result())
+
+
+_default_runtime: SyncRuntime | None = None
+_default_runtime_lock = threading.Lock()
+
+
+def get_sync_runtime() -> SyncRuntime:
+    """Return the process-wide SyncRuntime used by clients that aren't given their own."""
+    global _default_runtime
+    if _default_runtime is None:
+        with _default_runtime_lock:
+            if _default_runtime is None:
+                _default_runtime = SyncRuntime()
+    return _default_runtime
+
+
+def set_sync_runtime(runtime: SyncRuntime | None) -> None:
+    """Replace the process-wide SyncRuntime. Passing None starts a fresh one on next use."""
+    global _default_runtime
+    with _default_runtime_lock:
+        _default_runtime = runtime
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run `coro` on the process-wide SyncRuntime - for sync helpers outside the client classes."""
+    return get_sync_runtime().run(coro)
+
+
+@atexit.register
+def _close_default_runtime() -> None:
+    if _default_runtime is not None:
+        _default_runtime.close(timeout=1.0)
@@ -0,0 +1,160 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Chunked reading of Data Engineer tabular data set reports.
+
+`DataEngineer.get_tabular_data_set` returns one report window (`startFromRow` /
+`maxRowCount`) as a raw dict; reading a whole data set meant looping over windows by hand
+and holding every window's per-row structures. `aiter_chunks()` walks the data set window
+by window instead, requesting the next window while the current one is consumed, and hands
+each one over as a TabularChunk of row tuples. The adapters on top of it never build more
+than one window of rows at a time:
+
+* `aiter_rows()` streams the rows as tuples,
+* `write_csv()` writes them to a text stream as they arrive, and
+* `build_frame()` appends each window column by column and builds a pandas DataFrame, a dict
+  of NumPy arrays or a pyarrow Table once at the end - no per-row dicts in between.
+
+Unlike metadata searches, a report window is never shortened by server-side filtering, so a
+window with fewer rows than requested is the last one.
+"""
+
+import asyncio
+import csv
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, NamedTuple, TextIO
+
+FetchWindow = Callable[[int, int], Awaitable[Any]]
+
+FRAME_KINDS = ("pandas", "numpy", "arrow")
+
+
+class TabularChunk(NamedTuple):
+    """One report window: the data set's column names and the rows starting at `start_row`."""
+    start_row: int
+    columns: tuple[str, ...]
+    rows: list[tuple]
+
+
+def report_columns(report: dict) -> tuple[str, ...]:
+    """Column names of a tabularDataSetReport, in order."""
+    return tuple(col.get("columnName") for col in report.get("columnDescriptions") or [])
+
+
+def report_rows(report: dict) -> list[tuple]:
+    """Rows of a tabularDataSetReport as tuples, in row order (dataRecords is keyed by row number)."""
+    records = report.get("dataRecords") or {}
+    if isinstance(records, list):
+        return [tuple(row) for row in records]
+    return [tuple(records[key]) for key in sorted(records, key=int)]
+
+
+async def aiter_chunks(fetch: FetchWindow, *, start_from_row: int = 0, chunk_rows: int = 5000,
+                       prefetch: bool = True, max_rows: int = None) -> AsyncIterator[TabularChunk]:
+    """
+    Yield successive windows of a tabular data set as TabularChunks.
+
+    Parameters
+    ----------
+    fetch : Callable
+        `fetch(start_from_row, max_row_count)` coroutine returning one tabularDataSetReport dict
+        (anything else ends the iteration).
+    start_from_row : int, default 0
+        Row of the first window.
+    chunk_rows : int, default 5000
+        Rows requested per window.
+    prefetch : bool, default True
+        Request the next window before the current one is handed to the caller.
+    max_rows : int, optional
+        Stop after this many rows.
+    """
+    chunk_rows = max(1, chunk_rows)
+    remaining = max_rows
+    row = start_from_row
+
+    def request(start: int) -> asyncio.Future:
+        size = chunk_rows if remaining is None else min(chunk_rows, remaining)
+        return asyncio.ensure_future(fetch(start, size))
+
+    pending = request(row)
+    try:
+        while pending is not None:
+            report = await pending
+            pending = None
+            rows = report_rows(report) if isinstance(report, dict) else []
+            if not rows:
+                return
+            if remaining is not None:
+                rows = rows[:remaining]
+                remaining -= len(rows)
+            last = len(rows) < chunk_rows or remaining == 0
+            if prefetch and not last:
+                pending = request(row + len(rows))
+            yield TabularChunk(row, report_columns(report), rows)
+            if last:
+                return
+            row += len(rows)
+            if pending is None:
+                pending = request(row)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+
+
+async def aiter_rows(chunks: AsyncIterator[TabularChunk]) -> AsyncIterator[tuple]:
+    """Flatten TabularChunks into a stream of row tuples."""
+    async for chunk in chunks:
+        for row in chunk.rows:
+            yield row
+
+
+async def write_csv(chunks: AsyncIterator[TabularChunk], out: TextIO, header: bool = True) -> int:
+    """Write the rows of `chunks` to `out` as CSV, one window at a time. Returns the rows written."""
+    writer = csv.writer(out)
+    written = 0
+    async for chunk in chunks:
+        if header:
+            writer.writerow(chunk.columns)
+            header = False
+        writer.writerows(chunk.rows)
+        written += len(chunk.rows)
+    return written
+
+
+async def build_frame(chunks: AsyncIterator[TabularChunk], kind: str = "pandas") -> Any:
+    """
+    Collect `chunks` column by column into a columnar frame.
+
+    Parameters
+    ----------
+    kind : str, default "pandas"
+        "pandas" (DataFrame), "numpy" (dict of column name -> ndarray) or "arrow" (pyarrow Table).
+        The library is imported only here; it is not a pyegeria dependency.
+    """
+    kind = kind.lower()
+    if kind not in FRAME_KINDS:
+        raise ValueError(f"Unknown frame kind {kind!r}; expected one of {', '.join(FRAME_KINDS)}")
+    columns: tuple[str, ...] = ()
+    data: list[list] = []
+    async for chunk in chunks:
+        if not data:
+            columns = chunk.columns
+            data = [[] for _ in columns]
+        for values, column in zip(data, zip(*chunk.rows)):
+            values.extend(column)
+    return _frame(kind, columns, data)
+
+
+def _frame(kind: str, columns: tuple[str, ...], data: list[list]) -> Any:
+    module = {"pandas": "pandas", "numpy": "numpy", "arrow": "pyarrow"}[kind]
+    try:
+        lib = __import__(module)
+    except ImportError as e:
+        raise ImportError(f"A {kind} frame needs the '{module}' package: pip install {module}") from e
+    if kind == "pandas":
+        return lib.DataFrame(dict(zip(columns, data)), columns=list(columns))
+    if kind == "numpy":
+        return {name: lib.asarray(values) for name, values in zip(columns, data)}
+    return lib.table(dict(zip(columns, data)))
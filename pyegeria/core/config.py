@@ -153,6 +153,68 @@ class DebugConfig(BaseModel):
     model_config = ConfigDict(populate_by_name=True, extra='allow')
 
 
+class RuntimeConfig(BaseModel):
+    """Runtime tuning settings: HTTP pooling, retries, caches and concurrency"""
+    # Shared HTTP connection pool (pyegeria.core._session_pool.SessionPool) - one pool per
+    # platform origin, shared by every client in the process.
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 20.0
+    http2_enabled: bool = False
+    # When clients verify platform connectivity: "eager" probes on construction, "lazy" lets the
+    # first real request do it, "off" never probes. A success is remembered per platform for
+    # connection_check_ttl seconds and shared by every client using the same SessionPool.
+    connection_check: str = "lazy"
+    connection_check_ttl: int = 300
+    # Retry policy for transient failures (pyegeria.core._retry.RetryPolicy) and the per-platform
+    # circuit breaker that fails fast after circuit_failure_threshold consecutive failures.
+    retry_max_attempts: int = 3
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 10.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 30.0
+    # Name -> GUID resolution cache used by ServerClient.__async_get_guid__
+    # (pyegeria.core._guid_cache.GuidCache). Misses are cached for the shorter negative TTL;
+    # set guid_cache_path to an SQLite file to share resolved GUIDs between runs.
+    guid_cache_enabled: bool = True
+    guid_cache_size: int = 4096
+    guid_cache_ttl: float = 600.0
+    guid_cache_negative_ttl: float = 30.0
+    guid_cache_path: str = ""
+    # Pooled, authenticated clients reused across report runs (pyegeria.core._client_pool.ClientPool);
+    # a pooled client's bearer token is re-created once it is client_pool_token_ttl seconds old.
+    client_pool_size: int = 16
+    client_pool_token_ttl: float = 1800.0
+    # MCP server: run_report calls served concurrently, and the per-call time limit in seconds.
+    mcp_max_concurrent_reports: int = 8
+    mcp_report_timeout: float = 300.0
+    # Opt-in cache of report results (pyegeria.view._report_cache). A report spec is cached only if
+    # its action declares cache_ttl, or report_cache_default_ttl is positive.
+    report_cache_enabled: bool = False
+    report_cache_size: int = 256
+    report_cache_default_ttl: float = 0.0
+    # Opt-in cache of historical overview_metrics trend points (pyegeria.view._metric_point_cache);
+    # set metric_point_cache_path to an SQLite file to keep computed points between runs.
+    metric_point_cache_enabled: bool = False
+    metric_point_cache_size: int = 4096
+    metric_point_cache_path: str = ""
+    # SQLite file of KPI results recorded by overview_metrics.collect_metric_snapshots
+    # (pyegeria.view._metric_snapshot_store); metric_trend reads history from it. Empty disables it.
+    metric_snapshot_store_path: str = ""
+    # JSON file of Dr.Egeria's expanded command specs (md_processing command_spec_cache), e.g.
+    # ~/.cache/pyegeria/command_specs.json; rebuilt whenever a command JSON file changes. Empty
+    # (the default) keeps the cache in memory only.
+    command_spec_cache_path: str = ""
+    # Dr.Egeria commands run at once by V2Dispatcher.dispatch_batch when they don't depend on
+    # each other (by the element names they target and mention). 1 runs a file strictly in order.
+    dr_egeria_max_concurrency: int = 8
+    # JSON library for request/response bodies (core/_json.py): "auto" picks orjson, then
+    # msgspec, when installed and falls back to the standard library; or name one of them.
+    json_backend: str = "auto"
+
+    model_config = ConfigDict(populate_by_name=True, extra='allow')
+
+
 class LoggingConfig(BaseModel):
     """Logging configuration settings"""
     console_filter_levels: List[str] = ["SUCCESS"]
@@ -184,6 +246,7 @@ class AppConfig(BaseModel):
     """Main application configuration"""
     Environment: EnvironmentConfig
     Debug: DebugConfig
+    Runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
     Logging: LoggingConfig
     User_Profile: UserProfileConfig = Field(alias="User Profile")
     feature_x_enabled: bool = False
@@ -204,7 +267,7 @@ class AppConfig(BaseModel):
             return getattr(self, key)
         
         # Then check if it's in any of the nested models
-        for section in [self.Environment, self.Debug, self.Logging, self.User_Profile]:
+        for section in [self.Environment, self.Debug, self.Runtime, self.Logging, self.User_Profile]:
             if hasattr(section, key):
                 return getattr(section, key)
             # Also check using the original field names (with aliases)
@@ -284,6 +347,7 @@ def load_app_config(env_file: str | None = None):
     config_dict: dict[str, Any] = {
         "Environment": {},
         "Debug": {},
+        "Runtime": {},
         "Logging": {},
         "User Profile": {},
         "feature_x_enabled": False,
@@ -315,6 +379,52 @@ def load_app_config(env_file: str | None = None):
     dbg["enable_logger_catch"] = _parse_bool_env("PYEGERIA_ENABLE_LOGGER_CATCH", bool(dbg.get("enable_logger_catch", False)))
     dbg["timeout_seconds"] = int(os.getenv("PYEGERIA_TIMEOUT_SECONDS", dbg.get("timeout_seconds", 30)))
 
+    # Runtime
+    rt = config_dict.setdefault("Runtime", {})
+    rt["http_max_connections"] = int(os.getenv("PYEGERIA_HTTP_MAX_CONNECTIONS", rt.get("http_max_connections", 100)))
+    rt["http_max_keepalive_connections"] = int(os.getenv("PYEGERIA_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+                                                         rt.get("http_max_keepalive_connections", 20)))
+    rt["http_keepalive_expiry"] = float(os.getenv("PYEGERIA_HTTP_KEEPALIVE_EXPIRY", rt.get("http_keepalive_expiry", 20.0)))
+    rt["http2_enabled"] = _parse_bool_env("PYEGERIA_HTTP2_ENABLED", bool(rt.get("http2_enabled", False)))
+    rt["connection_check"] = os.getenv("PYEGERIA_CONNECTION_CHECK", rt.get("connection_check", "lazy")).lower()
+    rt["connection_check_ttl"] = int(os.getenv("PYEGERIA_CONNECTION_CHECK_TTL", rt.get("connection_check_ttl", 300)))
+    rt["retry_max_attempts"] = int(os.getenv("PYEGERIA_RETRY_MAX_ATTEMPTS", rt.get("retry_max_attempts", 3)))
+    rt["retry_backoff_base"] = float(os.getenv("PYEGERIA_RETRY_BACKOFF_BASE", rt.get("retry_backoff_base", 0.5)))
+    rt["retry_backoff_max"] = float(os.getenv("PYEGERIA_RETRY_BACKOFF_MAX", rt.get("retry_backoff_max", 10.0)))
+    rt["circuit_failure_threshold"] = int(os.getenv("PYEGERIA_CIRCUIT_FAILURE_THRESHOLD",
+                                                    rt.get("circuit_failure_threshold", 5)))
+    rt["circuit_reset_timeout"] = float(os.getenv("PYEGERIA_CIRCUIT_RESET_TIMEOUT", rt.get("circuit_reset_timeout", 30.0)))
+    rt["guid_cache_enabled"] = _parse_bool_env("PYEGERIA_GUID_CACHE_ENABLED", bool(rt.get("guid_cache_enabled", True)))
+    rt["guid_cache_size"] = int(os.getenv("PYEGERIA_GUID_CACHE_SIZE", rt.get("guid_cache_size", 4096)))
+    rt["guid_cache_ttl"] = float(os.getenv("PYEGERIA_GUID_CACHE_TTL", rt.get("guid_cache_ttl", 600.0)))
+    rt["guid_cache_negative_ttl"] = float(os.getenv("PYEGERIA_GUID_CACHE_NEGATIVE_TTL",
+                                                    rt.get("guid_cache_negative_ttl", 30.0)))
+    rt["guid_cache_path"] = os.getenv("PYEGERIA_GUID_CACHE_PATH", rt.get("guid_cache_path", ""))
+    rt["client_pool_size"] = int(os.getenv("PYEGERIA_CLIENT_POOL_SIZE", rt.get("client_pool_size", 16)))
+    rt["client_pool_token_ttl"] = float(os.getenv("PYEGERIA_CLIENT_POOL_TOKEN_TTL",
+                                                  rt.get("client_pool_token_ttl", 1800.0)))
+    rt["mcp_max_concurrent_reports"] = int(os.getenv("PYEGERIA_MCP_MAX_CONCURRENT_REPORTS",
+                                                     rt.get("mcp_max_concurrent_reports", 8)))
+    rt["mcp_report_timeout"] = float(os.getenv("PYEGERIA_MCP_REPORT_TIMEOUT", rt.get("mcp_report_timeout", 300.0)))
+    rt["report_cache_enabled"] = _parse_bool_env("PYEGERIA_REPORT_CACHE_ENABLED",
+                                                 bool(rt.get("report_cache_enabled", False)))
+    rt["report_cache_size"] = int(os.getenv("PYEGERIA_REPORT_CACHE_SIZE", rt.get("report_cache_size", 256)))
+    rt["report_cache_default_ttl"] = float(os.getenv("PYEGERIA_REPORT_CACHE_DEFAULT_TTL",
+                                                     rt.get("report_cache_default_ttl", 0.0)))
+    rt["metric_point_cache_enabled"] = _parse_bool_env("PYEGERIA_METRIC_POINT_CACHE_ENABLED",
+                                                       bool(rt.get("metric_point_cache_enabled", False)))
+    rt["metric_point_cache_size"] = int(os.getenv("PYEGERIA_METRIC_POINT_CACHE_SIZE",
+                                                  rt.get("metric_point_cache_size", 4096)))
+    rt["metric_point_cache_path"] = os.getenv("PYEGERIA_METRIC_POINT_CACHE_PATH",
+                                              rt.get("metric_point_cache_path", ""))
+    rt["metric_snapshot_store_path"] = os.getenv("PYEGERIA_METRIC_SNAPSHOT_STORE_PATH",
+                                                 rt.get("metric_snapshot_store_path", ""))
+    rt["command_spec_cache_path"] = os.getenv("PYEGERIA_COMMAND_SPEC_CACHE_PATH",
+                                              rt.get("command_spec_cache_path", ""))
+    rt["dr_egeria_max_concurrency"] = int(os.getenv("PYEGERIA_DR_EGERIA_MAX_CONCURRENCY",
+                                                    rt.get("dr_egeria_max_concurrency", 8)))
+    rt["json_backend"] = os.getenv("PYEGERIA_JSON_BACKEND", rt.get("json_backend", "auto"))
+
     # Environment
     env = config_dict.setdefault("Environment", {})
     
@@ -527,6 +637,19 @@ class _LazySettings:
 settings = _LazySettings()
 
 
+def runtime_setting(name: str, default: Any) -> Any:
+    """Return the Runtime setting `name`, or `default` when it is unset.
+
+    Modules read their tuning settings through this at use time, so importing them never
+    forces configuration loading; if the configuration cannot be loaded, `default` is used.
+    """
+    try:
+        value = getattr(settings.Runtime, name, None)
+    except Exception:  # noqa: BLE001 -- config not ready yet; safe default
+        value = None
+    return default if value is None else value
+
+
 def pretty_print_config(env_file: str | None = None, safe: bool = True, to_console: bool = True) -> Dict[str, Dict[str, Any]]:
     """
     Pretty print the current configuration and indicate the source of each value
@@ -579,6 +702,37 @@ def pretty_print_config(env_file: str | None = None, safe: bool = True, to_conso
         ("Debug", "debug_mode"): "PYEGERIA_DEBUG_MODE",
         ("Debug", "enable_logger_catch"): "PYEGERIA_ENABLE_LOGGER_CATCH",
         ("Debug", "timeout_seconds"): "PYEGERIA_TIMEOUT_SECONDS",
+        # Runtime
+        ("Runtime", "http_max_connections"): "PYEGERIA_HTTP_MAX_CONNECTIONS",
+        ("Runtime", "http_max_keepalive_connections"): "PYEGERIA_HTTP_MAX_KEEPALIVE_CONNECTIONS",
+        ("Runtime", "http_keepalive_expiry"): "PYEGERIA_HTTP_KEEPALIVE_EXPIRY",
+        ("Runtime", "http2_enabled"): "PYEGERIA_HTTP2_ENABLED",
+        ("Runtime", "connection_check"): "PYEGERIA_CONNECTION_CHECK",
+        ("Runtime", "connection_check_ttl"): "PYEGERIA_CONNECTION_CHECK_TTL",
+        ("Runtime", "retry_max_attempts"): "PYEGERIA_RETRY_MAX_ATTEMPTS",
+        ("Runtime", "retry_backoff_base"): "PYEGERIA_RETRY_BACKOFF_BASE",
+        ("Runtime", "retry_backoff_max"): "PYEGERIA_RETRY_BACKOFF_MAX",
+        ("Runtime", "circuit_failure_threshold"): "PYEGERIA_CIRCUIT_FAILURE_THRESHOLD",
+        ("Runtime", "circuit_reset_timeout"): "PYEGERIA_CIRCUIT_RESET_TIMEOUT",
+        ("Runtime", "guid_cache_enabled"): "PYEGERIA_GUID_CACHE_ENABLED",
+        ("Runtime", "guid_cache_size"): "PYEGERIA_GUID_CACHE_SIZE",
+        ("Runtime", "guid_cache_ttl"): "PYEGERIA_GUID_CACHE_TTL",
+        ("Runtime", "guid_cache_negative_ttl"): "PYEGERIA_GUID_CACHE_NEGATIVE_TTL",
+        ("Runtime", "guid_cache_path"): "PYEGERIA_GUID_CACHE_PATH",
+        ("Runtime", "client_pool_size"): "PYEGERIA_CLIENT_POOL_SIZE",
+        ("Runtime", "client_pool_token_ttl"): "PYEGERIA_CLIENT_POOL_TOKEN_TTL",
+        ("Runtime", "mcp_max_concurrent_reports"): "PYEGERIA_MCP_MAX_CONCURRENT_REPORTS",
+        ("Runtime", "mcp_report_timeout"): "PYEGERIA_MCP_REPORT_TIMEOUT",
+        ("Runtime", "report_cache_enabled"): "PYEGERIA_REPORT_CACHE_ENABLED",
+        ("Runtime", "report_cache_size"): "PYEGERIA_REPORT_CACHE_SIZE",
+        ("Runtime", "report_cache_default_ttl"): "PYEGERIA_REPORT_CACHE_DEFAULT_TTL",
+        ("Runtime", "metric_point_cache_enabled"): "PYEGERIA_METRIC_POINT_CACHE_ENABLED",
+        ("Runtime", "metric_point_cache_size"): "PYEGERIA_METRIC_POINT_CACHE_SIZE",
+        ("Runtime", "metric_point_cache_path"): "PYEGERIA_METRIC_POINT_CACHE_PATH",
+        ("Runtime", "metric_snapshot_store_path"): "PYEGERIA_METRIC_SNAPSHOT_STORE_PATH",
+        ("Runtime", "command_spec_cache_path"): "PYEGERIA_COMMAND_SPEC_CACHE_PATH",
+        ("Runtime", "dr_egeria_max_concurrency"): "PYEGERIA_DR_EGERIA_MAX_CONCURRENCY",
+        ("Runtime", "json_backend"): "PYEGERIA_JSON_BACKEND",
         # Environment
         ("Environment", "Egeria Width"): "EGERIA_WIDTH",
         ("Environment", "Egeria Outbox"): "EGERIA_OUTBOX",
@@ -633,6 +787,7 @@ def pretty_print_config(env_file: str | None = None, safe: bool = True, to_conso
     defaults = {
         "Environment": EnvironmentConfig().model_dump(by_alias=True),
         "Debug": DebugConfig().model_dump(by_alias=True),
+        "Runtime": RuntimeConfig().model_dump(by_alias=False),
         "Logging": LoggingConfig().model_dump(by_alias=False),
         "User Profile": UserProfileConfig().model_dump(by_alias=True),
         "feature_x_enabled": False,
@@ -642,6 +797,7 @@ def pretty_print_config(env_file: str | None = None, safe: bool = True, to_conso
     sections = [
         ("Environment", cfg.Environment.model_dump(by_alias=True)),
         ("Debug", cfg.Debug.model_dump(by_alias=False)),
+        ("Runtime", cfg.Runtime.model_dump(by_alias=False)),
         ("Logging", cfg.Logging.model_dump(by_alias=False)),
         ("User Profile", cfg.User_Profile.model_dump(by_alias=True)),
     ]
@@ -682,7 +838,7 @@ def pretty_print_config(env_file: str | None = None, safe: bool = True, to_conso
 
     if to_console:
         if use_rich and console:
-            for section_name in ["Environment", "Debug", "Logging", "User Profile"]:
+            for section_name in ["Environment", "Debug", "Runtime", "Logging", "User Profile"]:
                 table = Table(title=f"{section_name} Settings", box=box.SIMPLE_HEAVY)
                 table.add_column("Key")
                 table.add_column("Value")
@@ -701,7 +857,7 @@ def pretty_print_config(env_file: str | None = None, safe: bool = True, to_conso
         else:
             # Plain text fallback
             print("Configuration:")
-            for section_name in ["Environment", "Debug", "Logging", "User Profile"]:
+            for section_name in ["Environment", "Debug", "Runtime", "Logging", "User Profile"]:
                 print(f"[{section_name}]")
                 for k, info in result[section_name].items():
                     print(f"- {k}: {info['value']} (source: {info['source']})")
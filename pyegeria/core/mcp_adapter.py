@@ -9,8 +9,10 @@ Only format sets that advertise DICT or ALL are considered eligible.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
+import weakref
 from typing import Any, Dict, Optional
 
 from loguru import logger
@@ -19,9 +21,15 @@ from pyegeria.view.base_report_formats import (
     list_mcp_format_sets,
     select_report_spec, find_report_specs,
 )
+from pyegeria.core._client_pool import get_client_pool
+from pyegeria.core._exceptions import PyegeriaUnauthorizedException
 from pyegeria.egeria_tech_client import EgeriaTech
 from pyegeria.view.format_set_executor import exec_report_spec, _async_run_report
 
+# One limiter per event loop - an asyncio.Semaphore may only be used on the loop it first ran on.
+_report_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+    weakref.WeakKeyDictionary()
+
 
 def list_reports() -> dict:
     """List eligible format sets as MCP tools (support DICT or ALL)."""
@@ -143,3 +151,65 @@ async def _async_run_report_tool(
     print(f"Report: {report}\n params: {json.dumps(params)}\n", file=sys.stderr)
     result = await _async_run_report(report, egeria_client, output_format=output_format, params=params)
     return result
+
+
+def _report_limiter() -> asyncio.Semaphore:
+    from pyegeria.core.config import runtime_setting
+    loop = asyncio.get_running_loop()
+    limiter = _report_limiters.get(loop)
+    if limiter is None:
+        limiter = _report_limiters[loop] = asyncio.Semaphore(
+            max(1, int(runtime_setting("mcp_max_concurrent_reports", 8))))
+    return limiter
+
+
+async def async_run_report(
+    *,
+    report: str,
+    params: Optional[Dict[str, Any]] = None,
+    output_format: str = "DICT",
+    egeria_client: Optional[EgeriaTech] = None,
+    timeout: Optional[float] = None,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run a report on the native asyncio path, for MCP tool handlers. Async version of run_report.
+
+    Concurrent calls run in parallel on the caller's event loop, up to the
+    `mcp_max_concurrent_reports` setting (PYEGERIA_MCP_MAX_CONCURRENT_REPORTS); further calls
+    wait for a slot. Unless `egeria_client` is given, the shared, already-authenticated
+    EgeriaTech from the client pool is used. Each call is bounded by `timeout` seconds
+    (default `mcp_report_timeout`, PYEGERIA_MCP_REPORT_TIMEOUT); cancelling the caller cancels
+    the report's in-flight Egeria requests. `use_cache=False` bypasses the report result cache.
+
+    Raises
+    ------
+    TimeoutError
+        If the report does not complete within the timeout.
+    """
+    from pyegeria.core.config import runtime_setting, settings as _settings
+
+    if timeout is None:
+        timeout = runtime_setting("mcp_report_timeout", 300.0)
+    pool = get_client_pool()
+    if egeria_client is None:
+        egeria_client = await pool.aget(
+            EgeriaTech,
+            _settings.Environment.egeria_view_server,
+            _settings.Environment.egeria_view_server_url,
+            _settings.User_Profile.user_name,
+            _settings.User_Profile.user_pwd,
+        )
+
+    async with _report_limiter():
+        try:
+            return await asyncio.wait_for(
+                _async_run_report(report, egeria_client, output_format=output_format, params=params,
+                                  use_cache=use_cache),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Report '{report}' did not complete within {timeout:g}s") from None
+        except PyegeriaUnauthorizedException:
+            pool.discard(egeria_client)
+            raise
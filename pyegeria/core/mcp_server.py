@@ -5,7 +5,6 @@ This module provides a basic MCP server for Egeria.
 """
 import re
 import sys
-import nest_asyncio
 from loguru import logger
 
 from typing import Any, Dict, Optional, Literal
@@ -13,11 +12,11 @@ from typing import Any, Dict, Optional, Literal
 from pydantic_core import ValidationError
 
 from pyegeria.egeria_tech_client import EgeriaTech
+from pyegeria.core._client_pool import get_client_pool
 from pyegeria.core._exceptions import print_validation_error
 from pyegeria.view.base_report_formats import load_egeria_report_specs
 
 GLOBAL_EGERIA_CLIENT: Optional[EgeriaTech] = None
-nest_asyncio.apply()
 
 try:
     # We use Optional[] and List[] types, so we import them.
@@ -26,7 +25,7 @@ try:
         list_reports,
         describe_report,
         run_report, _execute_egeria_call_blocking,
-        _async_run_report_tool, run_find_report_specs
+        _async_run_report_tool, async_run_report, run_find_report_specs
     )
 
     print("MCP import successful...", file=sys.stderr)
@@ -55,14 +54,15 @@ def main() -> None:
         user_id = _settings.User_Profile.user_name
         user_pwd = _settings.User_Profile.user_pwd
 
-        GLOBAL_EGERIA_CLIENT = EgeriaTech(
+        # The pooled client is the same instance run_report's handlers borrow, so
+        # this login also serves the first tool calls.
+        GLOBAL_EGERIA_CLIENT = get_client_pool().get(
+            EgeriaTech,
             _settings.Environment.egeria_view_server,
             _settings.Environment.egeria_view_server_url,
             user_id,
             user_pwd
         )
-        logger.debug("Egeria Client initialized")
-        GLOBAL_EGERIA_CLIENT.create_egeria_bearer_token("erinoverview", "secret")
         logger.debug("Egeria Client connected")
 
         load_egeria_report_specs(GLOBAL_EGERIA_CLIENT)
@@ -120,10 +120,6 @@ def main() -> None:
                 "FORM", "MD", "MERMAID", "HTML", "GRAPH",
             ] = "DICT"
     ) -> Dict[str, Any]:
-        import asyncio
-        import nest_asyncio
-        nest_asyncio.apply()
-
         """Run a report with the specified parameters."""
         print("DEBUG: Running report...", file=sys.stderr)
         # 1. Automatic Validation: MCPServer/Pydantic ensures types are correct.
@@ -162,46 +158,16 @@ def main() -> None:
         logger.debug(f"Running report={report_name} with params={params}")
 
         try:
-            # Build a fresh Egeria client bound to THIS handler's event loop and
-            # mint a fresh bearer token per call. Reusing the module-level
-            # GLOBAL_EGERIA_CLIENT (created in the server's startup loop) caused
-            # intermittent CLIENT_ERROR_400 ("unable to connect") because its
-            # httpx async client is bound to a different loop than the one
-            # MCPServer runs tool handlers in. A per-call client (mirroring
-            # exec_report_spec / the CLI) is reliable.
-            from pyegeria.core.config import settings as _settings
-            _user = _settings.User_Profile.user_name
-            _pwd = _settings.User_Profile.user_pwd
-            egeria_client = EgeriaTech(
-                _settings.Environment.egeria_view_server,
-                _settings.Environment.egeria_view_server_url,
-                _user,
-                _pwd,
+            # Native asyncio path: the shared pooled EgeriaTech, up to
+            # mcp_max_concurrent_reports reports in parallel, each bounded by
+            # mcp_report_timeout (PYEGERIA_MCP_REPORT_TIMEOUT, default 300s - large
+            # master-detail or graph reports can legitimately take well over 30s).
+            # Cancelling this handler cancels the report's in-flight requests.
+            result = await async_run_report(
+                report=report_name,
+                params=params,
+                output_format=effective_output_format,
             )
-            await egeria_client._async_create_egeria_bearer_token(_user, _pwd)
-            logger.debug("Egeria Client connected (fresh per-call client)")
-            try:
-                # Large/multi-request reports (e.g. master-detail LIST, big
-                # graph reports) can legitimately take well over 30s; a tight
-                # cap cancels them mid-request and surfaces as a confusing
-                # CLIENT_ERROR_400. Use a generous, env-configurable timeout.
-                import os
-                _report_timeout = float(os.environ.get("PYEGERIA_MCP_REPORT_TIMEOUT", "300"))
-                result = await asyncio.wait_for(
-                    _async_run_report_tool(
-                        report=report_name,
-                        egeria_client=egeria_client,
-                        params=params,
-                        output_format=effective_output_format),
-                    timeout=_report_timeout
-                )
-            finally:
-                # Release the per-call client's HTTP connections (sync method).
-                try:
-                    egeria_client.close_session()
-                except Exception:
-                    pass
-
             logger.debug("run_report completed successfully")
             return _ok(result)
         except Exception as e:
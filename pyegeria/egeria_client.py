@@ -12,45 +12,7 @@ for all use cases..using the more role based clients is often appropriate:
 
 """
 
-from pyegeria.egeria_config_client import EgeriaConfig
-from pyegeria.omvs.action_author import ActionAuthor
-from pyegeria.omvs.actor_manager import ActorManager
-from pyegeria.omvs.asset_catalog import AssetCatalog
-from pyegeria.omvs.asset_maker import AssetMaker
-from pyegeria.omvs.automated_curation import AutomatedCuration
-from pyegeria.omvs.classification_explorer import ClassificationExplorer
-from pyegeria.omvs.collection_manager import CollectionManager
-from pyegeria.omvs.community_matters_omvs import CommunityMatters
-from pyegeria.omvs.data_designer import DataDesigner
-from pyegeria.omvs.data_discovery import DataDiscovery
-from pyegeria.omvs.data_engineer import DataEngineer
-from pyegeria.omvs.digital_business import DigitalBusiness
-from pyegeria.omvs.external_links import ExternalReferences
-from pyegeria.core._server_client import ServerClient
-from pyegeria.omvs.full_omag_server_config import FullServerConfig
-from pyegeria.omvs.glossary_manager import GlossaryManager
-from pyegeria.omvs.governance_officer import GovernanceOfficer
-from pyegeria.omvs.lineage_linker import LineageLinker
-from pyegeria.omvs.location_arena import LocationArena
-from pyegeria.omvs.metadata_expert import MetadataExpert
-from pyegeria.omvs.my_profile import MyProfile
-from pyegeria.omvs.notification_manager import NotificationManager
-from pyegeria.omvs.people_organizer import PeopleOrganizer
-from pyegeria.omvs.product_manager import ProductManager
-from pyegeria.omvs.project_manager import ProjectManager
-from pyegeria.omvs.reference_data import ReferenceDataManager
-from pyegeria.omvs.registered_info import RegisteredInfo
-from pyegeria.omvs.runtime_manager import RuntimeManager
-from pyegeria.omvs.schema_maker import SchemaMaker
-from pyegeria.omvs.server_operations import ServerOps
-from pyegeria.omvs.solution_architect import SolutionArchitect
-from pyegeria.omvs.specification_properties import SpecificationProperties
-from pyegeria.omvs.subject_area import SubjectArea
-from pyegeria.omvs.template_manager_omvs import TemplateManager
-from pyegeria.omvs.time_keeper import TimeKeeper
-from pyegeria.omvs.valid_metadata import ValidMetadataManager
-from pyegeria.omvs.valid_metadata_lists import ValidMetadataLists
-from pyegeria.omvs.valid_type_lists import ValidTypeLists
+from pyegeria._lazy import resolve
 from pyegeria.core.config import settings
 
 
@@ -76,69 +38,69 @@ class Egeria:
         self.timeout = timeout
 
         self._subclient_map = {
-            "action_author": ActionAuthor,
-            "actor_manager": ActorManager,
-            "asset_catalog": AssetCatalog,
-            "asset_maker": AssetMaker,
-            "auto_curate": AutomatedCuration,
-            "automated_curation": AutomatedCuration,
-            "class_mgr": ClassificationExplorer,
-            "classification_manager": ClassificationExplorer,
-            "collections": CollectionManager,
-            "collection_manager": CollectionManager,
-            "community": CommunityMatters,
-            "community_matters": CommunityMatters,
-            "config": EgeriaConfig,
-            "data_discovery": DataDiscovery,
-            "data_engineer": DataEngineer,
-            "designer": DataDesigner,
-            "data_designer": DataDesigner,
-            "digital_business": DigitalBusiness,
-            "expert": MetadataExpert,
-            "metadata_expert": MetadataExpert,
-            "external_refs": ExternalReferences,
-            "external_references": ExternalReferences,
-            "feedback": ServerClient,
-            "feedback_manager": ServerClient,
-            "full_server_config": FullServerConfig,
-            "glossary": GlossaryManager,
-            "glossary_manager": GlossaryManager,
-            "gov_officer": GovernanceOfficer,
-            "governance_officer": GovernanceOfficer,
-            "lineage_linker": LineageLinker,
-            "location": LocationArena,
-            "my_profile": MyProfile,
-            "notifications": NotificationManager,
-            "notification_manager": NotificationManager,
-            "people_organizer": PeopleOrganizer,
-            "product_manager": ProductManager,
-            "projects": ProjectManager,
-            "project_manager": ProjectManager,
-            "reference_data": ReferenceDataManager,
-            "reg_info": RegisteredInfo,
-            "registered_info": RegisteredInfo,
-            "runtime": RuntimeManager,
-            "runtime_manager": RuntimeManager,
-            "schema_maker": SchemaMaker,
-            "server_ops": ServerOps,
-            "sol_arch": SolutionArchitect,
-            "solution_architect": SolutionArchitect,
-            "specification_properties": SpecificationProperties,
-            "subject_area": SubjectArea,
-            "subject_area_manager": SubjectArea,
-            "templates": TemplateManager,
-            "template_manager": TemplateManager,
-            "time_keeper": TimeKeeper,
-            "valid": ValidMetadataManager,
-            "valid_metadata": ValidMetadataManager,
-            "valid_metadata_lists": ValidMetadataLists,
-            "valid_type_lists": ValidTypeLists,
+            "action_author": "pyegeria.omvs.action_author.ActionAuthor",
+            "actor_manager": "pyegeria.omvs.actor_manager.ActorManager",
+            "asset_catalog": "pyegeria.omvs.asset_catalog.AssetCatalog",
+            "asset_maker": "pyegeria.omvs.asset_maker.AssetMaker",
+            "auto_curate": "pyegeria.omvs.automated_curation.AutomatedCuration",
+            "automated_curation": "pyegeria.omvs.automated_curation.AutomatedCuration",
+            "class_mgr": "pyegeria.omvs.classification_explorer.ClassificationExplorer",
+            "classification_manager": "pyegeria.omvs.classification_explorer.ClassificationExplorer",
+            "collections": "pyegeria.omvs.collection_manager.CollectionManager",
+            "collection_manager": "pyegeria.omvs.collection_manager.CollectionManager",
+            "community": "pyegeria.omvs.community_matters_omvs.CommunityMatters",
+            "community_matters": "pyegeria.omvs.community_matters_omvs.CommunityMatters",
+            "config": "pyegeria.egeria_config_client.EgeriaConfig",
+            "data_discovery": "pyegeria.omvs.data_discovery.DataDiscovery",
+            "data_engineer": "pyegeria.omvs.data_engineer.DataEngineer",
+            "designer": "pyegeria.omvs.data_designer.DataDesigner",
+            "data_designer": "pyegeria.omvs.data_designer.DataDesigner",
+            "digital_business": "pyegeria.omvs.digital_business.DigitalBusiness",
+            "expert": "pyegeria.omvs.metadata_expert.MetadataExpert",
+            "metadata_expert": "pyegeria.omvs.metadata_expert.MetadataExpert",
+            "external_refs": "pyegeria.omvs.external_links.ExternalReferences",
+            "external_references": "pyegeria.omvs.external_links.ExternalReferences",
+            "feedback": "pyegeria.core._server_client.ServerClient",
+            "feedback_manager": "pyegeria.core._server_client.ServerClient",
+            "full_server_config": "pyegeria.omvs.full_omag_server_config.FullServerConfig",
+            "glossary": "pyegeria.omvs.glossary_manager.GlossaryManager",
+            "glossary_manager": "pyegeria.omvs.glossary_manager.GlossaryManager",
+            "gov_officer": "pyegeria.omvs.governance_officer.GovernanceOfficer",
+            "governance_officer": "pyegeria.omvs.governance_officer.GovernanceOfficer",
+            "lineage_linker": "pyegeria.omvs.lineage_linker.LineageLinker",
+            "location": "pyegeria.omvs.location_arena.LocationArena",
+            "my_profile": "pyegeria.omvs.my_profile.MyProfile",
+            "notifications": "pyegeria.omvs.notification_manager.NotificationManager",
+            "notification_manager": "pyegeria.omvs.notification_manager.NotificationManager",
+            "people_organizer": "pyegeria.omvs.people_organizer.PeopleOrganizer",
+            "product_manager": "pyegeria.omvs.product_manager.ProductManager",
+            "projects": "pyegeria.omvs.project_manager.ProjectManager",
+            "project_manager": "pyegeria.omvs.project_manager.ProjectManager",
+            "reference_data": "pyegeria.omvs.reference_data.ReferenceDataManager",
+            "reg_info": "pyegeria.omvs.registered_info.RegisteredInfo",
+            "registered_info": "pyegeria.omvs.registered_info.RegisteredInfo",
+            "runtime": "pyegeria.omvs.runtime_manager.RuntimeManager",
+            "runtime_manager": "pyegeria.omvs.runtime_manager.RuntimeManager",
+            "schema_maker": "pyegeria.omvs.schema_maker.SchemaMaker",
+            "server_ops": "pyegeria.omvs.server_operations.ServerOps",
+            "sol_arch": "pyegeria.omvs.solution_architect.SolutionArchitect",
+            "solution_architect": "pyegeria.omvs.solution_architect.SolutionArchitect",
+            "specification_properties": "pyegeria.omvs.specification_properties.SpecificationProperties",
+            "subject_area": "pyegeria.omvs.subject_area.SubjectArea",
+            "subject_area_manager": "pyegeria.omvs.subject_area.SubjectArea",
+            "templates": "pyegeria.omvs.template_manager_omvs.TemplateManager",
+            "template_manager": "pyegeria.omvs.template_manager_omvs.TemplateManager",
+            "time_keeper": "pyegeria.omvs.time_keeper.TimeKeeper",
+            "valid": "pyegeria.omvs.valid_metadata.ValidMetadataManager",
+            "valid_metadata": "pyegeria.omvs.valid_metadata.ValidMetadataManager",
+            "valid_metadata_lists": "pyegeria.omvs.valid_metadata_lists.ValidMetadataLists",
+            "valid_type_lists": "pyegeria.omvs.valid_type_lists.ValidTypeLists",
         }
         self._instantiated_clients = {}
 
     def _get_subclient(self, attr_name: str):
         if attr_name not in self._instantiated_clients:
-            client_cls = self._subclient_map[attr_name]
+            client_cls = resolve(self._subclient_map[attr_name])
             self._instantiated_clients[attr_name] = client_cls(
                 self.view_server,
                 self.platform_url,
@@ -158,8 +120,8 @@ class Egeria:
         for inst in self._instantiated_clients.values():
             if hasattr(inst, name):
                 return getattr(inst, name)
-        for attr_name, client_cls in self._subclient_map.items():
-            if hasattr(client_cls, name):
+        for attr_name, client_path in self._subclient_map.items():
+            if hasattr(resolve(client_path), name):
                 return getattr(self._get_subclient(attr_name), name)
         raise AttributeError(f"{self.__class__.__name__} object has no attribute {name}")
 
@@ -5,47 +5,10 @@ Copyright Contributors to the ODPi Egeria project.
 The Tech Client is a facade that provides a unified interface to the most 
 commonly used technical OMVS modules.
 """
-from pyegeria.omvs.action_author import ActionAuthor
-from pyegeria.omvs.actor_manager import ActorManager
-from pyegeria.omvs.asset_catalog import AssetCatalog
-from pyegeria.omvs.asset_maker import AssetMaker
-from pyegeria.omvs.automated_curation import AutomatedCuration
-from pyegeria.omvs.classification_explorer import ClassificationExplorer
-from pyegeria.omvs.collection_manager import CollectionManager
-from pyegeria.omvs.community_matters_omvs import CommunityMatters
-from pyegeria.omvs.connection_maker import ConnectionMaker
-from pyegeria.omvs.data_designer import DataDesigner
-from pyegeria.omvs.data_discovery import DataDiscovery
-from pyegeria.omvs.data_engineer import DataEngineer
-from pyegeria.omvs.digital_business import DigitalBusiness
-from pyegeria.omvs.external_links import ExternalReferences
-from pyegeria.core._server_client import ServerClient
-from pyegeria.omvs.glossary_manager import GlossaryManager
-from pyegeria.omvs.governance_officer import GovernanceOfficer
-from pyegeria.omvs.lineage_linker import LineageLinker
-from pyegeria.omvs.location_arena import LocationArena
-from pyegeria.omvs.metadata_expert import MetadataExpert
-from pyegeria.omvs.my_profile import MyProfile
-from pyegeria.omvs.privacy_officer import PrivacyOfficer
-from pyegeria.omvs.notification_manager import NotificationManager
-from pyegeria.omvs.people_organizer import PeopleOrganizer
-from pyegeria.omvs.product_manager import ProductManager
-from pyegeria.omvs.project_manager import ProjectManager
-from pyegeria.omvs.reference_data import ReferenceDataManager
-from pyegeria.omvs.registered_info import RegisteredInfo
-from pyegeria.omvs.runtime_manager import RuntimeManager
-from pyegeria.omvs.schema_maker import SchemaMaker
-from pyegeria.omvs.server_operations import ServerOps
-from pyegeria.omvs.security_officer import SecurityOfficer
-from pyegeria.omvs.solution_architect import SolutionArchitect
-from pyegeria.omvs.specification_properties import SpecificationProperties
-from pyegeria.omvs.subject_area import SubjectArea
-from pyegeria.omvs.template_manager_omvs import TemplateManager
-from pyegeria.omvs.time_keeper import TimeKeeper
-from pyegeria.omvs.valid_metadata import ValidMetadataManager
-from pyegeria.omvs.valid_metadata_lists import ValidMetadataLists
-from pyegeria.omvs.valid_type_lists import ValidTypeLists
+from pyegeria._lazy import resolve
 from pyegeria.core._globals import NO_ELEMENTS_FOUND
+from pyegeria.core._paging import aiter_find, iter_find
+from pyegeria.core._session_pool import SessionPool
 from pyegeria.core.config import settings
 
 class EgeriaTech:
@@ -63,6 +26,10 @@ class EgeriaTech:
             The password associated with the user_id. Defaults to None
         token: str, optional
             Bearer token
+        session_pool: SessionPool, optional
+            Connection pool shared by every sub-client. Defaults to the process-wide pool, so
+            sub-clients already share keep-alive connections to the view server; pass a
+            dedicated SessionPool to scope connections (and their lifecycle) to this client.
 
     Methods:
         Methods are provided by composed sub-clients via delegation.
@@ -76,6 +43,7 @@ class EgeriaTech:
         user_pwd: str = None,
         token: str = None,
         timeout: int = None,
+        session_pool: SessionPool = None,
     ):
         self.view_server = view_server or settings.Environment.egeria_view_server
         self.platform_url = platform_url or settings.Environment.egeria_platform_url
@@ -83,68 +51,69 @@ class EgeriaTech:
         self.user_pwd = user_pwd or settings.User_Profile.user_pwd
         self.token = token
         self.timeout = timeout
+        self.session_pool = session_pool
 
-        # Mapping of attribute names to their classes for lazy loading
+        # Attribute name -> dotted path of the sub-client class; a class is imported on first use
         self._subclient_map = {
-            "auto_curate": AutomatedCuration,
-            "automated_curation": AutomatedCuration,
-            "class_mgr": ClassificationExplorer,
-            "classification_manager": ClassificationExplorer,
-            "reg_info": RegisteredInfo,
-            "registered_info": RegisteredInfo,
-            "runtime": RuntimeManager,
-            "runtime_manager": RuntimeManager,
-            "valid": ValidMetadataManager,
-            "valid_metadata": ValidMetadataManager,
-            "expert": MetadataExpert,
-            "metadata_expert": MetadataExpert,
-            "sol_arch": SolutionArchitect,
-            "solution_architect": SolutionArchitect,
-            "designer": DataDesigner,
-            "data_designer": DataDesigner,
-            "glossary": GlossaryManager,
-            "glossary_manager": GlossaryManager,
-            "templates": TemplateManager,
-            "template_manager": TemplateManager,
-            "gov_officer": GovernanceOfficer,
-            "governance_officer": GovernanceOfficer,
-            "privacy_officer": PrivacyOfficer,
-            "collections": CollectionManager,
-            "collection_manager": CollectionManager,
-            "external_references": ExternalReferences,
-            "external_refs": ExternalReferences,
-            "actor_manager": ActorManager,
-            "action_author": ActionAuthor,
-            "asset_catalog": AssetCatalog,
-            "asset_maker": AssetMaker,
-            "connection_maker": ConnectionMaker,
-            "time_keeper": TimeKeeper,
-            "product_manager": ProductManager,
-            "location_arena": LocationArena,
-            "data_discovery": DataDiscovery,
-            "data_engineer": DataEngineer,
-            "security_officer": SecurityOfficer,
-            "digital_business": DigitalBusiness,
-            "lineage_linker": LineageLinker,
-            "schema_maker": SchemaMaker,
-            "server_ops": ServerOps,
-            "valid_types": ValidTypeLists,
-            "valid_type_lists": ValidTypeLists,
-            "valid_metadata_lists": ValidMetadataLists,
-            "community": CommunityMatters,
-            "community_matters": CommunityMatters,
-            "feedback": ServerClient,
-            "feedback_manager": ServerClient,
-            "my_profile": MyProfile,
-            "notifications": NotificationManager,
-            "notification_manager": NotificationManager,
-            "people_organizer": PeopleOrganizer,
-            "projects": ProjectManager,
-            "project_manager": ProjectManager,
-            "reference_data": ReferenceDataManager,
-            "specification_properties": SpecificationProperties,
-            "subject_area": SubjectArea,
-            "subject_area_manager": SubjectArea,
+            "auto_curate": "pyegeria.omvs.automated_curation.AutomatedCuration",
+            "automated_curation": "pyegeria.omvs.automated_curation.AutomatedCuration",
+            "class_mgr": "pyegeria.omvs.classification_explorer.ClassificationExplorer",
+            "classification_manager": "pyegeria.omvs.classification_explorer.ClassificationExplorer",
+            "reg_info": "pyegeria.omvs.registered_info.RegisteredInfo",
+            "registered_info": "pyegeria.omvs.registered_info.RegisteredInfo",
+            "runtime": "pyegeria.omvs.runtime_manager.RuntimeManager",
+            "runtime_manager": "pyegeria.omvs.runtime_manager.RuntimeManager",
+            "valid": "pyegeria.omvs.valid_metadata.ValidMetadataManager",
+            "valid_metadata": "pyegeria.omvs.valid_metadata.ValidMetadataManager",
+            "expert": "pyegeria.omvs.metadata_expert.MetadataExpert",
+            "metadata_expert": "pyegeria.omvs.metadata_expert.MetadataExpert",
+            "sol_arch": "pyegeria.omvs.solution_architect.SolutionArchitect",
+            "solution_architect": "pyegeria.omvs.solution_architect.SolutionArchitect",
+            "designer": "pyegeria.omvs.data_designer.DataDesigner",
+            "data_designer": "pyegeria.omvs.data_designer.DataDesigner",
+            "glossary": "pyegeria.omvs.glossary_manager.GlossaryManager",
+            "glossary_manager": "pyegeria.omvs.glossary_manager.GlossaryManager",
+            "templates": "pyegeria.omvs.template_manager_omvs.TemplateManager",
+            "template_manager": "pyegeria.omvs.template_manager_omvs.TemplateManager",
+            "gov_officer": "pyegeria.omvs.governance_officer.GovernanceOfficer",
+            "governance_officer": "pyegeria.omvs.governance_officer.GovernanceOfficer",
+            "privacy_officer": "pyegeria.omvs.privacy_officer.PrivacyOfficer",
+            "collections": "pyegeria.omvs.collection_manager.CollectionManager",
+            "collection_manager": "pyegeria.omvs.collection_manager.CollectionManager",
+            "external_references": "pyegeria.omvs.external_links.ExternalReferences",
+            "external_refs": "pyegeria.omvs.external_links.ExternalReferences",
+            "actor_manager": "pyegeria.omvs.actor_manager.ActorManager",
+            "action_author": "pyegeria.omvs.action_author.ActionAuthor",
+            "asset_catalog": "pyegeria.omvs.asset_catalog.AssetCatalog",
+            "asset_maker": "pyegeria.omvs.asset_maker.AssetMaker",
+            "connection_maker": "pyegeria.omvs.connection_maker.ConnectionMaker",
+            "time_keeper": "pyegeria.omvs.time_keeper.TimeKeeper",
+            "product_manager": "pyegeria.omvs.product_manager.ProductManager",
+            "location_arena": "pyegeria.omvs.location_arena.LocationArena",
+            "data_discovery": "pyegeria.omvs.data_discovery.DataDiscovery",
+            "data_engineer": "pyegeria.omvs.data_engineer.DataEngineer",
+            "security_officer": "pyegeria.omvs.security_officer.SecurityOfficer",
+            "digital_business": "pyegeria.omvs.digital_business.DigitalBusiness",
+            "lineage_linker": "pyegeria.omvs.lineage_linker.LineageLinker",
+            "schema_maker": "pyegeria.omvs.schema_maker.SchemaMaker",
+            "server_ops": "pyegeria.omvs.server_operations.ServerOps",
+            "valid_types": "pyegeria.omvs.valid_type_lists.ValidTypeLists",
+            "valid_type_lists": "pyegeria.omvs.valid_type_lists.ValidTypeLists",
+            "valid_metadata_lists": "pyegeria.omvs.valid_metadata_lists.ValidMetadataLists",
+            "community": "pyegeria.omvs.community_matters_omvs.CommunityMatters",
+            "community_matters": "pyegeria.omvs.community_matters_omvs.CommunityMatters",
+            "feedback": "pyegeria.core._server_client.ServerClient",
+            "feedback_manager": "pyegeria.core._server_client.ServerClient",
+            "my_profile": "pyegeria.omvs.my_profile.MyProfile",
+            "notifications": "pyegeria.omvs.notification_manager.NotificationManager",
+            "notification_manager": "pyegeria.omvs.notification_manager.NotificationManager",
+            "people_organizer": "pyegeria.omvs.people_organizer.PeopleOrganizer",
+            "projects": "pyegeria.omvs.project_manager.ProjectManager",
+            "project_manager": "pyegeria.omvs.project_manager.ProjectManager",
+            "reference_data": "pyegeria.omvs.reference_data.ReferenceDataManager",
+            "specification_properties": "pyegeria.omvs.specification_properties.SpecificationProperties",
+            "subject_area": "pyegeria.omvs.subject_area.SubjectArea",
+            "subject_area_manager": "pyegeria.omvs.subject_area.SubjectArea",
         }
         self._instantiated_clients = {}
         self.NO_ELEMENTS_FOUND = NO_ELEMENTS_FOUND
@@ -152,7 +121,7 @@ class EgeriaTech:
     def _get_subclient(self, attr_name: str):
         """Lazy-load and cache sub-clients."""
         if attr_name not in self._instantiated_clients:
-            client_cls = self._subclient_map[attr_name]
+            client_cls = resolve(self._subclient_map[attr_name])
             self._instantiated_clients[attr_name] = client_cls(
                 self.view_server,
                 self.platform_url,
@@ -161,6 +130,8 @@ class EgeriaTech:
                 self.token,
                 timeout=self.timeout,
             )
+            if self.session_pool is not None:
+                self._instantiated_clients[attr_name].use_session_pool(self.session_pool)
         return self._instantiated_clients[attr_name]
 
     def __getattr__(self, name):
@@ -174,9 +145,9 @@ class EgeriaTech:
             if hasattr(inst, name):
                 return getattr(inst, name)
 
-        # Look through the map for a class that provides this method
-        for attr_name, client_cls in self._subclient_map.items():
-            if hasattr(client_cls, name):
+        # Look through the map for a class that provides this method, importing in map order
+        for attr_name, client_path in self._subclient_map.items():
+            if hasattr(resolve(client_path), name):
                 client = self._get_subclient(attr_name)
                 return getattr(client, name)
 
@@ -184,6 +155,27 @@ class EgeriaTech:
             f"{self.__class__.__name__!s} object has no attribute {name!r}"
         )
 
+    def _paged_method(self, find):
+        if callable(find):
+            return find
+        return getattr(self, find if find.startswith("_async_") else f"_async_{find}")
+
+    def aiter_find(self, find, *args, **kwargs):
+        """Stream every element of a find/get request from whichever sub-client provides it (Async).
+
+        `find` is a method name such as "find_collections" or an async bound method; see
+        ServerClient.aiter_find for the paging options.
+        """
+        return aiter_find(self._paged_method(find), *args, **kwargs)
+
+    def iter_find(self, find, *args, **kwargs):
+        """Stream every element of a find/get request from whichever sub-client provides it.
+
+        `find` is a method name such as "find_collections" or an async bound method; see
+        ServerClient.iter_find for the paging options.
+        """
+        return iter_find(self._paged_method(find), *args, **kwargs)
+
     async def _async_create_egeria_bearer_token(
             self, user_id: str = None, password: str = None, new_password: str = None
     ) -> str:
@@ -1,43 +1,53 @@
 """
 OMVS Module Clients for ODPi Egeria.
+
+Each client module is imported the first time its class is used (see pyegeria._lazy).
 """
-from pyegeria.omvs.action_author import ActionAuthor
-from pyegeria.omvs.actor_manager import ActorManager
-from pyegeria.omvs.asset_catalog import AssetCatalog
-from pyegeria.omvs.asset_maker import AssetMaker
-from pyegeria.omvs.automated_curation import AutomatedCuration
-from pyegeria.omvs.classification_explorer import ClassificationExplorer
-from pyegeria.omvs.collection_manager import CollectionManager
-from pyegeria.omvs.community_matters_omvs import CommunityMatters
-from pyegeria.omvs.data_designer import DataDesigner
-from pyegeria.omvs.data_discovery import DataDiscovery
-from pyegeria.omvs.data_engineer import DataEngineer
-from pyegeria.omvs.digital_business import DigitalBusiness
-from pyegeria.omvs.external_links import ExternalReferences
-from pyegeria.omvs.full_omag_server_config import FullServerConfig
-from pyegeria.omvs.glossary_manager import GlossaryManager
-from pyegeria.omvs.governance_officer import GovernanceOfficer
-from pyegeria.omvs.lineage_linker import LineageLinker
-from pyegeria.omvs.location_arena import LocationArena
-from pyegeria.omvs.metadata_expert import MetadataExpert
-from pyegeria.omvs.my_profile import MyProfile
-from pyegeria.omvs.notification_manager import NotificationManager
-from pyegeria.omvs.people_organizer import PeopleOrganizer
-from pyegeria.omvs.product_manager import ProductManager
-from pyegeria.omvs.project_manager import ProjectManager
-from pyegeria.omvs.reference_data import ReferenceDataManager
-from pyegeria.omvs.registered_info import RegisteredInfo
-from pyegeria.omvs.runtime_manager import RuntimeManager
-from pyegeria.omvs.schema_maker import SchemaMaker
-from pyegeria.omvs.server_operations import ServerOps
-from pyegeria.omvs.solution_architect import SolutionArchitect
-from pyegeria.omvs.specification_properties import SpecificationProperties
-from pyegeria.omvs.subject_area import SubjectArea
-from pyegeria.omvs.template_manager_omvs import TemplateManager
-from pyegeria.omvs.time_keeper import TimeKeeper
-from pyegeria.omvs.valid_metadata import ValidMetadataManager
-from pyegeria.omvs.valid_metadata_lists import ValidMetadataLists
-from pyegeria.omvs.valid_type_lists import ValidTypeLists
+from pyegeria._lazy import lazy_exports
+
+# Public name -> defining module, imported on first use.
+_LAZY_EXPORTS = {
+    "ActionAuthor": "pyegeria.omvs.action_author",
+    "ActorManager": "pyegeria.omvs.actor_manager",
+    "AssetCatalog": "pyegeria.omvs.asset_catalog",
+    "AssetMaker": "pyegeria.omvs.asset_maker",
+    "AutomatedCuration": "pyegeria.omvs.automated_curation",
+    "ClassificationExplorer": "pyegeria.omvs.classification_explorer",
+    "CollectionManager": "pyegeria.omvs.collection_manager",
+    "CommunityMatters": "pyegeria.omvs.community_matters_omvs",
+    "DataDesigner": "pyegeria.omvs.data_designer",
+    "DataDiscovery": "pyegeria.omvs.data_discovery",
+    "DataEngineer": "pyegeria.omvs.data_engineer",
+    "DigitalBusiness": "pyegeria.omvs.digital_business",
+    "ExternalReferences": "pyegeria.omvs.external_links",
+    "FullServerConfig": "pyegeria.omvs.full_omag_server_config",
+    "GlossaryManager": "pyegeria.omvs.glossary_manager",
+    "GovernanceOfficer": "pyegeria.omvs.governance_officer",
+    "LineageLinker": "pyegeria.omvs.lineage_linker",
+    "LocationArena": "pyegeria.omvs.location_arena",
+    "MetadataExpert": "pyegeria.omvs.metadata_expert",
+    "MyProfile": "pyegeria.omvs.my_profile",
+    "NotificationManager": "pyegeria.omvs.notification_manager",
+    "PeopleOrganizer": "pyegeria.omvs.people_organizer",
+    "ProductManager": "pyegeria.omvs.product_manager",
+    "ProjectManager": "pyegeria.omvs.project_manager",
+    "ReferenceDataManager": "pyegeria.omvs.reference_data",
+    "RegisteredInfo": "pyegeria.omvs.registered_info",
+    "RuntimeManager": "pyegeria.omvs.runtime_manager",
+    "SchemaMaker": "pyegeria.omvs.schema_maker",
+    "ServerOps": "pyegeria.omvs.server_operations",
+    "SolutionArchitect": "pyegeria.omvs.solution_architect",
+    "SpecificationProperties": "pyegeria.omvs.specification_properties",
+    "SubjectArea": "pyegeria.omvs.subject_area",
+    "TemplateManager": "pyegeria.omvs.template_manager_omvs",
+    "TimeKeeper": "pyegeria.omvs.time_keeper",
+    "ValidMetadataManager": "pyegeria.omvs.valid_metadata",
+    "ValidMetadataLists": "pyegeria.omvs.valid_metadata_lists",
+    "ValidTypeLists": "pyegeria.omvs.valid_type_lists",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     "ActionAuthor",
@@ -6,7 +6,6 @@ Copyright Contributors to the ODPi Egeria project.
 
 """
 
-import asyncio
 from typing import Optional, Any
 
 from loguru import logger
@@ -189,7 +188,7 @@ class ActorManager(ServerClient):
 
            """
 
-        return asyncio.get_event_loop().run_until_complete(self._async_create_actor_profile(body))
+        return self._run_sync(self._async_create_actor_profile(body))
 
     #######
 
@@ -306,8 +305,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_create_actor_profile_from_template(body))
+        resp = self._run_sync(self._async_create_actor_profile_from_template(body))
         return resp
 
     @dynamic_catch
@@ -428,7 +426,7 @@ class ActorManager(ServerClient):
         }
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_update_actor_profile(actor_profile_guid, body))
 
     @dynamic_catch
@@ -534,8 +532,7 @@ class ActorManager(ServerClient):
             }
 
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_asset_to_profile(asset_guid, it_profile_guid, body))
+        self._run_sync(self._async_link_asset_to_profile(asset_guid, it_profile_guid, body))
 
     @dynamic_catch
     async def _async_detach_asset_from_profile(self, asset_guid: str, it_profile_guid: str,
@@ -623,8 +620,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_asset_from_profile(asset_guid, it_profile_guid, body))
+        self._run_sync(self._async_detach_asset_from_profile(asset_guid, it_profile_guid, body))
 
     @dynamic_catch
     async def _async_delete_actor_profile(self, actor_profile_guid: str,
@@ -715,8 +711,7 @@ class ActorManager(ServerClient):
            "forDuplicateProcessing": false
          }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_actor_profile(actor_profile_guid, body, cascade))
+        self._run_sync(self._async_delete_actor_profile(actor_profile_guid, body, cascade))
 
     @dynamic_catch
     async def _async_find_actor_profiles(
@@ -879,8 +874,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_actor_profiles(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -1020,8 +1014,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actor_profiles_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -1126,8 +1119,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actor_profile_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -1370,7 +1362,7 @@ class ActorManager(ServerClient):
 
            """
 
-        return asyncio.get_event_loop().run_until_complete(self._async_create_actor_role(body))
+        return self._run_sync(self._async_create_actor_role(body))
 
     @dynamic_catch
     async def _async_create_actor_role_from_template(self, body: Optional[dict | TemplateRequestBody] = None) -> str:
@@ -1485,8 +1477,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_create_actor_role_from_template(body))
+        resp = self._run_sync(self._async_create_actor_role_from_template(body))
         return resp
 
     @dynamic_catch
@@ -1607,7 +1598,7 @@ class ActorManager(ServerClient):
         }
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_update_actor_role(actor_role_guid, body))
 
     @dynamic_catch
@@ -1707,8 +1698,7 @@ class ActorManager(ServerClient):
             }
 
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_person_role_to_profile(person_role_guid, person_profile_guid, body))
+        self._run_sync(self._async_link_person_role_to_profile(person_role_guid, person_profile_guid, body))
 
     @dynamic_catch
     async def _async_detach_person_role_from_profile(self, person_role_guid: str, person_profile_guid: str,
@@ -1797,8 +1787,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_person_role_from_profile(person_role_guid, person_profile_guid, body))
 
     #
@@ -1899,8 +1888,7 @@ class ActorManager(ServerClient):
             }
 
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_team_role_to_profile(team_role_guid, team_profile_guid, body))
+        self._run_sync(self._async_link_team_role_to_profile(team_role_guid, team_profile_guid, body))
 
     @dynamic_catch
     async def _async_detach_team_role_from_profile(self, team_role_guid: str, team_profile_guid: str,
@@ -1988,8 +1976,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_team_role_from_profile(team_role_guid, team_profile_guid, body))
+        self._run_sync(self._async_detach_team_role_from_profile(team_role_guid, team_profile_guid, body))
 
     #
     @dynamic_catch
@@ -2089,8 +2076,7 @@ class ActorManager(ServerClient):
             }
 
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_it_profile_role_to_it_profile(it_profile_role_guid, it_profile_guid, body))
 
     @dynamic_catch
@@ -2180,8 +2166,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_it_profile_role_from_it_profile(it_profile_role_guid, it_profile_guid, body))
 
     #
@@ -2276,8 +2261,7 @@ class ActorManager(ServerClient):
            "forDuplicateProcessing": false
          }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_actor_role(actor_role_guid, body, cascade))
+        self._run_sync(self._async_delete_actor_role(actor_role_guid, body, cascade))
 
     @dynamic_catch
     async def _async_find_actor_roles(
@@ -2440,8 +2424,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_actor_roles(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -2581,8 +2564,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actor_roles_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -2687,8 +2669,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actor_role_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -2944,7 +2925,7 @@ class ActorManager(ServerClient):
 
             """
 
-        return asyncio.get_event_loop().run_until_complete(self._async_create_user_identity(body))
+        return self._run_sync(self._async_create_user_identity(body))
 
     @dynamic_catch
     async def _async_create_user_identity_from_template(self, body: Optional[dict | TemplateRequestBody] = None) -> str:
@@ -3057,8 +3038,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_create_user_identity_from_template(body))
+        resp = self._run_sync(self._async_create_user_identity_from_template(body))
         return resp
 
     @dynamic_catch
@@ -3181,7 +3161,7 @@ class ActorManager(ServerClient):
         }
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_update_user_identity(user_identity_guid, body))
 
     @dynamic_catch
@@ -3282,8 +3262,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_identity_to_profile(user_identity_guid, actor_profile_guid, body))
+        self._run_sync(self._async_link_identity_to_profile(user_identity_guid, actor_profile_guid, body))
 
     @dynamic_catch
     async def _async_detach_identity_from_profile(self, user_identity_guid: str, actor_profile_guid: str,
@@ -3372,8 +3351,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_identity_from_profile(user_identity_guid, actor_profile_guid, body))
+        self._run_sync(self._async_detach_identity_from_profile(user_identity_guid, actor_profile_guid, body))
 
     @dynamic_catch
     async def _async_link_assignment_scope(self, scope_element_guid: str, actor_guid: str,
@@ -3474,8 +3452,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_assignment_scope(scope_element_guid, actor_guid, body))
+        self._run_sync(self._async_link_assignment_scope(scope_element_guid, actor_guid, body))
 
     @dynamic_catch
     async def _async_detach_assignment_scope(self, scope_element_guid: str, actor_guid: str,
@@ -3562,8 +3539,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_assignment_scope(scope_element_guid, actor_guid, body))
+        self._run_sync(self._async_detach_assignment_scope(scope_element_guid, actor_guid, body))
 
     @dynamic_catch
     async def _async_add_security_group_membership(self, user_identity_guid: str, security_groups: list[str] = [""],
@@ -3664,8 +3640,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_security_group_membership(user_identity_guid, security_groups, body))
+        self._run_sync(self._async_add_security_group_membership(user_identity_guid, security_groups, body))
 
     @dynamic_catch
     async def _async_update_security_group_membership(self, user_identity_guid: str,
@@ -3762,8 +3737,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing" : false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_security_group_membership(user_identity_guid, body))
+        self._run_sync(self._async_update_security_group_membership(user_identity_guid, body))
 
     @dynamic_catch
     async def _async_remove_all_security_group_memberships(self, user_identity_guid: str,
@@ -3848,8 +3822,7 @@ class ActorManager(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_identity_from_profile(user_identity_guid, body))
+        self._run_sync(self._async_detach_identity_from_profile(user_identity_guid, body))
 
     #
     # do deletes etc
@@ -3944,8 +3917,7 @@ class ActorManager(ServerClient):
            "forDuplicateProcessing": false
          }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_user_identity(user_identity_guid, body, cascade))
+        self._run_sync(self._async_delete_user_identity(user_identity_guid, body, cascade))
 
     @dynamic_catch
     async def _async_find_user_identities(
@@ -4108,8 +4080,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_user_identities(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -4261,8 +4232,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_user_identities_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -4368,8 +4338,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_user_identity_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -4620,7 +4589,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_contribution_record(actor_profile_guid, body))
+        return self._run_sync(self._async_create_contribution_record(actor_profile_guid, body))
 
     @dynamic_catch
     async def _async_update_contribution_record(self, contribution_record_guid: str, body: Optional[dict | UpdateElementRequestBody] = None) -> None:
@@ -4741,7 +4710,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        return asyncio.run(self._async_update_contribution_record(contribution_record_guid, body))
+        return self._run_sync(self._async_update_contribution_record(contribution_record_guid, body))
 
     @dynamic_catch
     async def _async_delete_contribution_record(self, contribution_record_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -4822,7 +4791,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        return asyncio.run(self._async_delete_contribution_record(contribution_record_guid, body))
+        return self._run_sync(self._async_delete_contribution_record(contribution_record_guid, body))
 
     @dynamic_catch
     async def _async_get_contribution_records_by_name(
@@ -4953,8 +4922,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_contribution_records_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -5131,8 +5099,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_contribution_records(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -5216,8 +5183,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_all_contribution_records(
                 start_from=start_from,
                 page_size=page_size,
@@ -5316,8 +5282,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_contribution_record_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -5475,7 +5440,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_contact_details(body))
+        return self._run_sync(self._async_create_contact_details(body))
 
     @dynamic_catch
     async def _async_create_contact_details_from_template(self, body: Optional[dict | TemplateRequestBody] = None) -> str:
@@ -5612,7 +5577,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_contact_details_from_template(body))
+        return self._run_sync(self._async_create_contact_details_from_template(body))
 
     @dynamic_catch
     async def _async_update_contact_details(self, contact_details_guid: str, body: Optional[dict | UpdateElementRequestBody] = None) -> None:
@@ -5735,7 +5700,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        return asyncio.run(self._async_update_contact_details(contact_details_guid, body))
+        return self._run_sync(self._async_update_contact_details(contact_details_guid, body))
 
     @dynamic_catch
     async def _async_delete_contact_details(self, contact_details_guid: str, body: Optional[dict | DeleteElementRequestBody] = None) -> None:
@@ -5816,7 +5781,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        return asyncio.run(self._async_delete_contact_details(contact_details_guid, body))
+        return self._run_sync(self._async_delete_contact_details(contact_details_guid, body))
 
     @dynamic_catch
     async def _async_link_contact_details(self, element_guid: str, contact_details_guid: str,
@@ -5915,8 +5880,7 @@ class ActorManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_contact_details(element_guid, contact_details_guid, body))
+        self._run_sync(self._async_link_contact_details(element_guid, contact_details_guid, body))
 
     @dynamic_catch
     async def _async_detach_contact_details(self, element_guid: str, contact_details_guid: str,
@@ -6005,8 +5969,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_contact_details(element_guid, contact_details_guid, body))
+        self._run_sync(self._async_detach_contact_details(element_guid, contact_details_guid, body))
 
     @dynamic_catch
     async def _async_get_contact_details_by_name(
@@ -6137,8 +6100,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_contact_details_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -6315,8 +6277,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_contact_details(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -6428,8 +6389,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_contact_details_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -6532,7 +6492,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_perspective(body))
+        return self._run_sync(self._async_create_perspective(body))
 
     @dynamic_catch
     async def _async_create_perspective_from_template(self, body: Optional[dict | TemplateRequestBody] = None) -> str:
@@ -6630,7 +6590,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_perspective_from_template(body))
+        return self._run_sync(self._async_create_perspective_from_template(body))
 
     @dynamic_catch
     async def _async_update_perspective(self, perspective_guid: str, body: Optional[dict | UpdateElementRequestBody] = None) -> None:
@@ -6729,7 +6689,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_update_perspective(perspective_guid, body))
+        return self._run_sync(self._async_update_perspective(perspective_guid, body))
 
     @dynamic_catch
     async def _async_delete_perspective(self, perspective_guid: str, body: Optional[dict | DeleteElementRequestBody] = None) -> None:
@@ -6812,7 +6772,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        return asyncio.run(self._async_delete_perspective(perspective_guid, body))
+        return self._run_sync(self._async_delete_perspective(perspective_guid, body))
 
     @dynamic_catch
     async def _async_get_perspectives_by_name(
@@ -6943,8 +6903,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_perspectives_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -7121,8 +7080,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_perspectives(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -7234,8 +7192,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_perspective_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -7338,7 +7295,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_skill(body))
+        return self._run_sync(self._async_create_skill(body))
 
     @dynamic_catch
     async def _async_create_skill_from_template(self, body: Optional[dict | TemplateRequestBody] = None) -> str:
@@ -7436,7 +7393,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_create_skill_from_template(body))
+        return self._run_sync(self._async_create_skill_from_template(body))
 
     @dynamic_catch
     async def _async_update_skill(self, skill_guid: str, body: Optional[dict | UpdateElementRequestBody] = None) -> None:
@@ -7535,7 +7492,7 @@ class ActorManager(ServerClient):
           }
         }
         """
-        return asyncio.run(self._async_update_skill(skill_guid, body))
+        return self._run_sync(self._async_update_skill(skill_guid, body))
 
     @dynamic_catch
     async def _async_delete_skill(self, skill_guid: str, body: Optional[dict | DeleteElementRequestBody] = None) -> None:
@@ -7618,7 +7575,7 @@ class ActorManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        return asyncio.run(self._async_delete_skill(skill_guid, body))
+        return self._run_sync(self._async_delete_skill(skill_guid, body))
 
     @dynamic_catch
     async def _async_get_skills_by_name(
@@ -7749,8 +7706,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_skills_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -7927,8 +7883,7 @@ class ActorManager(ServerClient):
         -------
         list | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_skills(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -8040,8 +7995,7 @@ class ActorManager(ServerClient):
         -------
         dict | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_skill_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
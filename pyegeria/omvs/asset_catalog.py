@@ -267,8 +267,7 @@ class AssetCatalog(ServerClient):
         NotAuthorizedException
             The principle specified by the user_id does not have authorization for the requested action.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_in_asset_domain(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -390,8 +389,7 @@ class AssetCatalog(ServerClient):
             The principle specified by the user_id does not have authorization.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_asset_graph_by_guid(
                 guid=guid,
                 start_from=start_from,
@@ -607,8 +605,7 @@ class AssetCatalog(ServerClient):
             If there are issues in communications, message format, or Egeria errors.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_asset_lineage_graph_by_guid(
                 guid=guid,
                 effective_time=effective_time,
@@ -832,8 +829,7 @@ class AssetCatalog(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_assets_by_metadata_collection_id(
                 metadata_collection_id=metadata_collection_id,
                 metadata_element_type_name=metadata_element_type_name,
@@ -887,8 +883,7 @@ class AssetCatalog(ServerClient):
             If there are issues in communications, message format, or Egeria errors.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_asset_types())
+        response = self._run_sync(self._async_get_asset_types())
         return response
 
 
@@ -10,6 +10,7 @@ The Asset Maker OMVS provides APIs for supporting the creation and editing of as
 import asyncio
 from typing import Any, Optional
 from pyegeria.core._server_client import ServerClient
+from pyegeria.core._paging import concurrent_pageable
 from pyegeria.core._globals import max_paging_size, NO_ELEMENTS_FOUND, NO_GUID_RETURNED
 from pyegeria.models import (
     GetRequestBody,
@@ -727,8 +728,7 @@ class AssetMaker(ServerClient):
           "sequencingProperty" : "qualifiedName"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_assets_by_name(filter_string=filter_string,
                                            metadata_element_type_name=metadata_element_type_name,
                                            metadata_element_subtypes=metadata_element_subtypes,
@@ -741,6 +741,7 @@ class AssetMaker(ServerClient):
         )
 
     @dynamic_catch
+    @concurrent_pageable
     async def _async_find_assets(self, search_string: str = "*", starts_with: bool = True, ends_with: bool = False,
                                  ignore_case: bool = True, anchor_domain: Optional[str] = None,
                                  metadata_element_type: Optional[str] = None,
@@ -779,6 +780,9 @@ class AssetMaker(ServerClient):
             Specification for report formatting.
         body: dict | SearchStringRequestBody, optional
             Additional search parameters.
+        concurrent_pages: int, optional
+            When > 1, return the complete result set (JSON only), fetched with this many page
+            requests in flight from `start_from` in pages of `page_size`. Default is 0.
 
         Returns
         -------
@@ -876,6 +880,9 @@ class AssetMaker(ServerClient):
             Specification for report formatting.
         body: dict | SearchStringRequestBody, optional
             Additional search parameters.
+        concurrent_pages: int, optional
+            When > 1, return the complete result set (JSON only), fetched with this many page
+            requests in flight from `start_from` in pages of `page_size`. Default is 0.
 
         Returns
         -------
@@ -1067,8 +1074,7 @@ class AssetMaker(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_asset_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -1204,8 +1210,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_add_catalog_target(
                 integration_connector_guid, metadata_element_guid, body
             )
@@ -1320,8 +1325,7 @@ class AssetMaker(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_catalog_target(relationship_guid, body)
         )
 
@@ -1417,8 +1421,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/integration-connector/
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_catalog_target(guid=guid, graph_query_depth=graph_query_depth,
                                            output_format=output_format, report_spec=report_spec,
                                            body=body, **kwargs)
@@ -1534,8 +1537,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/integration-connector/
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_catalog_targets(
                 integration_connector_guid=integration_connector_guid,
                 graph_query_depth=graph_query_depth,
@@ -1609,8 +1611,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/integration-connector/
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_catalog_target(relationship_guid, body)
         )
 
@@ -1696,8 +1697,7 @@ class AssetMaker(ServerClient):
 
         See _async_link_supported_governance_service for parameter and return details.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_supported_governance_service(
                 governance_engine_guid, governance_service_guid, body
             )
@@ -1768,8 +1768,7 @@ class AssetMaker(ServerClient):
 
         See _async_update_supported_governance_service for parameter details.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_supported_governance_service(relationship_guid, body)
         )
 
@@ -1815,8 +1814,7 @@ class AssetMaker(ServerClient):
 
         See _async_detach_supported_governance_service for parameter details.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_supported_governance_service(relationship_guid, body)
         )
 
@@ -1899,8 +1897,7 @@ class AssetMaker(ServerClient):
           "class" : "DeleteRelationshipRequestBody"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_catalog_target(
                 integration_connector_guid, metadata_element_guid, body
             )
@@ -2143,8 +2140,7 @@ class AssetMaker(ServerClient):
           "pageSize": 0
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_data_assets(
                 search_string=search_string,
                 content_status_list=content_status_list,
@@ -2293,8 +2289,7 @@ class AssetMaker(ServerClient):
           "pageSize": 0
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_data_assets_by_category(
                 category=category,
                 content_status_list=content_status_list,
@@ -2403,8 +2398,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_data_set_content(data_set_guid, data_content_asset_guid, body)
         )
 
@@ -2467,8 +2461,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_data_set_content(data_set_guid, data_content_asset_guid, body)
         )
 
@@ -2567,8 +2560,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_report_originator(originator_guid, report_guid, body)
         )
 
@@ -2631,8 +2623,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_report_originator(originator_guid, report_guid, body)
         )
 
@@ -2727,8 +2718,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_report_dependency(prior_report_guid, report_guid, body)
         )
 
@@ -2791,8 +2781,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_report_dependency(prior_report_guid, report_guid, body)
         )
 
@@ -2887,8 +2876,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_report_subject(subject_guid, report_guid, body)
         )
 
@@ -2951,8 +2939,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_report_subject(subject_guid, report_guid, body)
         )
 
@@ -3163,8 +3150,7 @@ class AssetMaker(ServerClient):
           "pageSize": 0
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_infrastructure(
                 search_string=search_string,
                 deployment_status_list=deployment_status_list,
@@ -3313,8 +3299,7 @@ class AssetMaker(ServerClient):
           "pageSize": 0
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_infrastructure_by_category(
                 category=category,
                 deployment_status_list=deployment_status_list,
@@ -3424,8 +3409,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_deploy_it_asset(asset_guid, destination_guid, body)
         )
 
@@ -3488,8 +3472,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_undeploy_it_asset(asset_guid, destination_guid, body)
         )
 
@@ -3584,8 +3567,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_software_capability_to_asset(asset_guid, capability_guid, body)
         )
 
@@ -3648,8 +3630,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_software_capability_from_asset(asset_guid, capability_guid, body)
         )
 
@@ -3832,8 +3813,7 @@ class AssetMaker(ServerClient):
           "pageSize": 0
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_processes(
                 search_string=search_string,
                 activity_status_list=activity_status_list,
@@ -3975,8 +3955,7 @@ class AssetMaker(ServerClient):
           "pageSize": 0
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_processes_by_category(
                 category=category,
                 activity_status_list=activity_status_list,
@@ -4073,7 +4052,7 @@ class AssetMaker(ServerClient):
         else:
             validated_body = self._action_request_adapter.validate_python(body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         response = await self._async_make_request("POST", url, json_body)
         return response.json().get("guid", NO_GUID_RETURNED)
 
@@ -4147,8 +4126,7 @@ class AssetMaker(ServerClient):
           "assignToActorGUID" : "add guid of actor that will be assigned this action (AssignmentScope relationship)"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_action(body))
+        return self._run_sync(self._async_create_action(body))
 
     @dynamic_catch
     async def _async_add_action_target(
@@ -4194,7 +4172,7 @@ class AssetMaker(ServerClient):
         else:
             validated_body = NewRelationshipRequestBody(class_="NewRelationshipRequestBody")
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         response = await self._async_make_request("POST", url, json_body)
         return response.json().get("guid", NO_GUID_RETURNED)
 
@@ -4241,8 +4219,7 @@ class AssetMaker(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_add_action_target(action_guid, metadata_element_guid, body)
         )
 
@@ -4272,7 +4249,7 @@ class AssetMaker(ServerClient):
         else:
             validated_body = self._update_relationship_request_adapter.validate_python(body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         await self._async_make_request("POST", url, json_body)
 
     @dynamic_catch
@@ -4315,8 +4292,7 @@ class AssetMaker(ServerClient):
           "effectiveTime": "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_action_target_properties(action_target_guid, body)
         )
 
@@ -4396,8 +4372,7 @@ class AssetMaker(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_action_target(action_target_guid=action_target_guid, graph_query_depth=graph_query_depth,
                                           output_format=output_format, report_spec=report_spec, body=body, **kwargs)
         )
@@ -4499,8 +4474,7 @@ class AssetMaker(ServerClient):
           "activityStatusList": ["IN_PROGRESS"]
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_action_targets(
                 action_guid=action_guid,
                 activity_status_list=activity_status_list,
@@ -4614,8 +4588,7 @@ class AssetMaker(ServerClient):
           "activityStatusList": ["IN_PROGRESS"]
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actions_for_action_target(
                 metadata_element_guid=metadata_element_guid,
                 activity_status_list=activity_status_list,
@@ -4691,8 +4664,7 @@ class AssetMaker(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_assign_action(action_guid, actor_guid, body))
+        self._run_sync(self._async_assign_action(action_guid, actor_guid, body))
 
     @dynamic_catch
     async def _async_reassign_action(
@@ -4747,8 +4719,7 @@ class AssetMaker(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_reassign_action(action_guid, actor_guid, body))
+        self._run_sync(self._async_reassign_action(action_guid, actor_guid, body))
 
     @dynamic_catch
     async def _async_unassign_action(
@@ -4798,8 +4769,7 @@ class AssetMaker(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_unassign_action(action_guid, actor_guid, body))
+        self._run_sync(self._async_unassign_action(action_guid, actor_guid, body))
 
     @dynamic_catch
     async def _async_get_assigned_actions(
@@ -4898,8 +4868,7 @@ class AssetMaker(ServerClient):
           "activityStatusList": ["IN_PROGRESS"]
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_assigned_actions(
                 actor_guid=actor_guid,
                 activity_status_list=activity_status_list,
@@ -5013,8 +4982,7 @@ class AssetMaker(ServerClient):
           "activityStatusList": ["IN_PROGRESS"]
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actions_for_sponsor(
                 metadata_element_guid=metadata_element_guid,
                 activity_status_list=activity_status_list,
@@ -5128,8 +5096,7 @@ class AssetMaker(ServerClient):
           "activityStatusList": ["IN_PROGRESS"]
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_actions_for_requester(
                 metadata_element_guid=metadata_element_guid,
                 activity_status_list=activity_status_list,
@@ -5232,8 +5199,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_software_capability(body))
+        return self._run_sync(self._async_create_software_capability(body))
 
     @dynamic_catch
     async def _async_create_software_capability_from_template(
@@ -5314,8 +5280,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_software_capability_from_template(body))
+        return self._run_sync(self._async_create_software_capability_from_template(body))
 
     @dynamic_catch
     async def _async_update_software_capability(
@@ -5396,8 +5361,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_software_capability(software_capability_guid, body)
         )
 
@@ -5499,8 +5463,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/software-capability
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_software_capability_by_guid(
                 guid=guid,
                 metadata_element_type_name=metadata_element_type_name,
@@ -5765,8 +5728,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_software_capabilities(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -5901,8 +5863,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/software-capability
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_software_capabilities_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -6020,8 +5981,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/software-capability
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_software_capabilities_by_deployed_implementation_type(
                 deployed_implementation_type=deployed_implementation_type,
                 metadata_element_type_name=metadata_element_type_name,
@@ -6129,8 +6089,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/software-capability
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_software_capabilities_for_infrastructure(
                 infrastructure_guid=infrastructure_guid,
                 graph_query_depth=graph_query_depth,
@@ -6246,8 +6205,7 @@ class AssetMaker(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_capability_asset_use(software_capability_guid, asset_guid, body)
         )
 
@@ -6310,8 +6268,7 @@ class AssetMaker(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_capability_asset_use(software_capability_guid, asset_guid, body)
         )
 
@@ -6409,8 +6366,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/software-capability
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_capability_use(
                 asset_guid=asset_guid,
                 graph_query_depth=graph_query_depth,
@@ -6517,8 +6473,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/governance-engine
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_governance_engines(
                 governance_service_guid=governance_service_guid,
                 graph_query_depth=graph_query_depth,
@@ -6597,8 +6552,7 @@ class AssetMaker(ServerClient):
         body: Optional[dict | NewRelationshipRequestBody] = None
     ) -> str:
         """Create a relationship that registers a governance service with a governance engine."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_supported_governance_service(governance_engine_guid, governance_service_guid, body)
         )
 
@@ -6654,8 +6608,7 @@ class AssetMaker(ServerClient):
         self, relationship_guid: str, body: Optional[dict | UpdateRelationshipRequestBody] = None
     ) -> None:
         """Update the properties of a SupportedGovernanceService relationship."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_supported_governance_service(relationship_guid, body))
+        self._run_sync(self._async_update_supported_governance_service(relationship_guid, body))
 
     @dynamic_catch
     async def _async_detach_supported_governance_service(
@@ -6688,8 +6641,7 @@ class AssetMaker(ServerClient):
         self, relationship_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None
     ) -> None:
         """Detach a governance service from a governance engine."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_supported_governance_service(relationship_guid, body))
+        self._run_sync(self._async_detach_supported_governance_service(relationship_guid, body))
 
     @dynamic_catch
     async def _async_get_integration_groups(
@@ -6785,8 +6737,7 @@ class AssetMaker(ServerClient):
         -----
         See: https://egeria-project.org/concepts/integration-group
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_integration_groups(
                 integration_connector_guid=integration_connector_guid,
                 graph_query_depth=graph_query_depth,
@@ -6837,8 +6788,7 @@ class AssetMaker(ServerClient):
     def link_api_endpoint(self, deployed_api_guid: str, endpoint_guid: str,
                           body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a network endpoint to a deployed API (APIEndpoint relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_api_endpoint(deployed_api_guid, endpoint_guid, body))
+        self._run_sync(self._async_link_api_endpoint(deployed_api_guid, endpoint_guid, body))
 
     @dynamic_catch
     async def _async_detach_api_endpoint(self, deployed_api_guid: str, endpoint_guid: str,
@@ -6851,8 +6801,7 @@ class AssetMaker(ServerClient):
     def detach_api_endpoint(self, deployed_api_guid: str, endpoint_guid: str,
                             body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a network endpoint from a deployed API."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_api_endpoint(deployed_api_guid, endpoint_guid, body))
+        self._run_sync(self._async_detach_api_endpoint(deployed_api_guid, endpoint_guid, body))
 
     @dynamic_catch
     async def _async_link_process_hierarchy(self, parent_process_guid: str, child_process_guid: str,
@@ -6865,8 +6814,7 @@ class AssetMaker(ServerClient):
     def link_process_hierarchy(self, parent_process_guid: str, child_process_guid: str,
                                body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a child process to its parent process (ProcessHierarchy relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_process_hierarchy(parent_process_guid, child_process_guid, body))
+        self._run_sync(self._async_link_process_hierarchy(parent_process_guid, child_process_guid, body))
 
     @dynamic_catch
     async def _async_detach_process_hierarchy(self, parent_process_guid: str, child_process_guid: str,
@@ -6879,8 +6827,7 @@ class AssetMaker(ServerClient):
     def detach_process_hierarchy(self, parent_process_guid: str, child_process_guid: str,
                                  body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a child process from its parent process."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_process_hierarchy(parent_process_guid, child_process_guid, body))
+        self._run_sync(self._async_detach_process_hierarchy(parent_process_guid, child_process_guid, body))
 
     @dynamic_catch
     async def _async_link_nested_files(self, folder_guid: str, file_guid: str,
@@ -6893,8 +6840,7 @@ class AssetMaker(ServerClient):
     def link_nested_files(self, folder_guid: str, file_guid: str,
                           body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a file to the folder that contains it (NestedFile relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_nested_files(folder_guid, file_guid, body))
+        self._run_sync(self._async_link_nested_files(folder_guid, file_guid, body))
 
     @dynamic_catch
     async def _async_detach_nested_file(self, folder_guid: str, file_guid: str,
@@ -6907,8 +6853,7 @@ class AssetMaker(ServerClient):
     def detach_nested_file(self, folder_guid: str, file_guid: str,
                            body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a file from the folder that contains it."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_nested_file(folder_guid, file_guid, body))
+        self._run_sync(self._async_detach_nested_file(folder_guid, file_guid, body))
 
     @dynamic_catch
     async def _async_link_linked_files(self, folder_guid: str, file_guid: str,
@@ -6921,8 +6866,7 @@ class AssetMaker(ServerClient):
     def link_linked_files(self, folder_guid: str, file_guid: str,
                           body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a file referenced by (but not contained in) a folder (LinkedFile relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_linked_files(folder_guid, file_guid, body))
+        self._run_sync(self._async_link_linked_files(folder_guid, file_guid, body))
 
     @dynamic_catch
     async def _async_detach_linked_file(self, folder_guid: str, file_guid: str,
@@ -6935,8 +6879,7 @@ class AssetMaker(ServerClient):
     def detach_linked_file(self, folder_guid: str, file_guid: str,
                            body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a referenced file from a folder."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_linked_file(folder_guid, file_guid, body))
+        self._run_sync(self._async_detach_linked_file(folder_guid, file_guid, body))
 
     @dynamic_catch
     async def _async_link_folder_hierarchy(self, parent_folder_guid: str, child_folder_guid: str,
@@ -6949,8 +6892,7 @@ class AssetMaker(ServerClient):
     def link_folder_hierarchy(self, parent_folder_guid: str, child_folder_guid: str,
                               body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a child folder to its parent folder (FolderHierarchy relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_folder_hierarchy(parent_folder_guid, child_folder_guid, body))
+        self._run_sync(self._async_link_folder_hierarchy(parent_folder_guid, child_folder_guid, body))
 
     @dynamic_catch
     async def _async_detach_folder_hierarchy(self, parent_folder_guid: str, child_folder_guid: str,
@@ -6963,8 +6905,7 @@ class AssetMaker(ServerClient):
     def detach_folder_hierarchy(self, parent_folder_guid: str, child_folder_guid: str,
                                 body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a child folder from its parent folder."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_folder_hierarchy(parent_folder_guid, child_folder_guid, body))
+        self._run_sync(self._async_detach_folder_hierarchy(parent_folder_guid, child_folder_guid, body))
 
     @dynamic_catch
     async def _async_link_impacted_resource(self, resource_guid: str, incident_report_guid: str,
@@ -6977,8 +6918,7 @@ class AssetMaker(ServerClient):
     def link_impacted_resource(self, resource_guid: str, incident_report_guid: str,
                                body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a resource to an incident report that affects it (ImpactedResource relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_impacted_resource(resource_guid, incident_report_guid, body))
+        self._run_sync(self._async_link_impacted_resource(resource_guid, incident_report_guid, body))
 
     @dynamic_catch
     async def _async_detach_impacted_resource(self, resource_guid: str, incident_report_guid: str,
@@ -6991,8 +6931,7 @@ class AssetMaker(ServerClient):
     def detach_impacted_resource(self, resource_guid: str, incident_report_guid: str,
                                  body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a resource from an incident report."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_impacted_resource(resource_guid, incident_report_guid, body))
+        self._run_sync(self._async_detach_impacted_resource(resource_guid, incident_report_guid, body))
 
     @dynamic_catch
     async def _async_link_archive_contents(self, archive_file_guid: str, collection_guid: str,
@@ -7005,8 +6944,7 @@ class AssetMaker(ServerClient):
     def link_archive_contents(self, archive_file_guid: str, collection_guid: str,
                               body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a collection as the contents of an archive file (ArchiveContents relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_archive_contents(archive_file_guid, collection_guid, body))
+        self._run_sync(self._async_link_archive_contents(archive_file_guid, collection_guid, body))
 
     @dynamic_catch
     async def _async_detach_archive_contents(self, archive_file_guid: str, collection_guid: str,
@@ -7019,8 +6957,7 @@ class AssetMaker(ServerClient):
     def detach_archive_contents(self, archive_file_guid: str, collection_guid: str,
                                 body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a collection from an archive file."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_archive_contents(archive_file_guid, collection_guid, body))
+        self._run_sync(self._async_detach_archive_contents(archive_file_guid, collection_guid, body))
 
     @dynamic_catch
     async def _async_link_associated_log(self, element_guid: str, log_asset_guid: str,
@@ -7033,8 +6970,7 @@ class AssetMaker(ServerClient):
     def link_associated_log(self, element_guid: str, log_asset_guid: str,
                             body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a log file asset to the element it logs activity for (AssociatedLog relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_associated_log(element_guid, log_asset_guid, body))
+        self._run_sync(self._async_link_associated_log(element_guid, log_asset_guid, body))
 
     @dynamic_catch
     async def _async_detach_associated_log(self, element_guid: str, log_asset_guid: str,
@@ -7047,8 +6983,7 @@ class AssetMaker(ServerClient):
     def detach_associated_log(self, element_guid: str, log_asset_guid: str,
                               body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a log file asset from the element it logs activity for."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_associated_log(element_guid, log_asset_guid, body))
+        self._run_sync(self._async_detach_associated_log(element_guid, log_asset_guid, body))
 
     @dynamic_catch
     async def _async_link_linked_media(self, media_file_guid: str, linked_media_file_guid: str,
@@ -7061,8 +6996,7 @@ class AssetMaker(ServerClient):
     def link_linked_media(self, media_file_guid: str, linked_media_file_guid: str,
                           body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a related media file to another media file (LinkedMedia relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_linked_media(media_file_guid, linked_media_file_guid, body))
+        self._run_sync(self._async_link_linked_media(media_file_guid, linked_media_file_guid, body))
 
     @dynamic_catch
     async def _async_detach_linked_media(self, media_file_guid: str, linked_media_file_guid: str,
@@ -7075,8 +7009,7 @@ class AssetMaker(ServerClient):
     def detach_linked_media(self, media_file_guid: str, linked_media_file_guid: str,
                             body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a related media file from another media file."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_linked_media(media_file_guid, linked_media_file_guid, body))
+        self._run_sync(self._async_detach_linked_media(media_file_guid, linked_media_file_guid, body))
 
     @dynamic_catch
     async def _async_link_process_port(self, process_guid: str, port_guid: str,
@@ -7089,8 +7022,7 @@ class AssetMaker(ServerClient):
     def link_process_port(self, process_guid: str, port_guid: str,
                           body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a port to the process it belongs to (ProcessPort relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_process_port(process_guid, port_guid, body))
+        self._run_sync(self._async_link_process_port(process_guid, port_guid, body))
 
     @dynamic_catch
     async def _async_detach_process_port(self, process_guid: str, port_guid: str,
@@ -7103,8 +7035,7 @@ class AssetMaker(ServerClient):
     def detach_process_port(self, process_guid: str, port_guid: str,
                             body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a port from the process it belongs to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_process_port(process_guid, port_guid, body))
+        self._run_sync(self._async_detach_process_port(process_guid, port_guid, body))
 
     @dynamic_catch
     async def _async_link_sample_data(self, element_guid: str, sample_data_guid: str,
@@ -7117,8 +7048,7 @@ class AssetMaker(ServerClient):
     def link_sample_data(self, element_guid: str, sample_data_guid: str,
                          body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a data resource as sample data for an element (SampleData relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_sample_data(element_guid, sample_data_guid, body))
+        self._run_sync(self._async_link_sample_data(element_guid, sample_data_guid, body))
 
     @dynamic_catch
     async def _async_detach_sample_data(self, element_guid: str, sample_data_guid: str,
@@ -7131,8 +7061,7 @@ class AssetMaker(ServerClient):
     def detach_sample_data(self, element_guid: str, sample_data_guid: str,
                            body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a sample data resource from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_sample_data(element_guid, sample_data_guid, body))
+        self._run_sync(self._async_detach_sample_data(element_guid, sample_data_guid, body))
 
     @dynamic_catch
     async def _async_link_port_delegation(self, delegating_from_port_guid: str, delegating_to_port_guid: str,
@@ -7145,8 +7074,7 @@ class AssetMaker(ServerClient):
     def link_port_delegation(self, delegating_from_port_guid: str, delegating_to_port_guid: str,
                              body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Attach a port to the port it delegates to (PortDelegation relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_port_delegation(delegating_from_port_guid, delegating_to_port_guid, body))
+        self._run_sync(self._async_link_port_delegation(delegating_from_port_guid, delegating_to_port_guid, body))
 
     @dynamic_catch
     async def _async_detach_port_delegation(self, delegating_from_port_guid: str, delegating_to_port_guid: str,
@@ -7159,8 +7087,7 @@ class AssetMaker(ServerClient):
     def detach_port_delegation(self, delegating_from_port_guid: str, delegating_to_port_guid: str,
                                body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Detach a port from the port it delegates to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_port_delegation(delegating_from_port_guid, delegating_to_port_guid, body))
+        self._run_sync(self._async_detach_port_delegation(delegating_from_port_guid, delegating_to_port_guid, body))
 
     @dynamic_catch
     async def _async_link_registered_integration_connector(self, integration_group_guid: str, integration_connector_guid: str,
@@ -7174,8 +7101,7 @@ class AssetMaker(ServerClient):
     def link_registered_integration_connector(self, integration_group_guid: str, integration_connector_guid: str,
                                                body: dict | NewRelationshipRequestBody | None = None) -> None:
         """Register an integration connector with an integration group (RegisteredIntegrationConnector relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_registered_integration_connector(
+        self._run_sync(self._async_link_registered_integration_connector(
             integration_group_guid, integration_connector_guid, body))
 
     @dynamic_catch
@@ -7190,8 +7116,7 @@ class AssetMaker(ServerClient):
     def detach_registered_integration_connector(self, integration_group_guid: str, integration_connector_guid: str,
                                                  body: dict | DeleteRelationshipRequestBody | None = None) -> None:
         """Deregister an integration connector from an integration group."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_registered_integration_connector(
+        self._run_sync(self._async_detach_registered_integration_connector(
             integration_group_guid, integration_connector_guid, body))
 
     @dynamic_catch
@@ -7207,8 +7132,7 @@ class AssetMaker(ServerClient):
     def set_asset_as_audit_log(self, asset_guid: str,
                                body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify an asset as holding audit log content."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_asset_as_audit_log(asset_guid, body))
+        self._run_sync(self._async_set_asset_as_audit_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_asset_as_audit_log(self, asset_guid: str,
@@ -7221,8 +7145,7 @@ class AssetMaker(ServerClient):
     def clear_asset_as_audit_log(self, asset_guid: str,
                                  body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the AuditLog classification from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_asset_as_audit_log(asset_guid, body))
+        self._run_sync(self._async_clear_asset_as_audit_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_set_asset_as_lineage_log(self, asset_guid: str,
@@ -7237,8 +7160,7 @@ class AssetMaker(ServerClient):
     def set_asset_as_lineage_log(self, asset_guid: str,
                                  body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify an asset as holding lineage log content."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_asset_as_lineage_log(asset_guid, body))
+        self._run_sync(self._async_set_asset_as_lineage_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_asset_as_lineage_log(self, asset_guid: str,
@@ -7251,8 +7173,7 @@ class AssetMaker(ServerClient):
     def clear_asset_as_lineage_log(self, asset_guid: str,
                                    body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the LineageLog classification from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_asset_as_lineage_log(asset_guid, body))
+        self._run_sync(self._async_clear_asset_as_lineage_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_set_asset_as_metering_log(self, asset_guid: str,
@@ -7267,8 +7188,7 @@ class AssetMaker(ServerClient):
     def set_asset_as_metering_log(self, asset_guid: str,
                                   body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify an asset as holding metering log content."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_asset_as_metering_log(asset_guid, body))
+        self._run_sync(self._async_set_asset_as_metering_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_asset_as_metering_log(self, asset_guid: str,
@@ -7281,8 +7201,7 @@ class AssetMaker(ServerClient):
     def clear_asset_as_metering_log(self, asset_guid: str,
                                     body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the MeteringLog classification from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_asset_as_metering_log(asset_guid, body))
+        self._run_sync(self._async_clear_asset_as_metering_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_set_asset_as_security_log(self, asset_guid: str,
@@ -7297,8 +7216,7 @@ class AssetMaker(ServerClient):
     def set_asset_as_security_log(self, asset_guid: str,
                                   body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify an asset as holding security log content."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_asset_as_security_log(asset_guid, body))
+        self._run_sync(self._async_set_asset_as_security_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_asset_as_security_log(self, asset_guid: str,
@@ -7311,8 +7229,7 @@ class AssetMaker(ServerClient):
     def clear_asset_as_security_log(self, asset_guid: str,
                                     body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the SecurityLog classification from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_asset_as_security_log(asset_guid, body))
+        self._run_sync(self._async_clear_asset_as_security_log(asset_guid, body))
 
     @dynamic_catch
     async def _async_set_asset_as_exception_backlog(self, asset_guid: str,
@@ -7327,8 +7244,7 @@ class AssetMaker(ServerClient):
     def set_asset_as_exception_backlog(self, asset_guid: str,
                                        body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify an asset as holding exception backlog content."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_asset_as_exception_backlog(asset_guid, body))
+        self._run_sync(self._async_set_asset_as_exception_backlog(asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_asset_as_exception_backlog(self, asset_guid: str,
@@ -7341,8 +7257,7 @@ class AssetMaker(ServerClient):
     def clear_asset_as_exception_backlog(self, asset_guid: str,
                                          body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the ExceptionBacklog classification from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_asset_as_exception_backlog(asset_guid, body))
+        self._run_sync(self._async_clear_asset_as_exception_backlog(asset_guid, body))
 
     @dynamic_catch
     async def _async_set_asset_as_log_analysis(self, asset_guid: str,
@@ -7357,8 +7272,7 @@ class AssetMaker(ServerClient):
     def set_asset_as_log_analysis(self, asset_guid: str,
                                   body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify an asset as performing log analysis."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_asset_as_log_analysis(asset_guid, body))
+        self._run_sync(self._async_set_asset_as_log_analysis(asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_asset_as_log_analysis(self, asset_guid: str,
@@ -7371,8 +7285,7 @@ class AssetMaker(ServerClient):
     def clear_asset_as_log_analysis(self, asset_guid: str,
                                     body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the LogAnalysis classification from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_asset_as_log_analysis(asset_guid, body))
+        self._run_sync(self._async_clear_asset_as_log_analysis(asset_guid, body))
 
     @dynamic_catch
     async def _async_set_api_as_listener_interface(self, deployed_api_guid: str,
@@ -7387,8 +7300,7 @@ class AssetMaker(ServerClient):
     def set_api_as_listener_interface(self, deployed_api_guid: str,
                                       body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify a deployed API as a listener interface."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_api_as_listener_interface(deployed_api_guid, body))
+        self._run_sync(self._async_set_api_as_listener_interface(deployed_api_guid, body))
 
     @dynamic_catch
     async def _async_clear_api_as_listener_interface(self, deployed_api_guid: str,
@@ -7401,8 +7313,7 @@ class AssetMaker(ServerClient):
     def clear_api_as_listener_interface(self, deployed_api_guid: str,
                                         body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the ListenerInterface classification from a deployed API."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_api_as_listener_interface(deployed_api_guid, body))
+        self._run_sync(self._async_clear_api_as_listener_interface(deployed_api_guid, body))
 
     @dynamic_catch
     async def _async_set_api_as_publisher_interface(self, deployed_api_guid: str,
@@ -7417,8 +7328,7 @@ class AssetMaker(ServerClient):
     def set_api_as_publisher_interface(self, deployed_api_guid: str,
                                        body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify a deployed API as a publisher interface."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_api_as_publisher_interface(deployed_api_guid, body))
+        self._run_sync(self._async_set_api_as_publisher_interface(deployed_api_guid, body))
 
     @dynamic_catch
     async def _async_clear_api_as_publisher_interface(self, deployed_api_guid: str,
@@ -7431,8 +7341,7 @@ class AssetMaker(ServerClient):
     def clear_api_as_publisher_interface(self, deployed_api_guid: str,
                                          body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the PublisherInterface classification from a deployed API."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_api_as_publisher_interface(deployed_api_guid, body))
+        self._run_sync(self._async_clear_api_as_publisher_interface(deployed_api_guid, body))
 
     @dynamic_catch
     async def _async_set_api_as_request_response_interface(self, deployed_api_guid: str,
@@ -7447,8 +7356,7 @@ class AssetMaker(ServerClient):
     def set_api_as_request_response_interface(self, deployed_api_guid: str,
                                                body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify a deployed API as a request-response interface."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_api_as_request_response_interface(deployed_api_guid, body))
+        self._run_sync(self._async_set_api_as_request_response_interface(deployed_api_guid, body))
 
     @dynamic_catch
     async def _async_clear_api_as_request_response_interface(self, deployed_api_guid: str,
@@ -7461,8 +7369,7 @@ class AssetMaker(ServerClient):
     def clear_api_as_request_response_interface(self, deployed_api_guid: str,
                                                  body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the RequestResponseInterface classification from a deployed API."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_api_as_request_response_interface(deployed_api_guid, body))
+        self._run_sync(self._async_clear_api_as_request_response_interface(deployed_api_guid, body))
 
     @dynamic_catch
     async def _async_set_data_asset_encoding(self, data_asset_guid: str,
@@ -7477,8 +7384,7 @@ class AssetMaker(ServerClient):
     def set_data_asset_encoding(self, data_asset_guid: str,
                                 body: dict | NewClassificationRequestBody | None = None) -> None:
         """Classify a data asset with its encoding details."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_data_asset_encoding(data_asset_guid, body))
+        self._run_sync(self._async_set_data_asset_encoding(data_asset_guid, body))
 
     @dynamic_catch
     async def _async_clear_data_asset_encoding(self, data_asset_guid: str,
@@ -7491,5 +7397,4 @@ class AssetMaker(ServerClient):
     def clear_data_asset_encoding(self, data_asset_guid: str,
                                   body: dict | DeleteClassificationRequestBody | None = None) -> None:
         """Remove the DataAssetEncoding classification from a data asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_data_asset_encoding(data_asset_guid, body))
+        self._run_sync(self._async_clear_data_asset_encoding(data_asset_guid, body))
@@ -669,8 +669,7 @@ class AutomatedCuration(ServerClient):
                "effectiveTime" : ""
              }
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_elem_from_template(body)
         )
         return response
@@ -838,8 +837,7 @@ class AutomatedCuration(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_secrets_store_element_from_template(
                 file_path_name, file_name, description, version_identifier,
                 file_system_name, file_type, file_extension, file_encoding,
@@ -922,8 +920,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the Kafka server element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_kafka_server_element_from_template(
                 kafka_server, host_name, port, description
             )
@@ -1024,8 +1021,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the CSV File element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_csv_data_file_element_from_template(
                 file_name, file_type, file_path_name, version_identifier,
                 file_encoding, file_extension, file_system_name, description
@@ -1137,8 +1133,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the CSV File element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_create_csv_data_file_element_from_template(
                 file_name,
                 file_type,
@@ -1247,8 +1242,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the Postgres server element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_postgres_server_element_from_template(
                 postgres_server, host_name, port, db_user, db_pwd, description
             )
@@ -1343,8 +1337,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the Postgres database element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_postgres_database_element_from_template(
                 postgres_database,
                 server_name,
@@ -1463,8 +1456,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_folder_element_from_template(
                 path_name, folder_name, file_system, description, version, is_own_anchor, initial_classifications
             )
@@ -1557,8 +1549,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_uc_server_element_from_template(
                 server_name, host_url, port, description, version
             )
@@ -1642,8 +1633,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_uc_catalog_element_from_template(
                 uc_catalog, network_address, description, version
             )
@@ -1736,8 +1726,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_uc_schema_element_from_template(
                 uc_catalog, uc_schema, network_address, description, version
             )
@@ -1860,8 +1849,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_uc_table_element_from_template(
                 uc_catalog,
                 uc_schema,
@@ -1971,8 +1959,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_uc_function_element_from_template(
                 uc_catalog,
                 uc_schema,
@@ -2096,8 +2083,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the File Folder element.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_uc_volume_element_from_template(
                 uc_catalog,
                 uc_schema,
@@ -2230,8 +2216,7 @@ class AutomatedCuration(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_save_client_side_secret(secrets_store_guid, body))
+        self._run_sync(self._async_save_client_side_secret(secrets_store_guid, body))
 
     async def _async_delete_client_side_secret(
         self,
@@ -2293,8 +2278,7 @@ class AutomatedCuration(ServerClient):
         -----
         See: https://egeria-project.org/concepts/client-side-secret
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_client_side_secret(secrets_store_guid, secret_name))
+        self._run_sync(self._async_delete_client_side_secret(secrets_store_guid, secret_name))
 
     #
     # Engine Actions
@@ -2349,8 +2333,7 @@ class AutomatedCuration(ServerClient):
         -----
         For more information see: https://egeria-project.org/concepts/engine-action
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_cancel_engine_action(engine_action_guid))
+        self._run_sync(self._async_cancel_engine_action(engine_action_guid))
         return
 
     async def _async_claim_engine_action(self, engine_action_guid: str) -> None:
@@ -2379,8 +2362,7 @@ class AutomatedCuration(ServerClient):
 
     def claim_engine_action(self, engine_action_guid: str) -> None:
         """Request that execution of an engine action is allocated to the caller."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_claim_engine_action(engine_action_guid))
+        self._run_sync(self._async_claim_engine_action(engine_action_guid))
         return
 
     async def _async_update_engine_action_status(self, engine_action_guid: str, status: str,
@@ -2424,8 +2406,7 @@ class AutomatedCuration(ServerClient):
     def update_engine_action_status(self, engine_action_guid: str, status: str,
                                     body: Optional[dict] = None) -> None:
         """Update the status of the engine action - providing the caller is permitted."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_engine_action_status(engine_action_guid, status, body))
+        self._run_sync(self._async_update_engine_action_status(engine_action_guid, status, body))
         return
 
     async def _async_update_action_target_status(
@@ -2493,8 +2474,7 @@ class AutomatedCuration(ServerClient):
             start_date: Optional[str] = None, completion_date: Optional[str] = None,
             completion_message: Optional[str] = None, body: Optional[dict] = None) -> None:
         """Update the status of a specific action target."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_action_target_status(
                 action_target_guid, status, start_date, completion_date, completion_message, body
             )
@@ -2576,8 +2556,7 @@ class AutomatedCuration(ServerClient):
             body: Optional[dict] = None) -> None:
         """Declare that all the processing for the governance action service is finished and the status of
             the work."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_record_completion_status(
                 engine_action_guid, status, request_parameters, output_guards, new_action_targets,
                 completion_message, body
@@ -2622,8 +2601,7 @@ class AutomatedCuration(ServerClient):
             self, governance_engine_guid: str, start_from: int = 0, page_size: int = 0) -> list | str:
         """Retrieve the engine actions that are still in process and that have been claimed by this caller's
             userId. This call is used when the caller restarts."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_active_claimed_engine_actions(governance_engine_guid, start_from, page_size)
         )
 
@@ -2716,8 +2694,7 @@ class AutomatedCuration(ServerClient):
         For more information see: https://egeria-project.org/concepts/engine-action
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_engine_actions(
                 start_from, page_size, output_format, report_spec, body, **kwargs
             )
@@ -2821,8 +2798,7 @@ class AutomatedCuration(ServerClient):
         For more information see: https://egeria-project.org/concepts/engine-action
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_active_engine_actions(
                 start_from,
                 page_size,
@@ -2982,8 +2958,7 @@ class AutomatedCuration(ServerClient):
         -----
         For more information see: https://egeria-project.org/concepts/engine-action
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_engine_actions_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -3167,8 +3142,7 @@ class AutomatedCuration(ServerClient):
         NotAuthorizedException
             The principle specified by the user_id does not have authorization for the requested action.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_engine_actions(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -3292,8 +3266,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the newly started governance engine process, or "Action not initiated".
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_gov_action_process(
                 action_type_qualified_name=action_type_qualified_name,
                 request_source_guids=request_source_guids,
@@ -3406,8 +3379,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the newly started governance engine process, or "Action not initiated".
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_gov_action_type(
                 action_type_qualified_name=action_type_qualified_name,
                 request_source_guids=request_source_guids,
@@ -3469,8 +3441,7 @@ class AutomatedCuration(ServerClient):
 
     def initiate_postgres_database_survey(self, postgres_database_guid: str) -> str:
         """Initiate a postgres database survey"""
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey(
                 "PostgreSQLSurvey:survey-postgres-database", postgres_database_guid
             )
@@ -3479,8 +3450,7 @@ class AutomatedCuration(ServerClient):
 
     def initiate_postgres_server_survey(self, postgres_server_guid: str) -> str:
         """Initiate a postgres server survey"""
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey(
                 "PostgreSQLSurvey::survey-postgres-server", postgres_server_guid
             )
@@ -3525,8 +3495,7 @@ class AutomatedCuration(ServerClient):
 
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey(
                 survey_name,
                 file_folder_guid,
@@ -3536,8 +3505,7 @@ class AutomatedCuration(ServerClient):
 
     def initiate_file_survey(self, file_guid: str) -> str:
         """Initiate a file survey"""
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey("FileSurveys:survey-data-file", file_guid)
         )
         return response
@@ -3556,8 +3524,7 @@ class AutomatedCuration(ServerClient):
             The GUID of the initiated action or "Action not initiated" if the action was not initiated.
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey(
                 "ApacheKafkaSurveys:survey-kafka-server", kafka_server_guid
             )
@@ -3578,8 +3545,7 @@ class AutomatedCuration(ServerClient):
             The GUID of the initiated action or "Action not initiated" if the action was not initiated.
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey(
                 "UnityCatalogSurveys:survey-unity-catalog-server", uc_server_guid
             )
@@ -3601,8 +3567,7 @@ class AutomatedCuration(ServerClient):
             The GUID of the initiated action or "Action not initiated" if the action was not initiated.
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_survey(
                 "UnityCatalogSurveys:survey-unity-catalog-schema", uc_schema_guid
             )
@@ -3652,7 +3617,7 @@ class AutomatedCuration(ServerClient):
     #
     #     """
     #     loop = asyncio.get_event_loop()
-    #     response = loop.run_until_complete(self._async_initiate_uc_server_survey(uc_server_guid))
+    #     response = self._run_sync(self._async_initiate_uc_server_survey(uc_server_guid))
     #     return response
     #
     # async def _async_initiate_uc_server_survey(self, uc_server_guid: str) -> str:
@@ -3698,7 +3663,7 @@ class AutomatedCuration(ServerClient):
     #
     #     """
     #     loop = asyncio.get_event_loop()
-    #     response = loop.run_until_complete(self._async_initiate_uc_server_survey(uc_server_guid))
+    #     response = self._run_sync(self._async_initiate_uc_server_survey(uc_server_guid))
     #     return response
     #
     # async def _async_initiate_uc_server_survey(self, uc_server_guid: str) -> str:
@@ -3744,7 +3709,7 @@ class AutomatedCuration(ServerClient):
     #
     #     """
     #     loop = asyncio.get_event_loop()
-    #     response = loop.run_until_complete(self._async_initiate_uc_server_survey(uc_server_guid))
+    #     response = self._run_sync(self._async_initiate_uc_server_survey(uc_server_guid))
     #     return response
 
     #
@@ -3908,8 +3873,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the initiated action, or "Action not initiated".
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_initiate_engine_action(
                 governance_engine_name=governance_engine_name,
                 qualified_name=qualified_name,
@@ -4026,8 +3990,7 @@ class AutomatedCuration(ServerClient):
             List of catalog targets.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_catalog_targets(
                 integ_connector_guid=integ_connector_guid,
                 start_from=start_from,
@@ -4127,8 +4090,7 @@ class AutomatedCuration(ServerClient):
             JSON structure of the catalog target.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_catalog_target(
                 relationship_guid=relationship_guid,
                 output_format=output_format,
@@ -4251,8 +4213,7 @@ class AutomatedCuration(ServerClient):
             The GUID of the relationship created.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_catalog_target(
                 integ_connector_guid=integ_connector_guid,
                 metadata_element_guid=metadata_element_guid,
@@ -4369,8 +4330,7 @@ class AutomatedCuration(ServerClient):
         None
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_catalog_target(
                 relationship_guid=relationship_guid,
                 catalog_target_name=catalog_target_name,
@@ -4425,8 +4385,7 @@ class AutomatedCuration(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_remove_catalog_target(relationship_guid))
+        self._run_sync(self._async_remove_catalog_target(relationship_guid))
 
     #
     #   Get information about technologies
@@ -4527,8 +4486,7 @@ class AutomatedCuration(ServerClient):
         list | str
             List of technology types.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_tech_types_for_open_metadata_type(
                 type_name=type_name,
                 tech_name=tech_name,
@@ -4633,8 +4591,7 @@ class AutomatedCuration(ServerClient):
             Detailed information for the specified technology type, or "no type found".
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_tech_type_detail(
                 filter_string=filter_string,
                 body=body,
@@ -4741,8 +4698,7 @@ class AutomatedCuration(ServerClient):
             The hierarchy of technology types, or "no type found".
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_tech_type_hierarchy(
                 filter_string=filter_string,
                 body=body,
@@ -4804,8 +4760,7 @@ class AutomatedCuration(ServerClient):
         str
             The GUID of the template, or None if not found.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_template_guid_for_technology_type(type_name, **kwargs)
         )
         return response
@@ -4975,8 +4930,7 @@ class AutomatedCuration(ServerClient):
         list | str
             List of technology types in the requested format.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_technology_types(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -5155,8 +5109,7 @@ class AutomatedCuration(ServerClient):
         -----
         For more information see: https://egeria-project.org/concepts/deployed-implementation-type
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_technology_types_body(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -5429,8 +5382,7 @@ class AutomatedCuration(ServerClient):
         -----
         For more information see: https://egeria-project.org/concepts/deployed-implementation-type
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_technology_type_elements(
                 filter_string=filter_string,
                 effective_time=effective_time,
@@ -234,8 +234,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_classified_elements_by(
                 classification_name, body, output_format, report_spec, **kwargs
             )
@@ -367,8 +366,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_security_tagged_elements(
                 body, output_format, report_spec, **kwargs
             )
@@ -493,8 +491,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_owners_elements(owner_name, body, output_format, report_spec, **kwargs)
         )
         return response
@@ -613,8 +610,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_root_elements_by_category(category, body, output_format, report_spec, **kwargs)
         )
         return response
@@ -740,8 +736,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_subject_area_members(
                 subject_area, body, output_format, report_spec, **kwargs
             )
@@ -874,8 +869,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_by_origin(body, output_format, report_spec, **kwargs)
         )
         return response
@@ -1015,8 +1009,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_meanings(element_guid, body, output_format, report_spec, **kwargs
                                     )
         )
@@ -1157,8 +1150,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_semantic_assignees(term_guid, body, output_format, report_spec, **kwargs
                                                )
         )
@@ -1286,8 +1278,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_governed_elements(gov_def_guid, start_from, page_size, output_format,
                                              report_spec, body, **kwargs)
         )
@@ -1415,8 +1406,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_governed_by_definitions(element_guid, start_from, page_size, output_format,
                                                    report_spec, body, **kwargs)
         )
@@ -1550,8 +1540,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_source_elements(element_guid, start_from, page_size, output_format,
                                               report_spec, body, **kwargs)
         )
@@ -1683,8 +1672,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_sourced_from(element_guid, start_from, page_size, output_format,
                                                  report_spec, body, **kwargs)
         )
@@ -1812,8 +1800,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_scopes(element_guid, start_from, page_size, output_format, report_spec,
                                               body, **kwargs)
         )
@@ -1946,8 +1933,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_scoped_elements(scope_guid, start_from, page_size, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -2073,8 +2059,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_licensed_elements(license_type_guid, start_from, page_size, output_format,
                                              report_spec, body, **kwargs)
         )
@@ -2202,8 +2187,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_licenses(element_guid, start_from, page_size, output_format,
                                     report_spec, body, **kwargs)
         )
@@ -2331,8 +2315,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_certified_elements(certification_type_guid, start_from, page_size, output_format,
                                               report_spec, body, **kwargs)
         )
@@ -2461,8 +2444,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_certifications(element_guid, start_from, page_size, output_format,
                                           report_spec, body, **kwargs)
         )
@@ -2567,8 +2549,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements(
                 metadata_element_type,
                 start_from,
@@ -2810,8 +2791,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_by_property_value(
                 property_value,
                 property_names,
@@ -3089,8 +3069,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_elements_by_property_value(
                 property_value,
                 property_names,
@@ -3215,8 +3194,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_element_by_guid(
                 guid=guid,
                 element_type_name=element_type_name,
@@ -3335,8 +3313,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_element_by_unique_name(name, property_name, output_format, report_spec, body, **kwargs)
         )
         return response
@@ -3414,8 +3391,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_element_guid_by_unique_name(
                 name,
                 property_name,
@@ -3488,8 +3464,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaExeception
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_guid_for_name(name, property_name, type_name, **kwargs)
         )
         return response
@@ -3599,8 +3574,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_by_classification(
                 classification_name,
                 start_from,
@@ -3849,8 +3823,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_elements_by_classification_with_property_value(
                 classification_name,
                 property_value,
@@ -4081,8 +4054,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_elements_by_classification_with_property_value(
                 classification_name,
                 property_value,
@@ -4238,8 +4210,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_related_elements(
                 element_guid,
                 relationship_type,
@@ -4470,8 +4441,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_related_elements_with_property_value(
                 element_guid,
                 relationship_type,
@@ -4719,8 +4689,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_related_elements_with_property_value(
                 element_guid,
                 relationship_type,
@@ -4868,8 +4837,7 @@ class ClassificationExplorer(ServerClient):
             report_spec ():
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_relationships(
                 relationship_type,
                 start_from,
@@ -5030,8 +4998,7 @@ class ClassificationExplorer(ServerClient):
             report_spec ():
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_relationships_with_property_value(
                 property_value,
                 property_names,
@@ -5287,8 +5254,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_relationships_with_property_value(
                 property_value,
                 property_names,
@@ -5431,8 +5397,7 @@ class ClassificationExplorer(ServerClient):
             report_spec ():
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_retrieve_instance_for_guid(guid, effective_time, for_lineage, for_duplicate_processing,
                                                    timeout, output_format, report_spec, **kwargs)
         )
@@ -5563,8 +5528,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_confidence_classification(
                 element_guid,
                 body,
@@ -5696,8 +5660,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_confidence_classification(
                 element_guid,
                 body,
@@ -5832,8 +5795,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_confidentiality_classification(
                 element_guid,
                 body,
@@ -5962,8 +5924,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_confidentiality_classification(
                 element_guid,
                 body,
@@ -6095,8 +6056,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_impact_classification(
                 element_guid,
                 body,
@@ -6225,8 +6185,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_impact_classification(
                 element_guid,
                 body,
@@ -6357,8 +6316,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_criticality_classification(
                 element_guid,
                 body,
@@ -6487,8 +6445,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_criticality_classification(
                 element_guid,
                 body,
@@ -6602,8 +6559,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_gov_definition_to_element(
                 definition_guid,
                 element_guid,
@@ -6700,8 +6656,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_gov_definition_from_element(
                 definition_guid,
                 element_guid,
@@ -6766,8 +6721,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_scope_to_element(
                 scoped_by_guid,
                 element_guid,
@@ -6841,8 +6795,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_scope_from_element(scoped_by_guid, element_guid, body)
         )
 
@@ -6907,8 +6860,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_resource_to_element(
                 resource_guid,
                 element_guid,
@@ -6980,8 +6932,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_resource_from_element(resource_guid, element_guid, body)
         )
 
@@ -7109,8 +7060,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_resource_list(element_guid, start_from, page_size, output_format,
                                             report_spec, body, **kwargs)
         )
@@ -7242,8 +7192,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_supported_by_resource(resource_guid, start_from, page_size, output_format,
                                                     report_spec, body, **kwargs)
         )
@@ -7309,8 +7258,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_more_information(
                 more_info_guid,
                 element_guid,
@@ -7382,8 +7330,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_more_information(more_info_guid, element_guid, body)
         )
 
@@ -7481,8 +7428,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_assign_actor_to_element(
                 element_guid,
                 actor_guid,
@@ -7588,8 +7534,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unassign_actor_from_element(
                 element_guid,
                 actor_guid,
@@ -7723,8 +7668,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_certification_to_element(certification_type_guid, element_guid, body)
         )
         return response
@@ -7841,8 +7785,7 @@ class ClassificationExplorer(ServerClient):
             }
             """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_certification(certification_guid, body)
         )
 
@@ -7899,8 +7842,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_decertify_element(certification_guid, body)
         )
 
@@ -8031,8 +7973,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_add_license_to_element(license_type_guid, element_guid, body)
         )
         return response
@@ -8157,8 +8098,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_license(license_guid, body)
         )
 
@@ -8220,8 +8160,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlicense_element(license_guid, body)
         )
 
@@ -8334,8 +8273,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_ownership_to_element(
                 element_guid,
                 body,
@@ -8431,8 +8369,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_ownership_from_element(element_guid, for_lineage, for_duplicate_processing,
                                                                   effective_time, timeout)
         )
@@ -8544,8 +8481,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_digital_resource_origin(
                 element_guid,
                 body,
@@ -8617,8 +8553,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_digital_resource_origin_from_element(element_guid, body)
         )
 
@@ -8723,8 +8658,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_zone_membership(
                 element_guid,
                 body,
@@ -8795,8 +8729,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_zone_membership(element_guid, body)
         )
 
@@ -8938,8 +8871,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_retention_classification(
                 element_guid,
                 body,
@@ -9068,8 +9000,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_retention_classification(
                 element_guid,
                 body,
@@ -9204,8 +9135,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_governance_expectation(
                 element_guid,
                 body,
@@ -9329,8 +9259,7 @@ class ClassificationExplorer(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_governance_expectation(
                 element_guid,
                 body,
@@ -9467,8 +9396,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_governance_expectation(
                 element_guid,
                 body,
@@ -9604,8 +9532,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_governance_measurements(
                 element_guid,
                 body,
@@ -9743,8 +9670,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_governance_measurements(
                 element_guid,
                 body,
@@ -9866,8 +9792,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_governance_measurements(
                 element_guid,
                 body,
@@ -9996,8 +9921,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_data_scope(
                 element_guid,
                 body,
@@ -10135,8 +10059,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_data_scope(
                 element_guid,
                 body,
@@ -10258,8 +10181,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_data_scope(
                 element_guid,
                 body,
@@ -10388,8 +10310,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_security_tags_classification(
                 element_guid,
                 body,
@@ -10514,8 +10435,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_security_tags_classification(
                 element_guid,
                 body,
@@ -10640,8 +10560,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_accounting_codes_classification(
                 element_guid,
                 body,
@@ -10765,8 +10684,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_accounting_codes_classification(
                 element_guid,
                 body,
@@ -10873,8 +10791,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_add_search_keyword_to_element(
                 element_guid,
                 body,
@@ -10978,8 +10895,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_search_keyword(
                 search_keyword_guid,
                 body,
@@ -11050,8 +10966,7 @@ class ClassificationExplorer(ServerClient):
         PyegeriaException
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_search_keyword_from_element(
                 search_keyword_guid,
                 timeout,
@@ -11159,8 +11074,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_known_duplicate_classification(
                 element_guid,
                 body,
@@ -11278,8 +11192,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_known_duplicate_classification(
                 element_guid,
                 body,
@@ -11411,8 +11324,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_elements_as_peer_duplicates(
                 element_guid,
                 peer_duplicate_guid,
@@ -11520,8 +11432,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_elements_as_peer_duplicates(
                 element_guid,
                 peer_duplicate_guid,
@@ -11643,8 +11554,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_consolidated_duplicate_classification(
                 element_guid,
                 body,
@@ -11760,8 +11670,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_consolidated_duplicate_classification(
                 element_guid,
                 body,
@@ -11882,8 +11791,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_consolidated_duplicate_to_source(
                 element_guid,
                 source_element_guid,
@@ -11991,8 +11899,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_consolidated_duplicate_from_source_element(
                 element_guid,
                 source_element_guid,
@@ -12128,8 +12035,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_setup_semantic_assignment(
                 glossary_term_guid,
                 element_guid,
@@ -12261,8 +12167,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_semantic_assignment_classification(
                 glossary_term_guid,
                 element_guid,
@@ -12377,8 +12282,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_element_to_subject_area(
                 element_guid,
                 body,
@@ -12482,8 +12386,7 @@ class ClassificationExplorer(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_element_from_subject_area(
                 element_guid,
                 for_lineage,
@@ -12580,7 +12483,7 @@ class ClassificationExplorer(ServerClient):
             }
             validated_body = FindRequestBody.model_validate(body_dict)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
 
         response = await self._async_make_request("POST", url, json_body, timeout=timeout)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
@@ -12644,8 +12547,7 @@ class ClassificationExplorer(ServerClient):
         # graph_query_depth, report_spec in output_format, timeout in report_spec, body in
         # timeout, and body itself dropped) — the same bug shape as ISSUE-21
         # (get_scoped_elements/get_scopes).
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_root_elements(
                 metadata_element_type_name=metadata_element_type_name,
                 search_properties=search_properties,
@@ -12829,8 +12731,7 @@ class ClassificationExplorer(ServerClient):
         list | str
             - a list of authored elements or a string message if no elements are found
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_authored_elements(
                 search_string=search_string,
                 content_status_list=content_status_list,
@@ -12969,8 +12870,7 @@ class ClassificationExplorer(ServerClient):
         list | str
             - a list of authored elements or a string message if no elements are found
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_authored_elements_by_category(
                 search_string,
                 content_status_list,
@@ -13098,8 +12998,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_add_supplementary_properties_to_element(
                 element_guid,
                 glossary_term_guid,
@@ -13227,8 +13126,7 @@ class ClassificationExplorer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_supplementary_properties_from_element(
                 element_guid,
                 glossary_term_guid,
@@ -13262,8 +13160,7 @@ class ClassificationExplorer(ServerClient):
     def set_element_as_incomplete(self, element_guid: str,
                                   body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as incomplete (still being assembled)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_element_as_incomplete(element_guid, body))
+        self._run_sync(self._async_set_element_as_incomplete(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_element_as_incomplete(self, element_guid: str,
@@ -13277,8 +13174,7 @@ class ClassificationExplorer(ServerClient):
     def clear_element_as_incomplete(self, element_guid: str,
                                     body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the Incomplete classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_element_as_incomplete(element_guid, body))
+        self._run_sync(self._async_clear_element_as_incomplete(element_guid, body))
 
     @dynamic_catch
     async def _async_set_element_as_object_identifier(self, element_guid: str,
@@ -13294,8 +13190,7 @@ class ClassificationExplorer(ServerClient):
     def set_element_as_object_identifier(self, element_guid: str,
                                          body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as an object identifier."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_element_as_object_identifier(element_guid, body))
+        self._run_sync(self._async_set_element_as_object_identifier(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_element_as_object_identifier(self, element_guid: str,
@@ -13309,8 +13204,7 @@ class ClassificationExplorer(ServerClient):
     def clear_element_as_object_identifier(self, element_guid: str,
                                            body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the ObjectIdentifier classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_element_as_object_identifier(element_guid, body))
+        self._run_sync(self._async_clear_element_as_object_identifier(element_guid, body))
 
     @dynamic_catch
     async def _async_set_element_as_reference_data(self, element_guid: str,
@@ -13326,8 +13220,7 @@ class ClassificationExplorer(ServerClient):
     def set_element_as_reference_data(self, element_guid: str,
                                       body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as reference data."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_element_as_reference_data(element_guid, body))
+        self._run_sync(self._async_set_element_as_reference_data(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_element_as_reference_data(self, element_guid: str,
@@ -13341,8 +13234,7 @@ class ClassificationExplorer(ServerClient):
     def clear_element_as_reference_data(self, element_guid: str,
                                         body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the ReferenceData classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_element_as_reference_data(element_guid, body))
+        self._run_sync(self._async_clear_element_as_reference_data(element_guid, body))
 
     @dynamic_catch
     async def _async_set_element_as_mobile_resource(self, element_guid: str,
@@ -13358,8 +13250,7 @@ class ClassificationExplorer(ServerClient):
     def set_element_as_mobile_resource(self, element_guid: str,
                                        body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a mobile resource."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_element_as_mobile_resource(element_guid, body))
+        self._run_sync(self._async_set_element_as_mobile_resource(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_element_as_mobile_resource(self, element_guid: str,
@@ -13373,8 +13264,7 @@ class ClassificationExplorer(ServerClient):
     def clear_element_as_mobile_resource(self, element_guid: str,
                                          body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the MobileResource classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_element_as_mobile_resource(element_guid, body))
+        self._run_sync(self._async_clear_element_as_mobile_resource(element_guid, body))
 
     @dynamic_catch
     async def _async_set_element_as_instance_metadata(self, element_guid: str,
@@ -13388,8 +13278,7 @@ class ClassificationExplorer(ServerClient):
     def set_element_as_instance_metadata(self, element_guid: str,
                                          body: dict | NewClassificationRequestBody) -> None:
         """Classify an element as instance metadata."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_element_as_instance_metadata(element_guid, body))
+        self._run_sync(self._async_set_element_as_instance_metadata(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_element_as_instance_metadata(self, element_guid: str,
@@ -13403,8 +13292,7 @@ class ClassificationExplorer(ServerClient):
     def clear_element_as_instance_metadata(self, element_guid: str,
                                            body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the InstanceMetadata classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_element_as_instance_metadata(element_guid, body))
+        self._run_sync(self._async_clear_element_as_instance_metadata(element_guid, body))
 
     @dynamic_catch
     async def _async_set_element_as_metamodel_instance(self, element_guid: str,
@@ -13432,8 +13320,7 @@ class ClassificationExplorer(ServerClient):
                                           body: Optional[dict | NewClassificationRequestBody] = None,
                                           metamodel_element_guid: Optional[str] = None) -> None:
         """Classify an element as an instance in a metamodel, referencing the metamodel element it instantiates."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_element_as_metamodel_instance(element_guid, body, metamodel_element_guid))
+        self._run_sync(self._async_set_element_as_metamodel_instance(element_guid, body, metamodel_element_guid))
 
     @dynamic_catch
     async def _async_clear_element_as_metamodel_instance(self, element_guid: str,
@@ -13447,8 +13334,7 @@ class ClassificationExplorer(ServerClient):
     def clear_element_as_metamodel_instance(self, element_guid: str,
                                             body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the MetamodelInstance classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_element_as_metamodel_instance(element_guid, body))
+        self._run_sync(self._async_clear_element_as_metamodel_instance(element_guid, body))
 
 
 if __name__ == "__main__":
@@ -13,7 +13,7 @@ from typing import Optional, Annotated, Literal, Union
 from loguru import logger
 from pydantic import Field, HttpUrl
 
-from pyegeria.core._exceptions import PyegeriaInvalidParameterException
+from pyegeria.core._exceptions import PyegeriaException, PyegeriaInvalidParameterException
 from pyegeria.core._globals import NO_ELEMENTS_FOUND, NO_GUID_RETURNED
 from pyegeria.view.base_report_formats import select_report_spec, get_report_spec_match
 from pyegeria.models import (SearchStringRequestBody, FilterRequestBody, GetRequestBody, NewElementRequestBody,
@@ -55,6 +55,7 @@ def query_string(params):
     return result
 
 from pyegeria.core._server_client import ServerClient
+from pyegeria.core._paging import aiter_find, concurrent_pageable
 
 class CollectionProperties(ReferenceableProperties):
     class_: Annotated[Literal["CollectionProperties"], Field(alias="class")]
@@ -357,12 +358,13 @@ class CollectionManager(ServerClient):
         }
 
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_attached_collections(parent_guid, start_from, page_size,
                                                  body, output_format, report_spec))
 
 
     @dynamic_catch
+    @concurrent_pageable
     async def _async_find_collections(
             self,
             search_string: str = "*",
@@ -416,6 +418,9 @@ class CollectionManager(ServerClient):
             Request body. If provided, overrides other parameters.
         _type : str, default "Collection"
             The type of element to search for.
+        concurrent_pages : int, default 0
+            When > 1, return the complete result set (JSON only), fetched with this many page
+            requests in flight from `start_from` in pages of `page_size`.
         **kwargs : dict, optional
             Additional query parameters.
 
@@ -516,6 +521,9 @@ class CollectionManager(ServerClient):
             Request body. If provided, overrides other parameters.
         _type : str, default "Collection"
             The type of element to search for.
+        concurrent_pages : int, default 0
+            When > 1, return the complete result set (JSON only), fetched with this many page
+            requests in flight from `start_from` in pages of `page_size`.
         **kwargs : dict, optional
             Additional query parameters.
 
@@ -533,8 +541,7 @@ class CollectionManager(ServerClient):
         NotAuthorizedException
             The principle specified by the user_id does not have authorization for the requested action.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_collections(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -649,7 +656,7 @@ class CollectionManager(ServerClient):
             }
             validated_body = DeploymentStatusSearchString.model_validate(body_dict)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         response = await self._async_make_request("POST", url, json_body)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
 
@@ -685,8 +692,7 @@ class CollectionManager(ServerClient):
         """
         Returns the list of digital products matching the search string and optional deployment status. Sync version.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_digital_products(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -773,7 +779,7 @@ class CollectionManager(ServerClient):
             }
             validated_body = DeploymentStatusFilterRequestBody.model_validate(body_dict)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         response = await self._async_make_request("POST", url, json_body)
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
 
@@ -802,7 +808,7 @@ class CollectionManager(ServerClient):
 
         See _async_get_digital_products_by_category for more details.
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_digital_products_by_category(
                 category,
                 deployment_status_list,
@@ -879,8 +885,7 @@ class CollectionManager(ServerClient):
         **kwargs,
     ) -> list | str:
         """Returns the list of collections matching the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_collections_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -929,7 +934,7 @@ class CollectionManager(ServerClient):
         PyegeriaException
 
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_collections_by_name(filter_string, classification_names, body, start_from, page_size,
                                                 output_format, report_spec))
 
@@ -1059,7 +1064,7 @@ class CollectionManager(ServerClient):
 
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_collections_by_category(category, classification_names, body, start_from, page_size,
                                                 output_format, report_spec))
 
@@ -1113,8 +1118,7 @@ class CollectionManager(ServerClient):
         **kwargs,
     ) -> dict | str:
         """Return the properties of a specific collection."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_collection_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -1189,7 +1193,7 @@ class CollectionManager(ServerClient):
         """
 
         if collection_guid is None:
-            collection_guid = self.__get_guid__(collection_guid, collection_name, "displayName",
+            collection_guid = await self.__async_get_guid__(collection_guid, collection_name, "displayName",
                                                 collection_qname, None, )
 
         url = str(HttpUrl(f"{self.collection_command_root}/{collection_guid}/members"))
@@ -1201,6 +1205,7 @@ class CollectionManager(ServerClient):
         # not filter results by it.
         response = await self._async_get_results_body_request(url, _type="Collection",
                                                   _gen_output=self._generate_collection_output,
+                                                  start_from=start_from, page_size=page_size,
                                                   output_format=output_format, report_spec=report_spec,
                                                   body=body, filter_results_by_type=False, **kwargs)
 
@@ -1264,8 +1269,7 @@ class CollectionManager(ServerClient):
         }
 
     """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_collection_members(collection_guid, collection_name, collection_qname, body, start_from,
                                                page_size, output_format, report_spec, **kwargs))
 
@@ -1388,7 +1392,7 @@ class CollectionManager(ServerClient):
               "sequencingProperty": ""
             }
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_collection_hierarchy(collection_guid, body, start_from, page_size,
                                              output_format, report_spec))
 
@@ -1649,7 +1653,7 @@ class CollectionManager(ServerClient):
 
              """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name, description,category,
                                                  initial_classifications,  prop,  body))
 
@@ -1689,7 +1693,7 @@ class CollectionManager(ServerClient):
         """
         prop = "RootCollection"
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name=display_name, description=description, category=category,
                                          initial_classifications = [], prop = [prop], body=body))
 
@@ -1728,7 +1732,7 @@ class CollectionManager(ServerClient):
         """
         prop = "CollectionFolder"
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name=display_name, description=description, category=category,
                                           initial_classifications=[], prop=[prop], body=body))
     @dynamic_catch
@@ -1765,7 +1769,7 @@ class CollectionManager(ServerClient):
         """
         prop = "Folio"
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name=display_name, description=description, category=category,
                                           initial_classifications=[], prop=[prop], body=body))
 
@@ -1804,7 +1808,7 @@ class CollectionManager(ServerClient):
         """
         prop = "SubjectArea"
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name=display_name, description=description, category=category,
                                           initial_classifications=[], prop=[prop], body=body))
 
@@ -1842,7 +1846,7 @@ class CollectionManager(ServerClient):
 
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name, description, category,
                                           ["ReferenceList"], body))
 
@@ -1880,7 +1884,7 @@ class CollectionManager(ServerClient):
 
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_collection(display_name, description, category,
                                           ["ContextEvent"], body))
 
@@ -2046,7 +2050,7 @@ class CollectionManager(ServerClient):
 
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create collection with GUID: {resp.json().get('guid')}")
@@ -2159,7 +2163,7 @@ class CollectionManager(ServerClient):
 
              """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_data_spec_collection(display_name, description,category,
                                                  classification_name, body))
 
@@ -2253,7 +2257,7 @@ class CollectionManager(ServerClient):
 
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create collection with GUID: {resp.json().get('guid')}")
@@ -2366,7 +2370,7 @@ class CollectionManager(ServerClient):
 
              """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_report_type_collection(display_name, description,category,
                                                  classification_name, body))
 
@@ -2414,7 +2418,7 @@ class CollectionManager(ServerClient):
             raise PyegeriaInvalidParameterException(additional_info={"reason": "Invalid input parameters"})
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create question spec folder with GUID: {resp.json().get('guid')}")
@@ -2443,7 +2447,7 @@ class CollectionManager(ServerClient):
         -------
         str - guid of the created CollectionFolder
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_question_spec_folder(display_name, description, category, body))
 
     @dynamic_catch
@@ -2540,7 +2544,7 @@ class CollectionManager(ServerClient):
             raise PyegeriaInvalidParameterException(additional_info={"reason": "Invalid input parameters"})
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create SecurityList collection with GUID: {resp.json().get('guid')}")
@@ -2607,7 +2611,7 @@ class CollectionManager(ServerClient):
         }
              """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_security_list(display_name, description,category,
                                                  classification_name, prop,
                                              distinguished_name, body))
@@ -2667,7 +2671,7 @@ class CollectionManager(ServerClient):
               The principle specified by the user_id does not have authorization for the requested action
 
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_security_list(display_name, description, category,
                                              classification_name, "SecurityGroup",
                                              distinguished_name, body))
@@ -2725,7 +2729,7 @@ class CollectionManager(ServerClient):
               The principle specified by the user_id does not have authorization for the requested action
 
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_security_list(display_name, description, category,
                                              classification_name, "SecurityRole",
                                              distinguished_name, body))
@@ -2867,7 +2871,7 @@ class CollectionManager(ServerClient):
 
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create collection with GUID: {resp.json().get('guid')}")
@@ -2980,7 +2984,7 @@ class CollectionManager(ServerClient):
 
              """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_data_dictionary_collection(display_name, description,category,
                                                  classification_name, body))
 
@@ -3072,7 +3076,7 @@ class CollectionManager(ServerClient):
             raise PyegeriaInvalidParameterException(additional_info={"reason": "Invalid input parameters"})
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create skill set collection with GUID: {resp.json().get('guid')}")
@@ -3136,7 +3140,7 @@ class CollectionManager(ServerClient):
 
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_skill_set_collection(display_name, description, category,
                                                     classification_name, body))
 
@@ -3226,7 +3230,7 @@ class CollectionManager(ServerClient):
             raise PyegeriaInvalidParameterException(additional_info={"reason": "Invalid input parameters"})
 
         url = f"{self.collection_command_root}"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create reference list collection with GUID: {resp.json().get('guid')}")
@@ -3289,7 +3293,7 @@ class CollectionManager(ServerClient):
 
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_reference_list_collection(display_name, description, category,
                                                          classification_name, body))
 
@@ -3382,7 +3386,7 @@ class CollectionManager(ServerClient):
           }
         }
         """
-        asyncio.get_event_loop().run_until_complete(
+        self._run_sync(
             self._async_link_associated_skill_set(actor_guid, skill_set_guid, body))
 
     @dynamic_catch
@@ -3464,7 +3468,7 @@ class CollectionManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        asyncio.get_event_loop().run_until_complete(
+        self._run_sync(
             self._async_detach_associated_skill_set(actor_guid, skill_set_guid, body))
 
 
@@ -3539,7 +3543,7 @@ class CollectionManager(ServerClient):
 
 
         url = f"{self.collection_command_root}/from-template"
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create collection from template with GUID: {resp.json().get('guid')}")
@@ -3597,8 +3601,7 @@ class CollectionManager(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_create_collection_from_template(body))
+        resp = self._run_sync(self._async_create_collection_from_template(body))
         return resp
 
         #
@@ -3718,7 +3721,7 @@ class CollectionManager(ServerClient):
         }
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_update_collection(collection_guid, body))
 
 
@@ -3816,8 +3819,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_editing_collection(collection_guid, body))
 
     @dynamic_catch
@@ -3902,8 +3904,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_editing_collection(collection_guid, body))
 
     @dynamic_catch
@@ -3998,8 +3999,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_scoping_collection(collection_guid, body))
 
     @dynamic_catch
@@ -4084,8 +4084,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_scoping_collection(collection_guid, body))
 
     @dynamic_catch
@@ -4180,8 +4179,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_staging_collection(collection_guid, body))
 
     @dynamic_catch
@@ -4266,8 +4264,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_staging_collection(collection_guid, body))
 
 
@@ -4410,7 +4407,7 @@ class CollectionManager(ServerClient):
             default to ACTIVE.
             """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_digital_product(body))
 
 
@@ -4510,7 +4507,7 @@ class CollectionManager(ServerClient):
             default to ACTIVE.
             """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_digital_product_catalog(body))
 
 
@@ -4645,7 +4642,7 @@ class CollectionManager(ServerClient):
         }
         """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_update_digital_product(collection_guid, body))
 
 
@@ -4777,7 +4774,7 @@ class CollectionManager(ServerClient):
             default to ACTIVE.
             """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_agreement(body))
 
     #
@@ -4914,7 +4911,7 @@ class CollectionManager(ServerClient):
     #         default to ACTIVE.
     #         """
     #
-    #     return asyncio.get_event_loop().run_until_complete(
+    #     return self._run_sync(
     #         self._async_create_data_sharing_agreement(body))
     #
 
@@ -5025,7 +5022,7 @@ class CollectionManager(ServerClient):
             }
             """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_update_agreement(agreement_guid, body))
 
 
@@ -5141,8 +5138,7 @@ class CollectionManager(ServerClient):
           }
 
           """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_agreement_actor(agreement_guid, actor_guid, body))
 
 
@@ -5234,8 +5230,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_agreement_actor(agreement_actor_relationship_guid,
                                                         body))
 
@@ -5378,8 +5373,7 @@ class CollectionManager(ServerClient):
                }
 
                """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_agreement_item(agreement_guid, agreement_item_guid, body))
+        return self._run_sync(self._async_link_agreement_item(agreement_guid, agreement_item_guid, body))
 
 
     @dynamic_catch
@@ -5466,8 +5460,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_agreement_item(agreement_guid, agreement_item_guid, body))
+        self._run_sync(self._async_detach_agreement_item(agreement_guid, agreement_item_guid, body))
 
 
     @dynamic_catch
@@ -5576,8 +5569,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_contract(agreement_guid, external_ref_guid, body))
+        self._run_sync(self._async_link_contract(agreement_guid, external_ref_guid, body))
 
 
     @dynamic_catch
@@ -5663,8 +5655,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_contract(agreement_guid, external_ref_guid, body))
+        self._run_sync(self._async_detach_contract(agreement_guid, external_ref_guid, body))
 
         #
         # Digital Subscriptions
@@ -5841,8 +5832,7 @@ class CollectionManager(ServerClient):
            "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_create_digital_subscription(body))
+        resp = self._run_sync(self._async_create_digital_subscription(body))
         return resp
 
 
@@ -5955,8 +5945,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_digital_subscription(digital_subscription_guid, body))
 
 
@@ -6063,8 +6052,7 @@ class CollectionManager(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_subscriber(subscriber_guid, subscription_guid, body))
+        self._run_sync(self._async_link_subscriber(subscriber_guid, subscription_guid, body))
 
 
     @dynamic_catch
@@ -6151,8 +6139,7 @@ class CollectionManager(ServerClient):
           "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_subscriber(subscriber_guid, subscription_guid, body))
+        self._run_sync(self._async_detach_subscriber(subscriber_guid, subscription_guid, body))
 
         #
         #
@@ -6244,8 +6231,7 @@ class CollectionManager(ServerClient):
     def attach_data_description(self, element_guid: str, collection_guid: str,
                                 body: dict | NewRelationshipRequestBody = None):
         """Attach a data description collection to an element (DataDescription relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_attach_data_description(element_guid, collection_guid, body))
+        self._run_sync(self._async_attach_data_description(element_guid, collection_guid, body))
 
     @dynamic_catch
     async def _async_detach_data_description(self, element_guid: str, collection_guid: str,
@@ -6272,8 +6258,7 @@ class CollectionManager(ServerClient):
     def detach_data_description(self, element_guid: str, collection_guid: str,
                                 body: Optional[dict | DeleteRelationshipRequestBody] = None):
         """Detach a data description collection from an element (DataDescription relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_data_description(element_guid, collection_guid, body))
+        self._run_sync(self._async_detach_data_description(element_guid, collection_guid, body))
 
     @dynamic_catch
     async def _async_attach_smart_query(self, results_set_guid: str, saved_query_guid: str,
@@ -6329,8 +6314,7 @@ class CollectionManager(ServerClient):
     def attach_smart_query(self, results_set_guid: str, saved_query_guid: str,
                            body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Connect a SavedQuery to a ResultsSet via the collection-manager-native SmartQuery attach endpoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_attach_smart_query(results_set_guid, saved_query_guid, body))
+        self._run_sync(self._async_attach_smart_query(results_set_guid, saved_query_guid, body))
 
     @dynamic_catch
     async def _async_detach_smart_query(self, results_set_guid: str, saved_query_guid: str,
@@ -6367,8 +6351,7 @@ class CollectionManager(ServerClient):
     def detach_smart_query(self, results_set_guid: str, saved_query_guid: str,
                            body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Disconnect a SavedQuery from a ResultsSet via the collection-manager-native SmartQuery detach endpoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_smart_query(results_set_guid, saved_query_guid, body))
+        self._run_sync(self._async_detach_smart_query(results_set_guid, saved_query_guid, body))
 
     @dynamic_catch
     def attach_collection(self, parent_guid: str, collection_guid: str,
@@ -6422,8 +6405,7 @@ class CollectionManager(ServerClient):
               "forDuplicateProcessing" : false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_attach_collection(parent_guid, collection_guid, body))
+        self._run_sync(self._async_attach_collection(parent_guid, collection_guid, body))
 
 
     @dynamic_catch
@@ -6516,8 +6498,7 @@ class CollectionManager(ServerClient):
             "forDuplicateProcessing": false
           }
           """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_collection(parent_guid, collection_guid, body))
+        self._run_sync(self._async_detach_collection(parent_guid, collection_guid, body))
 
 
     @dynamic_catch
@@ -6609,8 +6590,7 @@ class CollectionManager(ServerClient):
 
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_collection(collection_guid, body, cascade))
+        self._run_sync(self._async_delete_collection(collection_guid, body, cascade))
 
 
     @dynamic_catch
@@ -6732,14 +6712,12 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_to_collection( collection_guid, element_guid, body))
+        self._run_sync(self._async_add_to_collection( collection_guid, element_guid, body))
 
     def add_term_to_folder(self, folder_guid: str, term_guid: str,
                              body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Add a term to a category.  The request body is optional."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_to_collection(folder_guid, term_guid, body))
+        self._run_sync(self._async_add_to_collection(folder_guid, term_guid, body))
 
 
     @dynamic_catch
@@ -6861,8 +6839,7 @@ class CollectionManager(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_collection_membership(collection_guid, element_guid, body))
 
 
@@ -6999,8 +6976,7 @@ class CollectionManager(ServerClient):
         str
             The unique identifier (GUID) of the newly created SmartQuery relationship.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_saved_query_to_results_set(results_set_guid, saved_query_guid, body))
 
     @dynamic_catch
@@ -7059,8 +7035,7 @@ class CollectionManager(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_saved_query_from_results_set(relationship_guid, body))
+        self._run_sync(self._async_detach_saved_query_from_results_set(relationship_guid, body))
 
 
     def remove_from_collection(self, collection_guid: str, element_guid: str,
@@ -7102,8 +7077,7 @@ class CollectionManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_remove_from_collection(collection_guid, element_guid, body))
+        self._run_sync(self._async_remove_from_collection(collection_guid, element_guid, body))
 
         #
         #
@@ -7141,8 +7115,7 @@ class CollectionManager(ServerClient):
         -----
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_remove_from_collection(folder_guid, term_guid, body))
+        self._run_sync(self._async_remove_from_collection(folder_guid, term_guid, body))
 
         #
         #
@@ -7227,11 +7200,129 @@ class CollectionManager(ServerClient):
             If the root_collection_name does not have exactly one root collection.
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_member_list(collection_guid, collection_name, collection_qname))
         return resp
 
+    @staticmethod
+    def _hierarchy_node(element: dict, depth: int) -> dict:
+        header = element.get("elementHeader", {})
+        el_type = header.get("type", {})
+        props = element.get("properties", {})
+        type_names = [el_type.get("typeName", "")] + list(el_type.get("superTypeNames") or [])
+        return {
+            "guid": header.get("guid"),
+            "displayName": props.get("displayName", ""),
+            "qualifiedName": props.get("qualifiedName", ""),
+            "description": props.get("description", ""),
+            "type": el_type.get("typeName", ""),
+            "depth": depth,
+            # Without superTypeNames we can't tell, so assume the member may have members of its own.
+            "isCollection": "Collection" in type_names or not el_type.get("superTypeNames"),
+        }
+
+    @dynamic_catch
+    async def _async_walk_collection_hierarchy(self, collection_guid: Optional[str] = None,
+                                               collection_name: Optional[str] = None,
+                                               collection_qname: Optional[str] = None, max_depth: int = None,
+                                               max_nodes: int = None, concurrency: int = 8) -> dict:
+        """Walk the collection hierarchy below a root collection, level by level - async version.
+
+        The members of every collection on a level are fetched concurrently (at most `concurrency`
+        collections paged at once), then the next level is expanded. Each element is expanded once: a
+        member reached again (shared between collections, or a cycle) only adds an edge. Members
+        that are not collections are not asked for members of their own.
+
+        Parameters
+        ----------
+        collection_guid: str,
+           identity of the root collection. If none, collection_name or collection_qname are used.
+        collection_name: str,
+           display name of the root collection. If none, collection_guid or collection_qname are used.
+        collection_qname: str,
+           qualified name of the root collection. If none, collection_guid or collection_name are used.
+        max_depth: int, optional
+           expand this many levels below the root; None walks the whole hierarchy.
+        max_nodes: int, optional
+           stop adding members once this many have been found; None is unbounded.
+        concurrency: int, default = 8
+           collections whose members are paged at once.
+
+        Returns
+        -------
+        dict
+            {"root": root guid,
+             "nodes": {guid: {"guid", "displayName", "qualifiedName", "description", "type", "depth",
+                              "isCollection"}},
+             "children": {guid: [member guid, ...]} - in member order, for every expanded collection,
+             "truncated": True if max_depth left collections unexpanded or max_nodes left members out,
+             "errors": {guid: message} - collections whose members could not all be fetched; the
+             members read before the failure are kept}
+
+        Raises
+        ------
+        PyegeriaInvalidParameterException
+            If the root collection can't be resolved from the name given.
+        """
+        if collection_guid is None:
+            collection_guid = await self.__async_get_guid__(collection_guid, collection_name, "displayName",
+                                                collection_qname, None, )
+        root = {"guid": collection_guid, "displayName": collection_name or "", "qualifiedName": collection_qname or "",
+                "description": "", "type": "", "depth": 0, "isCollection": True}
+        tree = {"root": collection_guid, "nodes": {collection_guid: root}, "children": {}, "truncated": False,
+                "errors": {}}
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def members_of(guid: str) -> list:
+            members = []
+            async with sem:
+                try:
+                    async for member in aiter_find(self._async_get_collection_members, guid, prefetch=False):
+                        members.append(member)
+                except PyegeriaException as e:
+                    logger.debug(f"Members of collection {guid} unavailable: {e}")
+                    tree["errors"][guid] = str(e)
+            return members
+
+        level = [collection_guid]
+        depth = 0
+        while level:
+            if max_depth is not None and depth >= max_depth:
+                tree["truncated"] = True
+                break
+            fetched = await asyncio.gather(*(members_of(guid) for guid in level))
+            depth += 1
+            next_level = []
+            for parent, members in zip(level, fetched):
+                edges = tree["children"].setdefault(parent, [])
+                for member in members:
+                    node = self._hierarchy_node(member, depth)
+                    guid = node["guid"]
+                    if guid is None:
+                        continue
+                    if guid not in tree["nodes"]:
+                        if max_nodes is not None and len(tree["nodes"]) - 1 >= max_nodes:
+                            tree["truncated"] = True
+                            continue
+                        tree["nodes"][guid] = node
+                        if node["isCollection"]:
+                            next_level.append(guid)
+                    edges.append(guid)
+            level = next_level
+        return tree
+
+    @dynamic_catch
+    def walk_collection_hierarchy(self, collection_guid: Optional[str] = None, collection_name: Optional[str] = None,
+                                  collection_qname: Optional[str] = None, max_depth: int = None,
+                                  max_nodes: int = None, concurrency: int = 8) -> dict:
+        """Walk the collection hierarchy below a root collection, level by level, with concurrent
+        member fetches. See `_async_walk_collection_hierarchy` for the parameters and the
+        adjacency structure returned.
+        """
+        return self._run_sync(
+            self._async_walk_collection_hierarchy(collection_guid, collection_name, collection_qname, max_depth,
+                                                  max_nodes, concurrency))
+
     def _extract_digital_product_properties(self, element: dict, guid: str, output_format: str) -> dict:
         props = element["properties"]
         prop_class = props.get("class", "DigitalProductProperties")
@@ -7375,8 +7466,7 @@ class CollectionManager(ServerClient):
     def update_agreement_item(self, agreement_item_relationship_guid: str,
                               body: Optional[dict | UpdateRelationshipRequestBody] = None) -> None:
         """Update the properties of an AgreementItem relationship, identified by its own relationship GUID."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_agreement_item(agreement_item_relationship_guid, body))
+        self._run_sync(self._async_update_agreement_item(agreement_item_relationship_guid, body))
 
     @dynamic_catch
     async def _async_detach_agreement_item_by_id(self, agreement_item_relationship_guid: str,
@@ -7389,8 +7479,7 @@ class CollectionManager(ServerClient):
     def detach_agreement_item_by_id(self, agreement_item_relationship_guid: str,
                                     body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach one specific AgreementItem relationship, identified by its own relationship GUID."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_agreement_item_by_id(agreement_item_relationship_guid, body))
+        self._run_sync(self._async_detach_agreement_item_by_id(agreement_item_relationship_guid, body))
 
     @dynamic_catch
     async def _async_set_collection_kind(self, collection_guid: str,
@@ -7405,8 +7494,7 @@ class CollectionManager(ServerClient):
     def set_collection_kind(self, collection_guid: str,
                             body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a collection with its collection kind."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_collection_kind(collection_guid, body))
+        self._run_sync(self._async_set_collection_kind(collection_guid, body))
 
     @dynamic_catch
     async def _async_clear_collection_kind(self, collection_guid: str,
@@ -7419,8 +7507,7 @@ class CollectionManager(ServerClient):
     def clear_collection_kind(self, collection_guid: str,
                               body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the CollectionKind classification from a collection."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_collection_kind(collection_guid, body))
+        self._run_sync(self._async_clear_collection_kind(collection_guid, body))
 
 
 if __name__ == "__main__":
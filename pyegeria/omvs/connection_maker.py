@@ -45,32 +45,28 @@ class ConnectionMaker(ServerClient):
         return await self._async_create_element_body_request(url, ["ConnectionProperties"], body)
 
     def create_connection(self, body: Union[NewElementRequestBody, dict]) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_connection(body))
+        return self._run_sync(self._async_create_connection(body))
 
     async def _async_create_connection_from_template(self, body: Union[TemplateRequestBody, dict]) -> str:
         url = f"{self.base_url}/connections/from-template"
         return await self._async_create_element_from_template(url, body)
 
     def create_connection_from_template(self, body: Union[TemplateRequestBody, dict]) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_connection_from_template(body))
+        return self._run_sync(self._async_create_connection_from_template(body))
 
     async def _async_update_connection(self, connection_guid: str, body: Union[UpdateElementRequestBody, dict]):
         url = f"{self.base_url}/connections/{connection_guid}/update"
         await self._async_update_element_body_request(url, ["ConnectionProperties"], body)
 
     def update_connection(self, connection_guid: str, body: Union[UpdateElementRequestBody, dict]):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_connection(connection_guid, body))
+        return self._run_sync(self._async_update_connection(connection_guid, body))
 
     async def _async_delete_connection(self, connection_guid: str, body: Union[DeleteElementRequestBody, dict] = None):
         url = f"{self.base_url}/connections/{connection_guid}/delete"
         await self._async_delete_element_request(url, body)
 
     def delete_connection(self, connection_guid: str, body: Union[DeleteElementRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_connection(connection_guid, body))
+        return self._run_sync(self._async_delete_connection(connection_guid, body))
 
     async def _async_get_connection_by_guid(
         self,
@@ -108,8 +104,7 @@ class ConnectionMaker(ServerClient):
         body: Union[GetRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_connection_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -168,8 +163,7 @@ class ConnectionMaker(ServerClient):
         body: Union[FilterRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_connections_by_name(
                 name=name,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -252,8 +246,7 @@ class ConnectionMaker(ServerClient):
         body: Union[SearchStringRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_connections(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -283,32 +276,28 @@ class ConnectionMaker(ServerClient):
         return await self._async_create_element_body_request(url, ["ConnectorTypeProperties"], body)
 
     def create_connector_type(self, body: Union[NewElementRequestBody, dict]) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_connector_type(body))
+        return self._run_sync(self._async_create_connector_type(body))
 
     async def _async_create_connector_type_from_template(self, body: Union[TemplateRequestBody, dict]) -> str:
         url = f"{self.base_url}/connector-types/from-template"
         return await self._async_create_element_from_template(url, body)
 
     def create_connector_type_from_template(self, body: Union[TemplateRequestBody, dict]) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_connector_type_from_template(body))
+        return self._run_sync(self._async_create_connector_type_from_template(body))
 
     async def _async_update_connector_type(self, connector_type_guid: str, body: Union[UpdateElementRequestBody, dict]):
         url = f"{self.base_url}/connector-types/{connector_type_guid}/update"
         await self._async_update_element_body_request(url, ["ConnectorTypeProperties"], body)
 
     def update_connector_type(self, connector_type_guid: str, body: Union[UpdateElementRequestBody, dict]):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_connector_type(connector_type_guid, body))
+        return self._run_sync(self._async_update_connector_type(connector_type_guid, body))
 
     async def _async_delete_connector_type(self, connector_type_guid: str, body: Union[DeleteElementRequestBody, dict] = None):
         url = f"{self.base_url}/connector-types/{connector_type_guid}/delete"
         await self._async_delete_element_request(url, body)
 
     def delete_connector_type(self, connector_type_guid: str, body: Union[DeleteElementRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_connector_type(connector_type_guid, body))
+        return self._run_sync(self._async_delete_connector_type(connector_type_guid, body))
 
     async def _async_get_connector_type_by_guid(
         self,
@@ -346,8 +335,7 @@ class ConnectionMaker(ServerClient):
         body: Union[GetRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_connector_type_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -406,8 +394,7 @@ class ConnectionMaker(ServerClient):
         body: Union[FilterRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_connector_types_by_name(
                 name=name,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -469,8 +456,7 @@ class ConnectionMaker(ServerClient):
         body: Union[FilterRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_connector_types_by_connector_provider_class_name(
                 connector_provider_class_name=connector_provider_class_name,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -553,8 +539,7 @@ class ConnectionMaker(ServerClient):
         body: Union[SearchStringRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_connector_types(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -584,32 +569,28 @@ class ConnectionMaker(ServerClient):
         return await self._async_create_element_body_request(url, ["EndpointProperties"], body)
 
     def create_endpoint(self, body: Union[NewElementRequestBody, dict]) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_endpoint(body))
+        return self._run_sync(self._async_create_endpoint(body))
 
     async def _async_create_endpoint_from_template(self, body: Union[TemplateRequestBody, dict]) -> str:
         url = f"{self.base_url}/endpoints/from-template"
         return await self._async_create_element_from_template(url, body)
 
     def create_endpoint_from_template(self, body: Union[TemplateRequestBody, dict]) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_endpoint_from_template(body))
+        return self._run_sync(self._async_create_endpoint_from_template(body))
 
     async def _async_update_endpoint(self, endpoint_guid: str, body: Union[UpdateElementRequestBody, dict]):
         url = f"{self.base_url}/endpoints/{endpoint_guid}/update"
         await self._async_update_element_body_request(url, ["EndpointProperties"], body)
 
     def update_endpoint(self, endpoint_guid: str, body: Union[UpdateElementRequestBody, dict]):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_endpoint(endpoint_guid, body))
+        return self._run_sync(self._async_update_endpoint(endpoint_guid, body))
 
     async def _async_delete_endpoint(self, endpoint_guid: str, body: Union[DeleteElementRequestBody, dict] = None):
         url = f"{self.base_url}/endpoints/{endpoint_guid}/delete"
         await self._async_delete_element_request(url, body)
 
     def delete_endpoint(self, endpoint_guid: str, body: Union[DeleteElementRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_endpoint(endpoint_guid, body))
+        return self._run_sync(self._async_delete_endpoint(endpoint_guid, body))
 
     async def _async_get_endpoint_by_guid(
         self,
@@ -647,8 +628,7 @@ class ConnectionMaker(ServerClient):
         body: Union[GetRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_endpoint_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -707,8 +687,7 @@ class ConnectionMaker(ServerClient):
         body: Union[FilterRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_endpoints_by_name(
                 name=name,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -770,8 +749,7 @@ class ConnectionMaker(ServerClient):
         body: Union[FilterRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_endpoints_by_network_address(
                 network_address=network_address,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -854,8 +832,7 @@ class ConnectionMaker(ServerClient):
         body: Union[SearchStringRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_endpoints(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -926,8 +903,7 @@ class ConnectionMaker(ServerClient):
         body: Union[FilterRequestBody, dict] = None,
         **kwargs,
     ) -> dict | list | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_endpoints_for_asset(
                 asset_guid=asset_guid,
                 name=name,
@@ -952,77 +928,67 @@ class ConnectionMaker(ServerClient):
         await self._async_new_relationship_request(url, ["ConnectionConnectorType"], body)
 
     def link_connection_connector_type(self, connection_guid: str, connector_type_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_connection_connector_type(connection_guid, connector_type_guid, body))
+        return self._run_sync(self._async_link_connection_connector_type(connection_guid, connector_type_guid, body))
 
     async def _async_detach_connection_connector_type(self, connection_guid: str, connector_type_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/connections/{connection_guid}/connector-types/{connector_type_guid}/detach"
         await self._async_delete_relationship_request(url, body)
 
     def detach_connection_connector_type(self, connection_guid: str, connector_type_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_connection_connector_type(connection_guid, connector_type_guid, body))
+        return self._run_sync(self._async_detach_connection_connector_type(connection_guid, connector_type_guid, body))
 
     async def _async_link_connection_endpoint(self, connection_guid: str, endpoint_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/connections/{connection_guid}/endpoints/{endpoint_guid}/attach"
         await self._async_new_relationship_request(url, ["ConnectionEndpoint"], body)
 
     def link_connection_endpoint(self, connection_guid: str, endpoint_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_connection_endpoint(connection_guid, endpoint_guid, body))
+        return self._run_sync(self._async_link_connection_endpoint(connection_guid, endpoint_guid, body))
 
     async def _async_detach_connection_endpoint(self, connection_guid: str, endpoint_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/connections/{connection_guid}/endpoints/{endpoint_guid}/detach"
         await self._async_delete_relationship_request(url, body)
 
     def detach_connection_endpoint(self, connection_guid: str, endpoint_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_connection_endpoint(connection_guid, endpoint_guid, body))
+        return self._run_sync(self._async_detach_connection_endpoint(connection_guid, endpoint_guid, body))
 
     async def _async_link_embedded_connection(self, connection_guid: str, embedded_connection_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/connections/{connection_guid}/embedded-connections/{embedded_connection_guid}/attach"
         await self._async_new_relationship_request(url, ["EmbeddedConnection"], body)
 
     def link_embedded_connection(self, connection_guid: str, embedded_connection_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_embedded_connection(connection_guid, embedded_connection_guid, body))
+        return self._run_sync(self._async_link_embedded_connection(connection_guid, embedded_connection_guid, body))
 
     async def _async_detach_embedded_connection(self, connection_guid: str, embedded_connection_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/connections/{connection_guid}/embedded-connections/{embedded_connection_guid}/detach"
         await self._async_delete_relationship_request(url, body)
 
     def detach_embedded_connection(self, connection_guid: str, embedded_connection_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_embedded_connection(connection_guid, embedded_connection_guid, body))
+        return self._run_sync(self._async_detach_embedded_connection(connection_guid, embedded_connection_guid, body))
 
     async def _async_link_asset_to_connection(self, asset_guid: str, connection_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/assets/{asset_guid}/connections/{connection_guid}/attach"
         await self._async_new_relationship_request(url, ["AssetConnection"], body)
 
     def link_asset_to_connection(self, asset_guid: str, connection_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_asset_to_connection(asset_guid, connection_guid, body))
+        return self._run_sync(self._async_link_asset_to_connection(asset_guid, connection_guid, body))
 
     async def _async_detach_asset_from_connection(self, asset_guid: str, connection_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/assets/{asset_guid}/connections/{connection_guid}/detach"
         await self._async_delete_relationship_request(url, body)
 
     def detach_asset_from_connection(self, asset_guid: str, connection_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_asset_from_connection(asset_guid, connection_guid, body))
+        return self._run_sync(self._async_detach_asset_from_connection(asset_guid, connection_guid, body))
 
     async def _async_link_endpoint_to_it_asset(self, asset_guid: str, endpoint_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/assets/{asset_guid}/endpoints/{endpoint_guid}/attach"
         await self._async_new_relationship_request(url, ["ITAssetEndpoint"], body)
 
     def link_endpoint_to_it_asset(self, asset_guid: str, endpoint_guid: str, body: Union[NewRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_endpoint_to_it_asset(asset_guid, endpoint_guid, body))
+        return self._run_sync(self._async_link_endpoint_to_it_asset(asset_guid, endpoint_guid, body))
 
     async def _async_detach_endpoint_from_it_asset(self, asset_guid: str, endpoint_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
         url = f"{self.base_url}/assets/{asset_guid}/endpoints/{endpoint_guid}/detach"
         await self._async_delete_relationship_request(url, body)
 
     def detach_endpoint_from_it_asset(self, asset_guid: str, endpoint_guid: str, body: Union[DeleteRelationshipRequestBody, dict] = None):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_endpoint_from_it_asset(asset_guid, endpoint_guid, body))
+        return self._run_sync(self._async_detach_endpoint_from_it_asset(asset_guid, endpoint_guid, body))
@@ -163,8 +163,7 @@ class DataDesigner(ServerClient):
         list | str
             The search results.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_data_value_specifications(
                 search_string,
                 graph_query_depth=graph_query_depth,
@@ -235,8 +234,7 @@ class DataDesigner(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_specialized_data_value_specification(spec_guid, grain_guid, body))
+        self._run_sync(self._async_link_specialized_data_value_specification(spec_guid, grain_guid, body))
 
     @dynamic_catch
     async def _async_detach_specialized_data_value_specification(
@@ -298,8 +296,7 @@ class DataDesigner(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_specialized_data_value_specification(spec_guid, grain_guid, body, cascade_delete)
         )
 
@@ -354,8 +351,7 @@ class DataDesigner(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_data_value_specification(guid, body, cascade_delete))
+        self._run_sync(self._async_delete_data_value_specification(guid, body, cascade_delete))
 
     @dynamic_catch
     async def _async_create_data_value_specification(self, body: dict | NewElementRequestBody) -> str:
@@ -400,8 +396,7 @@ class DataDesigner(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_data_value_specification(body))
+        return self._run_sync(self._async_create_data_value_specification(body))
 
     @dynamic_catch
     async def _async_create_data_value_specification_from_template(
@@ -452,8 +447,7 @@ class DataDesigner(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_data_value_specification_from_template(body))
+        return self._run_sync(self._async_create_data_value_specification_from_template(body))
 
     @dynamic_catch
     async def _async_create_data_grain(self, body: dict | NewElementRequestBody) -> str:
@@ -498,8 +492,7 @@ class DataDesigner(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_data_grain(body))
+        return self._run_sync(self._async_create_data_grain(body))
     #
     # DataDesigner is a class that extends the Client class. The Data Designer OMVS provides APIs for
     # building specifications for data. This includes common data fields in a data dictionary, data specifications
@@ -539,8 +532,7 @@ class DataDesigner(ServerClient):
         str
             The GUID of the element - or "No element found"
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_data_class(body))
+        return self._run_sync(self._async_create_data_class(body))
 
     @dynamic_catch
     async def _async_delete_data_class(self, data_class_guid: str, body: dict = None,
@@ -603,8 +595,7 @@ class DataDesigner(ServerClient):
         PyegeriaUnauthorizedException
             the requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_data_class(data_class_guid, body, cascade_delete))
+        self._run_sync(self._async_delete_data_class(data_class_guid, body, cascade_delete))
 
     #
     #    Data Structures
@@ -749,8 +740,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_data_structure(body))
         return response
 
@@ -899,8 +889,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_data_structure_from_template(body))
+        response = self._run_sync(self._async_create_data_structure_from_template(body))
         return response
 
     @dynamic_catch
@@ -963,8 +952,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_find_all_data_structures(output_format=output_format,
+        return self._run_sync(self._async_find_all_data_structures(output_format=output_format,
                                                                            report_spec=report_spec))
 
     @dynamic_catch
@@ -1133,8 +1121,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_data_structures(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -1264,8 +1251,7 @@ class DataDesigner(ServerClient):
 
     """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_data_structures_by_name(name=name, classification_names=classification_names, body=body, start_from=start_from, page_size=page_size,
                                                     graph_query_depth=graph_query_depth,
                                                     output_format=output_format, report_spec=report_spec, **kwargs))
@@ -1387,8 +1373,7 @@ class DataDesigner(ServerClient):
 
     """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_data_structure_by_guid(guid=guid, element_type=element_type, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
 
@@ -1920,8 +1905,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_data_field(body))
+        response = self._run_sync(self._async_create_data_field(body))
         return response
 
     @dynamic_catch
@@ -1983,8 +1967,7 @@ class DataDesigner(ServerClient):
         PyegeriaUnauthorizedException
             the requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_data_field(data_field_guid, body, cascade_delete))
+        self._run_sync(self._async_delete_data_field(data_field_guid, body, cascade_delete))
 
     @dynamic_catch
     async def _async_create_data_field_from_template(self, body: dict | TemplateRequestBody) -> str:
@@ -2130,8 +2113,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_data_field_from_template(body))
+        response = self._run_sync(self._async_create_data_field_from_template(body))
         return response
 
     @dynamic_catch
@@ -2242,8 +2224,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_data_structure(data_struct_guid, body))
 
     @dynamic_catch
@@ -2355,8 +2336,7 @@ class DataDesigner(ServerClient):
 
          """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_member_data_field(parent_data_struct_guid, member_data_field_guid, body))
 
     @dynamic_catch
@@ -2461,8 +2441,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_member_data_field(parent_data_struct_guid, member_data_field_guid, body, cascade_delete))
 
 
@@ -2479,8 +2458,7 @@ class DataDesigner(ServerClient):
     def link_nested_data_field(self, parent_data_field_guid: str, nested_data_field_guid: str,
                                body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Link a nested data field to a parent data field (NestedDataField relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_nested_data_field(parent_data_field_guid, nested_data_field_guid, body))
+        self._run_sync(self._async_link_nested_data_field(parent_data_field_guid, nested_data_field_guid, body))
 
     @dynamic_catch
     async def _async_detach_nested_data_field(self, parent_data_field_guid: str, nested_data_field_guid: str,
@@ -2495,8 +2473,7 @@ class DataDesigner(ServerClient):
     def detach_nested_data_field(self, parent_data_field_guid: str, nested_data_field_guid: str,
                                   body: Optional[dict] = None, cascade_delete: bool = False) -> None:
         """Detach a nested data field from its parent data field."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_nested_data_field(
+        self._run_sync(self._async_detach_nested_data_field(
             parent_data_field_guid, nested_data_field_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -2597,8 +2574,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_data_structure(data_struct_guid, body, cascade_delete))
+        self._run_sync(self._async_delete_data_structure(data_struct_guid, body, cascade_delete))
 
     @dynamic_catch
     async def _async_find_all_data_fields(self, graph_query_depth: int = 3, output_format: str = 'JSON',
@@ -2667,8 +2643,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_all_data_fields(graph_query_depth, output_format, report_spec, body))
         return response
 
@@ -2878,8 +2853,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_data_fields(
                 search_string,
                 body=body,
@@ -2998,8 +2972,7 @@ class DataDesigner(ServerClient):
 
     """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_data_fields_by_name(filter_string=filter_string, classification_names=classification_names, body=body, start_from=start_from, page_size=page_size,
                                                 graph_query_depth=graph_query_depth,
                                                 output_format=output_format, report_spec=report_spec, **kwargs))
@@ -3024,8 +2997,7 @@ class DataDesigner(ServerClient):
                                 body: Optional[dict] = None,
                                 graph_query_depth: int = 3, output_format: str = 'JSON', report_spec: str | dict = None, **kwargs) -> list | str:
         """Get a data field by its GUID."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_data_field_by_guid(guid, element_type, body, graph_query_depth, output_format, report_spec, **kwargs))
 
     @dynamic_catch
@@ -3131,8 +3103,7 @@ class DataDesigner(ServerClient):
 
     """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_data_value_specifications_by_name(filter_string, classification_names, body, start_from, page_size,
                                                              graph_query_depth,
                                                              output_format, report_spec, **kwargs))
@@ -3245,8 +3216,7 @@ class DataDesigner(ServerClient):
 
     """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_data_value_specification_by_guid(guid, element_type, body, graph_query_depth, output_format, report_spec, **kwargs))
         return response
 
@@ -3282,8 +3252,7 @@ class DataDesigner(ServerClient):
                                 graph_query_depth: int = 3, output_format: str = 'JSON', report_spec: str | dict = None,
                                 **kwargs) -> list | str:
         """Get a data class by its GUID."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_data_class_by_guid(guid=guid, element_type=element_type, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
 
     @dynamic_catch
@@ -3292,8 +3261,7 @@ class DataDesigner(ServerClient):
                                 graph_query_depth: int = 3, output_format: str = 'JSON', report_spec: str | dict = None,
                                 **kwargs) -> list | str:
         """Get a data grain by its GUID. Alias for get_data_value_specification_by_guid with DataGrain type."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_data_value_specification_by_guid(
                 guid=guid, element_type=element_type or "DataGrain", body=body, output_format=output_format, report_spec=report_spec, **kwargs))
 
@@ -3460,8 +3428,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_data_classification(body))
+        response = self._run_sync(self._async_create_data_classification(body))
         return response
 
     @dynamic_catch
@@ -3597,8 +3564,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_data_classification(data_classification_guid, body))
+        self._run_sync(self._async_update_data_classification(data_classification_guid, body))
 
     @dynamic_catch
     async def _async_link_data_classification_to_data_field(self, data_classification_guid: str, data_field_guid: str,
@@ -3704,8 +3670,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_data_classification_to_data_field(data_classification_guid, data_field_guid, body))
 
     @dynamic_catch
@@ -3806,8 +3771,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_data_classification_from_data_field(data_classification_guid, data_field_guid, body, cascade_delete))
 
     ###
@@ -3913,8 +3877,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_data_class_definition(data_definition_guid, data_class_guid, body))
+        self._run_sync(self._async_link_data_class_definition(data_definition_guid, data_class_guid, body))
 
     @dynamic_catch
     async def _async_detach_data_class_definition(self, data_definition_guid: str, data_class_guid: str,
@@ -4013,8 +3976,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_data_class_definition(data_definition_guid, data_class_guid, body, cascade_delete))
 
 
@@ -4031,8 +3993,7 @@ class DataDesigner(ServerClient):
     def link_nested_data_class(self, parent_data_class_guid: str, child_data_class_guid: str,
                                body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Link a child data class to a parent via DataClassComposition relationship."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_nested_data_class(parent_data_class_guid, child_data_class_guid, body))
+        self._run_sync(self._async_link_nested_data_class(parent_data_class_guid, child_data_class_guid, body))
 
     @dynamic_catch
     async def _async_detach_nested_data_class(self, parent_data_class_guid: str, child_data_class_guid: str,
@@ -4047,8 +4008,7 @@ class DataDesigner(ServerClient):
     def detach_nested_data_class(self, parent_data_class_guid: str, child_data_class_guid: str,
                                   body: Optional[dict] = None, cascade_delete: bool = False) -> None:
         """Detach a child data class from its parent (DataClassComposition)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_nested_data_class(
+        self._run_sync(self._async_detach_nested_data_class(
             parent_data_class_guid, child_data_class_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -4064,8 +4024,7 @@ class DataDesigner(ServerClient):
     def link_specialist_data_class(self, parent_data_class_guid: str, child_data_class_guid: str,
                                    body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Link a specialized (child) data class to a parent via SpecializedDataClass relationship."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_specialist_data_class(parent_data_class_guid, child_data_class_guid, body))
 
     @dynamic_catch
@@ -4081,8 +4040,7 @@ class DataDesigner(ServerClient):
     def detach_specialist_data_class(self, parent_data_class_guid: str, child_data_class_guid: str,
                                      body: Optional[dict] = None, cascade_delete: bool = False) -> None:
         """Detach a specialized (child) data class from its parent."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_specialist_data_class(
+        self._run_sync(self._async_detach_specialist_data_class(
             parent_data_class_guid, child_data_class_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -4183,8 +4141,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_semantic_definition(data_definition_guid, glossary_term_guid, body))
+        self._run_sync(self._async_link_semantic_definition(data_definition_guid, glossary_term_guid, body))
 
     @dynamic_catch
     async def _async_detach_semantic_definition(self, data_definition_guid: str, glossary_term_guid: str,
@@ -4282,8 +4239,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_semantic_definition(data_definition_guid, glossary_term_guid, body, cascade_delete))
 
 
@@ -4391,8 +4347,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_certification_type_to_data_structure(certification_type_guid, data_structure_guid, body))
 
     async def _async_detach_certification_type_from_data_structure(self, certification_type_guid: str,
@@ -4488,8 +4443,7 @@ class DataDesigner(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_certification_type_from_data_structure(certification_type_guid, data_structure_guid,
                                                                       body, cascade_delete))
 
@@ -4863,8 +4817,7 @@ class DataDesigner(ServerClient):
         """
         Link a Data Value Specification to an element (DataValueAssignment relationship). Sync version.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_data_value_assignment(element_guid, spec_guid, body))
+        self._run_sync(self._async_link_data_value_assignment(element_guid, spec_guid, body))
 
     @dynamic_catch
     async def _async_detach_data_value_assignment(self, element_guid: str, spec_guid: str, body: dict = None) -> None:
@@ -4880,8 +4833,7 @@ class DataDesigner(ServerClient):
         """
         Detach a Data Value Specification from an element (DataValueAssignment relationship). Sync version.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_data_value_assignment(element_guid, spec_guid, body))
+        self._run_sync(self._async_detach_data_value_assignment(element_guid, spec_guid, body))
 
     @dynamic_catch
     async def _async_update_data_field(self, data_field_guid: str, body: dict | UpdateElementRequestBody) -> None:
@@ -4902,8 +4854,7 @@ class DataDesigner(ServerClient):
     @dynamic_catch
     def update_data_field(self, data_field_guid: str, body: dict | UpdateElementRequestBody) -> None:
         """Update the properties of a data field."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_data_field(data_field_guid, body))
+        self._run_sync(self._async_update_data_field(data_field_guid, body))
 
     @dynamic_catch
     async def _async_update_data_value_specification(self, guid: str, body: dict | UpdateElementRequestBody) -> None:
@@ -4936,8 +4887,7 @@ class DataDesigner(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_data_value_specification(guid, body))
+        self._run_sync(self._async_update_data_value_specification(guid, body))
 
     #
     # Additional relationship maintenance - added to close the gap found by
@@ -4958,8 +4908,7 @@ class DataDesigner(ServerClient):
     def link_linked_data_field(self, data_field_one_guid: str, data_field_two_guid: str,
                                body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach two related data fields (LinkedDataField relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_linked_data_field(data_field_one_guid, data_field_two_guid, body))
+        self._run_sync(self._async_link_linked_data_field(data_field_one_guid, data_field_two_guid, body))
 
     @dynamic_catch
     async def _async_detach_linked_data_field(self, data_field_one_guid: str, data_field_two_guid: str,
@@ -4975,8 +4924,7 @@ class DataDesigner(ServerClient):
                                  body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                  cascade_delete: bool = False) -> None:
         """Detach two related data fields."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_linked_data_field(
+        self._run_sync(self._async_detach_linked_data_field(
             data_field_one_guid, data_field_two_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -4991,8 +4939,7 @@ class DataDesigner(ServerClient):
     def link_schema_attribute_definition(self, data_field_guid: str, schema_attribute_guid: str,
                                          body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a data field to the schema attribute that defines it (SchemaAttributeDefinition relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_schema_attribute_definition(data_field_guid, schema_attribute_guid, body))
+        self._run_sync(self._async_link_schema_attribute_definition(data_field_guid, schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_detach_schema_attribute_definition(self, data_field_guid: str, schema_attribute_guid: str,
@@ -5008,8 +4955,7 @@ class DataDesigner(ServerClient):
                                            body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                            cascade_delete: bool = False) -> None:
         """Detach a data field from the schema attribute that defines it."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_schema_attribute_definition(
+        self._run_sync(self._async_detach_schema_attribute_definition(
             data_field_guid, schema_attribute_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -5024,8 +4970,7 @@ class DataDesigner(ServerClient):
     def link_schema_type_definition(self, data_structure_guid: str, schema_type_guid: str,
                                     body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a data structure to the schema type that defines it (SchemaTypeDefinition relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_schema_type_definition(data_structure_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_schema_type_definition(data_structure_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_schema_type_definition(self, data_structure_guid: str, schema_type_guid: str,
@@ -5041,8 +4986,7 @@ class DataDesigner(ServerClient):
                                       body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                       cascade_delete: bool = False) -> None:
         """Detach a data structure from the schema type that defines it."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_schema_type_definition(
+        self._run_sync(self._async_detach_schema_type_definition(
             data_structure_guid, schema_type_guid, body, cascade_delete))
 
 
@@ -173,8 +173,7 @@ class DataDiscovery(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_annotation(body))
+        return self._run_sync(self._async_create_annotation(body))
 
     @dynamic_catch
     async def _async_create_annotation_from_template(self, body: dict | TemplateRequestBody) -> str:
@@ -256,8 +255,7 @@ class DataDiscovery(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_annotation_from_template(body))
+        return self._run_sync(self._async_create_annotation_from_template(body))
 
     @dynamic_catch
     async def _async_update_annotation(
@@ -331,8 +329,7 @@ class DataDiscovery(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_annotation(annotation_guid, body))
+        self._run_sync(self._async_update_annotation(annotation_guid, body))
 
     async def _async_attach_annotation_to_report(
         self,
@@ -379,8 +376,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_attach_annotation_to_report(survey_report_guid, annotation_guid, body)
         )
 
@@ -429,8 +425,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_annotation_from_report(survey_report_guid, annotation_guid, body)
         )
 
@@ -479,8 +474,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_annotation_to_described_element(annotation_guid, element_guid, body)
         )
 
@@ -502,8 +496,7 @@ class DataDiscovery(ServerClient):
         body: dict | DeleteRelationshipRequestBody,
     ) -> None:
         """Detach an annotation from the element it describes."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_annotation_from_described_element(annotation_guid, element_guid, body)
         )
 
@@ -552,8 +545,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_annotation_to_its_predecessor(annotation_guid, predecessor_guid, body)
         )
 
@@ -602,8 +594,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_annotation_from_its_predecessor(annotation_guid, predecessor_guid, body)
         )
 
@@ -652,8 +643,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_resource_profile_data(annotation_guid, element_guid, body)
         )
 
@@ -702,8 +692,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_resource_profile_data(annotation_guid, element_guid, body)
         )
 
@@ -752,8 +741,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_annotation_match(annotation_guid, element_guid, body)
         )
 
@@ -802,8 +790,7 @@ class DataDiscovery(ServerClient):
         -------
         None
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_annotation_match(annotation_guid, element_guid, body)
         )
 
@@ -871,8 +858,7 @@ class DataDiscovery(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_annotation(annotation_guid, body))
+        self._run_sync(self._async_delete_annotation(annotation_guid, body))
 
     @dynamic_catch
     async def _async_get_annotations_by_name(
@@ -999,8 +985,7 @@ class DataDiscovery(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_annotations_by_name(
                 name=name,
                 classification_names=classification_names,
@@ -1064,8 +1049,7 @@ class DataDiscovery(ServerClient):
         **kwargs,
     ) -> str | list[dict]:
         """Get annotations by analysis step."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_annotations_by_analysis_step(
                 analysis_step, body, start_from, page_size, output_format, report_spec, **kwargs
             )
@@ -1121,8 +1105,7 @@ class DataDiscovery(ServerClient):
         **kwargs,
     ) -> str | list[dict]:
         """Get annotations by annotation type."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_annotations_by_annotation_type(
                 annotation_type, body, start_from, page_size, output_format, report_spec, **kwargs
             )
@@ -1176,8 +1159,7 @@ class DataDiscovery(ServerClient):
         **kwargs,
     ) -> str | list[dict]:
         """Get the annotations associated with an element."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_annotations_for_element(
                 element_guid, body, start_from, page_size, output_format, report_spec, **kwargs
             )
@@ -1231,8 +1213,7 @@ class DataDiscovery(ServerClient):
         **kwargs,
     ) -> str | list[dict]:
         """Get the new annotations for a survey report."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_new_annotations(
                 survey_report_guid, body, start_from, page_size, output_format, report_spec, **kwargs
             )
@@ -1286,8 +1267,7 @@ class DataDiscovery(ServerClient):
         **kwargs,
     ) -> str | list[dict]:
         """Get the annotations that extend an annotation."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_annotation_extensions(
                 annotation_guid, body, start_from, page_size, output_format, report_spec, **kwargs
             )
@@ -1341,8 +1321,7 @@ class DataDiscovery(ServerClient):
         **kwargs,
     ) -> str | list[dict]:
         """Get the annotations that precede an annotation."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_previous_annotations(
                 annotation_guid, body, start_from, page_size, output_format, report_spec, **kwargs
             )
@@ -1544,8 +1523,7 @@ class DataDiscovery(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_annotations(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -1671,8 +1649,7 @@ class DataDiscovery(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_annotation_by_guid(
                 guid=guid,
                 element_type=element_type,
@@ -1696,8 +1673,7 @@ class DataDiscovery(ServerClient):
 
     def create_analysis_report(self, body: dict | NewElementRequestBody) -> str:
         """Create an analysis report."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_analysis_report(body))
+        return self._run_sync(self._async_create_analysis_report(body))
 
     @dynamic_catch
     async def _async_update_analysis_report(self, report_guid: str, body: dict | UpdateElementRequestBody) -> None:
@@ -1707,8 +1683,7 @@ class DataDiscovery(ServerClient):
 
     def update_analysis_report(self, report_guid: str, body: dict | UpdateElementRequestBody) -> None:
         """Update an analysis report."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_analysis_report(report_guid, body))
+        self._run_sync(self._async_update_analysis_report(report_guid, body))
 
     @dynamic_catch
     async def _async_delete_analysis_report(self, report_guid: str, body: Optional[dict | DeleteElementRequestBody] = None) -> None:
@@ -1718,8 +1693,7 @@ class DataDiscovery(ServerClient):
 
     def delete_analysis_report(self, report_guid: str, body: Optional[dict | DeleteElementRequestBody] = None) -> None:
         """Delete an analysis report."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_analysis_report(report_guid, body))
+        self._run_sync(self._async_delete_analysis_report(report_guid, body))
 
     @dynamic_catch
     async def _async_get_analysis_reports_by_name(self, name: str, start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
@@ -1729,8 +1703,7 @@ class DataDiscovery(ServerClient):
 
     def get_analysis_reports_by_name(self, name: str, start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
         """Get analysis reports by name."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_analysis_reports_by_name(name, start_from, page_size, **kwargs))
+        return self._run_sync(self._async_get_analysis_reports_by_name(name, start_from, page_size, **kwargs))
 
     @dynamic_catch
     async def _async_find_analysis_reports(self, search_string: str = "*", start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
@@ -1740,8 +1713,7 @@ class DataDiscovery(ServerClient):
 
     def find_analysis_reports(self, search_string: str = "*", start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
         """Find analysis reports."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_find_analysis_reports(search_string, start_from, page_size, **kwargs))
+        return self._run_sync(self._async_find_analysis_reports(search_string, start_from, page_size, **kwargs))
 
     @dynamic_catch
     async def _async_get_analysis_report_by_guid(self, guid: str, **kwargs) -> dict | str:
@@ -1751,8 +1723,7 @@ class DataDiscovery(ServerClient):
 
     def get_analysis_report_by_guid(self, guid: str, **kwargs) -> dict | str:
         """Get analysis report by GUID."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_analysis_report_by_guid(guid, **kwargs))
+        return self._run_sync(self._async_get_analysis_report_by_guid(guid, **kwargs))
 
     #
     # Linking
@@ -1766,8 +1737,7 @@ class DataDiscovery(ServerClient):
 
     def link_analysis_report_to_asset(self, analysis_report_guid: str, asset_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Link an analysis report to an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_analysis_report_to_asset(analysis_report_guid, asset_guid, body))
+        self._run_sync(self._async_link_analysis_report_to_asset(analysis_report_guid, asset_guid, body))
 
     @dynamic_catch
     async def _async_detach_analysis_report_from_asset(self, analysis_report_guid: str, asset_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -1777,8 +1747,7 @@ class DataDiscovery(ServerClient):
 
     def detach_analysis_report_from_asset(self, analysis_report_guid: str, asset_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach an analysis report from an asset."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_analysis_report_from_asset(analysis_report_guid, asset_guid, body))
+        self._run_sync(self._async_detach_analysis_report_from_asset(analysis_report_guid, asset_guid, body))
 
 
     @dynamic_catch
@@ -1789,8 +1758,7 @@ class DataDiscovery(ServerClient):
 
     def link_request_for_action_target(self, annotation_guid: str, element_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Link a request for action target."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_request_for_action_target(annotation_guid, element_guid, body))
+        self._run_sync(self._async_link_request_for_action_target(annotation_guid, element_guid, body))
 
     @dynamic_catch
     async def _async_detach_request_for_action_target(self, annotation_guid: str, element_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -1800,5 +1768,4 @@ class DataDiscovery(ServerClient):
 
     def detach_request_for_action_target(self, annotation_guid: str, element_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a request for action target."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_request_for_action_target(annotation_guid, element_guid, body))
+        self._run_sync(self._async_detach_request_for_action_target(annotation_guid, element_guid, body))
@@ -6,15 +6,18 @@ Copyright Contributors to the ODPi Egeria project.
 
 """
 import asyncio
+from collections.abc import AsyncIterator, Iterator
 
 from pydantic import HttpUrl
 
 from pyegeria.core._exceptions import PyegeriaException
 from pyegeria.core.utils import dynamic_catch, transform_json_to_tabular
 from pyegeria.core._server_client import ServerClient
+from pyegeria.core import _tabular
+from pyegeria.core._tabular import TabularChunk
 from pyegeria.models import SearchStringRequestBody
 from pyegeria.view.output_formatter import _generate_default_output
-from typing import Any, Optional
+from typing import Any, Optional, TextIO
 
 class DataEngineer(ServerClient):
     """
@@ -268,8 +271,7 @@ class DataEngineer(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_tabular_data_sets(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -311,8 +313,7 @@ class DataEngineer(ServerClient):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_tabular_data_set(guid=guid, start_from_row=start_from_row, max_row_count=max_row_count, output_format=output_format, **kwargs)
         )
         return response
@@ -353,4 +354,139 @@ class DataEngineer(ServerClient):
         if isinstance(el_list, dict):
             return el_list
         else:
-            raise PyegeriaException(f"Unsupported output format: {output_format}")
\ No newline at end of file
+            raise PyegeriaException(f"Unsupported output format: {output_format}")
+
+    #
+    #   Chunked reading of whole data sets - see pyegeria.core._tabular
+    #
+
+    async def _async_fetch_tabular_window(self, guid: str, start_from_row: int, max_row_count: int) -> dict | None:
+        url = str(HttpUrl(f"{self.command_root}/tabular-data-sets/{guid}/report?"
+                          f"startFromRow={start_from_row}&maxRowCount={max_row_count}"))
+        response = await self._async_make_request("GET", url)
+        report = response.json().get("tabularDataSetReport")
+        return report if isinstance(report, dict) else None
+
+    def aiter_tabular_data_set_chunks(self, guid: str, chunk_rows: int = 5000, start_from_row: int = 0,
+                                      prefetch: bool = True, max_rows: int = None) -> AsyncIterator[TabularChunk]:
+        """Walk a whole tabular data set window by window.
+
+        Parameters
+        ----------
+        guid: str
+            The unique identifier of the tabular data set.
+        chunk_rows: int, optional
+            Rows requested per report window.
+        start_from_row: int, optional
+            The first row to read.
+        prefetch: bool, optional
+            Request the next window while the current one is being consumed.
+        max_rows: int, optional
+            Stop after this many rows.
+
+        Returns
+        -------
+        AsyncIterator[TabularChunk]
+            (start_row, columns, rows) per window, rows as tuples.
+        """
+        return _tabular.aiter_chunks(
+            lambda start, count: self._async_fetch_tabular_window(guid, start, count),
+            start_from_row=start_from_row, chunk_rows=chunk_rows, prefetch=prefetch, max_rows=max_rows)
+
+    def aiter_tabular_data_set_rows(self, guid: str, chunk_rows: int = 5000, start_from_row: int = 0,
+                                    prefetch: bool = True, max_rows: int = None) -> AsyncIterator[tuple]:
+        """Stream the rows of a whole tabular data set as tuples (see aiter_tabular_data_set_chunks)."""
+        return _tabular.aiter_rows(self.aiter_tabular_data_set_chunks(guid, chunk_rows, start_from_row,
+                                                                      prefetch, max_rows))
+
+    def iter_tabular_data_set_rows(self, guid: str, chunk_rows: int = 5000, start_from_row: int = 0,
+                                   prefetch: bool = True, max_rows: int = None) -> Iterator[tuple]:
+        """Synchronous version of aiter_tabular_data_set_rows(). Each window is fetched with one
+        call into the sync runtime and its rows are then yielded locally."""
+        chunks = self.aiter_tabular_data_set_chunks(guid, chunk_rows, start_from_row, prefetch, max_rows)
+        try:
+            while True:
+                try:
+                    chunk = self._run_sync(chunks.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield from chunk.rows
+        finally:
+            self._run_sync(chunks.aclose())
+
+    @dynamic_catch
+    async def _async_write_tabular_data_set_csv(self, guid: str, out: TextIO, chunk_rows: int = 5000,
+                                                start_from_row: int = 0, max_rows: int = None,
+                                                header: bool = True) -> int:
+        """Write a whole tabular data set to `out` as CSV, one window at a time. Async version.
+
+        Parameters
+        ----------
+        guid: str
+            The unique identifier of the tabular data set.
+        out: TextIO
+            Text stream to write to (open files with newline="").
+        chunk_rows: int, optional
+            Rows requested per report window.
+        start_from_row: int, optional
+            The first row to read.
+        max_rows: int, optional
+            Stop after this many rows.
+        header: bool, optional
+            Write the column names first.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return await _tabular.write_csv(
+            self.aiter_tabular_data_set_chunks(guid, chunk_rows, start_from_row, max_rows=max_rows), out, header)
+
+    @dynamic_catch
+    def write_tabular_data_set_csv(self, guid: str, out: TextIO, chunk_rows: int = 5000, start_from_row: int = 0,
+                                   max_rows: int = None, header: bool = True) -> int:
+        """Write a whole tabular data set to `out` as CSV, one window at a time.
+
+        See `_async_write_tabular_data_set_csv` for the parameters. Returns the number of rows written.
+        """
+        return self._run_sync(
+            self._async_write_tabular_data_set_csv(guid, out, chunk_rows, start_from_row, max_rows, header)
+        )
+
+    @dynamic_catch
+    async def _async_get_tabular_data_set_frame(self, guid: str, kind: str = "pandas", chunk_rows: int = 5000,
+                                                start_from_row: int = 0, max_rows: int = None) -> Any:
+        """Read a whole tabular data set into a columnar frame. Async version.
+
+        Parameters
+        ----------
+        guid: str
+            The unique identifier of the tabular data set.
+        kind: str, optional
+            "pandas" (DataFrame), "numpy" (dict of column name -> ndarray) or "arrow" (pyarrow Table).
+            The library must be installed; pyegeria does not depend on it.
+        chunk_rows: int, optional
+            Rows requested per report window.
+        start_from_row: int, optional
+            The first row to read.
+        max_rows: int, optional
+            Stop after this many rows.
+
+        Returns
+        -------
+        The frame, built once from per-column lists (no per-row dicts).
+        """
+        return await _tabular.build_frame(
+            self.aiter_tabular_data_set_chunks(guid, chunk_rows, start_from_row, max_rows=max_rows), kind)
+
+    @dynamic_catch
+    def get_tabular_data_set_frame(self, guid: str, kind: str = "pandas", chunk_rows: int = 5000,
+                                   start_from_row: int = 0, max_rows: int = None) -> Any:
+        """Read a whole tabular data set into a pandas, NumPy or pyarrow frame.
+
+        See `_async_get_tabular_data_set_frame` for the parameters.
+        """
+        return self._run_sync(
+            self._async_get_tabular_data_set_frame(guid, kind, chunk_rows, start_from_row, max_rows)
+        )
@@ -187,8 +187,7 @@ class GlossaryManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_glossary(display_name, description, language, usage, category, body)
             )
         return response
@@ -232,8 +231,7 @@ class GlossaryManager(CollectionManager):
         None
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_glossary(glossary_guid, body, cascade))
+        self._run_sync(self._async_delete_glossary(glossary_guid, body, cascade))
 
     @dynamic_catch
     async def _async_update_glossary(
@@ -300,8 +298,7 @@ class GlossaryManager(CollectionManager):
 
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_glossary(
                 glossary_guid,
                 body, merge_update
@@ -396,8 +393,7 @@ class GlossaryManager(CollectionManager):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_glossary_as_taxonomy(glossary_guid, organizing_principle, body))
+        self._run_sync(self._async_set_glossary_as_taxonomy(glossary_guid, organizing_principle, body))
 
     @dynamic_catch
     async def _async_clear_glossary_as_taxonomy(self, glossary_guid: str,
@@ -466,8 +462,7 @@ class GlossaryManager(CollectionManager):
             "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_glossary_as_taxonomy(glossary_guid, body))
+        self._run_sync(self._async_clear_glossary_as_taxonomy(glossary_guid, body))
 
     @dynamic_catch
     async def _async_set_glossary_as_canonical(self, glossary_guid: str, scope: Optional[str] = None,
@@ -552,8 +547,7 @@ class GlossaryManager(CollectionManager):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_glossary_as_canonical(glossary_guid, scope, body))
+        self._run_sync(self._async_set_glossary_as_canonical(glossary_guid, scope, body))
 
     @dynamic_catch
     async def _async_clear_glossary_as_canonical(self, glossary_guid: str,
@@ -622,8 +616,7 @@ class GlossaryManager(CollectionManager):
             "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_glossary_as_canonical(glossary_guid, body))
+        self._run_sync(self._async_clear_glossary_as_canonical(glossary_guid, body))
 
     #
     #  Terms
@@ -674,8 +667,7 @@ class GlossaryManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_glossary_term(body)
             )
 
@@ -734,7 +726,7 @@ class GlossaryManager(CollectionManager):
         The file path is relative to the caller, not the Egeria platform.
         """
         # Check that the glossary exists and retrieve its GUID
-        glossaries = self.get_glossaries_by_name(glossary_name)
+        glossaries = await self._async_get_glossaries_by_name(glossary_name)
         if not isinstance(glossaries, list) or len(glossaries) == 0:
             raise ValueError(f"Glossary '{glossary_name}' not found.")
         if len(glossaries) > 1:
@@ -751,6 +743,7 @@ class GlossaryManager(CollectionManager):
             raise ValueError(glossary_error)
 
         glossary_guid = glossaries[0]["elementHeader"]["guid"]
+        recognized_term_status = await self._async_get_glossary_term_statuses()
 
         valid_term_properties = {
             "Term Name",
@@ -819,7 +812,7 @@ class GlossaryManager(CollectionManager):
                 version = row.get("Version Identifier") or "1.0"
                 status = (row.get("Status") or "DRAFT").upper()
 
-                if not self.__validate_term_status__(status):
+                if status not in recognized_term_status:
                     term_info.append(
                         {
                             "term_name": term_name,
@@ -832,7 +825,7 @@ class GlossaryManager(CollectionManager):
 
                 if upsert and qualified_name:
                     # Try to find an existing term by qualified name
-                    term_stuff = self.get_terms_by_name(filter_string=qualified_name)
+                    term_stuff = await self._async_get_terms_by_name(filter_string=qualified_name)
                     if isinstance(term_stuff, str):
                         # Not found — treat as a new insert
                         pass
@@ -960,8 +953,7 @@ class GlossaryManager(CollectionManager):
 
         The file path is relative to the caller, not the Egeria platform.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_import_glossary_terms_from_csv(
                 glossary_name, filename, file_path, upsert, verbose
                 )
@@ -1118,8 +1110,7 @@ class GlossaryManager(CollectionManager):
         :meth:`import_glossary_terms_from_csv` so a round-trip
         export → edit → import is straightforward.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_export_glossary_to_csv(glossary_guid, target_file, file_path)
             )
 
@@ -1248,8 +1239,7 @@ class GlossaryManager(CollectionManager):
         -----
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_create_term_copy(
                 glossary_guid,
                 glossary_term_guid,
@@ -1352,8 +1342,7 @@ class GlossaryManager(CollectionManager):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_glossary_term(
                 glossary_term_guid,
                 body,
@@ -1418,7 +1407,7 @@ class GlossaryManager(CollectionManager):
             validated_body = UpdateWithTemplateRequestBody.model_validate(body)
         else:
             validated_body = body
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Updated glossary term {glossary_term_guid} from template {template_guid}")
@@ -1468,8 +1457,7 @@ class GlossaryManager(CollectionManager):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_glossary_term_from_template(
+        self._run_sync(self._async_update_glossary_term_from_template(
             glossary_term_guid, template_guid, body, merge_update, merge_classifications))
 
     @dynamic_catch
@@ -1556,8 +1544,7 @@ class GlossaryManager(CollectionManager):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_glossary_term_status(
                 glossary_term_guid,
                 term_status,
@@ -1641,8 +1628,7 @@ class GlossaryManager(CollectionManager):
         Notes
         -----
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_delete_term(term_guid, cascade, body)
             )
 
@@ -1716,8 +1702,7 @@ class GlossaryManager(CollectionManager):
         Notes
         -----
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_move_term(term_guid, glossary_guid, body)
             )
 
@@ -1827,8 +1812,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_is_abstract_concept(term_guid, body)
             )
 
@@ -1917,8 +1901,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_is_abstract_concept(term_guid, body)
             )
 
@@ -2019,8 +2002,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_is_context_definition(term_guid, body)
             )
 
@@ -2108,8 +2090,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_is_context_definition(term_guid, body)
             )
 
@@ -2206,8 +2187,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_is_data_value(term_guid, body)
             )
 
@@ -2296,8 +2276,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_is_data_value(term_guid, body)
             )
 
@@ -2400,8 +2379,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_activity_description(term_guid, activity_type, body)
             )
 
@@ -2490,8 +2468,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_activity_description(term_guid, body)
             )
 
@@ -2571,8 +2548,7 @@ class GlossaryManager(CollectionManager):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_term_as_question(term_guid, body))
+        self._run_sync(self._async_set_term_as_question(term_guid, body))
 
     @dynamic_catch
     async def _async_clear_term_as_question(self, term_guid: str,
@@ -2641,8 +2617,7 @@ class GlossaryManager(CollectionManager):
             "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_term_as_question(term_guid, body))
+        self._run_sync(self._async_clear_term_as_question(term_guid, body))
 
     @dynamic_catch
     async def _async_create_question(self, display_name: Optional[str] = None,
@@ -2712,8 +2687,7 @@ class GlossaryManager(CollectionManager):
         -------
         str - guid of the created question term
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_question(display_name, description, body))
+        return self._run_sync(self._async_create_question(display_name, description, body))
 
     #
     #   Term - Term Relationships
@@ -2843,8 +2817,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_relationship_between_terms(term1_guid, term2_guid, relationship_type,
                                                        body)
             )
@@ -2968,8 +2941,7 @@ class GlossaryManager(CollectionManager):
          }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_relationship_between_terms(term1_guid, term2_guid, relationship_type,
                                                           body)
             )
@@ -3053,8 +3025,7 @@ class GlossaryManager(CollectionManager):
              The principle specified by the user_id does not have authorization for the requested action.
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_relationship_between_terms(term1_guid, term2_guid, relationship_type,
                                                           body)
             )
@@ -3235,8 +3206,7 @@ class GlossaryManager(CollectionManager):
 
     @dynamic_catch
     def get_glossary_term_statuses(self) -> [str]:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_glossary_term_statuses())
+        response = self._run_sync(self._async_get_glossary_term_statuses())
         return response
 
     @dynamic_catch
@@ -3248,8 +3218,7 @@ class GlossaryManager(CollectionManager):
 
     @dynamic_catch
     def get_glossary_term_rel_statuses(self) -> [str]:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_glossary_term_rel_statuses())
+        response = self._run_sync(self._async_get_glossary_term_rel_statuses())
         return response
 
     @dynamic_catch
@@ -3261,8 +3230,7 @@ class GlossaryManager(CollectionManager):
 
     @dynamic_catch
     def get_glossary_term_activity_types(self) -> [str]:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_glossary_term_activity_types())
+        response = self._run_sync(self._async_get_glossary_term_activity_types())
         return response
 
     @dynamic_catch
@@ -3274,8 +3242,7 @@ class GlossaryManager(CollectionManager):
 
     @dynamic_catch
     def get_term_relationship_types(self) -> [str]:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_term_relationship_types())
+        response = self._run_sync(self._async_get_term_relationship_types())
         return response
 
     @dynamic_catch
@@ -3396,8 +3363,7 @@ class GlossaryManager(CollectionManager):
         **kwargs,
     ) -> list | str:
         """Retrieve the list of glossary metadata elements that contain the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_glossaries(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -3473,8 +3439,7 @@ class GlossaryManager(CollectionManager):
         body: Optional[dict | FilterRequestBody] = None,
         **kwargs,
     ) -> dict | str:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_glossaries_by_name(
                 filter_string=filter_string,
                 classification_names=classification_names,
@@ -3531,8 +3496,7 @@ class GlossaryManager(CollectionManager):
         body: Optional[dict | GetRequestBody] = None,
         **kwargs,
     ) -> dict | str:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_glossary_by_guid(
                 glossary_guid=glossary_guid,
                 include_only_relationships=include_only_relationships,
@@ -3598,8 +3562,7 @@ class GlossaryManager(CollectionManager):
         body: Optional[dict | FilterRequestBody] = None,
         **kwargs,
     ) -> list | str:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_terms_by_name(
                 filter_string=filter_string,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -3656,8 +3619,7 @@ class GlossaryManager(CollectionManager):
         body: Optional[dict | GetRequestBody] = None,
         **kwargs,
     ) -> dict | str:
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_term_by_guid(
                 term_guid=term_guid,
                 include_only_relationships=include_only_relationships,
@@ -3790,8 +3752,7 @@ class GlossaryManager(CollectionManager):
         **kwargs,
     ) -> list | str:
         """Retrieve the list of glossary term metadata elements that contain the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_glossary_terms(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -3867,8 +3828,7 @@ class GlossaryManager(CollectionManager):
         PyegeriaException
             If the term is not found, or it is not anchored to any glossary.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_glossary_for_term(term_guid))
+        return self._run_sync(self._async_get_glossary_for_term(term_guid))
 
     #
     # Naming standards classifications (0438) -- Egeria PR #9166. Simple marker
@@ -3913,8 +3873,7 @@ class GlossaryManager(CollectionManager):
     def set_is_prime_word(self, term_guid: str,
                           body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a glossary term as a prime word in a naming standard."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_is_prime_word(term_guid, body))
+        self._run_sync(self._async_set_is_prime_word(term_guid, body))
 
     @dynamic_catch
     async def _async_clear_is_prime_word(self, term_guid: str,
@@ -3939,8 +3898,7 @@ class GlossaryManager(CollectionManager):
     def clear_is_prime_word(self, term_guid: str,
                             body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the prime word designation from a glossary term."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_is_prime_word(term_guid, body))
+        self._run_sync(self._async_clear_is_prime_word(term_guid, body))
 
     @dynamic_catch
     async def _async_set_is_modifier(self, term_guid: str,
@@ -3967,8 +3925,7 @@ class GlossaryManager(CollectionManager):
     def set_is_modifier(self, term_guid: str,
                         body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a glossary term as a modifier in a naming standard."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_is_modifier(term_guid, body))
+        self._run_sync(self._async_set_is_modifier(term_guid, body))
 
     @dynamic_catch
     async def _async_clear_is_modifier(self, term_guid: str,
@@ -3993,8 +3950,7 @@ class GlossaryManager(CollectionManager):
     def clear_is_modifier(self, term_guid: str,
                           body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the modifier designation from a glossary term."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_is_modifier(term_guid, body))
+        self._run_sync(self._async_clear_is_modifier(term_guid, body))
 
     @dynamic_catch
     async def _async_set_is_class_word(self, term_guid: str,
@@ -4021,8 +3977,7 @@ class GlossaryManager(CollectionManager):
     def set_is_class_word(self, term_guid: str,
                           body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a glossary term as a class word in a naming standard."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_is_class_word(term_guid, body))
+        self._run_sync(self._async_set_is_class_word(term_guid, body))
 
     @dynamic_catch
     async def _async_clear_is_class_word(self, term_guid: str,
@@ -4047,8 +4002,7 @@ class GlossaryManager(CollectionManager):
     def clear_is_class_word(self, term_guid: str,
                             body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the class word designation from a glossary term."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_is_class_word(term_guid, body))
+        self._run_sync(self._async_clear_is_class_word(term_guid, body))
 
 
     #
@@ -4072,8 +4026,7 @@ class GlossaryManager(CollectionManager):
     def link_used_in_context(self, glossary_term_guid: str, context_element_guid: str,
                              body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a glossary term to the element that provides its usage context (UsedInContext relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_used_in_context(glossary_term_guid, context_element_guid, body))
+        self._run_sync(self._async_link_used_in_context(glossary_term_guid, context_element_guid, body))
 
     @dynamic_catch
     async def _async_detach_used_in_context(self, glossary_term_guid: str, context_element_guid: str,
@@ -4087,8 +4040,7 @@ class GlossaryManager(CollectionManager):
     def detach_used_in_context(self, glossary_term_guid: str, context_element_guid: str,
                                body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a glossary term from its usage context element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_used_in_context(glossary_term_guid, context_element_guid, body))
+        self._run_sync(self._async_detach_used_in_context(glossary_term_guid, context_element_guid, body))
 
     @dynamic_catch
     async def _async_set_term_as_element_supplement(self, glossary_term_guid: str,
@@ -4104,8 +4056,7 @@ class GlossaryManager(CollectionManager):
     def set_term_as_element_supplement(self, glossary_term_guid: str,
                                        body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a glossary term as a supplement (additional description) for another element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_term_as_element_supplement(glossary_term_guid, body))
+        self._run_sync(self._async_set_term_as_element_supplement(glossary_term_guid, body))
 
     @dynamic_catch
     async def _async_clear_term_as_element_supplement(self, glossary_term_guid: str,
@@ -4119,8 +4070,7 @@ class GlossaryManager(CollectionManager):
     def clear_term_as_element_supplement(self, glossary_term_guid: str,
                                          body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the ElementSupplement classification from a glossary term."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_term_as_element_supplement(glossary_term_guid, body))
+        self._run_sync(self._async_clear_term_as_element_supplement(glossary_term_guid, body))
 
 
 if __name__ == "__main__":
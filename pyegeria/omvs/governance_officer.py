@@ -552,8 +552,7 @@ class GovernanceOfficer(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_governance_definition(body))
+        response = self._run_sync(self._async_create_governance_definition(body))
         return response
 
     @dynamic_catch
@@ -714,8 +713,7 @@ class GovernanceOfficer(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_data_lens(body))
+        return self._run_sync(self._async_create_data_lens(body))
 
     @dynamic_catch
     async def _async_create_governance_definition_from_template(self, body: dict | TemplateRequestBody) -> str:
@@ -800,7 +798,7 @@ class GovernanceOfficer(ServerClient):
             raise PyegeriaInvalidParameterException(
                 additional_info={"reason": "body must be a dict or TemplateRequestBody"})
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Created governance definition from template with GUID: {resp.json().get('guid')}")
@@ -879,8 +877,7 @@ class GovernanceOfficer(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_governance_definition_from_template(body))
+        response = self._run_sync(self._async_create_governance_definition_from_template(body))
         return response
 
     @dynamic_catch
@@ -1007,8 +1004,7 @@ class GovernanceOfficer(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_governance_definition(guid, body))
+        self._run_sync(self._async_update_governance_definition(guid, body))
 
     @dynamic_catch
     async def _async_delete_governance_definition(self, definition_guid: str,
@@ -1098,8 +1094,7 @@ class GovernanceOfficer(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_governance_definition(definition_guid, body, cascade))
+        self._run_sync(self._async_delete_governance_definition(definition_guid, body, cascade))
 
     @dynamic_catch
     async def _async_link_peer_definitions(self, definition_guid1: str, relationship_type: str, definition_guid2: str,
@@ -1219,8 +1214,7 @@ class GovernanceOfficer(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_peer_definitions(definition_guid1, relationship_type, definition_guid2, body))
 
     @dynamic_catch
@@ -1316,8 +1310,7 @@ class GovernanceOfficer(ServerClient):
           "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_peer_definitions(definition_guid1, relationship_type, definition_guid2, body))
 
     @dynamic_catch
@@ -1440,8 +1433,7 @@ class GovernanceOfficer(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_attach_supporting_definitions(definition_guid1, relationship_type, definition_guid2, body))
 
     @dynamic_catch
@@ -1539,8 +1531,7 @@ class GovernanceOfficer(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_supporting_definitions(definition_guid1, relationship_type, definition_guid2, body))
 
 
@@ -1635,8 +1626,7 @@ class GovernanceOfficer(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_attach_governed_by_definition(element_guid, definition_guid, body))
 
     @dynamic_catch
@@ -1728,8 +1718,7 @@ class GovernanceOfficer(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_governed_by_definition(element_guid, definition_guid, body))
 
     @dynamic_catch
@@ -1796,7 +1785,7 @@ class GovernanceOfficer(ServerClient):
         )
         validated_body = self.validate_new_relationship_request(body, ["LicenseProperties"])
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             resp = await self._async_make_request("POST", url, json_body)
         else:
             resp = await self._async_make_request("POST", url)
@@ -1860,8 +1849,7 @@ class GovernanceOfficer(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_license_element(element_guid, license_type_guid, body))
 
     @dynamic_catch
@@ -1925,7 +1913,7 @@ class GovernanceOfficer(ServerClient):
         )
         validated_body = self.validate_new_relationship_request(body, ["CertificationProperties"])
         if validated_body:
-            json_body = validated_body.model_dump_json(indent=2, exclude_none=True)
+            json_body = validated_body.model_dump_json(exclude_none=True)
             resp = await self._async_make_request("POST", url, json_body)
         else:
             resp = await self._async_make_request("POST", url)
@@ -1986,8 +1974,7 @@ class GovernanceOfficer(ServerClient):
            "effectiveTime" : "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_certify_element(element_guid, certification_type_guid, body))
 
 
@@ -2082,7 +2069,7 @@ class GovernanceOfficer(ServerClient):
     #    """
 
     #     loop = asyncio.get_event_loop()
-    #     loop.run_until_complete(self._async_delete_governance_definition(guid, body))
+    #     self._run_sync(self._async_delete_governance_definition(guid, body))
 
     @dynamic_catch
     async def _async_find_governance_definitions(
@@ -2284,8 +2271,7 @@ class GovernanceOfficer(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_governance_definitions(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -2390,8 +2376,7 @@ class GovernanceOfficer(ServerClient):
         **kwargs
     ) -> list | str:
         """ Retrieve the list of governance action process metadata elements that contain the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_governance_action_processes(
                 search_string=search_string,
                 body=body,
@@ -2454,8 +2439,7 @@ class GovernanceOfficer(ServerClient):
     def link_approved_purpose(self, element_guid: str, data_processing_purpose_guid: str,
                               body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """ Attach an element to an approved purpose."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_approved_purpose(element_guid, data_processing_purpose_guid, body))
+        self._run_sync(self._async_link_approved_purpose(element_guid, data_processing_purpose_guid, body))
 
     @dynamic_catch
     async def _async_detach_approved_purpose(self, element_guid: str, data_processing_purpose_guid: str,
@@ -2489,8 +2473,7 @@ class GovernanceOfficer(ServerClient):
     def detach_approved_purpose(self, element_guid: str, data_processing_purpose_guid: str,
                                 body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """ Detach an element from an approved purpose."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_approved_purpose(element_guid, data_processing_purpose_guid, body))
+        self._run_sync(self._async_detach_approved_purpose(element_guid, data_processing_purpose_guid, body))
 
     @dynamic_catch
     async def _async_get_governance_definitions_by_name(self, name: Optional[str] = None,
@@ -2634,8 +2617,7 @@ class GovernanceOfficer(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_governance_definitions_by_name(name=name, classification_names=classification_names, body=body,
                                                            graph_query_depth=graph_query_depth,
                                                            start_from=start_from, page_size=page_size, output_format=output_format, report_spec=report_spec,
@@ -2780,8 +2762,7 @@ class GovernanceOfficer(ServerClient):
             "forDuplicateProcessing" : false
             }
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_governance_definition_by_guid(guid=guid, element_type=element_type, body=body,
                                                             graph_query_depth=graph_query_depth,
                                                             output_format=output_format, report_spec=report_spec,
@@ -2865,8 +2846,7 @@ class GovernanceOfficer(ServerClient):
                 REPORT - output markdown with a preamble for a report
                 MERMAID - output mermaid markdown
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_gov_def_in_context(guid=guid, element_type=element_type, body=body,
                                                 graph_query_depth=graph_query_depth,
                                                 output_format=output_format, report_spec=report_spec,
@@ -2989,8 +2969,7 @@ class GovernanceOfficer(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_governance_action_process_graph(guid, element_type, body,
+        response = self._run_sync(self._async_get_governance_action_process_graph(guid, element_type, body,
                                                                                          output_format,
                                                                                          report_spec, **kwargs))
         return response
@@ -3066,8 +3045,7 @@ class GovernanceOfficer(ServerClient):
         dict | list | str
             The governance action process.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_governance_action_process(
                 guid, element_type, output_format, report_spec, body, **kwargs
             )
@@ -3182,8 +3160,7 @@ class GovernanceOfficer(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_design_to_implementation(design_desc_guid, implementation_guid, body))
+        self._run_sync(self._async_link_design_to_implementation(design_desc_guid, implementation_guid, body))
 
     @dynamic_catch
     async def _async_detach_design_from_implementation(self, design_desc_guid: str, implementation_guid: str,
@@ -3271,8 +3248,7 @@ class GovernanceOfficer(ServerClient):
           "effectiveTime": "2025-06-13T15:13:31.339Z"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_design_from_implementation(design_desc_guid, implementation_guid, body))
 
     @dynamic_catch
@@ -3385,8 +3361,7 @@ class GovernanceOfficer(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_implementation_resource(design_desc_guid, implementation_guid, body))
+        self._run_sync(self._async_link_implementation_resource(design_desc_guid, implementation_guid, body))
 
     @dynamic_catch
     async def _async_detach_implementation_resource(self, design_desc_guid: str, implementation_guid: str,
@@ -3476,8 +3451,7 @@ class GovernanceOfficer(ServerClient):
           "effectiveTime": "2025-06-13T15:13:31.339Z"
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_implementation_resource(design_desc_guid, implementation_guid, body))
+        self._run_sync(self._async_detach_implementation_resource(design_desc_guid, implementation_guid, body))
 
 
     @dynamic_catch
@@ -3576,8 +3550,7 @@ class GovernanceOfficer(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_governance_results(gov_metric_guid, data_asset_guid, body))
+        self._run_sync(self._async_link_governance_results(gov_metric_guid, data_asset_guid, body))
 
     @dynamic_catch
     async def _async_detach_governance_results(self, gov_metric_guid: str, data_asset_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -3658,8 +3631,7 @@ class GovernanceOfficer(ServerClient):
            "effectiveTime": "2025-06-13T15:13:31.339Z"
          }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_governance_results(gov_metric_guid, data_asset_guid, body))
+        self._run_sync(self._async_detach_governance_results(gov_metric_guid, data_asset_guid, body))
     @dynamic_catch
     async def _async_add_regulator_to_regulation(self, regulation_guid: str, regulator_guid,
                                                   body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
@@ -3762,8 +3734,7 @@ class GovernanceOfficer(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_regulator_to_regulation(regulation_guid, regulator_guid, body))
+        self._run_sync(self._async_add_regulator_to_regulation(regulation_guid, regulator_guid, body))
 
     @dynamic_catch
     async def _async_detach_regulator_from_regulation(self, regulation_guid: str, regulator_guid, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -3844,8 +3815,7 @@ class GovernanceOfficer(ServerClient):
           "forDuplicateProcessing" : false
         }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_regulator_from_regulation(regulation_guid, regulator_guid, body))
+        self._run_sync(self._async_detach_regulator_from_regulation(regulation_guid, regulator_guid, body))
 
 
 
@@ -3872,8 +3842,7 @@ class GovernanceOfficer(ServerClient):
     def link_exception(self, element_guid: str, exception_type_guid: str,
                        body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach an exception to the element it was raised against (Exception relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_exception(element_guid, exception_type_guid, body))
+        self._run_sync(self._async_link_exception(element_guid, exception_type_guid, body))
 
     @dynamic_catch
     async def _async_update_exception(self, exception_guid: str,
@@ -3887,8 +3856,7 @@ class GovernanceOfficer(ServerClient):
     def update_exception(self, exception_guid: str,
                          body: Optional[dict | UpdateRelationshipRequestBody] = None) -> None:
         """Update the properties of an Exception relationship."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_exception(exception_guid, body))
+        self._run_sync(self._async_update_exception(exception_guid, body))
 
     @dynamic_catch
     async def _async_detach_exception(self, exception_guid: str,
@@ -3902,8 +3870,7 @@ class GovernanceOfficer(ServerClient):
     def detach_exception(self, exception_guid: str,
                          body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach (delete) an Exception relationship."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_exception(exception_guid, body))
+        self._run_sync(self._async_detach_exception(exception_guid, body))
 
     @dynamic_catch
     async def _async_link_regulation_certification_type(self, regulation_guid: str, certification_type_guid: str,
@@ -3917,8 +3884,7 @@ class GovernanceOfficer(ServerClient):
     def link_regulation_certification_type(self, regulation_guid: str, certification_type_guid: str,
                                             body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a certification type that demonstrates compliance with a regulation (RegulationCertificationType relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_regulation_certification_type(regulation_guid, certification_type_guid, body))
+        self._run_sync(self._async_link_regulation_certification_type(regulation_guid, certification_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_regulation_certification_type(self, regulation_guid: str, certification_type_guid: str,
@@ -3932,8 +3898,7 @@ class GovernanceOfficer(ServerClient):
     def detach_regulation_certification_type(self, regulation_guid: str, certification_type_guid: str,
                                               body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a certification type from a regulation."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_regulation_certification_type(regulation_guid, certification_type_guid, body))
+        self._run_sync(self._async_detach_regulation_certification_type(regulation_guid, certification_type_guid, body))
 
     @dynamic_catch
     async def _async_set_control_point(self, element_guid: str,
@@ -3949,8 +3914,7 @@ class GovernanceOfficer(ServerClient):
     def set_control_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a ControlPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_control_point(element_guid, body))
+        self._run_sync(self._async_set_control_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_control_point(self, element_guid: str,
@@ -3964,8 +3928,7 @@ class GovernanceOfficer(ServerClient):
     def clear_control_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the ControlPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_control_point(element_guid, body))
+        self._run_sync(self._async_clear_control_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_verification_point(self, element_guid: str,
@@ -3981,8 +3944,7 @@ class GovernanceOfficer(ServerClient):
     def set_verification_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a VerificationPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_verification_point(element_guid, body))
+        self._run_sync(self._async_set_verification_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_verification_point(self, element_guid: str,
@@ -3996,8 +3958,7 @@ class GovernanceOfficer(ServerClient):
     def clear_verification_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the VerificationPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_verification_point(element_guid, body))
+        self._run_sync(self._async_clear_verification_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_enforcement_point(self, element_guid: str,
@@ -4013,8 +3974,7 @@ class GovernanceOfficer(ServerClient):
     def set_enforcement_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a EnforcementPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_enforcement_point(element_guid, body))
+        self._run_sync(self._async_set_enforcement_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_enforcement_point(self, element_guid: str,
@@ -4028,8 +3988,7 @@ class GovernanceOfficer(ServerClient):
     def clear_enforcement_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the EnforcementPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_enforcement_point(element_guid, body))
+        self._run_sync(self._async_clear_enforcement_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_execution_point(self, element_guid: str,
@@ -4045,8 +4004,7 @@ class GovernanceOfficer(ServerClient):
     def set_execution_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a ExecutionPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_execution_point(element_guid, body))
+        self._run_sync(self._async_set_execution_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_execution_point(self, element_guid: str,
@@ -4060,8 +4018,7 @@ class GovernanceOfficer(ServerClient):
     def clear_execution_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the ExecutionPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_execution_point(element_guid, body))
+        self._run_sync(self._async_clear_execution_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_policy_administration_point(self, element_guid: str,
@@ -4077,8 +4034,7 @@ class GovernanceOfficer(ServerClient):
     def set_policy_administration_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a PolicyAdministrationPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_policy_administration_point(element_guid, body))
+        self._run_sync(self._async_set_policy_administration_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_policy_administration_point(self, element_guid: str,
@@ -4092,8 +4048,7 @@ class GovernanceOfficer(ServerClient):
     def clear_policy_administration_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the PolicyAdministrationPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_policy_administration_point(element_guid, body))
+        self._run_sync(self._async_clear_policy_administration_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_policy_decision_point(self, element_guid: str,
@@ -4109,8 +4064,7 @@ class GovernanceOfficer(ServerClient):
     def set_policy_decision_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a PolicyDecisionPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_policy_decision_point(element_guid, body))
+        self._run_sync(self._async_set_policy_decision_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_policy_decision_point(self, element_guid: str,
@@ -4124,8 +4078,7 @@ class GovernanceOfficer(ServerClient):
     def clear_policy_decision_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the PolicyDecisionPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_policy_decision_point(element_guid, body))
+        self._run_sync(self._async_clear_policy_decision_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_policy_enforcement_point(self, element_guid: str,
@@ -4141,8 +4094,7 @@ class GovernanceOfficer(ServerClient):
     def set_policy_enforcement_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a PolicyEnforcementPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_policy_enforcement_point(element_guid, body))
+        self._run_sync(self._async_set_policy_enforcement_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_policy_enforcement_point(self, element_guid: str,
@@ -4156,8 +4108,7 @@ class GovernanceOfficer(ServerClient):
     def clear_policy_enforcement_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the PolicyEnforcementPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_policy_enforcement_point(element_guid, body))
+        self._run_sync(self._async_clear_policy_enforcement_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_policy_information_point(self, element_guid: str,
@@ -4173,8 +4124,7 @@ class GovernanceOfficer(ServerClient):
     def set_policy_information_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a PolicyInformationPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_policy_information_point(element_guid, body))
+        self._run_sync(self._async_set_policy_information_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_policy_information_point(self, element_guid: str,
@@ -4188,8 +4138,7 @@ class GovernanceOfficer(ServerClient):
     def clear_policy_information_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the PolicyInformationPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_policy_information_point(element_guid, body))
+        self._run_sync(self._async_clear_policy_information_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_policy_management_point(self, element_guid: str,
@@ -4205,8 +4154,7 @@ class GovernanceOfficer(ServerClient):
     def set_policy_management_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a PolicyManagementPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_policy_management_point(element_guid, body))
+        self._run_sync(self._async_set_policy_management_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_policy_management_point(self, element_guid: str,
@@ -4220,8 +4168,7 @@ class GovernanceOfficer(ServerClient):
     def clear_policy_management_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the PolicyManagementPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_policy_management_point(element_guid, body))
+        self._run_sync(self._async_clear_policy_management_point(element_guid, body))
 
     @dynamic_catch
     async def _async_set_policy_retrieval_point(self, element_guid: str,
@@ -4237,8 +4184,7 @@ class GovernanceOfficer(ServerClient):
     def set_policy_retrieval_point(self, element_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as a PolicyRetrievalPoint."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_policy_retrieval_point(element_guid, body))
+        self._run_sync(self._async_set_policy_retrieval_point(element_guid, body))
 
     @dynamic_catch
     async def _async_clear_policy_retrieval_point(self, element_guid: str,
@@ -4252,8 +4198,7 @@ class GovernanceOfficer(ServerClient):
     def clear_policy_retrieval_point(self, element_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the PolicyRetrievalPoint classification from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_policy_retrieval_point(element_guid, body))
+        self._run_sync(self._async_clear_policy_retrieval_point(element_guid, body))
 
 
 if __name__ == "__main__":
@@ -207,8 +207,7 @@ class LineageLinker(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_lineage(element_one_guid, relationship_type_name, element_two_guid, body)
         )
 
@@ -309,8 +308,7 @@ class LineageLinker(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_data_flow(element_one_guid, relationship_type_name, element_two_guid, body)
         )
 
@@ -404,8 +402,7 @@ class LineageLinker(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_lineage(lineage_relationship_guid, body))
+        return self._run_sync(self._async_update_lineage(lineage_relationship_guid, body))
 
     @dynamic_catch
     async def _async_detach_lineage(
@@ -493,7 +490,6 @@ class LineageLinker(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_detach_lineage(lineage_relationship_guid, body, cascade_delete=cascade_delete)
         )
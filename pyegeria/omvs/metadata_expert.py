@@ -19,6 +19,9 @@ from pyegeria.models import (NewOpenMetadataElementRequestBody, TemplateRequestB
                              DeleteRelationshipRequestBody)
 from pyegeria.core.utils import body_slimmer, dynamic_catch
 from pyegeria.core._server_client import ServerClient, max_paging_size
+from pyegeria.core._paging import aiter_pages, concurrent_pageable, page_fetcher
+from pyegeria.core._exceptions import (PyegeriaConnectionException, PyegeriaException,
+                                       PyegeriaTimeoutException, PyegeriaUnauthorizedException)
 from pyegeria.core._globals import default_timeout, NO_ELEMENTS_FOUND
 
 def base_path(client: ServerClient, view_server: str):
@@ -70,6 +73,13 @@ def process_related_element_list(
     return elements
 
 
+def _endpoint_missing(e: PyegeriaException) -> bool:
+    """True if `e` says the server has no such endpoint (an older platform), rather than
+    rejecting this particular request."""
+    return (e.http_status_code in (404, 405, 501)
+            or (e.additional_info or {}).get("relatedHTTPCode") == 501)
+
+
 class MetadataExpert(ServerClient):
     """
     Metadata Expert OMVS client (merged with Explorer).
@@ -85,6 +95,8 @@ class MetadataExpert(ServerClient):
         self.command_root: str = (
             f"{self.platform_url}/servers/{self.view_server}/api/open-metadata/metadata-expert")
         self.metadata_expert_command_root = self.command_root
+        # Whether the view server answers metadata-elements/.../count; None until first probed.
+        self._native_count_supported: Optional[bool] = None
 
     @dynamic_catch
     async def _async_create_metadata_element(self, body: Optional[dict | NewOpenMetadataElementRequestBody] = None) -> str:
@@ -134,8 +146,7 @@ class MetadataExpert(ServerClient):
         """
         Create a new metadata element in the metadata store.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_metadata_element(body))
+        return self._run_sync(self._async_create_metadata_element(body))
 
 
     @dynamic_catch
@@ -195,8 +206,7 @@ class MetadataExpert(ServerClient):
         """
         Create a new metadata element in the metadata store using a template.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_metadata_element_from_template(body))
+        return self._run_sync(self._async_create_metadata_element_from_template(body))
 
 
     @dynamic_catch
@@ -242,8 +252,7 @@ class MetadataExpert(ServerClient):
         """
         Update the properties of a specific metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_metadata_element_properties(metadata_element_guid, body))
+        return self._run_sync(self._async_update_metadata_element_properties(metadata_element_guid, body))
 
     @dynamic_catch
     async def _async_publish_metadata_element(self, metadata_element_guid: str, body: Optional[dict | MetadataSourceRequestBody] = None) -> None:
@@ -277,8 +286,7 @@ class MetadataExpert(ServerClient):
         """
         Update the zone membership to increase its visibility.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_publish_metadata_element(metadata_element_guid, body))
+        return self._run_sync(self._async_publish_metadata_element(metadata_element_guid, body))
 
     @dynamic_catch
     async def _async_withdraw_metadata_element(self, metadata_element_guid: str, body: Optional[dict | MetadataSourceRequestBody] = None) -> None:
@@ -312,8 +320,7 @@ class MetadataExpert(ServerClient):
         """
         Update the zone membership to decrease its visibility.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_withdraw_metadata_element(metadata_element_guid, body))
+        return self._run_sync(self._async_withdraw_metadata_element(metadata_element_guid, body))
 
     @dynamic_catch
     async def _async_update_metadata_element_effectivity(self, metadata_element_guid: str, body: Optional[dict | UpdateEffectivityDatesRequestBody] = None) -> None:
@@ -349,8 +356,7 @@ class MetadataExpert(ServerClient):
         """
         Update the effectivity dates for a specific metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_metadata_element_effectivity(metadata_element_guid, body))
+        return self._run_sync(self._async_update_metadata_element_effectivity(metadata_element_guid, body))
 
     @dynamic_catch
     async def _async_delete_metadata_element(self, metadata_element_guid: str, body: Optional[dict | DeleteElementRequestBody] = None,
@@ -400,8 +406,7 @@ class MetadataExpert(ServerClient):
         """
         Delete a specific metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_metadata_element(metadata_element_guid, body, cascade_delete))
+        return self._run_sync(self._async_delete_metadata_element(metadata_element_guid, body, cascade_delete))
 
     @dynamic_catch
     async def _async_archive_metadata_element(self, metadata_element_guid: str, body: Optional[dict | DeleteElementRequestBody] = None) -> None:
@@ -466,8 +471,7 @@ class MetadataExpert(ServerClient):
           "effectiveTime": "{{$isoTimestamp}}"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_archive_metadata_element(metadata_element_guid, body))
+        return self._run_sync(self._async_archive_metadata_element(metadata_element_guid, body))
 
     @dynamic_catch
     async def _async_classify_metadata_element(self, metadata_element_guid: str, classification_name: str, body: Optional[dict | NewClassificationRequestBody] = None) -> None:
@@ -503,8 +507,7 @@ class MetadataExpert(ServerClient):
         """
         Add a new classification to the metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_classify_metadata_element(metadata_element_guid, classification_name, body))
+        return self._run_sync(self._async_classify_metadata_element(metadata_element_guid, classification_name, body))
 
     @dynamic_catch
     async def _async_reclassify_metadata_element(self, metadata_element_guid: str, classification_name: str, body: Optional[dict | UpdatePropertiesRequestBody] = None) -> None:
@@ -540,8 +543,7 @@ class MetadataExpert(ServerClient):
         """
         Update the properties of a classification that is currently attached to a specific metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_reclassify_metadata_element(metadata_element_guid, classification_name, body))
+        return self._run_sync(self._async_reclassify_metadata_element(metadata_element_guid, classification_name, body))
 
     @dynamic_catch
     async def _async_update_classification_effectivity(self, metadata_element_guid: str, classification_name: str, body: Optional[dict | UpdateEffectivityDatesRequestBody] = None) -> None:
@@ -579,8 +581,7 @@ class MetadataExpert(ServerClient):
         """
         Update the effectivity dates of a specific classification attached to a metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_classification_effectivity(metadata_element_guid, classification_name, body))
+        return self._run_sync(self._async_update_classification_effectivity(metadata_element_guid, classification_name, body))
 
     @dynamic_catch
     async def _async_declassify_metadata_element(self, metadata_element_guid: str, classification_name: str, body: Optional[dict | MetadataSourceRequestBody] = None) -> None:
@@ -616,8 +617,7 @@ class MetadataExpert(ServerClient):
         """
         Remove the named classification from a specific metadata element.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_declassify_metadata_element(metadata_element_guid, classification_name, body))
+        return self._run_sync(self._async_declassify_metadata_element(metadata_element_guid, classification_name, body))
 
     @dynamic_catch
     async def _async_create_related_elements(self, body: Optional[dict | NewRelatedElementsRequestBody] = None) -> str:
@@ -671,8 +671,7 @@ class MetadataExpert(ServerClient):
         """
         Create a relationship between two metadata elements.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_related_elements(body))
+        return self._run_sync(self._async_create_related_elements(body))
 
     @dynamic_catch
     async def _async_update_related_elements_properties(self, relationship_guid: str, body: Optional[dict | UpdatePropertiesRequestBody] = None) -> None:
@@ -706,8 +705,7 @@ class MetadataExpert(ServerClient):
         """
         Update the properties associated with a relationship.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_related_elements_properties(relationship_guid, body))
+        return self._run_sync(self._async_update_related_elements_properties(relationship_guid, body))
 
     @dynamic_catch
     async def _async_update_related_elements_effectivity(self, relationship_guid: str, body: Optional[dict | UpdateEffectivityDatesRequestBody] = None) -> None:
@@ -743,8 +741,7 @@ class MetadataExpert(ServerClient):
         """
         Update the effectivity dates of a specific relationship between metadata elements.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_related_elements_effectivity(relationship_guid, body))
+        return self._run_sync(self._async_update_related_elements_effectivity(relationship_guid, body))
 
     @dynamic_catch
     async def _async_delete_related_elements(self, relationship_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -790,8 +787,7 @@ class MetadataExpert(ServerClient):
         """
         Delete a relationship between two metadata elements.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_related_elements(relationship_guid, body))
+        return self._run_sync(self._async_delete_related_elements(relationship_guid, body))
 
     @dynamic_catch
     async def _async_detach_related_elements_in_store(
@@ -875,8 +871,7 @@ class MetadataExpert(ServerClient):
           "effectiveTime" : "2024-01-01T00:00:00.000+00:00"
         }
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_detach_related_elements_in_store(
                 metadata_element_1_guid, relationship_type_name, metadata_element_2_guid, body
             )
@@ -1010,8 +1005,7 @@ class MetadataExpert(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_metadata_guid_by_unique_name(
                 name=name, property_name=property_name, as_of_time=as_of_time, body=body, **kwargs
             )
@@ -1122,8 +1116,7 @@ class MetadataExpert(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_metadata_element_by_guid(
                 graph_query_depth=graph_query_depth,
                 output_format=output_format,
@@ -1249,8 +1242,7 @@ class MetadataExpert(ServerClient):
 
             """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_anchored_element_graph(
                 guid=guid, as_of_time=as_of_time, mermaid_only=mermaid_only, body=body, **kwargs
             )
@@ -1377,8 +1369,7 @@ class MetadataExpert(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_metadata_element_by_unique_name(
                 name=name, property_name=property_name, body=body, **kwargs
             )
@@ -1537,8 +1528,7 @@ class MetadataExpert(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_element_history(
                 guid=guid, oldest_first=oldest_first, from_time=from_time, to_time=to_time,
                 start_from=start_from, page_size=page_size, body=body, **kwargs
@@ -1596,8 +1586,7 @@ class MetadataExpert(ServerClient):
         **kwargs,
     ) -> list | str:
         """Retrieve the history of a metadata element."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_metadata_element_history(metadata_element_guid, effective_time, oldest_first, body, **kwargs)
         )
 
@@ -1762,8 +1751,7 @@ class MetadataExpert(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_classification_history(
                 guid=guid, classification_name=classification_name, oldest_first=oldest_first,
                 from_time=from_time, to_time=to_time, start_from=start_from, page_size=page_size,
@@ -1937,8 +1925,7 @@ class MetadataExpert(ServerClient):
             list | str: Returns the search results as a list of metadata elements, or as a string in cases
                 where the output is serialized in text format.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_metadata_elements_with_string(
                 search_string=search_string, starts_with=starts_with, ends_with=ends_with,
                 ignore_case=ignore_case, anchor_domain=anchor_domain, zone_filter=zone_filter,
@@ -2119,8 +2106,7 @@ class MetadataExpert(ServerClient):
                     list | str: Returns the search results as a list of metadata elements, or as a string in cases
                         where the output is serialized in text format.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_elements_for_anchor(
                 guid=guid, search_string=search_string, starts_with=starts_with, ends_with=ends_with,
                 ignore_case=ignore_case, anchor_domain=anchor_domain, zone_filter=zone_filter,
@@ -2300,8 +2286,7 @@ class MetadataExpert(ServerClient):
                     list | str: Returns the search results as a list of metadata elements, or as a string in cases
                         where the output is serialized in text format.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_elements_in_anchor_domain(
                 search_string=search_string, starts_with=starts_with, ends_with=ends_with,
                 ignore_case=ignore_case, anchor_domain=anchor_domain, zone_filter=zone_filter,
@@ -2486,8 +2471,7 @@ class MetadataExpert(ServerClient):
                     list | str: Returns the search results as a list of metadata elements, or as a string in cases
                         where the output is serialized in text format.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_elements_in_anchor_scope(
                 guid=guid, search_string=search_string, starts_with=starts_with, ends_with=ends_with,
                 ignore_case=ignore_case, anchor_domain=anchor_domain, zone_filter=zone_filter,
@@ -2641,8 +2625,7 @@ class MetadataExpert(ServerClient):
               "sequencingProperty": ""
             }
     """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_all_related_elements(
                 guid=guid, starting_at_end=starting_at_end, start_from=start_from, page_size=page_size,
                 graph_query_depth=graph_query_depth, relationships_page_size=relationships_page_size,
@@ -2800,8 +2783,7 @@ class MetadataExpert(ServerClient):
                 }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_related_metadata_elements(
                 guid,
                 relationship_type,
@@ -2972,8 +2954,7 @@ class MetadataExpert(ServerClient):
                 }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_all_metadata_element_relationships(
                 end1_guid,
                 end2_guid,
@@ -3150,8 +3131,7 @@ class MetadataExpert(ServerClient):
                 }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_metadata_element_relationships(
                 end1_guid,
                 end2_guid,
@@ -3169,6 +3149,7 @@ class MetadataExpert(ServerClient):
         )
         return response
 
+    @concurrent_pageable
     async def _async_find_metadata_elements(
         self,
         body: dict,
@@ -3208,6 +3189,12 @@ class MetadataExpert(ServerClient):
               existed.)
         timeout: int, default = default_timeout
             - http request timeout for this request
+        concurrent_pages: int, default = 0
+            - when > 1, ignore the single-page contract and return the complete
+              result set, fetched with this many page requests in flight. Paging
+              starts at the body's "startFrom" and uses its "pageSize" (default
+              max_paging_size) for every request; each page gets its own copy of
+              the body, the caller's is never modified.
 
         Returns
         -------
@@ -3289,7 +3276,7 @@ class MetadataExpert(ServerClient):
         # method's own docstring / ISSUE-34 for why pyegeria no longer tries
         # to guess where pagination belongs for this endpoint.
         response: Response = await self._async_make_request(
-            "POST", url, body_slimmer(body), timeout=timeout
+            "POST", url, body_slimmer(body), timeout=timeout, idempotent=True
         )
 
         elements = response.json().get("elements", NO_ELEMENTS_FOUND)
@@ -3302,6 +3289,7 @@ class MetadataExpert(ServerClient):
         self,
         body: dict,
         timeout: int = default_timeout,
+        concurrent_pages: int = 0,
     ) -> list | str:
         """
         Retrieve the relationships linking the supplied elements.
@@ -3318,6 +3306,12 @@ class MetadataExpert(ServerClient):
               story on why these aren't separate parameters here).
         timeout: int, default = default_timeout
             - http request timeout for this request
+        concurrent_pages: int, default = 0
+            - when > 1, ignore the single-page contract and return the complete
+              result set, fetched with this many page requests in flight. Paging
+              starts at the body's "startFrom" and uses its "pageSize" (default
+              max_paging_size) for every request; each page gets its own copy of
+              the body, the caller's is never modified.
 
         Returns
         -------
@@ -3390,9 +3384,8 @@ class MetadataExpert(ServerClient):
                 }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
-            self._async_find_metadata_elements(body, timeout=timeout)
+        response = self._run_sync(
+            self._async_find_metadata_elements(body, timeout=timeout, concurrent_pages=concurrent_pages)
         )
         return response
 
@@ -3481,11 +3474,153 @@ class MetadataExpert(ServerClient):
         PyegeriaUnauthorizedException
             the requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_count_metadata_elements(body, timeout=timeout, **kwargs)
         )
 
+    async def _async_count_metadata_elements_batch(
+        self,
+        bodies: List[dict],
+        max_count: int = None,
+        concurrency: int = 8,
+        timeout: int = default_timeout,
+        return_exceptions: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Count the metadata elements matching each of several search conditions at once.
+        Async version.
+
+        Each body is counted with the native count request, up to `concurrency` in flight.
+        On a server without native counting (detected on the first request, then remembered
+        for this client) each body is counted by paging through `find_metadata_elements`
+        with a minimal projection (`graphQueryDepth` 0, so no related elements) and
+        only the page sizes are kept.
+
+        Parameters
+        ----------
+        bodies: [dict]
+            - `FindRequestBody` search structures (see `find_metadata_elements`), one per count.
+              Any "startFrom"/"pageSize" in them is ignored.
+        max_count: int, optional
+            - stop a paged count once this many elements are seen; None pages to the end.
+              Native counts are always exact.
+        concurrency: int, default = 8
+            - count requests kept in flight at once
+        timeout: int, default = default_timeout
+            - http request timeout for each request
+        return_exceptions: bool, default = False
+            - put the exception of a body that could not be counted in its place in the
+              result instead of raising it, so one bad body doesn't fail the others
+
+        Returns
+        -------
+        [dict]
+            One {"count": int, "exact": bool, "native": bool} per body, in order. `exact` is
+            False when a paged count found more than `max_count` - the count is then a lower bound.
+
+        Raises
+        ------
+        PyegeriaInvalidParameterException
+            one of the parameters is null or invalid or
+        PyegeriaAPIException
+            There is a problem issuing the request to the metadata repository or
+        PyegeriaUnauthorizedException
+            the requesting user is not authorized to issue this request.
+        """
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        async def count_one(body: dict) -> Dict[str, Any]:
+            async with sem:
+                if self._native_count_supported is not False:
+                    try:
+                        count = await self._async_count_metadata_elements(body, timeout=timeout)
+                        self._native_count_supported = True
+                        return {"count": int(count), "exact": True, "native": True}
+                    except (PyegeriaConnectionException, PyegeriaTimeoutException, PyegeriaUnauthorizedException):
+                        raise
+                    except PyegeriaException as e:
+                        # Only a missing endpoint settles the probe; a bad body (e.g. an unknown
+                        # type name) fails that body alone and the next one probes again.
+                        if self._native_count_supported or not _endpoint_missing(e):
+                            raise
+                        logger.info(f"Native element count unavailable on {self.view_server} - counting by paging ({e})")
+                        self._native_count_supported = False
+                return await self._async_count_by_paging(body, max_count, timeout)
+
+        bodies = list(bodies)
+        if not bodies:
+            return []
+        results = []
+        if self._native_count_supported is None:
+            # Probe with the first body alone so a server without native counting costs one failed request.
+            try:
+                results.append(await count_one(bodies[0]))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+            bodies = bodies[1:]
+        results += await asyncio.gather(*(count_one(b) for b in bodies), return_exceptions=return_exceptions)
+        return results
+
+    async def _async_count_by_paging(self, body: dict, max_count: Optional[int], timeout: int) -> Dict[str, Any]:
+        """Count by paging find_metadata_elements without related elements; see count_metadata_elements_batch."""
+        probe = {k: v for k, v in body.items() if k not in ("startFrom", "pageSize")}
+        probe["graphQueryDepth"] = 0
+        # One element past max_count tells a catalog of exactly max_count elements from a larger one.
+        page_size = max_paging_size if max_count is None else max(1, min(max_count + 1, max_paging_size))
+        pages = aiter_pages(page_fetcher(self._async_find_metadata_elements, body=probe, timeout=timeout),
+                            page_size=page_size, prefetch=False)
+        count = 0
+        try:
+            async for page in pages:
+                count += len(page)
+                if max_count is not None and count > max_count:
+                    return {"count": count, "exact": False, "native": False}
+        finally:
+            await pages.aclose()
+        return {"count": count, "exact": True, "native": False}
+
+    def count_metadata_elements_batch(
+        self,
+        bodies: List[dict],
+        max_count: int = None,
+        concurrency: int = 8,
+        timeout: int = default_timeout,
+    ) -> List[Dict[str, Any]]:
+        """Count the metadata elements matching each of several search conditions at once.
+
+        Native counts run concurrently; on a server without native counting each body is
+        counted by paging with a minimal projection instead (see the async version).
+
+        Parameters
+        ----------
+        bodies: [dict]
+            - `FindRequestBody` search structures (see `find_metadata_elements`), one per count.
+        max_count: int, optional
+            - stop a paged count once this many elements are seen; None pages to the end.
+        concurrency: int, default = 8
+            - count requests kept in flight at once
+        timeout: int, default = default_timeout
+            - http request timeout for each request
+
+        Returns
+        -------
+        [dict]
+            One {"count": int, "exact": bool, "native": bool} per body, in order.
+
+        Raises
+        ------
+        PyegeriaInvalidParameterException
+            one of the parameters is null or invalid or
+        PyegeriaAPIException
+            There is a problem issuing the request to the metadata repository or
+        PyegeriaUnauthorizedException
+            the requesting user is not authorized to issue this request.
+        """
+        return self._run_sync(
+            self._async_count_metadata_elements_batch(bodies, max_count, concurrency, timeout)
+        )
+
     async def _async_find_relationships_between_elements(
         self,
         body: dict,
@@ -3666,8 +3801,7 @@ class MetadataExpert(ServerClient):
                 }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_relationships_between_elements(
                 body,
                 graph_query_depth=graph_query_depth,
@@ -3770,8 +3904,7 @@ class MetadataExpert(ServerClient):
         PyegeriaUnauthorizedException
             the requesting user is not authorized to issue this request.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_count_relationships_between_elements(body, timeout=timeout, **kwargs)
         )
 
@@ -3871,8 +4004,7 @@ class MetadataExpert(ServerClient):
             the requesting user is not authorized to issue this request.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_relationship_by_guid(
                 guid=guid,
                 as_of_time=as_of_time,
@@ -4024,8 +4156,7 @@ class MetadataExpert(ServerClient):
              the requesting user is not authorized to issue this request.
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_relationship_history(
                 guid,
                 oldest_first=oldest_first,
@@ -4054,8 +4185,7 @@ class MetadataExpert(ServerClient):
     @dynamic_catch
     def get_match_criteria_list(self) -> list:
         """Retrieve the list of valid match criteria."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_match_criteria_list())
+        return self._run_sync(self._async_get_match_criteria_list())
 
     @dynamic_catch
     async def _async_get_property_comparison_operator_list(self) -> list:
@@ -4067,5 +4197,4 @@ class MetadataExpert(ServerClient):
     @dynamic_catch
     def get_property_comparison_operator_list(self) -> list:
         """Retrieve the list of valid property comparison operators."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_property_comparison_operator_list())
+        return self._run_sync(self._async_get_property_comparison_operator_list())
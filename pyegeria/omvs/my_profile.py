@@ -462,8 +462,7 @@ class MyProfile(AssetMaker):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_profile_by_get(output_format, report_spec, **kwargs)
         )
 
@@ -507,7 +506,7 @@ class MyProfile(AssetMaker):
         list[dict]
             A list of dictionaries, each containing 'properties' and 'time' for an entry.
         """
-        return asyncio.get_event_loop().run_until_complete(self._async_get_my_entries())
+        return self._run_sync(self._async_get_my_entries())
 
     @dynamic_catch
     def get_my_profile(
@@ -534,7 +533,7 @@ class MyProfile(AssetMaker):
             One of the pyegeria exceptions will be raised if there are issues in communications, message format, or
             Egeria errors.
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_my_profile(body, output_format, report_spec,**kwargs)
         )
 
@@ -657,7 +656,7 @@ class MyProfile(AssetMaker):
         }
         ```
         """
-        return asyncio.get_event_loop().run_until_complete(self._async_add_my_profile(body))
+        return self._run_sync(self._async_add_my_profile(body))
 
     @dynamic_catch
     async def _async_get_my_actors(
@@ -697,8 +696,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Return the list of actors linked to the user's profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_actors(
                 graph_query_depth=graph_query_depth,
                 start_from=start_from,
@@ -748,8 +746,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Return the list of user identities linked to the user's profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_user_identities(
                 graph_query_depth=graph_query_depth,
                 start_from=start_from,
@@ -799,8 +796,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Return the list of assigned roles linked to the user's profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_roles(
                 graph_query_depth=graph_query_depth,
                 start_from=start_from,
@@ -850,8 +846,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Return the list of assigned resources linked to the user's profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_resources(
                 graph_query_depth=graph_query_depth,
                 start_from=start_from,
@@ -934,8 +929,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Get assigned actions for the user profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_assigned_actions(
                 metadata_element_type=metadata_element_type,
                 metadata_element_subtypes=metadata_element_subtypes,
@@ -999,8 +993,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Get actions sponsored by the user profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_sponsored_actions(
                 activity_status_list=activity_status_list,
                 start_from=start_from,
@@ -1062,8 +1055,7 @@ class MyProfile(AssetMaker):
         **kwargs,
     ) -> list | str:
         """Get actions requested by the user profile."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_my_requested_actions(
                 activity_status_list=activity_status_list,
                 start_from=start_from,
@@ -1126,8 +1118,7 @@ class MyProfile(AssetMaker):
                         body: Optional[dict | NewAttachmentRequestBody] = None,
                         qualified_name: Optional[str] = None) -> str:
         """Add a notification to the user's activity log."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_log_my_activity(text, display_name, body, qualified_name))
+        return self._run_sync(self._async_log_my_activity(text, display_name, body, qualified_name))
 
     @dynamic_catch
     async def _async_journal_my_activity(self, text: str = None, display_name: str = None,
@@ -1175,8 +1166,7 @@ class MyProfile(AssetMaker):
                             body: Optional[dict | NewAttachmentRequestBody] = None,
                             qualified_name: Optional[str] = None) -> str:
         """Add a notification to the user's journal."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_journal_my_activity(text, display_name, body, qualified_name))
+        return self._run_sync(self._async_journal_my_activity(text, display_name, body, qualified_name))
 
     @dynamic_catch
     async def _async_blog_my_activity(self, text: str = None, display_name: str = None,
@@ -1224,8 +1214,7 @@ class MyProfile(AssetMaker):
                          body: Optional[dict | NewAttachmentRequestBody] = None,
                          qualified_name: Optional[str] = None) -> str:
         """Add a notification to the user's blog."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_blog_my_activity(text, display_name, body, qualified_name))
+        return self._run_sync(self._async_blog_my_activity(text, display_name, body, qualified_name))
 
     #
     # Lifecycle
@@ -1286,7 +1275,7 @@ class MyProfile(AssetMaker):
         if qualified_name is None:
             qualified_name = self.__create_qualified_name__("Todo", todo_name)+f"-{int(time.time())}"
         if not self.my_profile_guid:
-            me = self.get_my_profile()
+            me = await self._async_get_my_profile()
             self.my_profile_guid = me['elementHeader']["guid"]
 
         body = {
@@ -1359,8 +1348,7 @@ class MyProfile(AssetMaker):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_my_todo(todo_name, activity_status,
+        response = self._run_sync(self._async_create_my_todo(todo_name, activity_status,
                                                                       description, situation, priority,
                                                                       qualified_name))
         return response
@@ -1399,7 +1387,7 @@ class MyProfile(AssetMaker):
         if qualified_name is None:
             qualified_name = self.__create_qualified_name__("Meeting", meeting_name)+f"-{int(time.time())}"
         if not self.my_profile_guid:
-            me = self.get_my_profile()
+            me = await self._async_get_my_profile()
             self.my_profile_guid = me['elementHeader']["guid"]
 
         body = {
@@ -1450,8 +1438,7 @@ class MyProfile(AssetMaker):
         ValidationError
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_meeting(meeting_name, activity_status,
+        response = self._run_sync(self._async_create_meeting(meeting_name, activity_status,
                                                                       description, situation, priority,
                                                                       qualified_name))
         return response
@@ -1490,7 +1477,7 @@ class MyProfile(AssetMaker):
         if qualified_name is None:
             qualified_name = self.__create_qualified_name__("Review", review_name)+f"-{int(time.time())}"
         if not self.my_profile_guid:
-            me = self.get_my_profile()
+            me = await self._async_get_my_profile()
             self.my_profile_guid = me['elementHeader']["guid"]
 
         body = {
@@ -1541,8 +1528,7 @@ class MyProfile(AssetMaker):
         ValidationError
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_review(review_name, activity_status,
+        response = self._run_sync(self._async_create_review(review_name, activity_status,
                                                                       description, situation, priority,
                                                                       qualified_name))
         return response
@@ -1655,8 +1641,7 @@ class MyProfile(AssetMaker):
     ) -> dict | str:
         """Retrieve the profile details of the user associated with the token, using a POST request that
         accepts an optional body to restrict/format the result."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_my_profile_by_post(body, output_format, report_spec, **kwargs))
+        return self._run_sync(self._async_get_my_profile_by_post(body, output_format, report_spec, **kwargs))
 
 
 if __name__ == "__main__":
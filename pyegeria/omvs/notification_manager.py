@@ -145,8 +145,7 @@ class NotificationManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_monitored_resource(
                 notification_type_guid, monitored_resource_guid, body
             )
@@ -216,8 +215,7 @@ class NotificationManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_monitored_resource(
                 notification_type_guid, monitored_resource_guid, body
             )
@@ -286,8 +284,7 @@ class NotificationManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_notification_subscriber(
                 notification_type_guid, subscriber_guid, body
             )
@@ -352,8 +349,7 @@ class NotificationManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_notification_subscriber(
                 notification_type_guid, subscriber_guid, body
             )
@@ -139,8 +139,7 @@ class PeopleOrganizer(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_peer_person(person_one_guid, person_two_guid, body)
         )
 
@@ -220,8 +219,7 @@ class PeopleOrganizer(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_peer_person(person_one_guid, person_two_guid, body)
         )
 
@@ -261,8 +259,7 @@ class PeopleOrganizer(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unlink_peer_person(person_one_guid, person_two_guid, body)
         )
 
@@ -348,8 +345,7 @@ class PeopleOrganizer(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_team_structure(super_team_guid, subteam_guid, body)
         )
 
@@ -429,7 +425,6 @@ class PeopleOrganizer(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_team_structure(super_team_guid, subteam_guid, body)
         )
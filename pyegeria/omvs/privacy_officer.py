@@ -79,8 +79,7 @@ class PrivacyOfficer(ServerClient):
         body: Union[dict, NewRelationshipRequestBody],
     ) -> None:
         """Link a data processing purpose to a data processing description."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_permitted_processing(
                 data_processing_purpose_guid, data_processing_description_guid, body
             )
@@ -113,8 +112,7 @@ class PrivacyOfficer(ServerClient):
         body: Union[dict, DeleteRelationshipRequestBody],
     ) -> None:
         """Detach a data processing purpose from a data processing description."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_detach_permitted_processing(
                 data_processing_purpose_guid, data_processing_description_guid, body
             )
@@ -147,8 +145,7 @@ class PrivacyOfficer(ServerClient):
         body: Union[dict, NewRelationshipRequestBody],
     ) -> None:
         """Link a data processing action to a target element."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_data_processing_target(
                 data_processing_action_guid, target_guid, body
             )
@@ -181,8 +178,7 @@ class PrivacyOfficer(ServerClient):
         body: Union[dict, DeleteRelationshipRequestBody],
     ) -> None:
         """Detach a data processing action from a target element."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_detach_data_processing_target(
                 data_processing_action_guid, target_guid, body
             )
@@ -205,8 +201,7 @@ class PrivacyOfficer(ServerClient):
     def link_data_processing_specification(self, element_guid: str, data_processing_description_guid: str,
                                            body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a data processing description to the element it specifies processing for (DataProcessingSpecification relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_data_processing_specification(element_guid, data_processing_description_guid, body))
+        self._run_sync(self._async_link_data_processing_specification(element_guid, data_processing_description_guid, body))
 
     @dynamic_catch
     async def _async_detach_data_processing_specification(self, element_guid: str, data_processing_description_guid: str,
@@ -219,8 +214,7 @@ class PrivacyOfficer(ServerClient):
     def detach_data_processing_specification(self, element_guid: str, data_processing_description_guid: str,
                                              body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a data processing description from an element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_data_processing_specification(element_guid, data_processing_description_guid, body))
+        self._run_sync(self._async_detach_data_processing_specification(element_guid, data_processing_description_guid, body))
 
     @dynamic_catch
     async def _async_link_detailed_processing_action(self, parent_processing_action_guid: str, child_processing_action_guid: str,
@@ -233,8 +227,7 @@ class PrivacyOfficer(ServerClient):
     def link_detailed_processing_action(self, parent_processing_action_guid: str, child_processing_action_guid: str,
                                         body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a child processing action to the parent action it details (DetailedProcessingAction relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_detailed_processing_action(parent_processing_action_guid, child_processing_action_guid, body))
+        self._run_sync(self._async_link_detailed_processing_action(parent_processing_action_guid, child_processing_action_guid, body))
 
     @dynamic_catch
     async def _async_detach_detailed_processing_action(self, parent_processing_action_guid: str, child_processing_action_guid: str,
@@ -247,5 +240,4 @@ class PrivacyOfficer(ServerClient):
     def detach_detailed_processing_action(self, parent_processing_action_guid: str, child_processing_action_guid: str,
                                           body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a detailed processing action from its parent action."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_detailed_processing_action(parent_processing_action_guid, child_processing_action_guid, body))
+        self._run_sync(self._async_detach_detailed_processing_action(parent_processing_action_guid, child_processing_action_guid, body))
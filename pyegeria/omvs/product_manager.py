@@ -201,8 +201,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_digital_product(body))
+        return self._run_sync(self._async_create_digital_product(body))
 
     @dynamic_catch
     async def _async_update_digital_product(
@@ -282,8 +281,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_digital_product(digital_product_guid, body)
         )
 
@@ -366,8 +364,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_delete_digital_product(digital_product_guid, body, cascade)
         )
 
@@ -464,8 +461,7 @@ class ProductManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_digital_product_by_guid(
                 graph_query_depth=graph_query_depth,
                 guid=guid, body=body, output_format=output_format, report_spec=report_spec, **kwargs
@@ -565,8 +561,7 @@ class ProductManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_digital_products_by_name(
                 graph_query_depth=graph_query_depth,
                 name=name, classification_names=classification_names, body=body, start_from=start_from, page_size=page_size, output_format=output_format, report_spec=report_spec, **kwargs
@@ -760,8 +755,7 @@ class ProductManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_digital_products(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -870,8 +864,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_digital_product_dependency(
                 consumer_product_guid, consumed_product_guid, body
             )
@@ -955,8 +948,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_digital_product_dependency(
                 consumer_product_guid, consumed_product_guid, body
             )
@@ -1054,8 +1046,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_product_manager(
                 digital_product_guid, product_manager_role_guid, body
             )
@@ -1139,8 +1130,7 @@ class ProductManager(CollectionManager):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_product_manager(
                 digital_product_guid, product_manager_role_guid, body
             )
@@ -1229,8 +1219,7 @@ class ProductManager(CollectionManager):
             If there are issues in communications, message format, or Egeria errors.
         """
         body = self._prepare_body(body)
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_digital_product_catalog(body))
+        return self._run_sync(self._async_create_digital_product_catalog(body))
 
     @dynamic_catch
     async def _async_update_digital_product_catalog(
@@ -1291,8 +1280,7 @@ class ProductManager(CollectionManager):
         """
         digital_product_catalog_guid = str(digital_product_catalog_guid)
         body = self._prepare_body(body)
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_digital_product_catalog(digital_product_catalog_guid, body)
         )
 
@@ -1363,8 +1351,7 @@ class ProductManager(CollectionManager):
         if body is not None:
             body = self._prepare_body(body)
         cascade = bool(cascade)
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_delete_digital_product_catalog(digital_product_catalog_guid, body, cascade)
         )
 
@@ -1454,8 +1441,7 @@ class ProductManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_digital_product_catalog_by_guid(
                 graph_query_depth=graph_query_depth,
                 guid=guid, body=body, output_format=output_format, report_spec=report_spec, **kwargs
@@ -1554,8 +1540,7 @@ class ProductManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_digital_product_catalogs_by_name(
                 graph_query_depth=graph_query_depth,
                 name=name, classification_names=classification_names, body=body, start_from=start_from, page_size=page_size, output_format=output_format, report_spec=report_spec, **kwargs
@@ -1742,8 +1727,7 @@ class ProductManager(CollectionManager):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_digital_product_catalogs(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -1775,8 +1759,7 @@ class ProductManager(CollectionManager):
     def update_digital_product_dependency(self, digital_product_dependency_relationship_guid: str,
                                           body: Optional[dict | UpdateRelationshipRequestBody] = None) -> None:
         """Update the properties of a DigitalProductDependency relationship, identified by its own relationship GUID."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_digital_product_dependency(digital_product_dependency_relationship_guid, body))
+        self._run_sync(self._async_update_digital_product_dependency(digital_product_dependency_relationship_guid, body))
 
     @dynamic_catch
     async def _async_detach_digital_product_dependency_by_id(self, digital_product_dependency_relationship_guid: str,
@@ -1789,5 +1772,4 @@ class ProductManager(CollectionManager):
     def detach_digital_product_dependency_by_id(self, digital_product_dependency_relationship_guid: str,
                                                  body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach one specific DigitalProductDependency relationship, identified by its own relationship GUID."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_digital_product_dependency_by_id(digital_product_dependency_relationship_guid, body))
+        self._run_sync(self._async_detach_digital_product_dependency_by_id(digital_product_dependency_relationship_guid, body))
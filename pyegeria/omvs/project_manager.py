@@ -195,8 +195,7 @@ class ProjectManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_linked_projects(
                 parent_guid,
                 body,
@@ -303,8 +302,7 @@ class ProjectManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_classified_projects(project_classification,
                 start_from,page_size,
 
@@ -408,8 +406,7 @@ class ProjectManager(ServerClient):
            }
          }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_project_classification(project_guid = project_guid,
                                                 body=body
                                                 )
@@ -503,8 +500,7 @@ class ProjectManager(ServerClient):
           "forDuplicateProcessing": false
          }
          """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_project_classification(project_guid = project_guid,
                                                 body=body
                                                 )
@@ -639,8 +635,7 @@ class ProjectManager(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_projects_by_classification_properties( approach, management_style, results_usage,
                                          start_from, page_size,
                                          output_format, report_spec, body, **kwargs)
@@ -746,8 +741,7 @@ class ProjectManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_project_team(project_guid, team_role, start_from, page_size,
                                          output_format,report_spec, body, **kwargs  )
         )
@@ -834,8 +828,7 @@ class ProjectManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_project_hierarchy(project_guid, output_format, report_spec, body, **kwargs)
         )
         return resp
@@ -959,8 +952,7 @@ class ProjectManager(ServerClient):
         **kwargs,
     ) -> list | str:
         """ Retrieve the list of project metadata elements that contain the search string. """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_projects(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -1037,8 +1029,7 @@ class ProjectManager(ServerClient):
         body: Optional[dict | FilterRequestBody] = None,
         **kwargs,
     ) -> list | str:
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_projects_by_name(
                 filter_string=filter_string,
                 classification_names=classification_names,
@@ -1100,8 +1091,7 @@ class ProjectManager(ServerClient):
         **kwargs,
     ) -> dict | str:
         """Return the properties of a specific project."""
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_project_by_guid(
                 project_guid=project_guid,
                 include_only_relationships=include_only_relationships,
@@ -1197,8 +1187,7 @@ class ProjectManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_project_graph(project_guid, element_type, body, output_format, report_spec, **kwargs)
         )
 
@@ -1429,8 +1418,7 @@ class ProjectManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_create_project(anchor_guid, parent_guid, parent_relationship_type_name, parent_at_end1,
                                        display_name, description, classification_name, identifier,
                                        is_own_anchor, status, phase, health, start_date, planned_end_date, body)
@@ -1556,8 +1544,7 @@ class ProjectManager(ServerClient):
           }
         }
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_create_project_from_template(body))
+        resp = self._run_sync(self._async_create_project_from_template(body))
         return resp
 
     #
@@ -1706,8 +1693,7 @@ class ProjectManager(ServerClient):
         NotAuthorizedException
           The principle specified by the user_id does not have authorization for the requested action
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_project(project_guid, qualified_name, identifier, display_name, description,
                                        project_status, project_phase, project_health, start_date, planned_end_date,
                                        merge_update, body))
@@ -1779,8 +1765,7 @@ class ProjectManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_project(project_guid, cascade, body))
+        self._run_sync(self._async_delete_project(project_guid, cascade, body))
 
     @dynamic_catch
     async def _async_set_project_dependency(self, project_guid: str,
@@ -1854,8 +1839,7 @@ class ProjectManager(ServerClient):
             -----
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_project_dependency(project_guid, upstream_project_guid,
                                                body))
 
@@ -1946,8 +1930,7 @@ class ProjectManager(ServerClient):
           "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_project_dependency(project_guid, upstream_project_guid, body))
 
     @dynamic_catch
@@ -2023,8 +2006,7 @@ class ProjectManager(ServerClient):
             -----
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_project_hierarchy(project_guid, parent_project_guid,
                                               body))
 
@@ -2115,8 +2097,7 @@ class ProjectManager(ServerClient):
           "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_project_hierarchy(project_guid, parent_project_guid, body))
 
     @dynamic_catch
@@ -2218,8 +2199,7 @@ class ProjectManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_to_project_team(
                 project_guid,
                 actor_guid,
@@ -2300,8 +2280,7 @@ class ProjectManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_remove_from_project_team(project_guid, actor_guid, body)
         )
 
@@ -2358,8 +2337,7 @@ class ProjectManager(ServerClient):
             body: Optional[dict | NewElementRequestBody] = None
     ) -> str:
         """Create a new task for a project.  """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_create_project_task(project_guid, display_name, identifier, description, status, phase, health,
                                             start_date, planned_end_date, body)
         )
@@ -2391,8 +2369,7 @@ class ProjectManager(ServerClient):
     def set_project_as_campaign(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a campaign."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_campaign(project_guid, body))
+        self._run_sync(self._async_set_project_as_campaign(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_campaign(self, project_guid: str,
@@ -2406,8 +2383,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_campaign(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the campaign classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_campaign(project_guid, body))
+        self._run_sync(self._async_clear_project_as_campaign(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_as_task(self, project_guid: str,
@@ -2423,8 +2399,7 @@ class ProjectManager(ServerClient):
     def set_project_as_task(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a task."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_task(project_guid, body))
+        self._run_sync(self._async_set_project_as_task(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_task(self, project_guid: str,
@@ -2438,8 +2413,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_task(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the task classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_task(project_guid, body))
+        self._run_sync(self._async_clear_project_as_task(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_as_personal_project(self, project_guid: str,
@@ -2455,8 +2429,7 @@ class ProjectManager(ServerClient):
     def set_project_as_personal_project(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a personal project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_personal_project(project_guid, body))
+        self._run_sync(self._async_set_project_as_personal_project(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_personal_project(self, project_guid: str,
@@ -2470,8 +2443,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_personal_project(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the personal project classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_personal_project(project_guid, body))
+        self._run_sync(self._async_clear_project_as_personal_project(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_as_study_project(self, project_guid: str,
@@ -2487,8 +2459,7 @@ class ProjectManager(ServerClient):
     def set_project_as_study_project(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a study project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_study_project(project_guid, body))
+        self._run_sync(self._async_set_project_as_study_project(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_study_project(self, project_guid: str,
@@ -2502,8 +2473,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_study_project(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the study project classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_study_project(project_guid, body))
+        self._run_sync(self._async_clear_project_as_study_project(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_as_experiment(self, project_guid: str,
@@ -2519,8 +2489,7 @@ class ProjectManager(ServerClient):
     def set_project_as_experiment(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a experiment."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_experiment(project_guid, body))
+        self._run_sync(self._async_set_project_as_experiment(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_experiment(self, project_guid: str,
@@ -2534,8 +2503,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_experiment(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the experiment classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_experiment(project_guid, body))
+        self._run_sync(self._async_clear_project_as_experiment(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_as_glossary_project(self, project_guid: str,
@@ -2551,8 +2519,7 @@ class ProjectManager(ServerClient):
     def set_project_as_glossary_project(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a glossary project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_glossary_project(project_guid, body))
+        self._run_sync(self._async_set_project_as_glossary_project(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_glossary_project(self, project_guid: str,
@@ -2566,8 +2533,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_glossary_project(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the glossary project classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_glossary_project(project_guid, body))
+        self._run_sync(self._async_clear_project_as_glossary_project(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_as_governance_project(self, project_guid: str,
@@ -2583,8 +2549,7 @@ class ProjectManager(ServerClient):
     def set_project_as_governance_project(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a governance project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_as_governance_project(project_guid, body))
+        self._run_sync(self._async_set_project_as_governance_project(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_as_governance_project(self, project_guid: str,
@@ -2598,8 +2563,7 @@ class ProjectManager(ServerClient):
     def clear_project_as_governance_project(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the governance project classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_as_governance_project(project_guid, body))
+        self._run_sync(self._async_clear_project_as_governance_project(project_guid, body))
 
     @dynamic_catch
     async def _async_set_project_kind(self, project_guid: str,
@@ -2615,8 +2579,7 @@ class ProjectManager(ServerClient):
     def set_project_kind(self, project_guid: str,
                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a project as a project kind."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_project_kind(project_guid, body))
+        self._run_sync(self._async_set_project_kind(project_guid, body))
 
     @dynamic_catch
     async def _async_clear_project_kind(self, project_guid: str,
@@ -2630,8 +2593,7 @@ class ProjectManager(ServerClient):
     def clear_project_kind(self, project_guid: str,
                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the project kind classification from a project."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_project_kind(project_guid, body))
+        self._run_sync(self._async_clear_project_kind(project_guid, body))
 
 
 if __name__ == "__main__":
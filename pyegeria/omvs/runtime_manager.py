@@ -117,7 +117,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             server_name,
             "resourceName",
@@ -208,8 +208,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_integration_connector_config_properties(
                 connector_name, server_guid, server_name, qualified_name, organization_name, output_format, report_spec, body
             )
@@ -264,7 +263,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -333,8 +332,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_connector_configuration(
                 connector_name,
                 server_guid,
@@ -390,7 +388,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, display_name, "qualifiedName", qualified_name, "Connection"
         )
         url = (
@@ -448,8 +446,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_endpoint_address(
                 connector_name,
                 endpoint_address,
@@ -510,7 +507,7 @@ class RuntimeManager(ServerClient):
         }
         ```
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, display_name, "qualifiedName", qualified_name, "Connection"
         )
         url = (
@@ -563,8 +560,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_update_connector_connection(
                 connector_name,
                 connection,
@@ -613,7 +609,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -676,8 +672,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_restart_connector(
                 connector_name, server_guid, display_name, qualified_name, organization_name, body
             )
@@ -713,7 +708,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, server_name, "resourceName", tech_type="OMAG Server",
             organization_name=organization_name
         )
@@ -753,8 +748,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_connect_to_cohort(cohort_name, server_guid, server_name, organization_name, body)
         )
         return
@@ -788,7 +782,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, server_name, "resourceName", tech_type="OMAG Server",
             organization_name=organization_name
         )
@@ -828,8 +822,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_disconnect_from_cohort(cohort_name, server_guid, server_name, organization_name, body)
         )
         return
@@ -863,7 +856,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, server_name, "resourceName", tech_type="OMAG Server",
             organization_name=organization_name
         )
@@ -903,8 +896,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_unregister_from_cohort(cohort_name, server_guid, server_name, organization_name, body)
         )
         return
@@ -952,7 +944,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "qualifiedName",
@@ -1015,8 +1007,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_refresh_gov_eng_config(
                 gov_engine_name, server_guid, display_name, qualified_name, body, **kwargs
             )
@@ -1064,7 +1055,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1122,8 +1113,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_refresh_integ_group_config(
                 integ_group_name, server_guid, display_name, qualified_name, organization_name, body, **kwargs
             )
@@ -1170,7 +1160,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1230,8 +1220,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_refresh_integration_connector(
                 connector_name,
                 server_guid,
@@ -1284,7 +1273,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1347,8 +1336,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_refresh_gov_engine(
                 gov_engine_name,
                 server_guid,
@@ -1403,7 +1391,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1456,8 +1444,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_publish_open_lineage_event(ol_event, server_guid, display_name, qualified_name, organization_name, body)
         )
 
@@ -1508,7 +1495,7 @@ class RuntimeManager(ServerClient):
         }
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1572,8 +1559,7 @@ class RuntimeManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_publish_open_lineage_event_string(
                 ol_event_string, server_guid, display_name, qualified_name, organization_name, body
             )
@@ -1622,7 +1608,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "qualifiedName",
@@ -1680,8 +1666,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_archive_content(
                 archive_content, server_guid, display_name, qualified_name, timeout, body
             )
@@ -1733,7 +1718,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid,
             display_name,
             "resourceName",
@@ -1793,8 +1778,7 @@ class RuntimeManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_add_archive_file(
                 archive_file, server_guid, display_name, qualified_name, timeout, organization_name, body
             )
@@ -1835,7 +1819,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, property_name="qualifiedName", qualified_name=qualified_name
         )
         url = f"{self.runtime_command_root}/omag-servers/{server_guid}"
@@ -1871,8 +1855,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_shutdown_and_unregister_server(server_guid, qualified_name, body)
         )
         return
@@ -1915,7 +1898,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, display_name, "resourceName", qualified_name,
             organization_name=organization_name
         )
@@ -1961,8 +1944,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_activate_server_with_stored_config(
                 server_guid, display_name, qualified_name, timeout, organization_name, body
             )
@@ -1996,7 +1978,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, None, "qualifiedName", qualified_name
         )
         url = f"{self.runtime_command_root}/omag-servers/{server_guid}/instance"
@@ -2032,8 +2014,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_shutdown_server(server_guid, qualified_name, body)
         )
         return
@@ -2071,8 +2052,7 @@ class RuntimeManager(ServerClient):
         Response
            A list of JSONdict with the platform reports.
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_platforms_by_name(
                 filter_string=filter_string,
                 start_from=start_from,
@@ -2238,8 +2218,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_platforms_by_type(
                 filter_string=filter_string,
                 start_from=start_from,
@@ -2347,8 +2326,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_platform_templates_by_type(
                 filter_string=filter_string,
                 effective_time=effective_time,
@@ -2441,8 +2419,7 @@ class RuntimeManager(ServerClient):
         PyegeriaAPIException
         PyegeriaUnauthorizedException
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_platform_report(platform_guid, platform_name, output_format, report_spec)
         )
 
@@ -2517,8 +2494,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_platform_by_guid(platform_guid, graph_query_depth, output_format, report_spec, body)
         )
         return response
@@ -2571,8 +2547,7 @@ class RuntimeManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_connector_type(platform_guid, java_class_name))
+        return self._run_sync(self._async_get_connector_type(platform_guid, java_class_name))
 
     @dynamic_catch
     async def _async_get_server_by_guid(
@@ -2651,8 +2626,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_server_by_guid(server_guid, output_format=output_format,
                                            graph_query_depth=graph_query_depth,
                                            report_spec=report_spec, body=body)
@@ -2748,8 +2722,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_servers_by_name(
                 filter_string=filter_string,
                 start_from=start_from,
@@ -2845,8 +2818,7 @@ class RuntimeManager(ServerClient):
             report_spec ():
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_servers_by_dep_impl_type(search_string, start_from,page_size,
                                                      output_format, report_spec, body)
         )
@@ -2942,8 +2914,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_server_templates_by_dep_impl_type(
                 filter_string=filter_string,
                 start_from=start_from,
@@ -2989,7 +2960,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        server_guid = self.__get_guid__(
+        server_guid = await self.__async_get_guid__(
             server_guid, server_name, "resourceName", tech_type="Integration Daemon",
             organization_name=organization_name
         )
@@ -3042,8 +3013,7 @@ class RuntimeManager(ServerClient):
         PyegeriaUnauthorizedException
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_server_report(server_guid, server_name, output_format, report_spec, organization_name)
         )
 
@@ -3272,7 +3242,7 @@ class RuntimeManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        return asyncio.get_event_loop().run_until_complete(self._async_create_metadata_repository_cohort(body))
+        return self._run_sync(self._async_create_metadata_repository_cohort(body))
 
     @dynamic_catch
     async def _async_create_metadata_repository_cohort_from_template(
@@ -3317,7 +3287,7 @@ class RuntimeManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_create_metadata_repository_cohort_from_template(body))
 
     @dynamic_catch
@@ -3364,8 +3334,7 @@ class RuntimeManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_metadata_repository_cohort(cohort_guid, body))
+        self._run_sync(self._async_update_metadata_repository_cohort(cohort_guid, body))
 
     @dynamic_catch
     async def _async_delete_metadata_repository_cohort(self, cohort_guid: str,
@@ -3419,8 +3388,7 @@ class RuntimeManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_metadata_repository_cohort(cohort_guid, body, cascade))
+        self._run_sync(self._async_delete_metadata_repository_cohort(cohort_guid, body, cascade))
 
     @dynamic_catch
     async def _async_get_metadata_repository_cohorts_by_name(
@@ -3502,8 +3470,7 @@ class RuntimeManager(ServerClient):
         **kwargs,
     ) -> list | str:
         """Returns the list of metadata repository cohorts with a particular name."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_metadata_repository_cohorts_by_name(
                 name, metadata_element_type_name, metadata_element_subtypes, graph_query_depth,
                 start_from, page_size, output_format, report_spec, body, **kwargs
@@ -3603,8 +3570,7 @@ class RuntimeManager(ServerClient):
         **kwargs,
     ) -> list | str:
         """Retrieve the list of metadata repository cohorts that contain the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_metadata_repository_cohorts(
                 search_string, starts_with, ends_with, ignore_case, metadata_element_type_name,
                 metadata_element_subtypes, graph_query_depth, start_from, page_size, output_format,
@@ -3669,8 +3635,7 @@ class RuntimeManager(ServerClient):
         **kwargs,
     ) -> dict | str:
         """Return the properties of a specific metadata repository cohort."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_metadata_repository_cohort_by_guid(
                 guid, graph_query_depth, output_format, report_spec, body, **kwargs
             )
@@ -3727,8 +3692,7 @@ class RuntimeManager(ServerClient):
     def link_cohort_member(self, cohort_guid: str, cohort_member_guid: str,
                            body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """ Connect a cohort to one of its members."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_cohort_member(cohort_guid, cohort_member_guid, body))
+        self._run_sync(self._async_link_cohort_member(cohort_guid, cohort_member_guid, body))
 
     @dynamic_catch
     async def _async_detach_cohort_member(self, cohort_guid: str, cohort_member_guid: str,
@@ -3775,8 +3739,7 @@ class RuntimeManager(ServerClient):
     def detach_cohort_member(self, cohort_guid: str, cohort_member_guid: str,
                              body: Optional[dict | MetadataSourceRequestBody] = None) -> None:
         """ Detach a cohort member from a cohort."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_cohort_member(cohort_guid, cohort_member_guid, body))
+        self._run_sync(self._async_detach_cohort_member(cohort_guid, cohort_member_guid, body))
 
     # connect_to_cohort/disconnect_from_cohort/unregister_from_cohort (POST,
     # above) already cover connectToCohort/disconnectFromCohort/
@@ -3811,8 +3774,7 @@ class RuntimeManager(ServerClient):
     @dynamic_catch
     def connect_to_cohort_get(self, server_guid: str, cohort_name: str) -> None:
         """ Register this server's metadata collection with the other servers in the cohort (GET variant)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_connect_to_cohort_get(server_guid, cohort_name))
+        self._run_sync(self._async_connect_to_cohort_get(server_guid, cohort_name))
 
     @dynamic_catch
     async def _async_disconnect_from_cohort_get(self, server_guid: str, cohort_name: str) -> None:
@@ -3840,8 +3802,7 @@ class RuntimeManager(ServerClient):
     @dynamic_catch
     def disconnect_from_cohort_get(self, server_guid: str, cohort_name: str) -> None:
         """ Disconnect communications from a specific cohort (GET variant)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_disconnect_from_cohort_get(server_guid, cohort_name))
+        self._run_sync(self._async_disconnect_from_cohort_get(server_guid, cohort_name))
 
     @dynamic_catch
     async def _async_unregister_from_cohort_get(self, server_guid: str, cohort_name: str) -> None:
@@ -3870,8 +3831,7 @@ class RuntimeManager(ServerClient):
     @dynamic_catch
     def unregister_from_cohort_get(self, server_guid: str, cohort_name: str) -> None:
         """ Unregister from a specific cohort and disconnect from cohort communications (GET variant)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_unregister_from_cohort_get(server_guid, cohort_name))
+        self._run_sync(self._async_unregister_from_cohort_get(server_guid, cohort_name))
 
     @dynamic_catch
     async def _async_get_elements_by_category(
@@ -3998,8 +3958,7 @@ class RuntimeManager(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_elements_by_category(
                 category, start_from, page_size, skip_relationships, relationships_page_size,
                 output_format, report_spec, body, **kwargs
@@ -121,8 +121,7 @@ class SchemaMaker(ServerClient):
         return await self._async_create_element_body_request(url, "SchemaTypeProperties", body)
 
     def create_schema_type(self, body: dict | NewElementRequestBody) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_schema_type(body))
+        return self._run_sync(self._async_create_schema_type(body))
 
     @dynamic_catch
     async def _async_update_schema_type(
@@ -132,8 +131,7 @@ class SchemaMaker(ServerClient):
         await self._async_update_element_body_request(url, body)
 
     def update_schema_type(self, schema_type_guid: str, body: dict | UpdateElementRequestBody) -> None:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_schema_type(schema_type_guid, body))
+        self._run_sync(self._async_update_schema_type(schema_type_guid, body))
 
     @dynamic_catch
     async def _async_delete_schema_type(
@@ -143,8 +141,7 @@ class SchemaMaker(ServerClient):
         await self._async_metadata_source_body_request(url, body)
 
     def delete_schema_type(self, schema_type_guid: str, body: dict | MetadataSourceRequestBody) -> None:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_schema_type(schema_type_guid, body))
+        self._run_sync(self._async_delete_schema_type(schema_type_guid, body))
 
     # Schema Attributes
 
@@ -154,8 +151,7 @@ class SchemaMaker(ServerClient):
         return await self._async_create_element_body_request(url, "SchemaAttributeProperties", body)
 
     def create_schema_attribute(self, body: dict | NewElementRequestBody) -> str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_schema_attribute(body))
+        return self._run_sync(self._async_create_schema_attribute(body))
 
     @dynamic_catch
     async def _async_update_schema_attribute(
@@ -167,8 +163,7 @@ class SchemaMaker(ServerClient):
     def update_schema_attribute(
         self, schema_attribute_guid: str, body: dict | UpdateElementRequestBody
     ) -> None:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_schema_attribute(schema_attribute_guid, body))
+        self._run_sync(self._async_update_schema_attribute(schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_delete_schema_attribute(
@@ -180,8 +175,7 @@ class SchemaMaker(ServerClient):
     def delete_schema_attribute(
         self, schema_attribute_guid: str, body: dict | MetadataSourceRequestBody
     ) -> None:
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_schema_attribute(schema_attribute_guid, body))
+        self._run_sync(self._async_delete_schema_attribute(schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_find_schema_types(
@@ -380,8 +374,7 @@ class SchemaMaker(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_schema_types(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -438,8 +431,7 @@ class SchemaMaker(ServerClient):
         report_spec: str | dict = "SchemaTypes",
         **kwargs,
     ) -> dict | str:
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_schema_type_by_guid(
                 graph_query_depth=graph_query_depth,
                 guid=guid, element_type=element_type, body=body, output_format=output_format, report_spec=report_spec,
@@ -455,8 +447,7 @@ class SchemaMaker(ServerClient):
 
     def create_schema_type_from_template(self, body: dict | TemplateRequestBody) -> str:
         """Create a schema type from a template."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_schema_type_from_template(body))
+        return self._run_sync(self._async_create_schema_type_from_template(body))
 
     @dynamic_catch
     async def _async_create_schema_attribute_from_template(self, body: dict | TemplateRequestBody) -> str:
@@ -466,8 +457,7 @@ class SchemaMaker(ServerClient):
 
     def create_schema_attribute_from_template(self, body: dict | TemplateRequestBody) -> str:
         """Create a schema attribute from a template."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_schema_attribute_from_template(body))
+        return self._run_sync(self._async_create_schema_attribute_from_template(body))
 
     @dynamic_catch
     async def _async_get_schema_types_by_name(self, name: str, start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
@@ -477,8 +467,7 @@ class SchemaMaker(ServerClient):
 
     def get_schema_types_by_name(self, name: str, start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
         """Get schema types by name."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_schema_types_by_name(name, start_from, page_size, **kwargs))
+        return self._run_sync(self._async_get_schema_types_by_name(name, start_from, page_size, **kwargs))
 
     @dynamic_catch
     async def _async_get_schema_attributes_by_name(self, name: str, start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
@@ -488,8 +477,7 @@ class SchemaMaker(ServerClient):
 
     def get_schema_attributes_by_name(self, name: str, start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
         """Get schema attributes by name."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_schema_attributes_by_name(name, start_from, page_size, **kwargs))
+        return self._run_sync(self._async_get_schema_attributes_by_name(name, start_from, page_size, **kwargs))
 
     @dynamic_catch
     async def _async_find_schema_attributes(self, search_string: str = "*", start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
@@ -499,8 +487,7 @@ class SchemaMaker(ServerClient):
 
     def find_schema_attributes(self, search_string: str = "*", start_from: int = 0, page_size: int = 100, **kwargs) -> list | str:
         """Find schema attributes."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_find_schema_attributes(search_string, start_from, page_size, **kwargs))
+        return self._run_sync(self._async_find_schema_attributes(search_string, start_from, page_size, **kwargs))
 
     @dynamic_catch
     async def _async_get_schema_attribute_by_guid(self, guid: str, **kwargs) -> dict | str:
@@ -510,8 +497,7 @@ class SchemaMaker(ServerClient):
 
     def get_schema_attribute_by_guid(self, guid: str, **kwargs) -> dict | str:
         """Get schema attribute by GUID."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_schema_attribute_by_guid(guid, **kwargs))
+        return self._run_sync(self._async_get_schema_attribute_by_guid(guid, **kwargs))
 
     #
     # Relationship and classification maintenance - added to close the gap
@@ -533,8 +519,7 @@ class SchemaMaker(ServerClient):
     def link_nested_schema_attribute(self, schema_attribute_guid: str, nested_schema_attribute_guid: str,
                                      body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a nested schema attribute to its parent schema attribute (NestedSchemaAttribute relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_nested_schema_attribute(schema_attribute_guid, nested_schema_attribute_guid, body))
+        self._run_sync(self._async_link_nested_schema_attribute(schema_attribute_guid, nested_schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_detach_nested_schema_attribute(self, schema_attribute_guid: str, nested_schema_attribute_guid: str,
@@ -551,8 +536,7 @@ class SchemaMaker(ServerClient):
                                        body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                        cascade_delete: bool = False) -> None:
         """Detach a nested schema attribute from its parent schema attribute."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_nested_schema_attribute(
+        self._run_sync(self._async_detach_nested_schema_attribute(
             schema_attribute_guid, nested_schema_attribute_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -568,8 +552,7 @@ class SchemaMaker(ServerClient):
     def link_attribute_for_schema(self, schema_type_guid: str, schema_attribute_guid: str,
                                   body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a schema attribute to the schema type that it belongs to (AttributeForSchema relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_attribute_for_schema(schema_type_guid, schema_attribute_guid, body))
+        self._run_sync(self._async_link_attribute_for_schema(schema_type_guid, schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_detach_attribute_for_schema(self, schema_type_guid: str, schema_attribute_guid: str,
@@ -586,8 +569,7 @@ class SchemaMaker(ServerClient):
                                     body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                     cascade_delete: bool = False) -> None:
         """Detach a schema attribute from the schema type that it belongs to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_attribute_for_schema(
+        self._run_sync(self._async_detach_attribute_for_schema(
             schema_type_guid, schema_attribute_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -603,8 +585,7 @@ class SchemaMaker(ServerClient):
     def link_foreign_key(self, primary_key_column_guid: str, foreign_key_column_guid: str,
                          body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a foreign key column to the primary key column that it refers to (ForeignKey relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_foreign_key(primary_key_column_guid, foreign_key_column_guid, body))
+        self._run_sync(self._async_link_foreign_key(primary_key_column_guid, foreign_key_column_guid, body))
 
     @dynamic_catch
     async def _async_detach_foreign_key(self, primary_key_column_guid: str, foreign_key_column_guid: str,
@@ -621,8 +602,7 @@ class SchemaMaker(ServerClient):
                            body: Optional[dict | DeleteRelationshipRequestBody] = None,
                            cascade_delete: bool = False) -> None:
         """Detach a foreign key column from the primary key column that it refers to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_foreign_key(
+        self._run_sync(self._async_detach_foreign_key(
             primary_key_column_guid, foreign_key_column_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -638,8 +618,7 @@ class SchemaMaker(ServerClient):
     def link_external_schema_type(self, schema_element_guid: str, schema_type_guid: str,
                                   body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a schema element to a reusable, externally-defined schema type (LinkedExternalSchemaType relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_external_schema_type(schema_element_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_external_schema_type(schema_element_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_external_schema_type(self, schema_element_guid: str, schema_type_guid: str,
@@ -656,8 +635,7 @@ class SchemaMaker(ServerClient):
                                     body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                     cascade_delete: bool = False) -> None:
         """Detach a schema element from a reusable, externally-defined schema type."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_external_schema_type(
+        self._run_sync(self._async_detach_external_schema_type(
             schema_element_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -673,8 +651,7 @@ class SchemaMaker(ServerClient):
     def link_map_from_schema_type(self, schema_element_guid: str, schema_type_guid: str,
                                   body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach the 'from' end of a map schema type (MapFromElementType relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_map_from_schema_type(schema_element_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_map_from_schema_type(schema_element_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_map_from_schema_type(self, schema_element_guid: str, schema_type_guid: str,
@@ -691,8 +668,7 @@ class SchemaMaker(ServerClient):
                                     body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                     cascade_delete: bool = False) -> None:
         """Detach the 'from' end of a map schema type."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_map_from_schema_type(
+        self._run_sync(self._async_detach_map_from_schema_type(
             schema_element_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -708,8 +684,7 @@ class SchemaMaker(ServerClient):
     def link_map_to_schema_type(self, schema_element_guid: str, schema_type_guid: str,
                                 body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach the 'to' end of a map schema type (MapToElementType relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_map_to_schema_type(schema_element_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_map_to_schema_type(schema_element_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_map_to_schema_type(self, schema_element_guid: str, schema_type_guid: str,
@@ -726,8 +701,7 @@ class SchemaMaker(ServerClient):
                                   body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                   cascade_delete: bool = False) -> None:
         """Detach the 'to' end of a map schema type."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_map_to_schema_type(
+        self._run_sync(self._async_detach_map_to_schema_type(
             schema_element_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -743,8 +717,7 @@ class SchemaMaker(ServerClient):
     def link_graph_edge(self, graph_edge_guid: str, graph_vertex_guid: str,
                         body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a graph edge to one of the vertices it connects (GraphEdgeLink relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_graph_edge(graph_edge_guid, graph_vertex_guid, body))
+        self._run_sync(self._async_link_graph_edge(graph_edge_guid, graph_vertex_guid, body))
 
     @dynamic_catch
     async def _async_detach_graph_edge(self, graph_edge_guid: str, graph_vertex_guid: str,
@@ -761,8 +734,7 @@ class SchemaMaker(ServerClient):
                           body: Optional[dict | DeleteRelationshipRequestBody] = None,
                           cascade_delete: bool = False) -> None:
         """Detach a graph edge from one of the vertices it connects."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_graph_edge(
+        self._run_sync(self._async_detach_graph_edge(
             graph_edge_guid, graph_vertex_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -778,8 +750,7 @@ class SchemaMaker(ServerClient):
     def link_query_target(self, schema_element_guid: str, query_target_schema_element_guid: str,
                           body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a query target to a derived schema element (DerivedSchemaTypeQueryTarget relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_query_target(schema_element_guid, query_target_schema_element_guid, body))
+        self._run_sync(self._async_link_query_target(schema_element_guid, query_target_schema_element_guid, body))
 
     @dynamic_catch
     async def _async_detach_query_target(self, schema_element_guid: str, query_target_schema_element_guid: str,
@@ -796,8 +767,7 @@ class SchemaMaker(ServerClient):
                             body: Optional[dict | DeleteRelationshipRequestBody] = None,
                             cascade_delete: bool = False) -> None:
         """Detach a query target from a derived schema element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_query_target(
+        self._run_sync(self._async_detach_query_target(
             schema_element_guid, query_target_schema_element_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -813,8 +783,7 @@ class SchemaMaker(ServerClient):
     def link_schema(self, element_guid: str, schema_type_guid: str,
                     body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a schema type to the element it describes (SchemaTypeAssociation relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_schema(element_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_schema(element_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_schema(self, element_guid: str, schema_type_guid: str,
@@ -831,8 +800,7 @@ class SchemaMaker(ServerClient):
                       body: Optional[dict | DeleteRelationshipRequestBody] = None,
                       cascade_delete: bool = False) -> None:
         """Detach a schema type from the element it describes."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_schema(
+        self._run_sync(self._async_detach_schema(
             element_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -848,8 +816,7 @@ class SchemaMaker(ServerClient):
     def link_relational_db_schema(self, database_schema_type_list_guid: str, relational_db_schema_type_guid: str,
                                   body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a relational database schema to the schema type list it belongs to (RelationalDBSchema relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_relational_db_schema(
+        self._run_sync(self._async_link_relational_db_schema(
             database_schema_type_list_guid, relational_db_schema_type_guid, body))
 
     @dynamic_catch
@@ -867,8 +834,7 @@ class SchemaMaker(ServerClient):
                                     body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                     cascade_delete: bool = False) -> None:
         """Detach a relational database schema from the schema type list it belongs to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_relational_db_schema(
+        self._run_sync(self._async_detach_relational_db_schema(
             database_schema_type_list_guid, relational_db_schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -884,8 +850,7 @@ class SchemaMaker(ServerClient):
     def link_api_operations(self, api_schema_type_guid: str, api_operation_guid: str,
                             body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach an API operation to the API schema type it belongs to (APIOperations relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_api_operations(api_schema_type_guid, api_operation_guid, body))
+        self._run_sync(self._async_link_api_operations(api_schema_type_guid, api_operation_guid, body))
 
     @dynamic_catch
     async def _async_detach_api_operations(self, api_schema_type_guid: str, api_operation_guid: str,
@@ -902,8 +867,7 @@ class SchemaMaker(ServerClient):
                               body: Optional[dict | DeleteRelationshipRequestBody] = None,
                               cascade_delete: bool = False) -> None:
         """Detach an API operation from the API schema type it belongs to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_api_operations(
+        self._run_sync(self._async_detach_api_operations(
             api_schema_type_guid, api_operation_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -919,8 +883,7 @@ class SchemaMaker(ServerClient):
     def link_api_header(self, api_operation_guid: str, schema_type_guid: str,
                         body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a schema type as the header for an API operation (APIHeader relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_api_header(api_operation_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_api_header(api_operation_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_api_header(self, api_operation_guid: str, schema_type_guid: str,
@@ -937,8 +900,7 @@ class SchemaMaker(ServerClient):
                           body: Optional[dict | DeleteRelationshipRequestBody] = None,
                           cascade_delete: bool = False) -> None:
         """Detach a schema type as the header for an API operation."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_api_header(
+        self._run_sync(self._async_detach_api_header(
             api_operation_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -954,8 +916,7 @@ class SchemaMaker(ServerClient):
     def link_api_request(self, api_operation_guid: str, schema_type_guid: str,
                          body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a schema type as the request for an API operation (APIRequest relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_api_request(api_operation_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_api_request(api_operation_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_api_request(self, api_operation_guid: str, schema_type_guid: str,
@@ -972,8 +933,7 @@ class SchemaMaker(ServerClient):
                            body: Optional[dict | DeleteRelationshipRequestBody] = None,
                            cascade_delete: bool = False) -> None:
         """Detach a schema type as the request for an API operation."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_api_request(
+        self._run_sync(self._async_detach_api_request(
             api_operation_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -989,8 +949,7 @@ class SchemaMaker(ServerClient):
     def link_api_response(self, api_operation_guid: str, schema_type_guid: str,
                           body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a schema type as the response for an API operation (APIResponse relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_api_response(api_operation_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_api_response(api_operation_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_api_response(self, api_operation_guid: str, schema_type_guid: str,
@@ -1007,8 +966,7 @@ class SchemaMaker(ServerClient):
                             body: Optional[dict | DeleteRelationshipRequestBody] = None,
                             cascade_delete: bool = False) -> None:
         """Detach a schema type as the response for an API operation."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_api_response(
+        self._run_sync(self._async_detach_api_response(
             api_operation_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -1024,8 +982,7 @@ class SchemaMaker(ServerClient):
     def link_schema_type_option(self, schema_element_guid: str, schema_type_guid: str,
                                 body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach an optional schema type to a schema element (SchemaTypeOption relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_schema_type_option(schema_element_guid, schema_type_guid, body))
+        self._run_sync(self._async_link_schema_type_option(schema_element_guid, schema_type_guid, body))
 
     @dynamic_catch
     async def _async_detach_schema_type_option(self, schema_element_guid: str, schema_type_guid: str,
@@ -1042,8 +999,7 @@ class SchemaMaker(ServerClient):
                                   body: Optional[dict | DeleteRelationshipRequestBody] = None,
                                   cascade_delete: bool = False) -> None:
         """Detach an optional schema type from a schema element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_schema_type_option(
+        self._run_sync(self._async_detach_schema_type_option(
             schema_element_guid, schema_type_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -1061,8 +1017,7 @@ class SchemaMaker(ServerClient):
     def add_primary_key_classification(self, relational_column_guid: str,
                                        body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a relational column as a primary key."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_primary_key_classification(relational_column_guid, body))
+        self._run_sync(self._async_add_primary_key_classification(relational_column_guid, body))
 
     @dynamic_catch
     async def _async_remove_primary_key_classification(self, relational_column_guid: str,
@@ -1079,8 +1034,7 @@ class SchemaMaker(ServerClient):
                                           body: Optional[dict | DeleteClassificationRequestBody] = None,
                                           cascade_delete: bool = False) -> None:
         """Remove the PrimaryKey classification from a relational column."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_remove_primary_key_classification(
+        self._run_sync(self._async_remove_primary_key_classification(
             relational_column_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -1098,8 +1052,7 @@ class SchemaMaker(ServerClient):
     def add_type_embedded_attribute(self, schema_attribute_guid: str,
                                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a schema attribute as having its type embedded rather than linked (TypeEmbeddedAttribute)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_type_embedded_attribute(schema_attribute_guid, body))
+        self._run_sync(self._async_add_type_embedded_attribute(schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_remove_type_embedded_attribute(self, schema_attribute_guid: str,
@@ -1116,8 +1069,7 @@ class SchemaMaker(ServerClient):
                                        body: Optional[dict | DeleteClassificationRequestBody] = None,
                                        cascade_delete: bool = False) -> None:
         """Remove the TypeEmbeddedAttribute classification from a schema attribute."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_remove_type_embedded_attribute(
+        self._run_sync(self._async_remove_type_embedded_attribute(
             schema_attribute_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -1135,8 +1087,7 @@ class SchemaMaker(ServerClient):
     def add_calculated_value(self, schema_attribute_guid: str,
                              body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a schema attribute as holding a calculated (derived) value."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_add_calculated_value(schema_attribute_guid, body))
+        self._run_sync(self._async_add_calculated_value(schema_attribute_guid, body))
 
     @dynamic_catch
     async def _async_remove_calculated_value(self, schema_attribute_guid: str,
@@ -1153,6 +1104,5 @@ class SchemaMaker(ServerClient):
                                 body: Optional[dict | DeleteClassificationRequestBody] = None,
                                 cascade_delete: bool = False) -> None:
         """Remove the CalculatedValue classification from a schema attribute."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_remove_calculated_value(
+        self._run_sync(self._async_remove_calculated_value(
             schema_attribute_guid, body, cascade_delete))
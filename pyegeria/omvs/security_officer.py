@@ -107,8 +107,7 @@ class SecurityOfficer(ServerClient):
         self, platform_name: str, body: Union[dict, UserAccountRequestBody], platform_guid: str = None
     ) -> None:
         """Create or update a user account in the platform metadata security connector."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_set_user_account(platform_name, body, platform_guid))
+        return self._run_sync(self._async_set_user_account(platform_name, body, platform_guid))
 
     @dynamic_catch
     async def _async_get_user_account(self, platform_name: str, user_id: str, platform_guid: str = None) -> dict:
@@ -123,8 +122,7 @@ class SecurityOfficer(ServerClient):
 
     def get_user_account(self, platform_name: str, user_id: str, platform_guid: str = None) -> dict:
         """Return the user account object for the requested user."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_user_account(platform_name, user_id, platform_guid))
+        return self._run_sync(self._async_get_user_account(platform_name, user_id, platform_guid))
 
     @dynamic_catch
     async def _async_delete_user_account(self, platform_name: str, user_id: str, platform_guid: str = None) -> None:
@@ -136,8 +134,7 @@ class SecurityOfficer(ServerClient):
 
     def delete_user_account(self, platform_name: str, user_id: str, platform_guid: str = None) -> None:
         """Clear the account for a user with the platform security connector."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_user_account(platform_name, user_id, platform_guid))
+        return self._run_sync(self._async_delete_user_account(platform_name, user_id, platform_guid))
 
     @dynamic_catch
     async def _async_get_user_list(
@@ -182,8 +179,7 @@ class SecurityOfficer(ServerClient):
         platform_guid: str = None,
     ) -> list[str]:
         """Return the list of users registered with the platform security connector."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_user_list(platform_name, status, user_type, platform_guid)
         )
 
@@ -211,8 +207,7 @@ class SecurityOfficer(ServerClient):
         body: Union[dict, NewRelationshipRequestBody],
     ) -> None:
         """Attach a nested governance zone to a broader governance zone definition."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_link_governance_zones(
                 governance_zone_guid, nested_governance_zone_guid, body
             )
@@ -242,8 +237,7 @@ class SecurityOfficer(ServerClient):
         body: Union[dict, DeleteRelationshipRequestBody],
     ) -> None:
         """Detach a governance zone definition from a hierarchical relationship."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_detach_governance_zones(
                 governance_zone_guid, nested_governance_zone_guid, body
             )
@@ -320,8 +314,7 @@ class SecurityOfficer(ServerClient):
         platform_guid : str, optional
             Pre-resolved GUID of the platform, bypassing the name lookup.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_set_security_access_control(platform_name, body, platform_guid)
         )
 
@@ -374,8 +367,7 @@ class SecurityOfficer(ServerClient):
         platform_guid : str, optional
             Pre-resolved GUID of the platform, bypassing the name lookup.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_security_access_control(platform_name, control_name, platform_guid)
         )
 
@@ -424,8 +416,7 @@ class SecurityOfficer(ServerClient):
         platform_guid : str, optional
             Pre-resolved GUID of the platform, bypassing the name lookup.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_delete_security_access_control(platform_name, control_name, platform_guid)
         )
 
@@ -508,8 +499,7 @@ class SecurityOfficer(ServerClient):
         **kwargs,
     ) -> list | str:
         """Return the list of security roles matching the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_security_roles(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -607,8 +597,7 @@ class SecurityOfficer(ServerClient):
         **kwargs,
     ) -> list | str:
         """Return the list of security groups matching the search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_security_groups(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -648,8 +637,7 @@ class SecurityOfficer(ServerClient):
     def link_resource_permissions(self, secrets_collection_guid: str, security_access_control_guid: str,
                                   body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a security access control to a secrets collection it grants permission for (ResourcePermissions relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_resource_permissions(secrets_collection_guid, security_access_control_guid, body))
+        self._run_sync(self._async_link_resource_permissions(secrets_collection_guid, security_access_control_guid, body))
 
     @dynamic_catch
     async def _async_detach_resource_permissions(self, secrets_collection_guid: str, security_access_control_guid: str,
@@ -662,8 +650,7 @@ class SecurityOfficer(ServerClient):
     def detach_resource_permissions(self, secrets_collection_guid: str, security_access_control_guid: str,
                                     body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a security access control from a secrets collection."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_resource_permissions(secrets_collection_guid, security_access_control_guid, body))
+        self._run_sync(self._async_detach_resource_permissions(secrets_collection_guid, security_access_control_guid, body))
 
     @dynamic_catch
     async def _async_link_secrets_collection_security_list(self, secrets_collection_guid: str, security_list_guid: str,
@@ -676,8 +663,7 @@ class SecurityOfficer(ServerClient):
     def link_secrets_collection_security_list(self, secrets_collection_guid: str, security_list_guid: str,
                                                body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a security list to a secrets collection it governs (SecretsCollectionSecurityList relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_secrets_collection_security_list(secrets_collection_guid, security_list_guid, body))
+        self._run_sync(self._async_link_secrets_collection_security_list(secrets_collection_guid, security_list_guid, body))
 
     @dynamic_catch
     async def _async_detach_secrets_collection_security_list(self, secrets_collection_guid: str, security_list_guid: str,
@@ -690,8 +676,7 @@ class SecurityOfficer(ServerClient):
     def detach_secrets_collection_security_list(self, secrets_collection_guid: str, security_list_guid: str,
                                                  body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a security list from a secrets collection."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_secrets_collection_security_list(secrets_collection_guid, security_list_guid, body))
+        self._run_sync(self._async_detach_secrets_collection_security_list(secrets_collection_guid, security_list_guid, body))
 
     @dynamic_catch
     async def _async_link_user_account(self, secrets_collection_guid: str, user_identity_guid: str,
@@ -704,8 +689,7 @@ class SecurityOfficer(ServerClient):
     def link_user_account(self, secrets_collection_guid: str, user_identity_guid: str,
                           body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a user identity to a secrets collection holding its account secrets (UserAccount relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_user_account(secrets_collection_guid, user_identity_guid, body))
+        self._run_sync(self._async_link_user_account(secrets_collection_guid, user_identity_guid, body))
 
     @dynamic_catch
     async def _async_detach_user_account(self, secrets_collection_guid: str, user_identity_guid: str,
@@ -718,8 +702,7 @@ class SecurityOfficer(ServerClient):
     def detach_user_account(self, secrets_collection_guid: str, user_identity_guid: str,
                             body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a user identity from a secrets collection."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_user_account(secrets_collection_guid, user_identity_guid, body))
+        self._run_sync(self._async_detach_user_account(secrets_collection_guid, user_identity_guid, body))
 
     @dynamic_catch
     async def _async_set_user_account_profile(self, secrets_collection_guid: str,
@@ -734,8 +717,7 @@ class SecurityOfficer(ServerClient):
     def set_user_account_profile(self, secrets_collection_guid: str,
                                  body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a secrets collection with its user account profile statistics."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_user_account_profile(secrets_collection_guid, body))
+        self._run_sync(self._async_set_user_account_profile(secrets_collection_guid, body))
 
     @dynamic_catch
     async def _async_clear_user_account_profile(self, secrets_collection_guid: str,
@@ -748,8 +730,7 @@ class SecurityOfficer(ServerClient):
     def clear_user_account_profile(self, secrets_collection_guid: str,
                                    body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the UserAccountProfile classification from a secrets collection."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_user_account_profile(secrets_collection_guid, body))
+        self._run_sync(self._async_clear_user_account_profile(secrets_collection_guid, body))
 
     @dynamic_catch
     async def _async_set_zone_membership_profile(self, governance_zone_guid: str,
@@ -764,8 +745,7 @@ class SecurityOfficer(ServerClient):
     def set_zone_membership_profile(self, governance_zone_guid: str,
                                     body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify a governance zone with its zone membership profile (e.g. allowed security groups)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_set_zone_membership_profile(governance_zone_guid, body))
+        self._run_sync(self._async_set_zone_membership_profile(governance_zone_guid, body))
 
     @dynamic_catch
     async def _async_clear_zone_membership_profile(self, governance_zone_guid: str,
@@ -778,6 +758,5 @@ class SecurityOfficer(ServerClient):
     def clear_zone_membership_profile(self, governance_zone_guid: str,
                                       body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the ZoneMembershipProfile classification from a governance zone."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_clear_zone_membership_profile(governance_zone_guid, body))
+        self._run_sync(self._async_clear_zone_membership_profile(governance_zone_guid, body))
 
@@ -133,8 +133,7 @@ class SolutionArchitect(ServerClient):
 
     def create_design_pattern(self, body: dict | NewElementRequestBody):
         """Create a design pattern."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_design_pattern(body))
+        return self._run_sync(self._async_create_design_pattern(body))
 
     async def _async_create_design_pattern_from_template(self, body: dict | TemplateRequestBody):
         url = f"{self.solution_architect_command_root}/design-patterns/from-template"
@@ -143,8 +142,7 @@ class SolutionArchitect(ServerClient):
 
     def create_design_pattern_from_template(self, body: dict | TemplateRequestBody):
         """Create a design pattern from template."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_design_pattern_from_template(body))
+        return self._run_sync(self._async_create_design_pattern_from_template(body))
 
     async def _async_update_design_pattern(self, guid: str, body: dict | UpdateElementRequestBody):
         validate_guid(guid)
@@ -153,8 +151,7 @@ class SolutionArchitect(ServerClient):
 
     def update_design_pattern(self, guid: str, body: dict | UpdateElementRequestBody):
         """Update a design pattern."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_design_pattern(guid, body))
+        return self._run_sync(self._async_update_design_pattern(guid, body))
 
     async def _async_link_nested_design_patterns(self, parent_guid: str, child_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None):
         validate_guid(parent_guid)
@@ -164,8 +161,7 @@ class SolutionArchitect(ServerClient):
 
     def link_nested_design_patterns(self, parent_guid: str, child_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None):
         """Link nested design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_nested_design_patterns(parent_guid, child_guid, body))
+        return self._run_sync(self._async_link_nested_design_patterns(parent_guid, child_guid, body))
 
     async def _async_detach_nested_design_patterns(self, parent_guid: str, child_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None):
         validate_guid(parent_guid)
@@ -175,8 +171,7 @@ class SolutionArchitect(ServerClient):
 
     def detach_nested_design_patterns(self, parent_guid: str, child_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None):
         """Detach nested design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_nested_design_patterns(parent_guid, child_guid, body))
+        return self._run_sync(self._async_detach_nested_design_patterns(parent_guid, child_guid, body))
 
     async def _async_link_specialized_design_patterns(self, general_guid: str, special_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None):
         validate_guid(general_guid)
@@ -186,8 +181,7 @@ class SolutionArchitect(ServerClient):
 
     def link_specialized_design_patterns(self, general_guid: str, special_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None):
         """Link specialized design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_specialized_design_patterns(general_guid, special_guid, body))
+        return self._run_sync(self._async_link_specialized_design_patterns(general_guid, special_guid, body))
 
     async def _async_detach_specialized_design_patterns(self, general_guid: str, special_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None):
         validate_guid(general_guid)
@@ -197,8 +191,7 @@ class SolutionArchitect(ServerClient):
 
     def detach_specialized_design_patterns(self, general_guid: str, special_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None):
         """Detach specialized design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_specialized_design_patterns(general_guid, special_guid, body))
+        return self._run_sync(self._async_detach_specialized_design_patterns(general_guid, special_guid, body))
 
     async def _async_link_related_design_patterns(self, guid1: str, guid2: str, body: Optional[dict | NewRelationshipRequestBody] = None):
         validate_guid(guid1)
@@ -208,8 +201,7 @@ class SolutionArchitect(ServerClient):
 
     def link_related_design_patterns(self, guid1: str, guid2: str, body: Optional[dict | NewRelationshipRequestBody] = None):
         """Link related design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_related_design_patterns(guid1, guid2, body))
+        return self._run_sync(self._async_link_related_design_patterns(guid1, guid2, body))
 
     async def _async_detach_related_design_patterns(self, guid1: str, guid2: str, body: Optional[dict | DeleteRelationshipRequestBody] = None):
         validate_guid(guid1)
@@ -219,8 +211,7 @@ class SolutionArchitect(ServerClient):
 
     def detach_related_design_patterns(self, guid1: str, guid2: str, body: Optional[dict | DeleteRelationshipRequestBody] = None):
         """Detach related design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_detach_related_design_patterns(guid1, guid2, body))
+        return self._run_sync(self._async_detach_related_design_patterns(guid1, guid2, body))
 
     async def _async_delete_design_pattern(self, guid: str, body: Optional[dict | DeleteElementRequestBody] = None):
         validate_guid(guid)
@@ -229,8 +220,7 @@ class SolutionArchitect(ServerClient):
 
     def delete_design_pattern(self, guid: str, body: Optional[dict | DeleteElementRequestBody] = None):
         """Delete a design pattern."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_delete_design_pattern(guid, body))
+        return self._run_sync(self._async_delete_design_pattern(guid, body))
 
     async def _async_find_design_patterns(self, search_string: str = "*", body: Optional[dict | SearchStringRequestBody] = None,
                                   starts_with: bool = True, ends_with: bool = False, ignore_case: bool = False,
@@ -260,8 +250,7 @@ class SolutionArchitect(ServerClient):
                            start_from: int = 0, page_size: int = 100, graph_query_depth: int = 3, output_format: str = "JSON",
                            report_spec: str | dict = "Design-Pattern-DrE", **kwargs):
         """Find design patterns."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_find_design_patterns(search_string, body, starts_with, ends_with,
+        return self._run_sync(self._async_find_design_patterns(search_string, body, starts_with, ends_with,
                                                          ignore_case, start_from, page_size,
                                                          graph_query_depth,
                                                          output_format, report_spec, **kwargs))
@@ -290,8 +279,7 @@ class SolutionArchitect(ServerClient):
                                   start_from: int = 0, page_size: int = max_paging_size,
                                   graph_query_depth: int = 3, output_format: str = "JSON", report_spec: str | dict = "Design-Pattern-DrE", **kwargs):
         """Get design patterns by name."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_design_patterns_by_name(name=name, body=body, start_from=start_from, page_size=page_size,
+        return self._run_sync(self._async_get_design_patterns_by_name(name=name, body=body, start_from=start_from, page_size=page_size,
                                                                 graph_query_depth=graph_query_depth,
                                                                 output_format=output_format, report_spec=report_spec, **kwargs))
 
@@ -315,8 +303,7 @@ class SolutionArchitect(ServerClient):
     def get_design_pattern_by_guid(self, guid: str = None, body: Optional[dict | GetRequestBody] = None,
                                  graph_query_depth: int = 3, output_format: str = "JSON", report_spec: str | dict = "Design-Pattern-DrE", **kwargs):
         """Get a design pattern by GUID."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_design_pattern_by_guid(guid=guid, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
+        return self._run_sync(self._async_get_design_pattern_by_guid(guid=guid, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
 
     async def _async_update_solution_blueprint_status(self, guid: str, body: dict | UpdateElementRequestBody):
         validate_guid(guid)
@@ -325,8 +312,7 @@ class SolutionArchitect(ServerClient):
 
     def update_solution_blueprint_status(self, guid: str, body: dict | UpdateElementRequestBody):
         """Update the status of a solution blueprint."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_update_solution_blueprint_status(guid, body))
+        return self._run_sync(self._async_update_solution_blueprint_status(guid, body))
 
 
     def _get_supply_chain_rel_elements_dict(self, el_struct: dict)-> dict | str:
@@ -999,8 +985,7 @@ class SolutionArchitect(ServerClient):
         }
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_info_supply_chain(body))
+        response = self._run_sync(self._async_create_info_supply_chain(body))
         return response
 
     @dynamic_catch
@@ -1084,7 +1069,7 @@ class SolutionArchitect(ServerClient):
         elif isinstance(body, dict):
             validated_body = self._template_request_adapter.validate_python(body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create Supply Chain from template with GUID: {resp.json().get('guid')}")
@@ -1162,8 +1147,7 @@ class SolutionArchitect(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_info_supply_chain_from_template(body))
+        response = self._run_sync(self._async_create_info_supply_chain_from_template(body))
         return response
 
     @dynamic_catch
@@ -1281,8 +1265,7 @@ class SolutionArchitect(ServerClient):
               }
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_info_supply_chain(guid, body))
+        self._run_sync(self._async_update_info_supply_chain(guid, body))
 
     @dynamic_catch
     async def _async_link_peer_info_supply_chains(self, peer1_guid: str, peer2_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
@@ -1387,8 +1370,7 @@ class SolutionArchitect(ServerClient):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_peer_info_supply_chains(peer1_guid, peer2_guid, body))
+        self._run_sync(self._async_link_peer_info_supply_chains(peer1_guid, peer2_guid, body))
 
     @dynamic_catch
     async def _async_unlink_peer_info_supply_chains(self, peer1_guid: str, peer2_guid: str,
@@ -1483,8 +1465,7 @@ class SolutionArchitect(ServerClient):
           "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_unlink_peer_info_supply_chains(peer1_guid,peer2_guid, body))
+        self._run_sync(self._async_unlink_peer_info_supply_chains(peer1_guid,peer2_guid, body))
 
     @dynamic_catch
     async def _async_delete_info_supply_chain(self, guid: str, body: Optional[dict | DeleteElementRequestBody] = None, cascade_delete: bool = False) -> None:
@@ -1571,8 +1552,7 @@ class SolutionArchitect(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_info_supply_chain(guid, body, cascade_delete))
+        self._run_sync(self._async_delete_info_supply_chain(guid, body, cascade_delete))
 
     def find_all_information_supply_chains(self, add_implementation: bool = True,
                                            starts_with: bool = True, ends_with: bool = False,
@@ -1957,8 +1937,7 @@ class SolutionArchitect(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_information_supply_chains(
                 search_string=search_string,
                 add_implementation=add_implementation,
@@ -2111,8 +2090,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_info_supply_chain_by_name(name=name, body=body, add_implementation=add_implementation, start_from=start_from, page_size=page_size,
                                                       graph_query_depth=graph_query_depth,
                                                       output_format=output_format, report_spec=report_spec, **kwargs))
@@ -2237,8 +2215,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_info_supply_chain_by_guid(guid=guid, body=body,
+        response = self._run_sync(self._async_get_info_supply_chain_by_guid(guid=guid, body=body,
                                                                                       graph_query_depth=graph_query_depth,
                                                                                       add_implementation=add_implementation, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
@@ -2477,8 +2454,7 @@ class SolutionArchitect(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_solution_blueprint(body))
+        response = self._run_sync(self._async_create_solution_blueprint(body))
         return response
 
     @dynamic_catch
@@ -2561,7 +2537,7 @@ class SolutionArchitect(ServerClient):
         elif isinstance(body, dict):
             validated_body = self._template_request_adapter.validate_python(body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create Blueprint from template with GUID: {resp.json().get('guid')}")
@@ -2637,8 +2613,7 @@ class SolutionArchitect(ServerClient):
         }
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_solution_blueprint_from_template(body))
+        response = self._run_sync(self._async_create_solution_blueprint_from_template(body))
         return response
 
     @dynamic_catch
@@ -2751,8 +2726,7 @@ class SolutionArchitect(ServerClient):
                }
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_solution_blueprint(guid, body))
+        self._run_sync(self._async_update_solution_blueprint(guid, body))
 
 
     @dynamic_catch
@@ -2856,8 +2830,7 @@ class SolutionArchitect(ServerClient):
           "forDuplicateProcessing" : false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_solution_design(blueprint_guid, element_guid, body))
+        self._run_sync(self._async_link_solution_design(blueprint_guid, element_guid, body))
 
     @dynamic_catch
     async def _async_detach_solution_design(self, blueprint_guid: str, element_guid: str,
@@ -2923,8 +2896,7 @@ class SolutionArchitect(ServerClient):
             the requesting user is not authorized to issue this request.
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_solution_design(blueprint_guid, element_guid, body))
+        self._run_sync(self._async_detach_solution_design(blueprint_guid, element_guid, body))
 
 
     @dynamic_catch
@@ -3014,8 +2986,7 @@ class SolutionArchitect(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_solution_blueprint(blueprint_guid, cascade_delete, body))
+        self._run_sync(self._async_delete_solution_blueprint(blueprint_guid, cascade_delete, body))
 
 
 
@@ -3218,8 +3189,7 @@ class SolutionArchitect(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_solution_blueprints(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -3388,8 +3358,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_solution_blueprint_by_guid(guid=guid, body=body,
+        response = self._run_sync(self._async_get_solution_blueprint_by_guid(guid=guid, body=body,
                                                                                       graph_query_depth=graph_query_depth,
                                                                                       max_mermaid_node_count=max_mermaid_node_count,
                                                                                       output_format=output_format, report_spec=report_spec, **kwargs))
@@ -3525,8 +3494,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_solution_blueprints_by_name(name=name, body=body, start_from=start_from, page_size=page_size, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
 
@@ -3704,8 +3672,7 @@ class SolutionArchitect(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_solution_component(body))
+        response = self._run_sync(self._async_create_solution_component(body))
         return response
 
     @dynamic_catch
@@ -3787,7 +3754,7 @@ class SolutionArchitect(ServerClient):
         elif isinstance(body, dict):
             validated_body = self._template_request_adapter.validate_python(body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create Solution Component from template with GUID: {resp.json().get('guid')}")
@@ -3865,8 +3832,7 @@ class SolutionArchitect(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_solution_component_from_template(body))
+        response = self._run_sync(self._async_create_solution_component_from_template(body))
         return response
 
     @dynamic_catch
@@ -3981,8 +3947,7 @@ class SolutionArchitect(ServerClient):
         }
 
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_solution_component(guid, body))
+        self._run_sync(self._async_update_solution_component(guid, body))
 
     @dynamic_catch
     async def _async_link_subcomponent(self, component_guid: str, sub_component_guid: str, body: dict | NewRelationshipRequestBody) -> None:
@@ -4069,8 +4034,7 @@ class SolutionArchitect(ServerClient):
                   "forDuplicateProcessing" : false
                 }
                 """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_subcomponent(component_guid, sub_component_guid, body))
+        self._run_sync(self._async_link_subcomponent(component_guid, sub_component_guid, body))
     @dynamic_catch
     async def _async_detach_sub_component(self, parent_component_guid: str, member_component_guid: str,
                                           body: dict |DeleteRelationshipRequestBody = None) -> None:
@@ -4162,8 +4126,7 @@ class SolutionArchitect(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_sub_component(parent_component_guid, member_component_guid, body))
+        self._run_sync(self._async_detach_sub_component(parent_component_guid, member_component_guid, body))
 
     @dynamic_catch
     async def _async_link_solution_linking_wire(self, component1_guid: str, component2_guid: str, body: dict | NewRelationshipRequestBody) -> Optional[str]:
@@ -4269,8 +4232,7 @@ class SolutionArchitect(ServerClient):
                   "forDuplicateProcessing": false
                 }
                 """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_link_solution_linking_wire(component1_guid, component2_guid, body))
+        return self._run_sync(self._async_link_solution_linking_wire(component1_guid, component2_guid, body))
 
     @dynamic_catch
     async def _async_detach_solution_linking_wire(self, component1_guid: str, component2_guid: str,
@@ -4374,8 +4336,7 @@ class SolutionArchitect(ServerClient):
                 }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_solution_linking_wire(component1_guid, component2_guid, body))
+        self._run_sync(self._async_detach_solution_linking_wire(component1_guid, component2_guid, body))
 
     #
     # GUID-based SolutionLinkingWire update/detach (Egeria PR #9156, multi-link) --
@@ -4436,8 +4397,7 @@ class SolutionArchitect(ServerClient):
                                      body: dict | UpdateRelationshipRequestBody) -> None:
         """ Update the properties of one specific SolutionLinkingWire relationship,
         identified by its own relationship GUID."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_solution_linking_wire(relationship_guid, body))
+        self._run_sync(self._async_update_solution_linking_wire(relationship_guid, body))
 
     @dynamic_catch
     async def _async_detach_solution_linking_wire_by_guid(self, relationship_guid: str,
@@ -4486,8 +4446,7 @@ class SolutionArchitect(ServerClient):
                                              body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """ Detach one specific SolutionLinkingWire relationship, identified by its
         own relationship GUID."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_solution_linking_wire_by_guid(relationship_guid, body))
+        self._run_sync(self._async_detach_solution_linking_wire_by_guid(relationship_guid, body))
 
     @dynamic_catch
     async def _async_delete_solution_component(self, solution_component_guid: str, cascade_delete: bool = False,
@@ -4575,8 +4534,7 @@ class SolutionArchitect(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_solution_component(solution_component_guid, cascade_delete, body))
+        self._run_sync(self._async_delete_solution_component(solution_component_guid, cascade_delete, body))
 
     async def _async_find_solution_components(
         self,
@@ -4775,8 +4733,7 @@ class SolutionArchitect(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_find_solution_components(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -4953,8 +4910,7 @@ class SolutionArchitect(ServerClient):
             report_spec ():
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_solution_components_by_name(name=name, body=body, start_from=start_from, page_size=page_size, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
 
@@ -5074,8 +5030,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_solution_component_by_guid(guid=guid, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
 
@@ -5276,8 +5231,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_solution_component_implementations(guid=guid, body=body, start_from=start_from, page_size=page_size,
                                                                output_format=output_format, **kwargs))
         return response
@@ -5424,8 +5378,7 @@ class SolutionArchitect(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_solution_role(body))
+        response = self._run_sync(self._async_create_solution_role(body))
         return response
 
     @dynamic_catch
@@ -5507,7 +5460,7 @@ class SolutionArchitect(ServerClient):
         elif isinstance(body, dict):
             validated_body = self._template_request_adapter.validate_python(body)
 
-        json_body = validated_body.model_dump_json(indent=2, exclude_none=True, by_alias=True)
+        json_body = validated_body.model_dump_json(exclude_none=True, by_alias=True)
         logger.info(json_body)
         resp = await self._async_make_request("POST", url, json_body, is_json=True)
         logger.info(f"Create Solution Role from template with GUID: {resp.json().get('guid')}")
@@ -5585,8 +5538,7 @@ class SolutionArchitect(ServerClient):
 
        """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_create_solution_role_from_template(body))
+        response = self._run_sync(self._async_create_solution_role_from_template(body))
         return response
 
     @dynamic_catch
@@ -5704,8 +5656,7 @@ class SolutionArchitect(ServerClient):
           "forDuplicateProcessing" : false
         }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_solution_role(guid, body))
+        self._run_sync(self._async_update_solution_role(guid, body))
 
     @dynamic_catch
     async def _async_link_component_to_actor(self, role_guid: str, component_guid: str, body: dict | NewRelationshipRequestBody) -> None:
@@ -5807,8 +5758,7 @@ class SolutionArchitect(ServerClient):
             }
 
                 """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_component_to_actor(role_guid, component_guid, body))
+        self._run_sync(self._async_link_component_to_actor(role_guid, component_guid, body))
 
     @dynamic_catch
     async def _async_detach_component_actor(self, role_guid: str, component_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -5898,8 +5848,7 @@ class SolutionArchitect(ServerClient):
           "forDuplicateProcessing": false
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_component_actor(role_guid, component_guid, body))
+        self._run_sync(self._async_detach_component_actor(role_guid, component_guid, body))
 
     @dynamic_catch
     async def _async_delete_solution_role(self, guid: str,  body: dict | DeleteElementRequestBody= None, cascade_delete: bool = False,) -> None:
@@ -5987,8 +5936,7 @@ class SolutionArchitect(ServerClient):
               "forDuplicateProcessing": false
             }
             """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_solution_role(guid, body, cascade_delete))
+        self._run_sync(self._async_delete_solution_role(guid, body, cascade_delete))
 
 
     async def _async_find_solution_roles(
@@ -6224,8 +6172,7 @@ class SolutionArchitect(ServerClient):
         }
         """
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_solution_roles(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -6400,8 +6347,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_solution_roles_by_name(name=name, body=body, start_from=start_from, page_size=page_size, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
 
@@ -6515,8 +6461,7 @@ class SolutionArchitect(ServerClient):
             }
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(self._async_get_solution_role_by_guid(guid=guid, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
+        response = self._run_sync(self._async_get_solution_role_by_guid(guid=guid, body=body, graph_query_depth=graph_query_depth, output_format=output_format, report_spec=report_spec, **kwargs))
         return response
 
 
@@ -6567,8 +6512,7 @@ class SolutionArchitect(ServerClient):
     @dynamic_catch
     def create_concept_model_element(self, body: dict | NewElementRequestBody) -> str:
         """Create a new concept model element (e.g. a ConceptBead)."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_concept_model_element(body))
+        return self._run_sync(self._async_create_concept_model_element(body))
 
     @dynamic_catch
     async def _async_create_concept_model_element_from_template(self, body: dict | TemplateRequestBody) -> str:
@@ -6579,8 +6523,7 @@ class SolutionArchitect(ServerClient):
     @dynamic_catch
     def create_concept_model_element_from_template(self, body: dict | TemplateRequestBody) -> str:
         """Create a new concept model element from a template."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_concept_model_element_from_template(body))
+        return self._run_sync(self._async_create_concept_model_element_from_template(body))
 
     @dynamic_catch
     async def _async_update_concept_model_element(self, guid: str, body: dict | UpdateElementRequestBody) -> None:
@@ -6594,8 +6537,7 @@ class SolutionArchitect(ServerClient):
     @dynamic_catch
     def update_concept_model_element(self, guid: str, body: dict | UpdateElementRequestBody) -> None:
         """Update the properties of a concept model element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_concept_model_element(guid, body))
+        self._run_sync(self._async_update_concept_model_element(guid, body))
 
     @dynamic_catch
     async def _async_delete_concept_model_element(self, guid: str, body: Optional[dict | DeleteElementRequestBody] = None,
@@ -6609,8 +6551,7 @@ class SolutionArchitect(ServerClient):
     def delete_concept_model_element(self, guid: str, body: Optional[dict | DeleteElementRequestBody] = None,
                                      cascade_delete: bool = False) -> None:
         """Delete a concept model element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_concept_model_element(guid, body, cascade_delete))
+        self._run_sync(self._async_delete_concept_model_element(guid, body, cascade_delete))
 
     @dynamic_catch
     async def _async_find_concept_model_elements(self, search_string: str = "*",
@@ -6635,8 +6576,7 @@ class SolutionArchitect(ServerClient):
                                     output_format: str = "JSON", report_spec: str | dict | None = None,
                                     **kwargs) -> list | str:
         """Find concept model elements matching a search string."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_find_concept_model_elements(
+        return self._run_sync(self._async_find_concept_model_elements(
             search_string, body, starts_with, ends_with, ignore_case, start_from, page_size,
             output_format, report_spec, **kwargs))
 
@@ -6660,8 +6600,7 @@ class SolutionArchitect(ServerClient):
                                            output_format: str = "JSON", report_spec: str | dict | None = None,
                                            **kwargs) -> list | str:
         """Return the concept model elements with a specific name."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_concept_model_elements_by_name(
+        return self._run_sync(self._async_get_concept_model_elements_by_name(
             name, body, start_from, page_size, output_format, report_spec, **kwargs))
 
     @dynamic_catch
@@ -6680,8 +6619,7 @@ class SolutionArchitect(ServerClient):
                                           output_format: str = "JSON", report_spec: str | dict | None = None,
                                           **kwargs) -> dict | str:
         """Return the properties of a specific concept model element."""
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_get_concept_model_element_by_guid(
+        return self._run_sync(self._async_get_concept_model_element_by_guid(
             guid, body, output_format, report_spec, **kwargs))
 
     @dynamic_catch
@@ -6695,8 +6633,7 @@ class SolutionArchitect(ServerClient):
     def link_concept_design(self, element_guid: str, concept_model_guid: str,
                             body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach an element to the concept model element that designs it (ConceptDesign relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_concept_design(element_guid, concept_model_guid, body))
+        self._run_sync(self._async_link_concept_design(element_guid, concept_model_guid, body))
 
     @dynamic_catch
     async def _async_detach_concept_design(self, element_guid: str, concept_model_guid: str,
@@ -6709,8 +6646,7 @@ class SolutionArchitect(ServerClient):
     def detach_concept_design(self, element_guid: str, concept_model_guid: str,
                               body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach an element from a concept model element."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_concept_design(element_guid, concept_model_guid, body))
+        self._run_sync(self._async_detach_concept_design(element_guid, concept_model_guid, body))
 
     @dynamic_catch
     async def _async_link_concept_bead_relationship_end(self, concept_bead_relationship_guid: str, concept_bead_guid: str,
@@ -6723,8 +6659,7 @@ class SolutionArchitect(ServerClient):
     def link_concept_bead_relationship_end(self, concept_bead_relationship_guid: str, concept_bead_guid: str,
                                            body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a concept bead as one end of a concept bead relationship (ConceptBeadRelationshipEnd relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_concept_bead_relationship_end(concept_bead_relationship_guid, concept_bead_guid, body))
+        self._run_sync(self._async_link_concept_bead_relationship_end(concept_bead_relationship_guid, concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_detach_concept_bead_relationship_end(self, concept_bead_relationship_guid: str, concept_bead_guid: str,
@@ -6737,8 +6672,7 @@ class SolutionArchitect(ServerClient):
     def detach_concept_bead_relationship_end(self, concept_bead_relationship_guid: str, concept_bead_guid: str,
                                              body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a concept bead from a concept bead relationship."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_concept_bead_relationship_end(concept_bead_relationship_guid, concept_bead_guid, body))
+        self._run_sync(self._async_detach_concept_bead_relationship_end(concept_bead_relationship_guid, concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_link_typed_by_concept_bead(self, concept_bead_attribute_guid: str, concept_bead_guid: str,
@@ -6751,8 +6685,7 @@ class SolutionArchitect(ServerClient):
     def link_typed_by_concept_bead(self, concept_bead_attribute_guid: str, concept_bead_guid: str,
                                    body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a concept bead attribute to the concept bead that types it (TypedByConceptBead relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_typed_by_concept_bead(concept_bead_attribute_guid, concept_bead_guid, body))
+        self._run_sync(self._async_link_typed_by_concept_bead(concept_bead_attribute_guid, concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_detach_typed_by_concept_bead(self, concept_bead_attribute_guid: str, concept_bead_guid: str,
@@ -6765,8 +6698,7 @@ class SolutionArchitect(ServerClient):
     def detach_typed_by_concept_bead(self, concept_bead_attribute_guid: str, concept_bead_guid: str,
                                      body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a concept bead attribute from the concept bead that types it."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_typed_by_concept_bead(concept_bead_attribute_guid, concept_bead_guid, body))
+        self._run_sync(self._async_detach_typed_by_concept_bead(concept_bead_attribute_guid, concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_link_is_a_concept_bead(self, concept_bead_guid: str, general_concept_bead_guid: str,
@@ -6779,8 +6711,7 @@ class SolutionArchitect(ServerClient):
     def link_is_a_concept_bead(self, concept_bead_guid: str, general_concept_bead_guid: str,
                                body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a concept bead to the more general concept bead it is a kind of (IsAConceptBead relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_is_a_concept_bead(concept_bead_guid, general_concept_bead_guid, body))
+        self._run_sync(self._async_link_is_a_concept_bead(concept_bead_guid, general_concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_detach_is_a_concept_bead(self, concept_bead_guid: str, general_concept_bead_guid: str,
@@ -6793,8 +6724,7 @@ class SolutionArchitect(ServerClient):
     def detach_is_a_concept_bead(self, concept_bead_guid: str, general_concept_bead_guid: str,
                                  body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a concept bead from a more general concept bead."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_is_a_concept_bead(concept_bead_guid, general_concept_bead_guid, body))
+        self._run_sync(self._async_detach_is_a_concept_bead(concept_bead_guid, general_concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_link_concept_bead_attribute_link(self, concept_bead_guid: str, concept_bead_attribute_guid: str,
@@ -6807,8 +6737,7 @@ class SolutionArchitect(ServerClient):
     def link_concept_bead_attribute_link(self, concept_bead_guid: str, concept_bead_attribute_guid: str,
                                          body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach an attribute to the concept bead it belongs to (ConceptBeadAttributeLink relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_concept_bead_attribute_link(concept_bead_guid, concept_bead_attribute_guid, body))
+        self._run_sync(self._async_link_concept_bead_attribute_link(concept_bead_guid, concept_bead_attribute_guid, body))
 
     @dynamic_catch
     async def _async_detach_concept_bead_attribute_link(self, concept_bead_guid: str, concept_bead_attribute_guid: str,
@@ -6821,8 +6750,7 @@ class SolutionArchitect(ServerClient):
     def detach_concept_bead_attribute_link(self, concept_bead_guid: str, concept_bead_attribute_guid: str,
                                            body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach an attribute from the concept bead it belongs to."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_concept_bead_attribute_link(concept_bead_guid, concept_bead_attribute_guid, body))
+        self._run_sync(self._async_detach_concept_bead_attribute_link(concept_bead_guid, concept_bead_attribute_guid, body))
 
     @dynamic_catch
     async def _async_link_concept_bead_extension(self, concept_bead_guid: str, extension_concept_bead_guid: str,
@@ -6835,8 +6763,7 @@ class SolutionArchitect(ServerClient):
     def link_concept_bead_extension(self, concept_bead_guid: str, extension_concept_bead_guid: str,
                                     body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a concept bead to another concept bead that extends it (ConceptBeadExtension relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_concept_bead_extension(concept_bead_guid, extension_concept_bead_guid, body))
+        self._run_sync(self._async_link_concept_bead_extension(concept_bead_guid, extension_concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_detach_concept_bead_extension(self, concept_bead_guid: str, extension_concept_bead_guid: str,
@@ -6849,8 +6776,7 @@ class SolutionArchitect(ServerClient):
     def detach_concept_bead_extension(self, concept_bead_guid: str, extension_concept_bead_guid: str,
                                       body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a concept bead extension."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_concept_bead_extension(concept_bead_guid, extension_concept_bead_guid, body))
+        self._run_sync(self._async_detach_concept_bead_extension(concept_bead_guid, extension_concept_bead_guid, body))
 
     @dynamic_catch
     async def _async_link_solution_component_port(self, solution_component_guid: str, solution_port_guid: str,
@@ -6863,8 +6789,7 @@ class SolutionArchitect(ServerClient):
     def link_solution_component_port(self, solution_component_guid: str, solution_port_guid: str,
                                      body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a solution port to the solution component it belongs to (SolutionComponentPort relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_solution_component_port(solution_component_guid, solution_port_guid, body))
+        self._run_sync(self._async_link_solution_component_port(solution_component_guid, solution_port_guid, body))
 
     @dynamic_catch
     async def _async_detach_solution_component_port(self, solution_component_guid: str, solution_port_guid: str,
@@ -6877,8 +6802,7 @@ class SolutionArchitect(ServerClient):
     def detach_solution_component_port(self, solution_component_guid: str, solution_port_guid: str,
                                        body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a solution port from a solution component."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_solution_component_port(solution_component_guid, solution_port_guid, body))
+        self._run_sync(self._async_detach_solution_component_port(solution_component_guid, solution_port_guid, body))
 
     @dynamic_catch
     async def _async_link_solution_port_delegation(self, aligns_to_port_guid: str, delegation_port_guid: str,
@@ -6891,8 +6815,7 @@ class SolutionArchitect(ServerClient):
     def link_solution_port_delegation(self, aligns_to_port_guid: str, delegation_port_guid: str,
                                       body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a solution port to the port it delegates to (PortDelegation relationship)."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_solution_port_delegation(aligns_to_port_guid, delegation_port_guid, body))
+        self._run_sync(self._async_link_solution_port_delegation(aligns_to_port_guid, delegation_port_guid, body))
 
     @dynamic_catch
     async def _async_detach_solution_port_delegation(self, aligns_to_port_guid: str, delegation_port_guid: str,
@@ -6905,8 +6828,7 @@ class SolutionArchitect(ServerClient):
     def detach_solution_port_delegation(self, aligns_to_port_guid: str, delegation_port_guid: str,
                                         body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a solution port delegation."""
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_detach_solution_port_delegation(aligns_to_port_guid, delegation_port_guid, body))
+        self._run_sync(self._async_detach_solution_port_delegation(aligns_to_port_guid, delegation_port_guid, body))
 
 
 
@@ -87,7 +87,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def link_sourced_from(self, element_guid: str, template_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a template to an element that was created from it."""
-        return asyncio.get_event_loop().run_until_complete(self._async_link_sourced_from(element_guid, template_guid, body))
+        return self._run_sync(self._async_link_sourced_from(element_guid, template_guid, body))
 
     @dynamic_catch
     async def _async_detach_sourced_from(self, element_guid: str, template_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -109,7 +109,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def detach_sourced_from(self, element_guid: str, template_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach the source template for an element."""
-        return asyncio.get_event_loop().run_until_complete(self._async_detach_sourced_from(element_guid, template_guid, body))
+        return self._run_sync(self._async_detach_sourced_from(element_guid, template_guid, body))
 
     @dynamic_catch
     async def _async_link_catalog_template(self, element_guid: str, template_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
@@ -131,7 +131,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def link_catalog_template(self, element_guid: str, template_guid: str, body: Optional[dict | NewRelationshipRequestBody] = None) -> None:
         """Attach a template to an element that was created from it."""
-        return asyncio.get_event_loop().run_until_complete(self._async_link_catalog_template(element_guid, template_guid, body))
+        return self._run_sync(self._async_link_catalog_template(element_guid, template_guid, body))
 
     @dynamic_catch
     async def _async_detach_catalog_template(self, element_guid: str, template_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
@@ -153,7 +153,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def detach_catalog_template(self, element_guid: str, template_guid: str, body: Optional[dict | DeleteRelationshipRequestBody] = None) -> None:
         """Detach a template for an element that this template is relevant to."""
-        return asyncio.get_event_loop().run_until_complete(self._async_detach_catalog_template(element_guid, template_guid, body))
+        return self._run_sync(self._async_detach_catalog_template(element_guid, template_guid, body))
 
     @dynamic_catch
     async def _async_add_template_classification(self, element_guid: str, body: Optional[dict | NewClassificationRequestBody] = None) -> None:
@@ -173,7 +173,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def add_template_classification(self, element_guid: str, body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as suitable to be used as a template for cataloguing elements of similar types."""
-        return asyncio.get_event_loop().run_until_complete(self._async_add_template_classification(element_guid, body))
+        return self._run_sync(self._async_add_template_classification(element_guid, body))
 
     @dynamic_catch
     async def _async_remove_template_classification(self, element_guid: str, body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
@@ -193,7 +193,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def remove_template_classification(self, element_guid: str, body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the Template classification from the element."""
-        return asyncio.get_event_loop().run_until_complete(self._async_remove_template_classification(element_guid, body))
+        return self._run_sync(self._async_remove_template_classification(element_guid, body))
 
     @dynamic_catch
     async def _async_add_template_substitute_classification(self, element_guid: str, body: Optional[dict | NewClassificationRequestBody] = None) -> None:
@@ -213,7 +213,7 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def add_template_substitute_classification(self, element_guid: str, body: Optional[dict | NewClassificationRequestBody] = None) -> None:
         """Classify an element as suitable to be used as a template substitute for cataloguing elements of similar types."""
-        return asyncio.get_event_loop().run_until_complete(self._async_add_template_substitute_classification(element_guid, body))
+        return self._run_sync(self._async_add_template_substitute_classification(element_guid, body))
 
     @dynamic_catch
     async def _async_remove_template_substitute_classification(self, element_guid: str, body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
@@ -233,4 +233,4 @@ class TemplateManager(ServerClient):
     @dynamic_catch
     def remove_template_substitute_classification(self, element_guid: str, body: Optional[dict | DeleteClassificationRequestBody] = None) -> None:
         """Remove the TemplateSubstitute classification from the element."""
-        return asyncio.get_event_loop().run_until_complete(self._async_remove_template_substitute_classification(element_guid, body))
+        return self._run_sync(self._async_remove_template_substitute_classification(element_guid, body))
@@ -216,8 +216,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_context_event(body))
+        return self._run_sync(self._async_create_context_event(body))
 
     @dynamic_catch
     async def _async_create_context_event_from_template(self, body: dict | TemplateRequestBody) -> str:
@@ -299,8 +298,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(self._async_create_context_event_from_template(body))
+        return self._run_sync(self._async_create_context_event_from_template(body))
 
     @dynamic_catch
     async def _async_update_context_event(
@@ -374,8 +372,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_update_context_event(context_event_guid, body))
+        self._run_sync(self._async_update_context_event(context_event_guid, body))
 
     @dynamic_catch
     async def _async_delete_context_event(
@@ -443,8 +440,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_delete_context_event(context_event_guid, body))
+        self._run_sync(self._async_delete_context_event(context_event_guid, body))
 
     @dynamic_catch
     async def _async_link_dependent_context_events(
@@ -530,8 +526,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_dependent_context_events(
                 parent_context_event_guid, child_context_event_guid, body
             )
@@ -615,8 +610,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_dependent_context_events(
                 parent_context_event_guid, child_context_event_guid, body
             )
@@ -706,8 +700,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_related_context_events(context_event_one_guid, context_event_two_guid, body)
         )
 
@@ -789,8 +782,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_related_context_events(context_event_one_guid, context_event_two_guid, body)
         )
 
@@ -872,8 +864,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_context_event_evidence(context_event_guid, evidence_guid, body)
         )
 
@@ -949,8 +940,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_context_event_evidence(context_event_guid, evidence_guid, body)
         )
 
@@ -1032,8 +1022,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_context_event_impact(context_event_guid, impacted_element_guid, body)
         )
 
@@ -1109,8 +1098,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_context_event_impact(context_event_guid, impacted_element_guid, body)
         )
 
@@ -1198,8 +1186,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_link_context_event_timeline_effect(
                 timeline_affected_element_guid, context_event_guid, body
             )
@@ -1283,8 +1270,7 @@ class TimeKeeper(ServerClient):
         }
         ```
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_context_event_timeline_effect(
                 timeline_affected_element_guid, context_event_guid, body
             )
@@ -1440,8 +1426,7 @@ class TimeKeeper(ServerClient):
         if name is None and body is None:
             name = "*"
 
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_context_events_by_name(
                 name=name,
                 metadata_element_type_name=metadata_element_type_name,
@@ -1619,8 +1604,7 @@ class TimeKeeper(ServerClient):
         -------
         List | str
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_context_events(
                 search_string=search_string,
                 starts_with=starts_with,
@@ -1743,8 +1727,7 @@ class TimeKeeper(ServerClient):
         PyegeriaException
             If there are issues in communications, message format, or Egeria errors.
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_get_context_event_by_guid(
                 guid=guid,
                 include_only_relationships=include_only_relationships,
@@ -369,8 +369,7 @@ class ValidMetadataManager(ServerClient):
             }
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_setup_valid_metadata_value(property_name, type_name, body)
         )
         return
@@ -485,8 +484,7 @@ class ValidMetadataManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_setup_valid_metadata_map_name(property_name, type_name, body)
         )
         return
@@ -600,8 +598,7 @@ class ValidMetadataManager(ServerClient):
           "isCaseSensitive": false,
         }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_setup_valid_metadata_map_value(
                 property_name, map_name, type_name, body
             )
@@ -674,8 +671,7 @@ class ValidMetadataManager(ServerClient):
 
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_valid_metadata_value(
                 property_name, type_name, preferred_value
             )
@@ -754,8 +750,7 @@ class ValidMetadataManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_valid_metadata_map_name(
                 property_name, type_name, map_name
             )
@@ -822,8 +817,7 @@ class ValidMetadataManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_clear_valid_metadata_map_value(
                 property_name, type_name, map_name, preferred_value
             )
@@ -896,8 +890,7 @@ class ValidMetadataManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_validate_metadata_value(
                 property_name, type_name, actual_value
             )
@@ -970,8 +963,7 @@ class ValidMetadataManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_validate_metadata_map_name(property_name, type_name, map_name)
         )
         return response
@@ -1046,8 +1038,7 @@ class ValidMetadataManager(ServerClient):
 
         """
 
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_validate_metadata_map_value(
                 property_name, type_name, map_name, actual_value
             )
@@ -1139,8 +1130,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_valid_metadata_value(
                 property_name, type_name, preferred_value, output_format=output_format, report_spec=report_spec
             )
@@ -1232,8 +1222,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_valid_metadata_map_name(property_name, type_name, map_name,
                                                     output_format=output_format, report_spec=report_spec)
         )
@@ -1332,8 +1321,7 @@ class ValidMetadataManager(ServerClient):
             map_name ():
 
         """
-        loop = asyncio.get_event_loop()
-        response = loop.run_until_complete(
+        response = self._run_sync(
             self._async_get_valid_metadata_map_value(property_name, type_name, preferred_value, map_name,
                                                      output_format=output_format, report_spec=report_spec)
         )
@@ -1453,8 +1441,7 @@ class ValidMetadataManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_valid_metadata_values(
                 property_name, type_name, start_from, page_size, output_format=output_format, report_spec=report_spec
             )
@@ -1582,8 +1569,7 @@ class ValidMetadataManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_consistent_metadata_values(
                 property_name,
                 type_name,
@@ -1707,8 +1693,7 @@ class ValidMetadataManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_set_consistent_metadata_values(property_name1, type_name1, map_name1, preferred_value1,
                                                        property_name2, type_name2, map_name2, preferred_value2)
         )
@@ -1802,8 +1787,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_get_all_entity_types(get_inherited_attributes=get_inherited_attributes,
+        resp = self._run_sync(self._async_get_all_entity_types(get_inherited_attributes=get_inherited_attributes,
                                                                         get_relationship_attributes=get_relationship_attributes,
                                                                         output_format=output_format,
                                                                         report_spec=report_spec))
@@ -1887,8 +1871,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_get_all_entity_defs(get_inherited_attributes=get_inherited_attributes,
+        resp = self._run_sync(self._async_get_all_entity_defs(get_inherited_attributes=get_inherited_attributes,
                                                                        get_relationship_attributes=get_relationship_attributes,
                                                                        output_format=output_format,
                                                                        report_spec=report_spec))
@@ -1972,8 +1955,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_get_all_relationship_defs(get_inherited_attributes=get_inherited_attributes,
+        resp = self._run_sync(self._async_get_all_relationship_defs(get_inherited_attributes=get_inherited_attributes,
                                                                              get_relationship_attributes=get_relationship_attributes,
                                                                              output_format=output_format,
                                                                              report_spec=report_spec))
@@ -2057,8 +2039,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_get_all_classification_defs(get_inherited_attributes=get_inherited_attributes,
+        resp = self._run_sync(self._async_get_all_classification_defs(get_inherited_attributes=get_inherited_attributes,
                                                                                get_relationship_attributes=get_relationship_attributes,
                                                                                output_format=output_format,
                                                                                report_spec=report_spec))
@@ -2131,8 +2112,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_get_attribute_types(category=category,
+        resp = self._run_sync(self._async_get_attribute_types(category=category,
                                                                         output_format=output_format,
                                                                         report_spec=report_spec))
         return resp
@@ -2225,8 +2205,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_sub_types(type_name,
                                       get_inherited_attributes=get_inherited_attributes,
                                       get_relationship_attributes=get_relationship_attributes,
@@ -2318,8 +2297,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_valid_relationship_types(entity_type,
                                                      get_inherited_attributes=get_inherited_attributes,
                                                      get_relationship_attributes=get_relationship_attributes,
@@ -2413,8 +2391,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(
+        resp = self._run_sync(
             self._async_get_valid_classification_types(entity_type,
                                                        get_inherited_attributes=get_inherited_attributes,
                                                        get_relationship_attributes=get_relationship_attributes,
@@ -2508,8 +2485,7 @@ class ValidMetadataManager(ServerClient):
         PyegeriaException
 
         """
-        loop = asyncio.get_event_loop()
-        resp = loop.run_until_complete(self._async_get_typedef_by_name(name=name,
+        resp = self._run_sync(self._async_get_typedef_by_name(name=name,
                                                                        get_inherited_attributes=get_inherited_attributes,
                                                                        get_relationship_attributes=get_relationship_attributes,
                                                                        output_format=output_format,
@@ -2630,8 +2606,7 @@ class ValidMetadataManager(ServerClient):
               }
             }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_setup_specification_property(element_guid, body)
         )
 
@@ -2715,8 +2690,7 @@ class ValidMetadataManager(ServerClient):
                   "forDuplicateProcessing": false
                 }
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_delete_specification_property(spec_property_guid, body, cascade)
         )
 
@@ -2805,8 +2779,7 @@ class ValidMetadataManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(self._async_link_specification_property(element_guid, vv_def_guid, body))
+        self._run_sync(self._async_link_specification_property(element_guid, vv_def_guid, body))
 
     @dynamic_catch
     async def _async_detach_specification_property(
@@ -2893,8 +2866,7 @@ class ValidMetadataManager(ServerClient):
         }
 
         """
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(
+        self._run_sync(
             self._async_detach_specification_property(element_guid, vv_def_guid, body, cascade_delete))
 
     @dynamic_catch
@@ -3095,8 +3067,7 @@ class ValidMetadataManager(ServerClient):
           The principle specified by the user_id does not have authorization for the requested action
 
         """
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(
+        return self._run_sync(
             self._async_find_specification_property(
                 search_string=search_string,
                 graph_query_depth=graph_query_depth,
@@ -3231,7 +3202,7 @@ class ValidMetadataManager(ServerClient):
               "sequencingProperty": ""
             }
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_specification_property_by_type(spec_property_type, body, start_from, page_size,
                                                  output_format, report_spec))
     @dynamic_catch
@@ -3358,7 +3329,7 @@ class ValidMetadataManager(ServerClient):
 
             """
 
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_specification_property_by_name(name=name, start_from=start_from, page_size=page_size,
                                                            category=category, classification_names=classification_names,
                                                            graph_query_depth=graph_query_depth,
@@ -3467,7 +3438,7 @@ class ValidMetadataManager(ServerClient):
               "forDuplicateProcessing": false
             }
         """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_specification_property_by_guid(guid=guid, element_type=element_type, body=body,
                                                graph_query_depth=graph_query_depth,
                                                output_format=output_format, report_spec=report_spec, **kwargs))
@@ -3551,7 +3522,7 @@ class ValidMetadataManager(ServerClient):
                "forDuplicateProcessing": false
              }
              """
-        return asyncio.get_event_loop().run_until_complete(
+        return self._run_sync(
             self._async_get_specification_property_types(output_format, report_spec))
 
 
@@ -1,20 +1,30 @@
 """
 View module for pyegeria, containing output formatters and mermaid utilities.
+
+The helpers are imported the first time they are used (see pyegeria._lazy).
 """
-from pyegeria.view.mermaid_utilities import (
-    construct_mermaid_web,
-    construct_mermaid_jup,
-    load_mermaid,
-    render_mermaid,
-    save_mermaid_html,
-    save_mermaid_graph,
-)
-from pyegeria.view.output_formatter import (
-    generate_output,
-    resolve_output_formats,
-    populate_common_columns,
+from pyegeria._lazy import lazy_exports
+
+# Public name -> defining module, imported on first use.
+_LAZY_EXPORTS = {
+    "construct_mermaid_web": "pyegeria.view.mermaid_utilities",
+    "construct_mermaid_jup": "pyegeria.view.mermaid_utilities",
+    "load_mermaid": "pyegeria.view.mermaid_utilities",
+    "render_mermaid": "pyegeria.view.mermaid_utilities",
+    "save_mermaid_html": "pyegeria.view.mermaid_utilities",
+    "save_mermaid_graph": "pyegeria.view.mermaid_utilities",
+    "generate_output": "pyegeria.view.output_formatter",
+    "iter_output": "pyegeria.view.output_formatter",
+    "aiter_output": "pyegeria.view.output_formatter",
+    "write_output": "pyegeria.view.output_formatter",
+    "async_write_output": "pyegeria.view.output_formatter",
+    "resolve_output_formats": "pyegeria.view.output_formatter",
+    "populate_common_columns": "pyegeria.view.output_formatter",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
-)
 __all__ = [
     "construct_mermaid_web",
     "construct_mermaid_jup",
@@ -23,6 +33,10 @@ __all__ = [
     "save_mermaid_html",
     "save_mermaid_graph",
     "generate_output",
+    "iter_output",
+    "aiter_output",
+    "write_output",
+    "async_write_output",
     "resolve_output_formats",
     "populate_common_columns",
 ]
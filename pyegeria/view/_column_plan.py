@@ -0,0 +1,203 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Compiled column extractors for output_formatter.
+
+Rendering a report spec touches every column of every element, and the column lookups used to
+redo the same string work per row: converting each snake_case key to camelCase, splitting and
+converting dot paths, and re-reading a column's enum `valid_values`. A ColumnPlan does that work
+once per report spec and output format:
+
+* each column's key candidates (as given, camelCase, UPPER) and whether it is the GUID;
+* dot paths pre-split into (part, camelCase part) steps;
+* `valid_values` turned into a single int -> label map.
+
+generate_output's entity renderers compile the plan before their row loop and hand it to the
+extractors inside the per-row columns_struct (under "_column_plan"), so populate_common_columns
+and populate_columns_from_properties run a tight loop over precomputed ColumnSpecs. Extractors
+that reshape the attribute list still work: a column that no longer lines up with its spec is
+compiled on the fly.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+from pyegeria.models import to_camel_case
+
+PLAN_KEY = "_column_plan"
+_PLAN_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=4096)
+def camel_key(key: str) -> str:
+    """to_camel_case, memoized - report column keys come from a small, fixed vocabulary."""
+    return to_camel_case(key)
+
+
+@lru_cache(maxsize=1024)
+def dot_path_steps(path: str) -> tuple[tuple[str, str], ...]:
+    """Split a dot path into (part, camelCase part) steps."""
+    return tuple((part, camel_key(part)) for part in path.split("."))
+
+
+def resolve_steps(element: Any, steps: tuple[tuple[str, str], ...]) -> Any:
+    """Follow pre-split dot-path steps through nested dicts; None if the path cannot be fully resolved."""
+    if not isinstance(element, dict) or not steps:
+        return None
+    current = element
+    for part, part_camel in steps:
+        if not isinstance(current, dict):
+            return None
+        if part in current:
+            current = current[part]
+        elif part_camel in current:
+            current = current[part_camel]
+        else:
+            return None
+    return current
+
+
+def _column_attr(column: Any, name: str, default: Any = None) -> Any:
+    if isinstance(column, dict):
+        return column.get(name, default)
+    return getattr(column, name, default)
+
+
+def _enum_map(valid_values: Any) -> Optional[dict]:
+    if not valid_values:
+        return None
+    if isinstance(valid_values, list):
+        return dict(enumerate(valid_values))
+    if isinstance(valid_values, dict):
+        mapping = {k: v for k, v in valid_values.items() if isinstance(k, int) and v is not None}
+        for k, v in valid_values.items():
+            # String keys win, as JSON-loaded specs carry them ("0", "1", ...)
+            if isinstance(k, str) and v is not None and k.lstrip("-").isdigit():
+                mapping[int(k)] = v
+        return mapping or None
+    return None
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Precomputed lookup data for one report column."""
+    key: str
+    name: Any
+    key_camel: str
+    candidates: tuple[str, ...]
+    is_guid: bool
+    steps: Optional[tuple[tuple[str, str], ...]]
+    enum: Optional[dict]
+    format: Any
+    detail_spec: Any
+
+    def map_enum(self, value: Any) -> Any:
+        """Replace an int value by its label when the column declares valid_values."""
+        if self.enum is not None and isinstance(value, int):
+            return self.enum.get(value, value)
+        return value
+
+
+def compile_column(column: Any) -> ColumnSpec:
+    """Compile one column (dict or Column) into a ColumnSpec."""
+    key = _column_attr(column, "key") or ""
+    key_camel = camel_key(key) if key else ""
+    candidates = tuple(dict.fromkeys(c for c in (key, key_camel, key.upper()) if c))
+    return ColumnSpec(
+        key=key,
+        name=_column_attr(column, "name"),
+        key_camel=key_camel,
+        candidates=candidates,
+        is_guid=key.lower() == "guid",
+        steps=dot_path_steps(key) if "." in key else None,
+        enum=_enum_map(_column_attr(column, "valid_values")),
+        format=_column_attr(column, "format"),
+        detail_spec=_column_attr(column, "detail_spec"),
+    )
+
+
+class ColumnPlan:
+    """The compiled columns of one report spec and output format, in display order."""
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: tuple[ColumnSpec, ...]):
+        self.columns = columns
+
+    def __repr__(self):
+        return f"ColumnPlan({[c.key for c in self.columns]})"
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    # Plans are immutable and shared; copying a columns_struct must not copy them.
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def spec(self, index: int, column: Any) -> ColumnSpec:
+        """Return the spec for `column` at `index`, compiling it if the attribute list was reshaped."""
+        if index < len(self.columns):
+            spec = self.columns[index]
+            if spec.key == (_column_attr(column, "key") or ""):
+                return spec
+        return compile_column(column)
+
+    def bind(self, columns_struct: dict) -> dict:
+        """Return a shallow copy of `columns_struct` carrying this plan for the extractors."""
+        return {**columns_struct, PLAN_KEY: self}
+
+
+def _attributes(columns_struct: Optional[dict]) -> list:
+    if not isinstance(columns_struct, dict):
+        return []
+    formats = columns_struct.get("formats") or {}
+    attributes = formats.get("attributes") if isinstance(formats, dict) else None
+    return attributes if isinstance(attributes, list) else []
+
+
+def _signature(column: Any) -> tuple:
+    fmt = _column_attr(column, "format")
+    valid_values = _column_attr(column, "valid_values")
+    return (_column_attr(column, "key"), _column_attr(column, "name"), repr(fmt) if fmt else None,
+            _column_attr(column, "detail_spec"), repr(valid_values) if valid_values else None)
+
+
+_plan_cache: OrderedDict[tuple, ColumnPlan] = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+def compile_columns(columns_struct: Optional[dict], output_format: str = None) -> ColumnPlan:
+    """
+    Return the ColumnPlan for `columns_struct`'s attributes, cached per
+    (report spec, output format, column definitions).
+    """
+    attributes = _attributes(columns_struct)
+    spec_name = columns_struct.get("_report_spec_name") if isinstance(columns_struct, dict) else None
+    cache_key = (spec_name, output_format, tuple(_signature(col) for col in attributes))
+    with _plan_cache_lock:
+        plan = _plan_cache.get(cache_key)
+        if plan is not None:
+            _plan_cache.move_to_end(cache_key)
+            return plan
+    plan = ColumnPlan(tuple(compile_column(col) for col in attributes))
+    with _plan_cache_lock:
+        _plan_cache[cache_key] = plan
+        while len(_plan_cache) > _PLAN_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+    return plan
+
+
+def plan_for(columns_struct: Optional[dict]) -> ColumnPlan:
+    """Return the plan bound to `columns_struct` by a renderer, or compile one."""
+    if isinstance(columns_struct, dict):
+        plan = columns_struct.get(PLAN_KEY)
+        if isinstance(plan, ColumnPlan):
+            return plan
+    return compile_columns(columns_struct)
@@ -0,0 +1,194 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Cache of historical metric points for overview_metrics' trend functions.
+
+`growth_series` and `metric_trend` rebuild a time series by re-running a metric once per
+`asOfTime` snapshot. A snapshot in the past never changes, yet every refresh of a 12-point
+trend used to recompute all 12 of them. A MetricPointCache remembers each historical point,
+keyed by:
+
+    (client scope, metric, normalized parameters, asOfTime)
+
+where the client scope is the platform URL, view server and user the metric ran against. Only
+points with an `asOfTime` are cached - the "now" point is always recomputed - and the trend
+functions place historical snapshots on a fixed time grid so the same `asOfTime` values recur
+from one refresh to the next.
+
+Points never expire. The in-memory LRU is bounded by `maxsize`; an optional SQLite file
+(`path`) keeps the points between runs and processes, so a dashboard restart still only
+recomputes the newest point.
+
+Caching is opt-in: enable it with the `metric_point_cache_enabled` setting
+(PYEGERIA_METRIC_POINT_CACHE_ENABLED) and set `metric_point_cache_path`
+(PYEGERIA_METRIC_POINT_CACHE_PATH) to persist it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from loguru import logger
+
+from pyegeria.core.config import runtime_setting
+
+# (client scope, metric, normalized parameters, asOfTime)
+PointKey = tuple[str, str, str, str]
+
+_MISSING = object()
+
+
+def metric_point_caching_enabled() -> bool:
+    """True when historical metric points may be served from the MetricPointCache."""
+    return bool(runtime_setting("metric_point_cache_enabled", False))
+
+
+def metric_point_key(scope: str, metric: str, params: Optional[dict], as_of: str) -> PointKey:
+    """Build the cache key for one historical point; `params` are the metric's own arguments."""
+    normalized = json.dumps(params or {}, sort_keys=True, default=str)
+    return (scope or "", metric, normalized, as_of)
+
+
+class MetricPointCache:
+    """
+    LRU cache of historical metric points, optionally backed by SQLite.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Points kept in memory. Defaults to `metric_point_cache_size` (PYEGERIA_METRIC_POINT_CACHE_SIZE).
+    path : str, optional
+        SQLite file for keeping points between runs. Defaults to `metric_point_cache_path`;
+        empty keeps the cache in memory only.
+    """
+
+    def __init__(self, maxsize: int = None, path: str = None):
+        self.maxsize = max(1, int(maxsize or runtime_setting("metric_point_cache_size", 4096)))
+        self.path = runtime_setting("metric_point_cache_path", "") if path is None else path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[PointKey, Any] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        if self.path:
+            self._db = self._open_db(os.path.expanduser(self.path))
+
+    def __repr__(self):
+        return f"MetricPointCache(size={len(self._entries)}, maxsize={self.maxsize}, path={self.path!r})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: PointKey, default: Any = None) -> Any:
+        """Return the cached point for `key`, or `default` if it has not been computed yet."""
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is _MISSING and self._db is not None:
+                value = self._db_lookup(key)
+                if value is not _MISSING:
+                    self._put(key, value)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def store(self, key: PointKey, value: Any) -> None:
+        """Remember the point for `key`. None (a failed computation) is never cached."""
+        if value is None:
+            return
+        with self._lock:
+            self._put(key, value)
+            if self._db is not None:
+                self._db_execute("INSERT OR REPLACE INTO metric_points VALUES (?, ?, ?, ?, ?)",
+                                 (*key, json.dumps(value, default=str)))
+
+    def invalidate(self, scope: str = None, metric: str = None) -> int:
+        """
+        Drop cached points - all of them, or only those for the given client scope and/or
+        metric. Returns the number of in-memory points dropped.
+        """
+        with self._lock:
+            stale = [key for key in self._entries
+                     if (scope is None or key[0] == scope) and (metric is None or key[1] == metric)]
+            for key in stale:
+                del self._entries[key]
+            if self._db is not None:
+                self._db_execute("DELETE FROM metric_points WHERE (? IS NULL OR scope = ?) AND (? IS NULL OR metric = ?)",
+                                 (scope, scope, metric, metric))
+        return len(stale)
+
+    def clear(self) -> None:
+        """Empty the cache, including its SQLite backing."""
+        self.invalidate()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size, for diagnostics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    #
+    #   Internals - callers hold the lock
+    #
+
+    def _put(self, key: PointKey, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _open_db(path: str) -> sqlite3.Connection | None:
+        try:
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("CREATE TABLE IF NOT EXISTS metric_points (scope TEXT, metric TEXT, params TEXT, "
+                       "as_of TEXT, value TEXT, PRIMARY KEY (scope, metric, params, as_of))")
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Metric point cache file '{path}' unavailable ({e}); caching in memory only")
+            return None
+
+    def _db_lookup(self, key: PointKey) -> Any:
+        try:
+            row = self._db.execute("SELECT value FROM metric_points WHERE scope = ? AND metric = ? "
+                                   "AND params = ? AND as_of = ?", key).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Metric point cache read failed: {e}")
+            return _MISSING
+        return json.loads(row[0]) if row else _MISSING
+
+    def _db_execute(self, sql: str, params: tuple) -> None:
+        try:
+            self._db.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.debug(f"Metric point cache write failed: {e}")
+
+
+_default_point_cache: MetricPointCache | None = None
+_default_point_cache_lock = threading.Lock()
+
+
+def get_metric_point_cache() -> MetricPointCache:
+    """Return the process-wide MetricPointCache, creating it on first use."""
+    global _default_point_cache
+    with _default_point_cache_lock:
+        if _default_point_cache is None:
+            _default_point_cache = MetricPointCache()
+        return _default_point_cache
+
+
+def set_metric_point_cache(cache: MetricPointCache | None) -> None:
+    """Replace the process-wide MetricPointCache (None resets it to a fresh default on next use)."""
+    global _default_point_cache
+    with _default_point_cache_lock:
+        _default_point_cache = cache
@@ -0,0 +1,156 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Local time-series store of overview_metrics KPI results.
+
+`metric_trend` reconstructs history by re-running a metric against Egeria with `asOfTime`
+queries, one per snapshot - expensive on the repository, and repeated by every dashboard that
+draws a trend. A MetricSnapshotStore instead records what a metric returned *at the time*: a
+collector (`overview_metrics.collect_metric_snapshots`, run from cron, or
+`run_metric_collector` in-process) stores each KPI result with its timestamp, keyed by:
+
+    (client scope, metric, normalized parameters)
+
+and `metric_trend` reads each historical point as the latest recording at or before the
+snapshot time (within one snapshot step), only falling back to an `asOfTime` query for
+points the store has no recording for. Trend charts become local reads; the repository sees
+one periodic collector instead.
+
+The store is an SQLite file, enabled by setting `metric_snapshot_store_path`
+(PYEGERIA_METRIC_SNAPSHOT_STORE_PATH). Old recordings are dropped with `prune()`.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from loguru import logger
+
+from pyegeria.core.config import runtime_setting
+
+
+def _params_key(params: Optional[dict]) -> str:
+    return json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class MetricSnapshotStore:
+    """
+    SQLite-backed store of timestamped metric results.
+
+    Parameters
+    ----------
+    path : str
+        SQLite file holding the recordings; ":memory:" keeps them for this process only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path if path == ":memory:" else os.path.expanduser(path),
+                                   check_same_thread=False, isolation_level=None)
+        self._db.execute("CREATE TABLE IF NOT EXISTS metric_snapshots (scope TEXT, metric TEXT, params TEXT, "
+                         "taken_at REAL, value TEXT, PRIMARY KEY (scope, metric, params, taken_at))")
+
+    def __repr__(self):
+        return f"MetricSnapshotStore(path={self.path!r})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM metric_snapshots").fetchone()[0]
+
+    def record(self, scope: str, metric: str, params: Optional[dict], value: Any, taken_at: float = None) -> None:
+        """Record `value` as the result of `metric` at `taken_at` (epoch seconds, default now). None is not recorded."""
+        if value is None:
+            return
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO metric_snapshots VALUES (?, ?, ?, ?, ?)",
+                             (scope or "", metric, _params_key(params),
+                              time.time() if taken_at is None else float(taken_at), json.dumps(value, default=str)))
+
+    def value_at(self, scope: str, metric: str, params: Optional[dict], at: float,
+                 tolerance: float = None) -> Any:
+        """
+        Return the latest value recorded at or before `at` (epoch seconds) - no older than
+        `tolerance` seconds before it, if given - or None when there is no such recording.
+        """
+        sql = ("SELECT value FROM metric_snapshots WHERE scope = ? AND metric = ? AND params = ? "
+               "AND taken_at <= ?")
+        args = [scope or "", metric, _params_key(params), float(at)]
+        if tolerance is not None:
+            sql += " AND taken_at >= ?"
+            args.append(float(at) - float(tolerance))
+        with self._lock:
+            try:
+                row = self._db.execute(sql + " ORDER BY taken_at DESC LIMIT 1", args).fetchone()
+            except sqlite3.Error as e:
+                logger.debug(f"Metric snapshot store read failed: {e}")
+                return None
+        return json.loads(row[0]) if row else None
+
+    def series(self, scope: str, metric: str, params: Optional[dict] = None,
+               since: float = None, until: float = None) -> list[tuple[float, Any]]:
+        """Return the recordings of `metric` as (taken_at, value) pairs, oldest first."""
+        sql = "SELECT taken_at, value FROM metric_snapshots WHERE scope = ? AND metric = ? AND params = ?"
+        args: list = [scope or "", metric, _params_key(params)]
+        if since is not None:
+            sql += " AND taken_at >= ?"
+            args.append(float(since))
+        if until is not None:
+            sql += " AND taken_at <= ?"
+            args.append(float(until))
+        with self._lock:
+            rows = self._db.execute(sql + " ORDER BY taken_at", args).fetchall()
+        return [(taken_at, json.loads(value)) for taken_at, value in rows]
+
+    def metrics(self, scope: str = None) -> list[str]:
+        """Return the names of the metrics with recordings - for `scope` only, if given."""
+        with self._lock:
+            if scope is None:
+                rows = self._db.execute("SELECT DISTINCT metric FROM metric_snapshots ORDER BY metric").fetchall()
+            else:
+                rows = self._db.execute("SELECT DISTINCT metric FROM metric_snapshots WHERE scope = ? "
+                                        "ORDER BY metric", (scope,)).fetchall()
+        return [row[0] for row in rows]
+
+    def prune(self, before: float) -> int:
+        """Drop recordings taken before `before` (epoch seconds). Returns the number dropped."""
+        with self._lock:
+            return self._db.execute("DELETE FROM metric_snapshots WHERE taken_at < ?", (float(before),)).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_default_store: MetricSnapshotStore | None = None
+_default_store_lock = threading.Lock()
+
+
+def get_metric_snapshot_store() -> MetricSnapshotStore | None:
+    """
+    Return the process-wide MetricSnapshotStore on `metric_snapshot_store_path`, opening it
+    on first use, or None when no store is configured.
+    """
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            path = runtime_setting("metric_snapshot_store_path", "")
+            if not path:
+                return None
+            try:
+                _default_store = MetricSnapshotStore(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Metric snapshot store '{path}' unavailable ({e})")
+                return None
+        return _default_store
+
+
+def set_metric_snapshot_store(store: MetricSnapshotStore | None) -> None:
+    """Replace the process-wide MetricSnapshotStore (None re-reads `metric_snapshot_store_path` on next use)."""
+    global _default_store
+    with _default_store_lock:
+        _default_store = store
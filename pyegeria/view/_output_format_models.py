@@ -245,6 +245,9 @@ class ActionParameter(BaseModel):
         analytic_spec_params: Parameters fixed for this action, for `analytic_function`
             (from `extra_constraints`) -- layered under whatever arbitrary
             parameters the caller supplies at execution time.
+        cache_ttl: Seconds a result of this report may be served from the report result
+            cache (pyegeria.view._report_cache) when `report_cache_enabled` is on. None
+            falls back to the `report_cache_default_ttl` setting; 0 never caches.
     """
     function: str
     required_params: List[str] = Field(default_factory=list)
@@ -252,6 +255,7 @@ class ActionParameter(BaseModel):
     spec_params: Dict[str, Any] = Field(default_factory=dict)
     analytic_function: Optional[str] = None
     analytic_spec_params: Dict[str, Any] = Field(default_factory=dict)
+    cache_ttl: Optional[float] = None
 
     @root_validator(pre=True)
     def _migrate_legacy_user_params(cls, values):
@@ -469,22 +473,27 @@ class FormatSetDict(Dict[str, FormatSet]):
         Returns:
             FormatSet: The format set if found, otherwise the default value
         """
+        label = self.label_for(key)
+        return super().get(label) if label is not None else default
+
+    def label_for(self, key) -> Optional[str]:
+        """
+        Return the name under which the format set called `key` is stored, resolving
+        space/dash variants and aliases, or None if there is no such format set.
+        """
         # First try to find by name (key)
-        format_set = super().get(key, None)
-        
+        if super().__contains__(key):
+            return key
+
         # Second try: normalize spaces to dashes (e.g., 'Business Imperative-DrE' -> 'Business-Imperative-DrE')
-        if format_set is None and isinstance(key, str) and " " in key:
-            format_set = super().get(key.replace(" ", "-"), None)
-        
+        if isinstance(key, str) and " " in key and super().__contains__(key.replace(" ", "-")):
+            return key.replace(" ", "-")
+
         # If not found by name/normalized name, try to find by alias
-        if format_set is None:
-            for value in self.values():
-                if key in value.aliases:
-                    format_set = value
-                    break
-        
-        # Return the format set if found, otherwise the default value
-        return format_set if format_set is not None else default
+        for label, value in self.items():
+            if key in value.aliases:
+                return label
+        return None
     
     def get(self, key, default=None):
         """
@@ -0,0 +1,148 @@
+"""
+SPDX-License-Identifier: Apache-2.0
+Copyright Contributors to the ODPi Egeria project.
+
+Result cache for report specs run through format_set_executor.
+
+A dashboard that polls the same report panels every few seconds used to re-query Egeria and
+re-render the output on every poll, although nothing had changed. A ReportResultCache keeps
+the normalized result of a report run - the raw DICT/JSON data or the rendered MD/HTML text,
+whichever output format was asked for - keyed by:
+
+    (view server, platform URL, user, report spec, output format, normalized parameters)
+
+Caching is opt-in twice over: the `report_cache_enabled` setting (PYEGERIA_REPORT_CACHE_ENABLED)
+must be on, and the report spec must declare how long its results stay fresh with the
+`cache_ttl` field of its action (or `report_cache_default_ttl` must be set). Callers bypass the
+cache for a single run with `use_cache=False`, and drop stale entries with `invalidate()` after
+changing the metadata a report shows.
+
+Cached results are shared between callers; treat them as read-only.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from pyegeria.core.config import runtime_setting
+
+ReportKey = tuple[str, str, str, str, str, str]
+
+
+def report_cache_ttl(action: Optional[dict]) -> float:
+    """
+    Return the seconds a result of the report spec with `action` may be served from cache,
+    or 0 when its results must not be cached (caching disabled, or no TTL declared).
+    """
+    if not runtime_setting("report_cache_enabled", False):
+        return 0.0
+    ttl = (action or {}).get("cache_ttl")
+    if ttl is None:
+        ttl = runtime_setting("report_cache_default_ttl", 0.0)
+    return max(0.0, float(ttl or 0.0))
+
+
+def report_cache_key(report_name: str, output_format: str, params: dict, view_server: str,
+                     platform_url: str, user_id: str) -> ReportKey:
+    """Build the cache key for one report run; `params` are the normalized call parameters."""
+    normalized = json.dumps(params or {}, sort_keys=True, default=str)
+    return (view_server or "", platform_url or "", user_id or "", report_name, output_format.upper(), normalized)
+
+
+class ReportResultCache:
+    """
+    LRU cache of normalized report results, each entry expiring after its own TTL.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Results kept at once. Defaults to `report_cache_size` (PYEGERIA_REPORT_CACHE_SIZE).
+    """
+
+    def __init__(self, maxsize: int = None):
+        self.maxsize = max(1, int(maxsize or runtime_setting("report_cache_size", 256)))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ReportKey, tuple[dict, float]] = OrderedDict()
+
+    def __repr__(self):
+        return f"ReportResultCache(size={len(self._entries)}, maxsize={self.maxsize})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: ReportKey) -> Optional[dict]:
+        """Return the cached result for `key`, or None if there is no live entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            # A fresh envelope, so callers adding keys don't alter the cached entry.
+            return dict(entry[0])
+
+    def put(self, key: ReportKey, result: dict, ttl: float) -> None:
+        """Keep `result` for `ttl` seconds."""
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (dict(result), time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, report: str = None, view_server: str = None, user_id: str = None) -> int:
+        """
+        Drop cached results - all of them, or only those matching the given report spec name,
+        view server and/or user. Returns the number of entries dropped.
+        """
+        with self._lock:
+            stale = [key for key in self._entries
+                     if (report is None or key[3] == report)
+                     and (view_server is None or key[0] == view_server)
+                     and (user_id is None or key[2] == user_id)]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current size, for diagnostics."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+
+_default_report_cache: ReportResultCache | None = None
+_default_report_cache_lock = threading.Lock()
+
+
+def get_report_cache() -> ReportResultCache:
+    """Return the process-wide ReportResultCache, creating it on first use."""
+    global _default_report_cache
+    with _default_report_cache_lock:
+        if _default_report_cache is None:
+            _default_report_cache = ReportResultCache()
+        return _default_report_cache
+
+
+def set_report_cache(cache: ReportResultCache | None) -> None:
+    """Replace the process-wide ReportResultCache (None resets it to a fresh default on next use)."""
+    global _default_report_cache
+    with _default_report_cache_lock:
+        _default_report_cache = cache
+
+
+def invalidate_report_cache(report: str = None, view_server: str = None, user_id: str = None) -> int:
+    """Drop cached report results; see ReportResultCache.invalidate."""
+    return get_report_cache().invalidate(report=report, view_server=view_server, user_id=user_id)
@@ -79,6 +79,7 @@ This module may raise the following exceptions:
 
 import os
 import re as _re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Union
@@ -3470,6 +3471,8 @@ def load_report_specs(file_path: str, merge: bool = True) -> None:
             # Replace existing format sets
             report_specs = loaded_sets
             logger.info(f"Existing format sets replaced with format sets from {file_path}")
+        # An upsert merges into FormatSets the registry shares, possibly adding aliases.
+        _invalidate_report_registry()
     except Exception as e:
         logger.error(f"Error loading format sets from {file_path}: {e}")
         raise
@@ -3566,6 +3569,100 @@ class ReportFormatCollision(ValueError):
     pass
 
 
+def _fold(text) -> str:
+    return (text or "").strip().lower()
+
+
+class ReportRegistry(FormatSetDict):
+    """
+    The combined report-spec registry returned by get_report_registry(), with lookup indexes.
+
+    Built once per registry version: name and alias resolution, family filtering and
+    perspective lookups use indexes precomputed here instead of scanning every FormatSet.
+    The snapshot is shared by all callers and must be treated as read-only - add specs with
+    register_report_specs() so the registry is rebuilt.
+    """
+
+    def __init__(self, *args, version: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = version
+        self._build_index()
+
+    def _build_index(self) -> None:
+        self._aliases: dict[str, str] = {}
+        self._folded: dict[str, list[str]] = {}
+        self._families: dict[str, list[str]] = {}
+        self._perspectives: dict[str, list[str]] = {}
+        for label, fs in self.items():
+            self._folded.setdefault(_fold(label), []).append(label)
+            self._families.setdefault(_fold(getattr(fs, "family", None)), []).append(label)
+            for alias in getattr(fs, "aliases", []) or []:
+                self._aliases.setdefault(alias, label)
+            for item in getattr(fs, "question_spec", None) or []:
+                for perspective in getattr(item, "perspectives", []) or []:
+                    labels = self._perspectives.setdefault(_fold(perspective), [])
+                    if label not in labels:
+                        labels.append(label)
+        for alias, label in self._aliases.items():
+            folded = self._folded.setdefault(_fold(alias), [])
+            if label not in folded:
+                folded.append(label)
+
+    def label_for(self, key) -> Optional[str]:
+        """Return the label of the spec named `key` (label, dashed label or alias), or None."""
+        if not isinstance(key, str):
+            return super().label_for(key)
+        if dict.__contains__(self, key):
+            return key
+        if " " in key and dict.__contains__(self, key.replace(" ", "-")):
+            return key.replace(" ", "-")
+        return self._aliases.get(key)
+
+    def labels_matching(self, name: str) -> list[str]:
+        """Return the labels whose label or an alias equals `name`, ignoring case and outer whitespace."""
+        return list(self._folded.get(_fold(name), []))
+
+    def labels_for_perspective(self, perspective: str) -> list[str]:
+        """Return the labels whose question_spec names `perspective` (case-insensitive)."""
+        return list(self._perspectives.get(_fold(perspective), []))
+
+    def filter_by_family(self, family: str) -> dict[str, FormatSet]:
+        return {label: dict.__getitem__(self, label) for label in self._families.get(_fold(family), [])}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        if hasattr(self, "_aliases"):
+            self._build_index()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._build_index()
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._build_index()
+        return value
+
+
+# Cached combined registry; rebuilt only after a tier changes (see _invalidate_report_registry).
+_report_registry_snapshot: Optional[ReportRegistry] = None
+_report_registry_version = 0
+_report_registry_lock = threading.RLock()
+
+
+def _invalidate_report_registry() -> None:
+    """Drop the cached registry after the CONFIG or RUNTIME tier (or a spec in it) changed."""
+    global _report_registry_snapshot, _report_registry_version
+    with _report_registry_lock:
+        _report_registry_snapshot = None
+        _report_registry_version += 1
+
+
+def report_registry_version() -> int:
+    """Return a counter that changes whenever the report-spec registry is modified."""
+    return _report_registry_version
+
+
 def _add_with_collision_check(target: FormatSetDict, new: FormatSetDict, source: str) -> None:
     for label in new.keys():
         if label in target.keys():
@@ -3611,6 +3708,13 @@ def refresh_report_specs() -> None:
         (older, still supported for backward compat).
     Collisions across sources will raise ReportFormatCollision.
     """
+    try:
+        _load_config_report_specs()
+    finally:
+        _invalidate_report_registry()
+
+
+def _load_config_report_specs() -> None:
     global _CONFIG_REPORT_FORMATS
     _CONFIG_REPORT_FORMATS = FormatSetDict()
 
@@ -3658,6 +3762,10 @@ def get_report_registry() -> FormatSetDict:
     Enforce no duplicate labels across all sources. The CONFIG tier
     (`refresh_report_specs()`) is auto-loaded on first call -- no consumer
     needs to remember to call it explicitly.
+
+    The combined ReportRegistry is built once and reused until register_report_specs,
+    unregister_report_spec, clear_runtime_report_specs, refresh_report_specs,
+    load_report_specs or load_egeria_report_specs change a tier. Treat it as read-only.
     """
     global _config_report_specs_loaded
     if not _config_report_specs_loaded:
@@ -3667,12 +3775,19 @@ def get_report_registry() -> FormatSetDict:
         except Exception as exc:  # noqa: BLE001 -- a misconfigured entry shouldn't break the registry
             logger.warning(f"refresh_report_specs() failed during auto-load: {exc}")
 
-    combined = FormatSetDict()
-    _add_with_collision_check(combined, base_report_specs, source="BUILTINS")
-    _add_with_collision_check(combined, generated_format_sets, source="GENERATED")
-    _add_with_collision_check(combined, _CONFIG_REPORT_FORMATS, source="CONFIG")
-    _add_with_collision_check(combined, _RUNTIME_REPORT_FORMATS, source="RUNTIME")
-    return combined
+    global _report_registry_snapshot
+    snapshot = _report_registry_snapshot
+    if snapshot is not None:
+        return snapshot
+    with _report_registry_lock:
+        if _report_registry_snapshot is None:
+            combined = FormatSetDict()
+            _add_with_collision_check(combined, base_report_specs, source="BUILTINS")
+            _add_with_collision_check(combined, generated_format_sets, source="GENERATED")
+            _add_with_collision_check(combined, _CONFIG_REPORT_FORMATS, source="CONFIG")
+            _add_with_collision_check(combined, _RUNTIME_REPORT_FORMATS, source="RUNTIME")
+            _report_registry_snapshot = ReportRegistry(combined, version=_report_registry_version)
+        return _report_registry_snapshot
 
 
 def find_report_specs_by_perspective(perspective: str, *, case_insensitive: bool = True) -> list[dict]:
@@ -3695,12 +3810,11 @@ def find_report_specs_by_perspective(perspective: str, *, case_insensitive: bool
     norm = (lambda s: (s or "").strip().lower()) if case_insensitive else (lambda s: (s or "").strip())
     needle_cmp = norm(needle)
 
+    registry = get_report_registry()
     results: list[dict] = []
-    for label, fs in get_report_registry().items():
-        qspec = getattr(fs, "question_spec", None)
-        if not qspec:
-            continue
-        for item in qspec:
+    for label in registry.labels_for_perspective(needle):
+        fs = dict.__getitem__(registry, label)
+        for item in getattr(fs, "question_spec", None) or []:
             perspectives = getattr(item, "perspectives", []) or []
             if any(norm(p) == needle_cmp for p in perspectives):
                 questions = getattr(item, "questions", []) or []
@@ -3790,8 +3904,15 @@ def find_report_specs(
     quest_cmp = norm(question) if question else None
     rs_cmp = norm(report_spec) if report_spec else None
 
+    registry = get_report_registry()
+    candidates = registry.items()
+    if rs_cmp is not None and case_insensitive:
+        candidates = [(label, dict.__getitem__(registry, label)) for label in registry.labels_matching(report_spec)]
+    elif persp_cmp is not None and case_insensitive:
+        candidates = [(label, dict.__getitem__(registry, label)) for label in registry.labels_for_perspective(perspective)]
+
     results: list[dict] = []
-    for label, fs in get_report_registry().items():
+    for label, fs in candidates:
         # filter on report_spec by label or alias
         if rs_cmp is not None:
             label_match = norm(label) == rs_cmp
@@ -3855,14 +3976,18 @@ def register_report_specs(new_formats: Union[FormatSetDict, dict], *, source: st
                 f"Report format label '{label}' already exists; cannot register from {source}")
     for k, v in new_formats.items():
         _RUNTIME_REPORT_FORMATS[k] = v
+    _invalidate_report_registry()
 
 
 def unregister_report_spec(label: str) -> bool:
-    return bool(_RUNTIME_REPORT_FORMATS.pop(label, None))
+    removed = _RUNTIME_REPORT_FORMATS.pop(label, None)
+    _invalidate_report_registry()
+    return bool(removed)
 
 
 def clear_runtime_report_specs() -> None:
     _RUNTIME_REPORT_FORMATS.clear()
+    _invalidate_report_registry()
 
 
 def list_report_specs() -> list[str]:
@@ -3993,37 +4118,18 @@ def load_egeria_report_specs(
             )
             return False
 
-    # Paginate through all collections with "ReportType" in their qualified name.
-    # Use page_size=1000 (the platform maximum) to fetch all in as few calls as possible.
-    # Do NOT stop on `len(page) < _page_size` -- per Egeria's own paging contract
-    # (https://egeria-project.org/guides/developer/finding-metadata/overview/#paging),
-    # a short-but-nonempty page does not mean "last page": server-side filtering can
-    # legitimately shorten an individual page without ending the result set, and the
-    # documented termination signal is a genuinely empty/null result, not a short one.
-    # Confirmed live (2026-08-18, ISSUE-54 investigation) that a `Referenceable`-scoped
-    # find_metadata_elements page can come back well short of pageSize while thousands
-    # of further elements are still reachable at a later startFrom. Always advance by
-    # _page_size regardless of how many came back; the `if not page` check above is the
-    # only correct stop condition.
-    _page_size = 1000
-    _start = 0
+    # Page through all collections with "ReportType" in their qualified name. iter_find
+    # follows Egeria's paging contract
+    # (https://egeria-project.org/guides/developer/finding-metadata/overview/#paging):
+    # only an empty page ends the result set, never a short one (confirmed live 2026-08-18,
+    # ISSUE-54 investigation - server-side filtering can shorten a page while thousands of
+    # further elements are still reachable at a later startFrom).
     report_types: list = []
     try:
-        while True:
-            page = client.find_collections(
-                search_string="ReportType",
-                _type="Collection",
-                start_from=_start,
-                page_size=_page_size,
-            )
-            if not page or isinstance(page, str):
-                break
+        for r in client.iter_find("find_collections", search_string="ReportType", _type="Collection"):
             # Keep only entries whose qualified name contains "ReportType::"
-            report_types.extend(
-                r for r in page
-                if "ReportType::" in r.get("properties", {}).get("qualifiedName", "")
-            )
-            _start += _page_size
+            if "ReportType::" in r.get("properties", {}).get("qualifiedName", ""):
+                report_types.append(r)
     except Exception as e:
         logger.warning(f"load_egeria_report_specs: could not query Egeria — skipping: {e}")
         return False
@@ -4173,6 +4279,7 @@ def load_egeria_report_specs(
         except Exception as e:
             logger.warning(f"load_egeria_report_specs: error processing ReportType — skipping: {e}")
 
+    _invalidate_report_registry()
     _EGERIA_SPECS_LOADED_AT = datetime.now(timezone.utc)
     logger.debug(f"load_egeria_report_specs: registry updated, cache set at {_EGERIA_SPECS_LOADED_AT.isoformat()}")
     return True
@@ -4186,15 +4293,9 @@ def _select_from_registry(registry: FormatSetDict, kind: str, output_type: str)
         raise PyegeriaInvalidParameterException(context={"reason": reason})
 
     output_type = output_type.upper()
-    resolved_key = kind if kind in registry else None
-    element: Optional[FormatSet] = registry.get(kind)
-    if element is None:
-        # try aliases
-        for key, value in registry.items():
-            if kind in value.aliases:
-                element = value
-                resolved_key = key
-                break
+    # Resolves labels, space/dash variants and aliases (indexed on the cached ReportRegistry)
+    resolved_key = registry.label_for(kind)
+    element: Optional[FormatSet] = dict.get(registry, resolved_key) if resolved_key is not None else None
     if element is None:
         logger.debug(f"No matching report format found for kind='{kind}' and output type_name = '{output_type}'.")
         return None
@@ -4254,25 +4355,13 @@ def report_format_list() -> list[str]:
 
 
 def get_report_format_heading(fmt_name: str) -> Optional[str]:
-    reg = get_report_registry()
-    fs = reg.get(fmt_name)
-    if fs is None:
-        for k, v in reg.items():
-            if fmt_name in v.aliases:
-                return v.heading
-        return None
-    return fs.heading
+    fs = get_report_registry().get(fmt_name)
+    return fs.heading if fs is not None else None
 
 
 def get_report_format_description(fmt_name: str) -> Optional[str]:
-    reg = get_report_registry()
-    fs = reg.get(fmt_name)
-    if fs is None:
-        for k, v in reg.items():
-            if fmt_name in v.aliases:
-                return v.description
-        return None
-    return fs.description
+    fs = get_report_registry().get(fmt_name)
+    return fs.description if fs is not None else None
 
 
 # Legacy names remain available (no change to behavior) and can be deprecated later.
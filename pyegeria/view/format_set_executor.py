@@ -23,9 +23,10 @@ from loguru import logger
 from pydantic import ValidationError
 
 import importlib
+from pyegeria.core._client_pool import get_client_pool
 from pyegeria.core._globals import NO_ELEMENTS_FOUND
 from pyegeria.core.config import settings
-from pyegeria.core._exceptions import PyegeriaException, print_validation_error
+from pyegeria.core._exceptions import PyegeriaException, PyegeriaUnauthorizedException, print_validation_error
 from pyegeria.view.base_report_formats import (
     select_report_spec,
     get_report_spec_heading,
@@ -33,6 +34,7 @@ from pyegeria.view.base_report_formats import (
     get_report_registry,
 )
 from pyegeria.view.output_formatter import generate_output
+from pyegeria.view._report_cache import get_report_cache, report_cache_key, report_cache_ttl
 from pyegeria.view.analytic_registry import AnalyticActionSpec
 from pyegeria.egeria_tech_client import EgeriaTech
 
@@ -186,8 +188,7 @@ def _run_analytic_function(
     call_params.update({k: v for k, v in params.items() if v not in (None, "")})
 
     func = _resolve_analytic_function(func_decl)
-    client = EgeriaTech(view_server, view_url, user_id=user, user_pwd=user_pass)
-    client.create_egeria_bearer_token()
+    client = get_client_pool().get(EgeriaTech, view_server, view_url, user, user_pass)
     return func(*_bind_client_args(func, client), **call_params)
 
 
@@ -197,10 +198,12 @@ def _resolve_action_target_client(egeria_client: EgeriaTech, client_class: type)
         return egeria_client
 
     # Prefer an existing lazy-loaded subclient that exactly matches the declared class.
+    # EgeriaTech maps attribute names to dotted class paths, so compare by path as well.
     subclient_map = getattr(egeria_client, "_subclient_map", {})
     if isinstance(subclient_map, dict) and hasattr(egeria_client, "_get_subclient"):
+        class_path = f"{client_class.__module__}.{client_class.__qualname__}"
         for attr_name, sub_cls in subclient_map.items():
-            if sub_cls is client_class:
+            if sub_cls is client_class or sub_cls == class_path:
                 return egeria_client._get_subclient(attr_name)
 
     # Fallback for non-standard clients outside EgeriaTech's map.
@@ -353,6 +356,46 @@ def _validate_report_spec_params(report_spec, params):
         raise PyegeriaException(f"Missing required parameters: {', '.join(missing_params)}")
 
 
+def _shape_report_result(result: Any, report_name: str | dict, output_format: str, call_params: Dict[str, Any],
+                         safe_target_type: str, fmt: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap an action's raw result in the normalized shape returned by the report executors,
+    rendering narrative output formats through generate_output."""
+    if not result or result == NO_ELEMENTS_FOUND:
+        return {"kind": "empty"}
+
+    if output_format in {"DICT", "JSON", "ALL", "TABLE"}:
+        # Return raw data (list/dict/any) — do not stringify here; include TABLE to enable Rich rendering upstream
+        return {"kind": "json", "data": result}
+
+    # For narrative formats, try to use generate_output if the result is structured
+    if output_format in {"REPORT", "REPORT-GRAPH", "MD", "FORM", "LIST", "HTML", "MERMAID", "GRAPH"}:
+        if isinstance(result, (list, dict)):
+            result = generate_output(
+                elements=result,
+                search_string=call_params.get("search_string")
+                or call_params.get("filter_string")
+                or "All",
+                entity_type=safe_target_type,
+                output_format=output_format,
+                columns_struct=fmt,
+            )
+
+        # If it's already a string, it might have its own preamble.
+        # We only add our preamble if it doesn't look like it has one.
+        heading = get_report_spec_heading(report_name)
+        desc = get_report_spec_description(report_name)
+        preamble = f"# {heading}\n{desc}\n\n" if heading and desc else ""
+
+        content = str(result)
+        if preamble and not content.strip().startswith("#"):
+            content = preamble + content
+
+        mime = "text/html" if output_format in ["HTML", "GRAPH"] else "text/markdown"
+        return {"kind": "text", "mime": mime, "content": content}
+
+    return {"kind": "unknown", "raw": result}
+
+
 async def safe_call_tool(func, **call_params):
     """
     Safely calls a function, awaiting it only if it is an asynchronous coroutine.
@@ -383,6 +426,7 @@ async def _async_run_report(
     egeria_client: EgeriaTech,
     output_format: str = "DICT",
     params: Optional[Dict[str, Any]] = None,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
         Execute the action for a given format set and return a normalized result structure.
@@ -392,6 +436,10 @@ async def _async_run_report(
         - {"kind":"json","data": <list|dict|any>}
         - {"kind":"text","mime": "text/markdown"|"text/html","content": str}
         - {"kind":"unknown","raw": any}
+
+        When the report result cache is enabled and the report spec declares a `cache_ttl`,
+        a repeat run with the same parameters and user is answered from the cache; pass
+        `use_cache=False` to force a fresh query (the fresh result still refreshes the cache).
         """
     params = dict(params or {})
     user_name = egeria_client.user_id
@@ -417,12 +465,6 @@ async def _async_run_report(
         try:
             registry = get_report_registry()
             fs = registry.get(report_name)
-            if fs is None:
-                for key, v in registry.items():
-                    aliases = getattr(v, "aliases", []) or []
-                    if report_name in aliases:
-                        fs = v
-                        break
             if fs is not None:
                 seen = set()
                 for f in getattr(fs, "formats", []) or []:
@@ -456,6 +498,7 @@ async def _async_run_report(
     required_params = action.get("required_params", action.get("user_params", [])) or []
     optional_params = action.get("optional_params", []) or []
     spec_params = action.get("spec_params", {}) or {}
+    cache_ttl = report_cache_ttl(action)
     action_mode = _infer_action_mode(method_name)
     params = _normalize_report_params(params, action_mode=action_mode)
     # Build call params: required/optional provided by caller + fixed spec_params
@@ -522,42 +565,23 @@ async def _async_run_report(
         except Exception as auth_err:
             # Do not fail the entire call if token refresh fails; downstream call may still work
             logger.debug(f"Token creation/lookup issue: {auth_err}")
-        result = await func(**call_params)
-
-        if not result or result == NO_ELEMENTS_FOUND:
-            return {"kind": "empty"}
-
-        if output_format in {"DICT", "JSON", "ALL", "TABLE"}:
-            # Return raw data (list/dict/any) — do not stringify here; include TABLE to enable Rich rendering upstream
-            return {"kind": "json", "data": result}
+        cache_key = None
+        if cache_ttl:
+            cache_key = report_cache_key(
+                fmt.get("_report_spec_name") or report_name, output_format, call_params,
+                getattr(egeria_client, "view_server", ""), getattr(egeria_client, "platform_url", ""), user_name,
+            )
+            if use_cache:
+                cached = get_report_cache().get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Report '{report_name}' served from the report result cache.")
+                    return cached
 
-        # For narrative formats, try to use generate_output if the result is structured
-        if output_format in {"REPORT", "REPORT-GRAPH", "MD", "FORM", "LIST", "HTML", "MERMAID", "GRAPH"}:
-            if isinstance(result, (list, dict)):
-                result = generate_output(
-                    elements=result,
-                    search_string=call_params.get("search_string")
-                    or call_params.get("filter_string")
-                    or "All",
-                    entity_type=safe_target_type,
-                    output_format=output_format,
-                    columns_struct=fmt,
-                )
-
-            # If it's already a string, it might have its own preamble. 
-            # We only add our preamble if it doesn't look like it has one.
-            heading = get_report_spec_heading(report_name)
-            desc = get_report_spec_description(report_name)
-            preamble = f"# {heading}\n{desc}\n\n" if heading and desc else ""
-            
-            content = str(result)
-            if preamble and not content.strip().startswith("#"):
-                content = preamble + content
-
-            mime = "text/html" if output_format in ["HTML", "GRAPH"] else "text/markdown"
-            return {"kind": "text", "mime": mime, "content": content}
-
-        return {"kind": "unknown", "raw": result}
+        result = await func(**call_params)
+        shaped = _shape_report_result(result, report_name, output_format, call_params, safe_target_type, fmt)
+        if cache_key is not None:
+            get_report_cache().put(cache_key, shaped, cache_ttl)
+        return shaped
 
     except PyegeriaException as e:
         # Re-raise with a simpler message for upstream mapping
@@ -692,6 +716,7 @@ def exec_report_spec(
     view_url: str = settings.Environment.egeria_view_server_url,
     user: str = settings.User_Profile.user_name,
     user_pass: str = settings.User_Profile.user_pwd,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Execute the action for a given format set and return a normalized result structure.
@@ -701,6 +726,9 @@ def exec_report_spec(
     - {"kind":"json","data": <list|dict|any>}
     - {"kind":"text","mime": "text/markdown"|"text/html","content": str}
     - {"kind":"unknown","raw": any}
+
+    Results of find-style report specs declaring a `cache_ttl` are served from the report
+    result cache when it is enabled; `use_cache=False` bypasses it for this run.
     """
     output_format = (output_format or "DICT").upper()
     params = _normalize_report_params(dict(params or {}), action_mode="find")
@@ -736,12 +764,6 @@ def exec_report_spec(
         try:
             registry = get_report_registry()
             fs = registry.get(format_set_name)
-            if fs is None:
-                for key, v in registry.items():
-                    aliases = getattr(v, "aliases", []) or []
-                    if format_set_name in aliases:
-                        fs = v
-                        break
             if fs is not None:
                 seen = set()
                 for f in getattr(fs, "formats", []) or []:
@@ -811,53 +833,39 @@ def exec_report_spec(
     call_params["report_spec"] = format_set_name
 
     client_class, method_name = _resolve_client_and_method(func_decl)
-    client = client_class(view_server, view_url, user_id=user, user_pwd=user_pass)
+    # Pooled: repeated report runs reuse the client and its bearer token (see _client_pool.py).
+    client = get_client_pool().get(client_class, view_server, view_url, user, user_pass)
 
     try:
-        client.create_egeria_bearer_token()
         func = getattr(client, method_name) if method_name and hasattr(client, method_name) else None
         if func is None:
             raise AttributeError(
                 f"Method '{method_name}' not found in client class '{client_class.__name__}'."
             )
 
-        result = func(**call_params)
-
-        if not result or result == NO_ELEMENTS_FOUND:
-            return {"kind": "empty"}
-
-        if output_format in {"DICT", "JSON", "ALL", "TABLE"}:
-            # Return raw data (list/dict/any) — do not stringify here
-            return {"kind": "json", "data": result}
-
-        # For narrative formats, try to use generate_output if the result is structured
-        if output_format in {"REPORT", "REPORT-GRAPH", "MD", "FORM", "LIST", "HTML", "MERMAID", "GRAPH"}:
-            if isinstance(result, (list, dict)):
-                result = generate_output(
-                    elements=result,
-                    search_string=call_params.get("search_string")
-                    or call_params.get("filter_string")
-                    or "All",
-                    entity_type=safe_target_type,
-                    output_format=output_format,
-                    columns_struct=fmt,
-                )
-
-            # If it's already a string, it might have its own preamble. 
-            # We only add our preamble if it doesn't look like it has one.
-            heading = get_report_spec_heading(format_set_name)
-            desc = get_report_spec_description(format_set_name)
-            preamble = f"# {heading}\n{desc}\n\n" if heading and desc else ""
-            
-            content = str(result)
-            if preamble and not content.strip().startswith("#"):
-                content = preamble + content
-
-            mime = "text/html" if output_format in ["HTML", "GRAPH"] else "text/markdown"
-            return {"kind": "text", "mime": mime, "content": content}
-
-        return {"kind": "unknown", "raw": result}
+        cache_key = None
+        cache_ttl = report_cache_ttl(action)
+        if cache_ttl:
+            cache_key = report_cache_key(
+                fmt.get("_report_spec_name") or str(format_set_name), output_format, call_params,
+                view_server, view_url, user,
+            )
+            if use_cache:
+                cached = get_report_cache().get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Report '{format_set_name}' served from the report result cache.")
+                    return cached
 
+        result = func(**call_params)
+        shaped = _shape_report_result(result, format_set_name, output_format, call_params, safe_target_type, fmt)
+        if cache_key is not None:
+            get_report_cache().put(cache_key, shaped, cache_ttl)
+        return shaped
+
+    except PyegeriaUnauthorizedException:
+        # Don't hand a client with rejected credentials to the next report run.
+        get_client_pool().discard(client)
+        raise
     except PyegeriaException as e:
         # Re-raise with a simpler message for upstream mapping
         raise
@@ -867,9 +875,3 @@ def exec_report_spec(
     except ValueError as e:
         import traceback
         traceback.print_exc()
-
-    finally:
-        try:
-            client.close_session()
-        except Exception:
-            pass
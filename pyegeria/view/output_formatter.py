@@ -15,11 +15,15 @@ Functions in this module may raise the following exceptions:
 - RuntimeError: Failures in Markdown/HTML conversion or Mermaid rendering helpers.
 """
 
+import asyncio
 import copy
 from datetime import datetime
+import json
 import os
 import re
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import threading
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, TextIO,
+                    Tuple, Union)
 
 from pyegeria.core._globals import MERMAID_GRAPH_TITLES, MERMAID_GRAPHS
 from pyegeria.core.utils import (camel_to_title_case, get_item_display_name)
@@ -30,6 +34,7 @@ from loguru import logger
 
 from pyegeria.view.mermaid_utilities import construct_mermaid_web
 from pyegeria.view.base_report_formats import select_report_format, MD_SEPARATOR, get_report_spec_match
+from pyegeria.view._column_plan import camel_key, compile_columns, dot_path_steps, plan_for, resolve_steps
 from pyegeria.models import to_camel_case
 
 # Flag to control whether Mermaid graphs are normalized for broad compatibility (e.g. Obsidian, PyCharm).
@@ -153,24 +158,7 @@ def _resolve_dot_path(element: dict, path: str) -> Any:
     """
     if not isinstance(element, dict) or not path:
         return None
-        
-    parts = path.split('.')
-    current = element
-    
-    for part in parts:
-        if isinstance(current, dict):
-            if part in current:
-                current = current[part]
-            else:
-                part_camel = to_camel_case(part)
-                if part_camel in current:
-                    current = current[part_camel]
-                else:
-                    return None
-        else:
-            return None
-            
-    return current
+    return resolve_steps(element, dot_path_steps(path))
 
 
 def _get_element_value(element: dict, key: str) -> Any:
@@ -199,11 +187,11 @@ def _get_element_value(element: dict, key: str) -> Any:
         if key in properties:
             return properties.get(key)
 
-        key_camel = to_camel_case(key)
+        key_camel = camel_key(key)
         if key_camel in properties:
             return properties.get(key_camel)
 
-    key_camel = to_camel_case(key)
+    key_camel = camel_key(key)
     if key_camel in element:
         return element.get(key_camel)
 
@@ -847,81 +835,36 @@ def populate_columns_from_properties(element: dict, columns_struct: dict) -> dic
     if not isinstance(columns, list):
         return columns_struct
 
-    # Pre-compute snake_case to camelCase mapping for all columns
-    key_mapping = {}
-    for col in columns:
-        key_snake = col.get('key') if isinstance(col, dict) else getattr(col, 'key', None)
-        if key_snake:
-            key_mapping[key_snake] = to_camel_case(key_snake)
-
-    # Single pass to populate values
-    for col in columns:
+    # Key candidates, enum maps etc. come precompiled from the report spec's ColumnPlan
+    plan = plan_for(columns_struct)
+    nested = props is not element
+    for index, col in enumerate(columns):
         try:
-            key_snake = col.get('key') if isinstance(col, dict) else getattr(col, 'key', None)
-            if not key_snake:
+            spec = plan.spec(index, col)
+            if not spec.key:
                 continue
-            
-            # Helper to set value in col
-            def set_col_value(val):
-                # Apply Enum mapping if valid_values is present
-                valid_values = col.get('valid_values') if isinstance(col, dict) else getattr(col, 'valid_values', None)
-                if valid_values and isinstance(val, int):
-                    if isinstance(valid_values, list):
-                        if 0 <= val < len(valid_values):
-                            val = valid_values[val]
-                    elif isinstance(valid_values, dict):
-                        # Try string key first (JSON usually has string keys)
-                        mapped = valid_values.get(str(val))
-                        if mapped is None:
-                            mapped = valid_values.get(val)
-                        if mapped is not None:
-                            val = mapped
 
+            # Try the key as given (handles already camelCased keys like assignmentType), then
+            # camelCase, then uppercase (GUID) - each in the properties, then the root element
+            val = None
+            for candidate in spec.candidates:
+                val = props.get(candidate)
+                if val is None and nested:
+                    val = element.get(candidate)
+                if val is not None:
+                    break
+
+            # GUID lives in elementHeader, not in properties
+            if val is None and spec.is_guid:
+                val = element.get('elementHeader', {}).get('guid')
+
+            if val is not None:
+                val = spec.map_enum(val)
                 if isinstance(col, dict):
                     col['value'] = val
                 else:
                     setattr(col, 'value', val)
 
-            # 1) Try original key (handles already camelCased keys like assignmentType)
-            val = props.get(key_snake)
-            # Fallback to root element if not found in nested properties
-            if val is None and props is not element:
-                val = element.get(key_snake)
-
-            if val is not None:
-                set_col_value(val)
-                continue
-
-            # 2) Try pre-computed camelCase key
-            key_camel = key_mapping.get(key_snake)
-            if key_camel:
-                val = props.get(key_camel)
-                # Fallback to root element if not found in nested properties
-                if val is None and props is not element:
-                    val = element.get(key_camel)
-                
-                if val is not None:
-                    set_col_value(val)
-                    continue
-            
-            # 3) Try uppercase (handles GUID if it was extracted as GUID)
-            key_upper = key_snake.upper()
-            val = props.get(key_upper)
-            # Fallback to root element if not found in nested properties
-            if val is None and props is not element:
-                val = element.get(key_upper)
-
-            if val is not None:
-                set_col_value(val)
-                continue
-
-            # 4) GUID lives in elementHeader, not in properties
-            if key_snake.lower() in ('guid',):
-                val = element.get('elementHeader', {}).get('guid')
-                if val is not None:
-                    set_col_value(val)
-                    continue
-
         except Exception as e:
             # Be resilient; log and continue
             logger.debug(f"populate_columns_from_properties: skipping column due to error: {e}")
@@ -967,7 +910,7 @@ def populate_feedback(element: dict, columns_struct: dict) -> dict:
             if not key_snake:
                 continue
             # Convert the snake_case key to camelCase to look up in properties
-            key_camel = to_camel_case(key_snake)
+            key_camel = camel_key(key_snake)
             if key_camel in props:
                 col['value'] = props.get(key_camel)
         except Exception as e:
@@ -1021,7 +964,7 @@ def get_required_relationships(element: dict, columns_struct: dict) -> dict:
         if col.get('value') not in (None, ""):
             continue
             
-        key_camel = to_camel_case(key_snake)
+        key_camel = camel_key(key_snake)
         if key_camel not in element:
             continue
 
@@ -1077,26 +1020,53 @@ def generate_entity_md(elements: List[Dict],
     Returns:
         str: Markdown representation
     """
+    return "".join(iter_entity_md(elements, elements_action, output_format, entity_type,
+                                  extract_properties_func, get_additional_props_func, columns_struct))
+
+
+def iter_entity_md(elements: Iterable[Dict],
+                   elements_action: str,
+                   output_format: str,
+                   entity_type: str,
+                   extract_properties_func: Callable,
+                   get_additional_props_func: Optional[Callable] = None,
+                   columns_struct: [dict] = None) -> Iterator[str]:
+    """
+    Generator form of generate_entity_md: yields the markdown one element section at a time.
+
+    `elements` may be any iterable (e.g. the iterator returned by iter_find), so a section is
+    rendered, yielded and released before the next element is read.
+
+    Yields:
+        str: Markdown chunks (heading, element sections and the separators between them)
+    """
     heading = columns_struct.get("heading")
     if heading == "Default Base Attributes":
-        elements_md = "### Reporting on Default Base Attributes - Perhaps couldn't find a valid combination of report_spec and output_format?\n\n"
-    else:
-        elements_md = ""
+        yield "### Reporting on Default Base Attributes - Perhaps couldn't find a valid combination of report_spec and output_format?\n\n"
     base_columns = columns_struct['formats'].get('attributes') if columns_struct else None
+    # Compile the column lookups once; every row's extractor reuses the plan
+    bound_struct = compile_columns(columns_struct, output_format).bind(columns_struct) if columns_struct is not None else None
 
+    # A separator goes between element sections; with a streamed iterable we only know there is
+    # a next element once it arrives, so it is emitted ahead of that element
+    pending_separator = False
     for element in elements:
+        if pending_separator:
+            yield MD_SEPARATOR
+            pending_separator = False
         if not isinstance(element, dict):
             if isinstance(element, str):
-                elements_md += element
+                yield element
             continue
         guid = element.get('elementHeader', {}).get('guid')
+        element_md = ""
 
         # Prefer new behavior: extractor returns an updated columns_struct with values
         returned_struct = None
         local_columns_struct = None
         if columns_struct is not None:
             # Use shallow copy and reset only column values for performance
-            local_columns_struct = columns_struct.copy()
+            local_columns_struct = bound_struct.copy()
             if 'formats' in local_columns_struct and 'attributes' in local_columns_struct['formats']:
                 # Create new list of columns with reset values
                 local_columns_struct['formats'] = local_columns_struct['formats'].copy()
@@ -1146,12 +1116,12 @@ def generate_entity_md(elements: List[Dict],
 
         # Format header based on output format
         if output_format in ['FORM', 'MD']:
-            elements_md += f"## {elements_action}\n\n"
-            elements_md += f"### {entity_type} Name \n\n{display_name}\n\n"
+            element_md += f"## {elements_action}\n\n"
+            element_md += f"### {entity_type} Name \n\n{display_name}\n\n"
         elif output_format == 'REPORT':
-            elements_md += f'<a id="{(guid or props.get("GUID") or "No GUID" )}"></a>\n## {entity_type} Name: {display_name}\n\n'
+            element_md += f'<a id="{(guid or props.get("GUID") or "No GUID" )}"></a>\n## {entity_type} Name: {display_name}\n\n'
         else:
-            elements_md += f"### {entity_type} Name \n\n{display_name}\n\n"
+            element_md += f"### {entity_type} Name \n\n{display_name}\n\n"
 
         # Add attributes based on column spec if available, otherwise, add all (legacy)
         if returned_struct is not None:
@@ -1167,7 +1137,7 @@ def generate_entity_md(elements: List[Dict],
                 if column.get('format'):
                     value = format_for_markdown_table(value, guid)
                 
-                elements_md += make_md_attribute(name, value, output_format, attribute_key=key)
+                element_md += make_md_attribute(name, value, output_format, attribute_key=key)
 
                 # Master-Detail support for REPORT, MD, and FORM formats
                 if detail_spec and value and output_format in ['REPORT', 'MD', 'FORM']:
@@ -1176,8 +1146,8 @@ def generate_entity_md(elements: List[Dict],
                         # Resolve the linked spec
                         detail_struct = select_report_format(detail_spec, 'REPORT')
                         if detail_struct:
-                            elements_md += f"\n#### {name} Details\n\n"
-                            elements_md += generate_output(
+                            element_md += f"\n#### {name} Details\n\n"
+                            element_md += generate_output(
                                 elements=values_list,
                                 search_string="",
                                 entity_type=detail_struct.get('target_type') or name,
@@ -1186,14 +1156,14 @@ def generate_entity_md(elements: List[Dict],
                                 columns_struct=detail_struct,
                                 include_preamble=False,
                             )
-                            elements_md += "\n"
+                            element_md += "\n"
             # wikilinks are Obsidian-style backlinks meant for human-readable
             # markdown documents (REPORT/MD/FORM) only - TABLE/DICT callers
             # don't route through this branch of generate_output at all
             # (see the DICT/TABLE dispatch above), but guard explicitly here
             # too since this function can in principle be called directly.
             if output_format in ('REPORT', 'MD', 'FORM') and (wk := returned_struct.get("annotations", {}).get("wikilinks", None)):
-                elements_md += ", ".join(wk)
+                element_md += ", ".join(wk)
         elif base_columns:
             # If we have columns but extractor didn't return struct, use legacy props lookup
             for column in base_columns:
@@ -1206,9 +1176,9 @@ def generate_entity_md(elements: List[Dict],
                     value = additional_props[key]
                 if column.get('format'):
                     value = format_for_markdown_table(value, guid or props.get('GUID'))
-                elements_md += make_md_attribute(name, value, output_format, attribute_key=key)
+                element_md += make_md_attribute(name, value, output_format, attribute_key=key)
             if output_format in ('REPORT', 'MD', 'FORM') and (wk := columns_struct.get("annotations", {}).get("wikilinks", None)):
-                elements_md += ", ".join(wk)
+                element_md += ", ".join(wk)
         else:
             # Legacy path without columns: dump all props
             for key, value in props.items():
@@ -1217,14 +1187,12 @@ def generate_entity_md(elements: List[Dict],
                 if key not in ['properties', 'display_name']:
                     if key == 'mermaid' and value == '':
                         continue
-                    elements_md += make_md_attribute(key.replace('_', ' '), value, output_format, attribute_key=key)
+                    element_md += make_md_attribute(key.replace('_', ' '), value, output_format, attribute_key=key)
             for key, value in additional_props.items():
-                elements_md += make_md_attribute(key.replace('_', ' '), value, output_format, attribute_key=key)
-
-        if element != elements[-1]:
-            elements_md += MD_SEPARATOR
+                element_md += make_md_attribute(key.replace('_', ' '), value, output_format, attribute_key=key)
 
-    return elements_md
+        yield element_md
+        pending_separator = True
 
 def _get_column_attribute(column: Union[dict, Any], attribute_name: str, default: Any = None) -> Any:
     """Helper to safely access column attributes from either dict or Column object."""
@@ -1254,6 +1222,26 @@ def generate_entity_md_table(elements: List[Dict],
     Returns:
         str: Markdown table
     """
+    return "".join(iter_entity_md_table(elements, search_string, entity_type, extract_properties_func,
+                                        columns_struct, get_additional_props_func, output_format))
+
+
+def iter_entity_md_table(elements: Iterable[Dict],
+                         search_string: str,
+                         entity_type: str,
+                         extract_properties_func: Callable,
+                         columns_struct: dict,
+                         get_additional_props_func: Optional[Callable] = None,
+                         output_format: str = 'LIST') -> Iterator[str]:
+    """
+    Generator form of generate_entity_md_table: yields the table heading, then one row at a time.
+
+    Detail sections for columns with a `detail_spec` follow the table, so they are held back
+    until the last row has been yielded; specs without detail columns hold nothing back.
+
+    Yields:
+        str: Markdown chunks (heading and header rows, table rows, detail sections)
+    """
     # Handle pluralization - if entity_type ends with 'y', use 'ies' instead of 's'
     target_type = columns_struct.get('target_type') or entity_type or "Referenceable"
     # if target_type.endswith('y'):
@@ -1283,8 +1271,11 @@ def generate_entity_md_table(elements: List[Dict],
 
     elements_md += header_row + "\n"
     elements_md += separator_row + "\n"
+    yield elements_md
 
     details_md = ""
+    # Compile the column lookups once; every row's extractor reuses the plan
+    bound_struct = compile_columns(columns_struct, output_format).bind(columns_struct)
 
     for element in elements:
         if not isinstance(element, dict):
@@ -1293,7 +1284,7 @@ def generate_entity_md_table(elements: List[Dict],
 
         # Extractor returns columns_struct with values when possible
         # Use shallow copy and reset only column values for performance
-        local_columns_struct = columns_struct.copy()
+        local_columns_struct = bound_struct.copy()
         if 'formats' in local_columns_struct and 'attributes' in local_columns_struct['formats']:
             # Create new list of columns with reset values
             local_columns_struct['formats'] = local_columns_struct['formats'].copy()
@@ -1400,7 +1391,7 @@ def generate_entity_md_table(elements: List[Dict],
 
                 row += f"{value} | "
 
-        elements_md += row + "\n"
+        yield row + "\n"
 
         # After the row, append queued detail sections
         for anchor_id, col_disp, spec_name, values_list in pending_details:
@@ -1424,8 +1415,8 @@ def generate_entity_md_table(elements: List[Dict],
                     include_preamble=False,
                 )
 
-    elements_md += details_md
-    return elements_md
+    if details_md:
+        yield details_md
 
 
 def generate_entity_dict(elements: List[Dict], 
@@ -1450,11 +1441,28 @@ def generate_entity_dict(elements: List[Dict],
     Returns:
         list: List of entity dictionaries
     """
-    result = []
+    return list(iter_entity_dict(elements, extract_properties_func, get_additional_props_func,
+                                 include_keys, exclude_keys, columns_struct, output_format))
+
+
+def iter_entity_dict(elements: Iterable[Dict],
+                     extract_properties_func: Callable,
+                     get_additional_props_func: Optional[Callable] = None,
+                     include_keys: Optional[List[str]] = None,
+                     exclude_keys: Optional[List[str]] = None,
+                     columns_struct: dict = None,
+                     output_format: str = 'DICT') -> Iterator[Dict]:
+    """
+    Generator form of generate_entity_dict: yields one entity dictionary per element.
+
+    Yields:
+        dict: The entity dictionary for each element, as generate_entity_dict would list it
+    """
+    # Compile the column lookups once; every row's extractor reuses the plan
+    bound_struct = compile_columns(columns_struct, output_format).bind(columns_struct) if columns_struct is not None else None
 
     #####
     # Add attributes based on column spec if available, otherwise, add all
-    import copy
     for element in elements:
         if not isinstance(element, dict):
             continue
@@ -1464,7 +1472,7 @@ def generate_entity_dict(elements: List[Dict],
         # Use shallow copy and reset only column values for performance
         local_columns_struct = None
         if columns_struct is not None:
-            local_columns_struct = columns_struct.copy()
+            local_columns_struct = bound_struct.copy()
             if 'formats' in local_columns_struct and 'attributes' in local_columns_struct['formats']:
                 # Create new list of columns with reset values
                 local_columns_struct['formats'] = local_columns_struct['formats'].copy()
@@ -1566,7 +1574,7 @@ def generate_entity_dict(elements: List[Dict],
                 if (include_keys is None or key in include_keys) and (exclude_keys is None or key not in exclude_keys):
                     entity_dict[key] = value
 
-        result.append(entity_dict)
+        yield entity_dict
     #####
     # for element in elements:
     #     if element is None:
@@ -1595,8 +1603,6 @@ def generate_entity_dict(elements: List[Dict],
     #
     #     result.append(entity_dict)
 
-    return result
-
 def resolve_output_formats(entity_type: str,
                            output_format: str,
                            report_spec: Optional[Union[str, dict]] = None,
@@ -1697,19 +1703,22 @@ def populate_common_columns(
     # Pre-compute mermaid value
     mermaid_val = element.get(mermaid_source_key, '') or ''
     
+    # Per-column camelCase keys and dot paths come precompiled from the report spec's ColumnPlan
+    plan = plan_for(columns_struct)
+
     # Pre-compute relationship values for efficiency
     relationship_values = {}
     if include_relationships:
         formats = columns_struct.get('formats') or {}
         columns = formats.get('attributes') if isinstance(formats, dict) else None
         if isinstance(columns, list):
-            for col in columns:
+            for index, col in enumerate(columns):
                 if not isinstance(col, dict):
                     continue
                 key_snake = col.get('key')
                 if not key_snake:
                     continue
-                key_camel = to_camel_case(key_snake)
+                key_camel = plan.spec(index, col).key_camel
                 if key_camel in element:
                     top_val = element.get(key_camel)
                     derived_value = ""
@@ -1739,7 +1748,7 @@ def populate_common_columns(
     columns_list = col_data.get('formats', {}).get('attributes', [])
     header = element.get('elementHeader', {}) if isinstance(element, dict) else {}
     
-    for column in columns_list:
+    for index, column in enumerate(columns_list):
         if not isinstance(column, dict):
             continue
         
@@ -1750,21 +1759,23 @@ def populate_common_columns(
         # Skip if already has a value
         if column.get('value') not in (None, ""):
             continue
-        
+
+        spec = plan.spec(index, column)
+
         # 0) Dot notation path resolution
-        if "." in key:
-            val = _resolve_dot_path(element, key)
+        if spec.steps is not None:
+            val = resolve_steps(element, spec.steps)
             if val is None:
-                val = _resolve_dot_path(props, key)
+                val = resolve_steps(props, spec.steps)
             if val is None:
-                val = _resolve_dot_path(header, key)
+                val = resolve_steps(header, spec.steps)
             
             if val is not None:
                 column['value'] = val
                 continue
                 
         # 1) Try properties (camelCase conversion)
-        key_camel = to_camel_case(key)
+        key_camel = spec.key_camel
         if key_camel in props:
             column['value'] = props.get(key_camel)
             continue
@@ -2207,6 +2218,31 @@ def generate_linked_graph_report(
     return "\n".join(lines)
 
 
+def _resolve_output_args(extract_properties_func: Optional[Callable], search_string: Optional[str],
+                         columns_struct: Optional[dict], entity_type: str, output_format: str,
+                         kwargs: dict) -> Tuple[Callable, str, Optional[dict], str]:
+    """Apply generate_output's defaults: extractor, search string, Default report spec and target type."""
+    if extract_properties_func is None:
+        extract_properties_func = _extract_referenceable_properties
+
+    if search_string is None:
+        search_string = kwargs.get('filter_string')
+
+    columns = columns_struct['formats'].get('attributes',None) if columns_struct else None
+    if not columns:
+        columns_struct = select_report_format("Default",output_format)
+        if columns_struct:
+            columns = columns_struct.get('formats', {}).get('attributes', None)
+
+    target_type = (columns_struct.get('target_type') if columns_struct else None) or entity_type or "Referenceable"
+
+    # Handle empty search string
+    if search_string is None or search_string == '':
+        search_string = "All"
+
+    return extract_properties_func, search_string, columns_struct, target_type
+
+
 def generate_output(elements: Union[Dict, List[Dict]],
                search_string: Optional[str] = None,
                entity_type: str = "Referenceable",
@@ -2233,28 +2269,13 @@ def generate_output(elements: Union[Dict, List[Dict]],
     Returns:
         Formatted output as string or list of dictionaries
     """
-    if extract_properties_func is None:
-        extract_properties_func = _extract_referenceable_properties
-
-    if search_string is None:
-        search_string = kwargs.get('filter_string')
-
-    columns = columns_struct['formats'].get('attributes',None) if columns_struct else None
-    if not columns:
-        columns_struct = select_report_format("Default",output_format)
-        if columns_struct:
-            columns = columns_struct.get('formats', {}).get('attributes', None)
-
-    target_type = (columns_struct.get('target_type') if columns_struct else None) or entity_type or "Referenceable"
+    extract_properties_func, search_string, columns_struct, target_type = _resolve_output_args(
+        extract_properties_func, search_string, columns_struct, entity_type, output_format, kwargs)
 
     # Ensure elements is a list
     if isinstance(elements, dict):
         elements = [elements]
 
-    # Handle empty search string
-    if search_string is None or search_string == '':
-        search_string = "All"
-
     # Set the output format to DICT to return values to table display
     # if output_format == "TABLE":
     #     output_format = "DICT"
@@ -2313,3 +2334,198 @@ def generate_output(elements: Union[Dict, List[Dict]],
         )
 
         return elements_md
+
+
+# Output formats whose renderers emit one element at a time; the others (HTML, MERMAID, JSON,
+# REPORT-GRAPH) need the whole element list and are rendered in one piece.
+STREAMED_OUTPUT_FORMATS = ('DICT', 'TABLE', 'LIST', 'MD', 'FORM', 'REPORT')
+
+
+def iter_output(elements: Union[Dict, Iterable[Dict]],
+                search_string: Optional[str] = None,
+                entity_type: str = "Referenceable",
+                output_format: str = "DICT",
+                extract_properties_func: Optional[Callable] = None,
+                get_additional_props_func: Optional[Callable] = None,
+                columns_struct: dict = None,
+                include_preamble: bool = True,
+                **kwargs) -> Iterator[Union[str, dict]]:
+    """
+    Streaming form of generate_output: yield the output incrementally instead of building it in memory.
+
+    `elements` may be any iterable - for example the iterator returned by `iter_find` - so an
+    export never holds the whole raw result set and its whole rendering at the same time.
+    Joining the yielded strings (or listing the yielded dicts) gives what generate_output returns.
+
+    Args:
+        elements: Dictionary or iterable of dictionaries containing element data
+        search_string: The search string used to find the elements
+        entity_type: The type of entity (e.g., "Glossary", "Term", "Category")
+        output_format: The desired output format (MD, FORM, REPORT, LIST, DICT, TABLE, MERMAID, HTML)
+        extract_properties_func: Function to extract properties from an element
+        get_additional_props_func: Optional function to get additional properties
+        columns_struct: Optional report specification structure
+        include_preamble: Whether to include the report header/preamble
+        **kwargs: Additional arguments, including potential 'filter_string'
+
+    Yields:
+        dict for DICT/TABLE (one per element); markdown str chunks for MD/FORM/REPORT/LIST.
+        Other formats are not streamable and yield generate_output's result as a single chunk
+        (or, for JSON, the elements themselves).
+    """
+    if isinstance(elements, dict):
+        elements = [elements]
+
+    if output_format not in STREAMED_OUTPUT_FORMATS:
+        result = generate_output(elements=list(elements), search_string=search_string, entity_type=entity_type,
+                                 output_format=output_format, extract_properties_func=extract_properties_func,
+                                 get_additional_props_func=get_additional_props_func,
+                                 columns_struct=columns_struct, include_preamble=include_preamble, **kwargs)
+        if isinstance(result, list):
+            yield from result
+        else:
+            yield result
+        return
+
+    extract_properties_func, search_string, columns_struct, target_type = _resolve_output_args(
+        extract_properties_func, search_string, columns_struct, entity_type, output_format, kwargs)
+
+    if output_format in ('DICT', 'TABLE'):
+        yield from iter_entity_dict(elements, extract_properties_func, get_additional_props_func,
+                                    columns_struct=columns_struct, output_format=output_format)
+    elif output_format == 'LIST':
+        yield from iter_entity_md_table(elements, search_string, entity_type, extract_properties_func,
+                                        columns_struct, get_additional_props_func, output_format=output_format)
+    else:  # MD, FORM, REPORT
+        elements_action = "Details"
+        if include_preamble:
+            preamble, elements_action = make_preamble(
+                obj_type=target_type,
+                search_string=search_string,
+                output_format=output_format
+            )
+            if preamble:
+                yield preamble
+        yield from iter_entity_md(
+            elements=elements,
+            elements_action=elements_action,
+            output_format=output_format,
+            entity_type=target_type,
+            extract_properties_func=extract_properties_func,
+            get_additional_props_func=get_additional_props_func,
+            columns_struct=columns_struct
+        )
+
+
+_STREAM_DONE = object()
+
+
+async def aiter_output(elements: Union[AsyncIterable[Dict], Iterable[Dict]],
+                       output_format: str = "DICT",
+                       queue_size: int = 64,
+                       **kwargs) -> AsyncIterator[Union[str, dict]]:
+    """
+    Streaming form of generate_output for async element sources, such as `aiter_find`. Async version.
+
+    The chunks are those of iter_output, which takes the remaining keyword arguments. Rendering is
+    CPU-bound, so it runs in a worker thread that pulls elements from `elements` on this event loop;
+    at most `queue_size` rendered chunks wait for the consumer, which makes this suitable for feeding
+    an HTTP streaming response without holding the whole report.
+
+    Yields:
+        dict for DICT/TABLE; markdown str chunks for MD/FORM/REPORT/LIST (see iter_output)
+    """
+    if not hasattr(elements, "__aiter__"):
+        for chunk in iter_output(elements, output_format=output_format, **kwargs):
+            yield chunk
+        return
+
+    loop = asyncio.get_running_loop()
+    source = elements.__aiter__()
+    chunks: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+    stopped = threading.Event()
+
+    def pull() -> Iterator[Dict]:
+        while not stopped.is_set():
+            try:
+                yield asyncio.run_coroutine_threadsafe(source.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+
+    def render() -> None:
+        try:
+            for chunk in iter_output(pull(), output_format=output_format, **kwargs):
+                asyncio.run_coroutine_threadsafe(chunks.put(chunk), loop).result()
+                if stopped.is_set():
+                    return
+            outcome = _STREAM_DONE
+        except BaseException as e:
+            outcome = e
+        if not stopped.is_set():
+            asyncio.run_coroutine_threadsafe(chunks.put(outcome), loop).result()
+
+    worker = loop.run_in_executor(None, render)
+    try:
+        while True:
+            chunk = await chunks.get()
+            if chunk is _STREAM_DONE:
+                break
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        # The consumer may stop early; release a worker blocked on a full queue and let it exit
+        stopped.set()
+        while not chunks.empty():
+            chunks.get_nowait()
+        await worker
+
+
+def _json_array_chunks(items: Iterable[Any]) -> Iterator[str]:
+    """Encode `items` as a JSON array, one element at a time."""
+    yield "["
+    first = True
+    for item in items:
+        yield ("\n" if first else ",\n") + json.dumps(item, default=str)
+        first = False
+    yield "\n]\n" if not first else "]\n"
+
+
+def write_output(elements: Union[Dict, Iterable[Dict]], out: TextIO, output_format: str = "DICT",
+                 **kwargs) -> None:
+    """
+    Render `elements` with iter_output and write the chunks to the text file handle `out` as they are produced.
+
+    DICT/TABLE output is written as a JSON array of the entity dictionaries; the other formats are
+    written as the rendered text. The remaining keyword arguments are passed to iter_output.
+
+    Example:
+        with open("catalog.md", "w") as fh:
+            write_output(client.iter_find("find_assets", output_format="JSON"), fh,
+                         output_format="REPORT", columns_struct=spec)
+    """
+    chunks = iter_output(elements, output_format=output_format, **kwargs)
+    if output_format in ('DICT', 'TABLE', 'JSON'):
+        chunks = _json_array_chunks(chunks)
+    for chunk in chunks:
+        out.write(chunk if isinstance(chunk, str) else str(chunk))
+
+
+async def async_write_output(elements: Union[AsyncIterable[Dict], Iterable[Dict]], out: TextIO,
+                             output_format: str = "DICT", **kwargs) -> None:
+    """Render `elements` with aiter_output and write the chunks to `out` as they are produced. Async version.
+
+    Output is the same as write_output; `elements` may be an async iterable such as aiter_find's.
+    """
+    first = True
+    as_json = output_format in ('DICT', 'TABLE', 'JSON')
+    if as_json:
+        out.write("[")
+    async for chunk in aiter_output(elements, output_format=output_format, **kwargs):
+        if as_json:
+            out.write(("\n" if first else ",\n") + json.dumps(chunk, default=str))
+            first = False
+        else:
+            out.write(chunk if isinstance(chunk, str) else str(chunk))
+    if as_json:
+        out.write("\n]\n" if not first else "]\n")
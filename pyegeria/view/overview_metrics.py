@@ -24,19 +24,39 @@ concerns. `overview_handler.py` is the reference caller; see its git history
 for the original inline versions this was extracted from.
 """
 
+import asyncio
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from loguru import logger
 
 from pyegeria.core._globals import max_paging_size
+from pyegeria.core._sync_runtime import run_sync
+from pyegeria.view._metric_point_cache import (get_metric_point_cache, metric_point_caching_enabled,
+                                               metric_point_key)
+from pyegeria.view._metric_snapshot_store import get_metric_snapshot_store
 
 __all__ = [
     "DEFAULT_CAP",
+    "FALLBACK_COUNT_CAP",
     "GOVERNANCE_CLASSIFICATIONS",
+    "DEFAULT_COUNT_CONCURRENCY",
     "count_elements",
+    "count_elements_batch",
+    "async_count_elements_batch",
     "count_relationships",
     "counts_by_type",
+    "sum_type_counts",
+    "async_count_elements",
+    "async_count_relationships",
+    "async_counts_by_type",
+    "async_sum_type_counts",
+    "async_semantic_grounding",
+    "async_context_readiness_funnel",
+    "async_people_counts",
+    "async_feedback_summary",
+    "async_usage_context_counts",
     "governed_coverage",
     "ownership_coverage",
     "business_value_signals",
@@ -56,6 +76,12 @@ __all__ = [
     "stale_assets",
     "growth_series",
     "metric_trend",
+    "async_growth_series",
+    "async_metric_trend",
+    "DEFAULT_COLLECTED_METRICS",
+    "collect_metric_snapshots",
+    "async_collect_metric_snapshots",
+    "run_metric_collector",
     "term_definition_completeness",
     "active_contributors",
     "WINDOWS",
@@ -80,6 +106,18 @@ DEFAULT_CAP = max_paging_size
 # a single ANY-over-these-names query, never combining with another filter).
 GOVERNANCE_CLASSIFICATIONS = ("ZoneMembership", "Confidentiality", "Criticality", "Impact", "Retention")
 
+# Upper bound on count requests a single metric keeps in flight at once (the
+# async_* variants fan their independent counts out concurrently, e.g. the five
+# people_counts types). Enough to turn a tile's latency from the sum of its
+# counts into roughly the slowest one, without flooding the view server.
+DEFAULT_COUNT_CONCURRENCY = 8
+
+# Where a server has no native count, MetadataExpert.count_metadata_elements_batch
+# counts by paging headers-only find results; stop after this many elements and
+# report the count as capped (a lower bound) rather than page a huge catalog
+# for one KPI tile.
+FALLBACK_COUNT_CAP = 10 * DEFAULT_CAP
+
 # Time-window -> (total span seconds, default #points) for growth_series.
 WINDOWS = {
     "8h":  (8 * 3600,       8),
@@ -112,6 +150,7 @@ def growth_label(d, span_s: int) -> str:
 # further attempts rather than paying a failed round-trip on every count.
 
 _ELEMENT_COUNT_CANDIDATES = ("count_metadata_elements", "get_metadata_element_count")
+_BATCH_COUNT_METHOD = "_async_count_metadata_elements_batch"
 _REL_COUNT_CANDIDATES = ("count_relationships_between_elements", "count_relationships")
 _count_caps: Dict[str, Optional[str]] = {}
 _native_server_ok: Dict[str, bool] = {}
@@ -162,6 +201,48 @@ def _json_list(raw) -> list:
 
 def _find(mgr, body: dict, page_size: int = DEFAULT_CAP) -> list:
     """Run a FindRequestBody, always returning a (possibly empty) list. Never raises."""
+    return _run(_async_find(mgr, body, page_size))
+
+
+def _element_count(mgr, body: dict, as_of: Optional[str] = None) -> int:
+    """Count elements matching a FindRequestBody -- native when available, else
+    len(find_metadata_elements(...))."""
+    return _run(_async_element_count(mgr, body, as_of))
+
+
+# ── async count seam -- same seam, fanned out concurrently ──────────────────
+# pyegeria clients expose every request as `_async_<name>` alongside the sync
+# `<name>` wrapper; the async_* metric variants await those directly so a
+# metric's independent counts share the event loop instead of running one
+# after another. Compatible clients (and test mocks) without an `_async_`
+# counterpart are called synchronously, in order -- never from worker threads,
+# as pyegeria's sync wrappers hand their work to the SyncRuntime themselves.
+
+def _run(coro: Awaitable[Any]) -> Any:
+    """Drive an async_* metric from its sync counterpart (on the SyncRuntime, like pyegeria's sync client methods)."""
+    return run_sync(coro)
+
+
+async def _async_call(client, name: str, *args, **kwargs) -> Any:
+    method = getattr(client, f"_async_{name}", None)
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return getattr(client, name)(*args, **kwargs)
+
+
+async def _gather_bounded(coros: Sequence[Awaitable[Any]], concurrency: int = DEFAULT_COUNT_CONCURRENCY) -> list:
+    """Await `coros` concurrently, at most `concurrency` at a time; results in the order given."""
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def bounded(coro):
+        async with sem:
+            return await coro
+
+    return list(await asyncio.gather(*(bounded(c) for c in coros)))
+
+
+async def _async_find(mgr, body: dict, page_size: int = DEFAULT_CAP, raise_errors: bool = False) -> list:
+    """Async version of _find. Never raises, unless `raise_errors` (a failed query then isn't mistaken for 0)."""
     try:
         # find_metadata_elements sends body exactly as given (no injected
         # defaults) -- graphQueryDepth/startFrom/pageSize all belong in the
@@ -171,28 +252,120 @@ def _find(mgr, body: dict, page_size: int = DEFAULT_CAP) -> list:
         # into the request body; find_metadata_elements no longer accepts
         # them as parameters at all, to avoid this drifting stale again).
         b = {**body, "graphQueryDepth": 0, "startFrom": 0, "pageSize": page_size}
-        raw = mgr.find_metadata_elements(b)
+        raw = await _async_call(mgr, "find_metadata_elements", b)
         return [el for el in (raw if isinstance(raw, list) else []) if isinstance(el, dict)]
     except Exception as exc:  # noqa: BLE001 -- best-effort, degrade don't fail
+        if raise_errors:
+            raise
         logger.debug(f"overview_metrics _find failed for {body.get('metadataElementTypeName')!r}: {exc}")
         return []
 
 
-def _element_count(mgr, body: dict, as_of: Optional[str] = None) -> int:
-    """Count elements matching a FindRequestBody -- native when available, else
-    len(find_metadata_elements(...))."""
-    b = dict(body)
-    if as_of:
-        b["asOfTime"] = as_of
+async def _async_element_count(mgr, body: dict, as_of: Optional[str] = None, raise_errors: bool = False) -> int:
+    """Async version of _element_count."""
+    return (await _async_element_counts(mgr, [body], as_of, raise_errors=raise_errors))[0]["count"]
+
+
+async def _async_element_counts(mgr, bodies: Sequence[dict], as_of: Optional[str] = None,
+                                concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+                                raise_errors: bool = False) -> List[Dict[str, Any]]:
+    """Count several FindRequestBodies as {"count": int, "exact": bool} -- one batched
+    request set where the client has count_metadata_elements_batch (whose own
+    fallback pages headers only, up to FALLBACK_COUNT_CAP), else the per-body seam
+    above, whose fallback count is exact only below DEFAULT_CAP."""
+    stamped = [{**body, "asOfTime": as_of} if as_of else dict(body) for body in bodies]
+    batch = getattr(mgr, _BATCH_COUNT_METHOD, None)
+    if inspect.iscoroutinefunction(batch):
+        try:
+            results = await batch(stamped, max_count=FALLBACK_COUNT_CAP, concurrency=concurrency,
+                                  return_exceptions=True)
+        except Exception as exc:  # noqa: BLE001 -- best-effort, degrade don't fail
+            if raise_errors:
+                raise
+            logger.debug(f"overview_metrics batched count failed: {exc}")
+            return [{"count": 0, "exact": False} for _ in stamped]
+        counts = []
+        for body, r in zip(stamped, results):
+            if isinstance(r, BaseException):
+                # Only the body that failed degrades; the rest keep their counts.
+                if raise_errors:
+                    raise r
+                logger.debug(f"overview_metrics count failed for {body.get('metadataElementTypeName')!r}: {r}")
+                counts.append({"count": 0, "exact": False})
+            else:
+                counts.append({"count": r["count"], "exact": r["exact"]})
+        return counts
+    return await _gather_bounded([_async_single_count(mgr, b, raise_errors) for b in stamped], concurrency)
+
+
+async def _async_single_count(mgr, body: dict, raise_errors: bool = False) -> Dict[str, Any]:
     name = _native_count_method(mgr, _ELEMENT_COUNT_CANDIDATES, "elem:" + type(mgr).__name__)
     if name and not _native_disabled(mgr):
         try:
-            c = _as_count(getattr(mgr, name)(b))
+            c = _as_count(await _async_call(mgr, name, body))
             if c is not None:
-                return c
+                return {"count": c, "exact": True}
         except Exception as exc:  # noqa: BLE001 -- old server: mark unsupported, fall back
             _disable_native(mgr, exc)
-    return len(_find(mgr, b))
+    n = len(await _async_find(mgr, body, raise_errors=raise_errors))
+    return {"count": n, "exact": n < DEFAULT_CAP}
+
+
+def _count_body(type_name: Optional[str], classifications: Optional[Sequence[str]]) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"class": "FindRequestBody", "limitResultsByStatus": ["ACTIVE"]}
+    if type_name:
+        body["metadataElementTypeName"] = type_name
+    if classifications:
+        body["matchClassifications"] = {
+            "class": "SearchClassifications", "matchCriteria": "ANY",
+            "conditions": [{"name": n} for n in classifications],
+        }
+    return body
+
+
+async def async_count_elements(
+    mgr,
+    type_name: Optional[str] = None,
+    as_of: Optional[str] = None,
+    classifications: Optional[Sequence[str]] = None,
+) -> int:
+    """Async version of `count_elements` (native `_async_count_metadata_elements`
+    when available, else `len(_async_find_metadata_elements(...))`)."""
+    return await _async_element_count(mgr, _count_body(type_name, classifications), as_of)
+
+
+async def async_count_elements_batch(
+    mgr,
+    conditions: Sequence[Tuple[Optional[str], Optional[Sequence[str]]]],
+    as_of: Optional[str] = None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """Async version of `count_elements_batch`."""
+    return await _async_element_counts(mgr, [_count_body(type_name, classifications)
+                                             for type_name, classifications in conditions], as_of, concurrency)
+
+
+def count_elements_batch(
+    mgr,
+    conditions: Sequence[Tuple[Optional[str], Optional[Sequence[str]]]],
+    as_of: Optional[str] = None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """
+    Count ACTIVE elements for many (type_name, classifications) conditions in
+    one call -- each as `count_elements` would, but through
+    MetadataExpert.count_metadata_elements_batch when the client has it:
+    native counts in flight together, and on servers without native counting
+    a headers-only paged count (graphQueryDepth 0) instead of materializing
+    full elements.
+
+    Returns one {"count": int, "exact": bool} per condition, in order.
+    `exact` is False when a fallback count stopped at its cap
+    (FALLBACK_COUNT_CAP, or DEFAULT_CAP for clients without the batch
+    method) -- the count is then a lower bound. Never raises; a failed batch
+    reads 0 / not exact.
+    """
+    return _run(async_count_elements_batch(mgr, conditions, as_of, concurrency))
 
 
 def count_elements(
@@ -218,15 +391,7 @@ def count_elements(
     -------
     int -- 0 on any failure (never raises)
     """
-    body: Dict[str, Any] = {"class": "FindRequestBody", "limitResultsByStatus": ["ACTIVE"]}
-    if type_name:
-        body["metadataElementTypeName"] = type_name
-    if classifications:
-        body["matchClassifications"] = {
-            "class": "SearchClassifications", "matchCriteria": "ANY",
-            "conditions": [{"name": n} for n in classifications],
-        }
-    return _element_count(mgr, body, as_of)
+    return _element_count(mgr, _count_body(type_name, classifications), as_of)
 
 
 def count_elements_by_property(
@@ -298,6 +463,12 @@ def count_relationships(ce, relationship_type: str, as_of: Optional[str] = None,
     -------
     Optional[int] -- None on total failure (never raises)
     """
+    return _run(async_count_relationships(ce, relationship_type, as_of, expert))
+
+
+async def async_count_relationships(ce, relationship_type: str, as_of: Optional[str] = None,
+                                    expert=None) -> Optional[int]:
+    """Async version of `count_relationships` (same default path and opt-in native fast-path)."""
     if expert is not None and not _native_disabled(expert):
         name = _native_count_method(expert, _REL_COUNT_CANDIDATES, "rel:" + type(expert).__name__)
         if name:
@@ -306,21 +477,31 @@ def count_relationships(ce, relationship_type: str, as_of: Optional[str] = None,
             if as_of:
                 body["asOfTime"] = as_of
             try:
-                c = _as_count(getattr(expert, name)(body))
+                c = _as_count(await _async_call(expert, name, body))
                 if c is not None:
                     return c
             except Exception as exc:  # noqa: BLE001
                 _disable_native(expert, exc)
     try:
         body = {"class": "ResultsRequestBody", "asOfTime": as_of} if as_of else None
-        return len(_json_list(ce.get_relationships(
-            relationship_type=relationship_type, output_format="JSON",
+        return len(_json_list(await _async_call(
+            ce, "get_relationships", relationship_type=relationship_type, output_format="JSON",
             start_from=0, page_size=DEFAULT_CAP, body=body)))
     except Exception as exc:  # noqa: BLE001
         logger.debug(f"overview_metrics count_relationships({relationship_type}) failed: {exc}")
         return None
 
 
+async def async_counts_by_type(mgr, type_map: Sequence[Tuple[str, str]], as_of: Optional[str] = None,
+                               concurrency: int = DEFAULT_COUNT_CONCURRENCY) -> List[Dict[str, Any]]:
+    """Async version of `counts_by_type`: all per-type counts in flight at once
+    (at most `concurrency`), rows still in the order given."""
+    counts = await async_count_elements_batch(mgr, [(type_name, None) for _, type_name in type_map], as_of,
+                                              concurrency)
+    return [{"label": label, "type": type_name, "count": count["count"]}
+            for (label, type_name), count in zip(type_map, counts)]
+
+
 def counts_by_type(mgr, type_map: Sequence[Tuple[str, str]], as_of: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Per-type counts for a set of (label, type_name) pairs -- e.g. the assets-
@@ -328,10 +509,17 @@ def counts_by_type(mgr, type_map: Sequence[Tuple[str, str]], as_of: Optional[str
     than failing the whole call.
 
     Returns a list of {"label": ..., "type": ..., "count": ...} dicts, in the
-    order given.
+    order given. The counts are issued concurrently (see `async_counts_by_type`).
     """
-    return [{"label": label, "type": type_name, "count": count_elements(mgr, type_name, as_of)}
-            for label, type_name in type_map]
+    return _run(async_counts_by_type(mgr, type_map, as_of))
+
+
+async def async_sum_type_counts(mgr, type_map: Sequence[Tuple[str, str]], as_of: Optional[str] = None,
+                                concurrency: int = DEFAULT_COUNT_CONCURRENCY) -> Dict[str, Any]:
+    """Async version of `sum_type_counts`: the same fetch (`async_counts_by_type`)
+    then analytic (`sum_counts`) steps, awaited directly rather than through
+    the sync action executor."""
+    return sum_counts(await async_counts_by_type(mgr, type_map, as_of, concurrency), mgr)
 
 
 def sum_type_counts(mgr, type_map: Sequence[Tuple[str, str]], as_of: Optional[str] = None) -> Dict[str, Any]:
@@ -733,8 +921,15 @@ def semantic_grounding(mgr, ce, as_of: Optional[str] = None) -> Dict[str, Any]:
 
     Returns {"groundingLinks": int|None, "groundingPct": int|None}.
     """
-    cataloged = count_elements(mgr, "Asset", as_of)
-    links = count_relationships(ce, "SemanticAssignment", as_of)
+    return _run(async_semantic_grounding(mgr, ce, as_of))
+
+
+async def async_semantic_grounding(mgr, ce, as_of: Optional[str] = None) -> Dict[str, Any]:
+    """Async version of `semantic_grounding`; the asset and link counts run concurrently."""
+    cataloged, links = await asyncio.gather(
+        async_count_elements(mgr, "Asset", as_of),
+        async_count_relationships(ce, "SemanticAssignment", as_of),
+    )
     pct = min(100, round(100 * links / cataloged)) if cataloged and links is not None else None
     return {"groundingLinks": links, "groundingPct": pct}
 
@@ -774,26 +969,37 @@ def context_readiness_funnel(mgr, ce, as_of: Optional[str] = None) -> Dict[str,
     Returns {"cataloged": int, "documented": int|None, "classified": int,
     "lineage": int|None, "aiReady": None}.
     """
-    cataloged = count_elements(mgr, "Asset", as_of)
-    classified = count_elements(mgr, None, as_of, classifications=GOVERNANCE_CLASSIFICATIONS)
+    return _run(async_context_readiness_funnel(mgr, ce, as_of))
 
-    documented = None
-    try:
-        body: Dict[str, Any] = {"class": "FindRequestBody", "limitResultsByStatus": ["ACTIVE"],
-                                 "metadataElementTypeName": "Asset"}
-        if as_of:
-            body["asOfTime"] = as_of
-        assets = _find(mgr, body)
-        documented = 0
-        for a in assets:
-            pvm = (a.get("elementProperties") or {}).get("propertyValueMap") or {}
-            desc = (pvm.get("description") or {}).get("primitiveValue")
-            if isinstance(desc, str) and desc.strip():
-                documented += 1
-    except Exception as exc:  # noqa: BLE001
-        logger.debug(f"context_readiness_funnel: documented query failed: {exc}")
 
-    lineage = count_relationships(ce, "DataFlow", as_of)
+async def async_context_readiness_funnel(mgr, ce, as_of: Optional[str] = None,
+                                         concurrency: int = DEFAULT_COUNT_CONCURRENCY) -> Dict[str, Optional[int]]:
+    """Async version of `context_readiness_funnel`; its four stage queries run concurrently."""
+
+    async def documented_count() -> Optional[int]:
+        try:
+            body: Dict[str, Any] = {"class": "FindRequestBody", "limitResultsByStatus": ["ACTIVE"],
+                                     "metadataElementTypeName": "Asset"}
+            if as_of:
+                body["asOfTime"] = as_of
+            assets = await _async_find(mgr, body)
+            documented = 0
+            for a in assets:
+                pvm = (a.get("elementProperties") or {}).get("propertyValueMap") or {}
+                desc = (pvm.get("description") or {}).get("primitiveValue")
+                if isinstance(desc, str) and desc.strip():
+                    documented += 1
+            return documented
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"context_readiness_funnel: documented query failed: {exc}")
+            return None
+
+    cataloged, classified, documented, lineage = await _gather_bounded([
+        async_count_elements(mgr, "Asset", as_of),
+        async_count_elements(mgr, None, as_of, classifications=GOVERNANCE_CLASSIFICATIONS),
+        documented_count(),
+        async_count_relationships(ce, "DataFlow", as_of),
+    ], concurrency)
 
     return {
         "cataloged": cataloged or None,
@@ -1030,6 +1236,15 @@ def _update_time(el: dict):
         return None
 
 
+_PEOPLE_TYPES = (
+    ("persons", "Person"),
+    ("teams", "Team"),
+    ("organizations", "Organization"),
+    ("itProfiles", "ITProfile"),
+    ("communities", "Community"),
+)
+
+
 def people_counts(mgr, as_of: Optional[str] = None) -> Dict[str, int]:
     """
     Person / Team / Organization / ITProfile / Community counts via native
@@ -1042,13 +1257,15 @@ def people_counts(mgr, as_of: Optional[str] = None) -> Dict[str, int]:
     Returns {"persons": int, "teams": int, "organizations": int,
     "itProfiles": int, "communities": int}.
     """
-    return {
-        "persons": count_elements(mgr, "Person", as_of),
-        "teams": count_elements(mgr, "Team", as_of),
-        "organizations": count_elements(mgr, "Organization", as_of),
-        "itProfiles": count_elements(mgr, "ITProfile", as_of),
-        "communities": count_elements(mgr, "Community", as_of),
-    }
+    return _run(async_people_counts(mgr, as_of))
+
+
+async def async_people_counts(mgr, as_of: Optional[str] = None,
+                              concurrency: int = DEFAULT_COUNT_CONCURRENCY) -> Dict[str, int]:
+    """Async version of `people_counts`; the five type counts run concurrently."""
+    counts = await async_count_elements_batch(mgr, [(type_name, None) for _, type_name in _PEOPLE_TYPES], as_of,
+                                              concurrency)
+    return {key: count["count"] for (key, _), count in zip(_PEOPLE_TYPES, counts)}
 
 
 _FEEDBACK_RELATIONSHIP_TYPES = (
@@ -1068,7 +1285,15 @@ def feedback_summary(ce, as_of: Optional[str] = None) -> Dict[str, Any]:
 
     Returns {"byType": {ratings, comments, likes, tags, noteLogs}, "total": int}.
     """
-    by_type = {key: (count_relationships(ce, rel, as_of) or 0) for rel, key in _FEEDBACK_RELATIONSHIP_TYPES}
+    return _run(async_feedback_summary(ce, as_of))
+
+
+async def async_feedback_summary(ce, as_of: Optional[str] = None,
+                                 concurrency: int = DEFAULT_COUNT_CONCURRENCY) -> Dict[str, Any]:
+    """Async version of `feedback_summary`; the relationship counts run concurrently."""
+    counts = await _gather_bounded([async_count_relationships(ce, rel, as_of)
+                                    for rel, _ in _FEEDBACK_RELATIONSHIP_TYPES], concurrency)
+    by_type = {key: (count or 0) for (_, key), count in zip(_FEEDBACK_RELATIONSHIP_TYPES, counts)}
     return {"byType": by_type, "total": sum(by_type.values())}
 
 
@@ -1080,10 +1305,14 @@ def usage_context_counts(mgr, as_of: Optional[str] = None) -> Dict[str, int]:
 
     Returns {"informationSupplyChains": int, "blueprints": int}.
     """
-    return {
-        "informationSupplyChains": count_elements(mgr, "InformationSupplyChain", as_of),
-        "blueprints": count_elements(mgr, "SolutionBlueprint", as_of),
-    }
+    return _run(async_usage_context_counts(mgr, as_of))
+
+
+async def async_usage_context_counts(mgr, as_of: Optional[str] = None) -> Dict[str, int]:
+    """Async version of `usage_context_counts`; both counts run concurrently."""
+    chains, blueprints = await async_count_elements_batch(
+        mgr, [("InformationSupplyChain", None), ("SolutionBlueprint", None)], as_of)
+    return {"informationSupplyChains": chains["count"], "blueprints": blueprints["count"]}
 
 
 def contextualised_coverage(mgr, ce, as_of: Optional[str] = None) -> Dict[str, Optional[int]]:
@@ -1297,11 +1526,112 @@ def engagement_series(ce, as_of: Optional[str] = None, weeks: int = 12) -> List[
     return series
 
 
+def _cache_scope(*clients) -> str:
+    """The platform/server/user a metric ran against -- what a cached point is only valid for."""
+    return ";".join(f"{getattr(c, 'platform_url', '')}|{getattr(c, 'view_server', '')}|{getattr(c, 'user_id', '')}"
+                    for c in clients if c is not None)
+
+
+def _snapshot_grid(window: str, points: Optional[int]) -> Tuple[int, List[Tuple[Any, Optional[str]]]]:
+    """
+    The (date, asOfTime) snapshots for a trend window, oldest first; the last is "now"
+    (asOfTime None). Historical snapshots sit on a fixed grid -- whole multiples of the
+    step since the epoch -- so the same asOfTime values recur from one refresh to the next
+    and their points can be served from the MetricPointCache.
+
+    Returns (span seconds, snapshots).
+    """
+    from datetime import datetime, timezone
+
+    span_s, default_pts = WINDOWS.get(window, WINDOWS["6mo"])
+    n = points or default_pts
+    now = datetime.now(timezone.utc)
+    step = span_s / (n - 1)
+    anchor = (now.timestamp() // step) * step
+
+    grid = []
+    for i in range(n - 1, -1, -1):
+        if i == 0:
+            grid.append((now, None))
+        else:
+            d = datetime.fromtimestamp(anchor - (i - 1) * step, tz=timezone.utc)
+            grid.append((d, d.isoformat()))
+    return span_s, grid
+
+
+async def _cached_point(cache, scope: str, metric: str, params: Optional[dict], as_of: Optional[str],
+                        compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Serve a historical point from `cache` when present, else compute (and remember) it. "Now" is never cached."""
+    key = metric_point_key(scope, metric, params, as_of) if cache is not None and as_of else None
+    if key is not None:
+        hit = cache.lookup(key)
+        if hit is not None:
+            return hit
+    value = await compute()
+    if key is not None:
+        cache.store(key, value)
+    return value
+
+
+async def async_growth_series(
+    mgr,
+    window: str = "6mo",
+    points: Optional[int] = None,
+    type_map: Optional[Sequence[Tuple[str, Optional[str], Optional[Sequence[str]]]]] = None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """Async version of `growth_series`: every (snapshot, series) count of the grid is
+    in flight at once, at most `concurrency` at a time. Historical counts come from the
+    MetricPointCache when it is enabled (`use_cache=False` recomputes them)."""
+    if type_map is None:
+        type_map = [
+            ("assets", "Asset", None),
+            ("terms", "GlossaryTerm", None),
+            ("governed", None, GOVERNANCE_CLASSIFICATIONS),
+            ("products", "DigitalProduct", None),
+        ]
+
+    span_s, grid = _snapshot_grid(window, points)
+    date_fmt = "%d %b %Y %H:%M" if span_s <= 2 * 86400 else "%d %b %Y"
+    cache = get_metric_point_cache() if use_cache and metric_point_caching_enabled() else None
+    scope = _cache_scope(mgr)
+
+    async def cell(type_name, classifications, as_of):
+        async def compute():
+            try:
+                return await _async_element_count(mgr, _count_body(type_name, classifications), as_of,
+                                                  raise_errors=True)
+            except Exception as exc:  # noqa: BLE001 -- a failed cell reads 0, and isn't cached
+                logger.debug(f"overview_metrics growth_series: {type_name or classifications} "
+                             f"snapshot {as_of or 'now'} failed: {exc}")
+                return None
+
+        params = {"type_name": type_name, "classifications": list(classifications) if classifications else None}
+        count = await _cached_point(cache, scope, "count_elements", params, as_of, compute)
+        return 0 if count is None else count
+
+    counts = await _gather_bounded([cell(type_name, classifications, as_of)
+                                    for _, as_of in grid for _, type_name, classifications in type_map],
+                                   concurrency)
+
+    series = []
+    per_point = len(type_map)
+    for p, (d, _) in enumerate(grid):
+        point = {"label": growth_label(d, span_s), "date": d.strftime(date_fmt)}
+        for (key, _, _), count in zip(type_map, counts[p * per_point:(p + 1) * per_point]):
+            point[key] = count
+        series.append(point)
+    return series
+
+
 def growth_series(
     mgr,
     window: str = "6mo",
     points: Optional[int] = None,
     type_map: Optional[Sequence[Tuple[str, Optional[str], Optional[Sequence[str]]]]] = None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+    use_cache: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     A real growth series -- one snapshot per point, using Egeria's native
@@ -1315,54 +1645,113 @@ def growth_series(
     type_map : what to snapshot at each point, as (series_key, type_name,
         classifications) triples. Defaults to the Overview dashboard's own
         four series: assets/terms/governed/products.
+    concurrency : cap on counts in flight at once across the snapshot x series grid
+    use_cache : serve historical counts from the MetricPointCache when it is
+        enabled (`metric_point_cache_enabled`); only the "now" point is always
+        recomputed
 
     Returns a list of dicts, oldest first, each
     {"label": ..., "date": ..., <series_key>: count, ...}.
+    Historical snapshots fall on a fixed grid of `span / (points - 1)` steps
+    (see `_snapshot_grid`), the last point is "now".
     """
-    from datetime import datetime, timezone
+    return _run(async_growth_series(mgr, window, points, type_map, concurrency, use_cache))
 
-    if type_map is None:
-        type_map = [
-            ("assets", "Asset", None),
-            ("terms", "GlossaryTerm", None),
-            ("governed", None, GOVERNANCE_CLASSIFICATIONS),
-            ("products", "DigitalProduct", None),
-        ]
 
-    span_s, default_pts = WINDOWS.get(window, WINDOWS["6mo"])
-    n = points or default_pts
+# Parameter names this module's own functions use for their leading client
+# argument(s) -- a small local copy of format_set_executor._bind_client_args'
+# binding logic (mgr/ce only; nothing here uses "expert"/"client") rather than
+# importing that module, to keep this module's stated design boundary intact
+# (independently callable/testable, no report-spec-registry dependency).
+_CLIENT_PARAM_NAMES = ("mgr", "ce")
 
-    now = datetime.now(timezone.utc)
-    step = span_s / (n - 1)
+
+def _resolve_metric(metric_path: str) -> Tuple[Callable, Optional[Callable]]:
+    """Import a metric function by dotted path; returns it and its `async_` sibling, if any."""
+    import importlib
+
+    module_path, func_name = metric_path.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+    func = getattr(module, func_name, None)
+    if func is None or not callable(func):
+        raise AttributeError(f"'{func_name}' not found in module '{module_path}'")
+    async_func = getattr(module, f"async_{func_name}", None)
+    return func, (async_func if inspect.iscoroutinefunction(async_func) else None)
+
+
+def _bind_metric_clients(func: Callable, mgr, ce) -> list:
+    """The leading client arguments `func` declares ("mgr"/"ce"), in order."""
+    clients = {"mgr": mgr, "ce": ce}
+    bound_args = []
+    for pname, param in inspect.signature(func).parameters.items():
+        if pname in _CLIENT_PARAM_NAMES and param.kind in (
+            inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            bound_args.append(clients[pname])
+        else:
+            break
+    return bound_args
+
+
+async def async_metric_trend(
+    mgr,
+    ce,
+    metric_path: str,
+    window: str = "6mo",
+    points: Optional[int] = None,
+    metric_params: Optional[Dict[str, Any]] = None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+    use_cache: bool = True,
+    use_store: bool = True,
+) -> List[Dict[str, Any]]:
+    """Async version of `metric_trend`. The snapshots are evaluated concurrently,
+    at most `concurrency` at a time: through the target's `async_<name>` sibling
+    when its module has one (e.g. `async_people_counts`), else by calling the
+    sync-only target in a worker thread, so it never blocks the event loop. Historical snapshots are read from the
+    MetricSnapshotStore when one is configured and holds a recording for them
+    (`use_store=False` ignores it), else from the MetricPointCache when it is
+    enabled (`use_cache=False` recomputes them)."""
+    func, async_func = _resolve_metric(metric_path)
+    bound_args = _bind_metric_clients(func, mgr, ce)
+
+    span_s, grid = _snapshot_grid(window, points)
     date_fmt = "%d %b %Y %H:%M" if span_s <= 2 * 86400 else "%d %b %Y"
+    cache = get_metric_point_cache() if use_cache and metric_point_caching_enabled() else None
+    store = get_metric_snapshot_store() if use_store else None
+    step = span_s / (len(grid) - 1)
+    scope = _cache_scope(*bound_args)
+
+    async def snapshot(i: int, d, as_of: Optional[str]) -> Any:
+        if store is not None and as_of:
+            recorded = store.value_at(scope, metric_path, metric_params, d.timestamp(), tolerance=step)
+            if recorded is not None:
+                return recorded
+
+        async def compute():
+            try:
+                if async_func is not None:
+                    return await async_func(*bound_args, as_of=as_of, **(metric_params or {}))
+                return await asyncio.to_thread(func, *bound_args, as_of=as_of, **(metric_params or {}))
+            except Exception as exc:  # noqa: BLE001
+                logger.debug(f"overview_metrics metric_trend: snapshot {i} of {metric_path} failed: {exc}")
+                return None
+
+        return await _cached_point(cache, scope, metric_path, metric_params, as_of, compute)
+
+    snapshots = [snapshot(len(grid) - 1 - p, d, as_of) for p, (d, as_of) in enumerate(grid)]
+    results = await _gather_bounded(snapshots, concurrency)
 
     series = []
-    for i in range(n - 1, -1, -1):
-        if i == 0:
-            d, as_of = now, None
-        else:
-            d = datetime.fromtimestamp(now.timestamp() - i * step, tz=timezone.utc)
-            as_of = d.isoformat()
+    for (d, _), result in zip(grid, results):
         point = {"label": growth_label(d, span_s), "date": d.strftime(date_fmt)}
-        try:
-            for key, type_name, classifications in type_map:
-                point[key] = count_elements(mgr, type_name, as_of, classifications=classifications)
-        except Exception as exc:  # noqa: BLE001
-            logger.debug(f"overview_metrics growth_series: snapshot {i} failed: {exc}")
-            for key, _, _ in type_map:
-                point.setdefault(key, None)
+        if isinstance(result, dict):
+            point.update(result)
+        else:
+            point["value"] = result
         series.append(point)
     return series
 
 
-# Parameter names this module's own functions use for their leading client
-# argument(s) -- a small local copy of format_set_executor._bind_client_args'
-# binding logic (mgr/ce only; nothing here uses "expert"/"client") rather than
-# importing that module, to keep this module's stated design boundary intact
-# (independently callable/testable, no report-spec-registry dependency).
-_CLIENT_PARAM_NAMES = ("mgr", "ce")
-
-
 def metric_trend(
     mgr,
     ce,
@@ -1370,6 +1759,9 @@ def metric_trend(
     window: str = "6mo",
     points: Optional[int] = None,
     metric_params: Optional[Dict[str, Any]] = None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+    use_cache: bool = True,
+    use_store: bool = True,
 ) -> List[Dict[str, Any]]:
     """
     Turn any single-snapshot function in this module into a time series, by
@@ -1399,51 +1791,128 @@ def metric_trend(
     dict (matching growth_series's flat-per-point shape), else stored under
     "value". A snapshot that raises logs at debug and stores None instead of
     aborting the whole series.
+
+    Snapshots are evaluated concurrently (up to `concurrency`) when the target
+    has an `async_` variant. Historical snapshots are read from the local
+    MetricSnapshotStore when one is configured (`metric_snapshot_store_path`)
+    and `collect_metric_snapshots` recorded the metric within a step before
+    the snapshot, else served from the MetricPointCache when it is enabled --
+    see `async_metric_trend`.
     """
-    import importlib
-    from datetime import datetime, timezone
+    return _run(async_metric_trend(mgr, ce, metric_path, window, points, metric_params, concurrency, use_cache,
+                                   use_store))
 
-    module_path, func_name = metric_path.rsplit(".", 1)
-    module = importlib.import_module(module_path)
-    func = getattr(module, func_name, None)
-    if func is None or not callable(func):
-        raise AttributeError(f"'{func_name}' not found in module '{module_path}'")
 
-    clients = {"mgr": mgr, "ce": ce}
-    bound_args = []
-    for pname, param in inspect.signature(func).parameters.items():
-        if pname in _CLIENT_PARAM_NAMES and param.kind in (
-            inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD,
-        ):
-            bound_args.append(clients[pname])
-        else:
-            break
+# ── snapshot collector -- records KPIs into the local MetricSnapshotStore ──
+# The KPIs the Overview dashboard trends; what collect_metric_snapshots records
+# when not told otherwise. Entries are names in this module or dotted paths,
+# optionally paired with the metric's own keyword arguments.
+DEFAULT_COLLECTED_METRICS = (
+    "governed_coverage",
+    "ownership_coverage",
+    "certifications_summary",
+    "business_value_signals",
+    "semantic_grounding",
+    "context_readiness_funnel",
+    "people_counts",
+    "feedback_summary",
+    "usage_context_counts",
+)
 
-    span_s, default_pts = WINDOWS.get(window, WINDOWS["6mo"])
-    n = points or default_pts
-    now = datetime.now(timezone.utc)
-    step = span_s / (n - 1)
-    date_fmt = "%d %b %Y %H:%M" if span_s <= 2 * 86400 else "%d %b %Y"
 
-    series = []
-    for i in range(n - 1, -1, -1):
-        if i == 0:
-            d, as_of = now, None
-        else:
-            d = datetime.fromtimestamp(now.timestamp() - i * step, tz=timezone.utc)
-            as_of = d.isoformat()
-        point = {"label": growth_label(d, span_s), "date": d.strftime(date_fmt)}
+async def async_collect_metric_snapshots(
+    mgr,
+    ce,
+    metrics: Optional[Sequence[Any]] = None,
+    store=None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Async version of `collect_metric_snapshots`; metrics run concurrently (at
+    most `concurrency` at a time), a sync-only one in a worker thread so it
+    never blocks the event loop."""
+    store = store if store is not None else get_metric_snapshot_store()
+    if store is None:
+        raise ValueError("No metric snapshot store: set metric_snapshot_store_path "
+                         "(PYEGERIA_METRIC_SNAPSHOT_STORE_PATH) or pass store=")
+    taken_at = time.time()
+
+    async def collect(entry) -> Tuple[str, Any]:
+        name, params = (entry if isinstance(entry, (tuple, list)) else (entry, None))
+        metric_path = name if "." in name else f"{__name__}.{name}"
         try:
-            result = func(*bound_args, as_of=as_of, **(metric_params or {}))
-            if isinstance(result, dict):
-                point.update(result)
+            func, async_func = _resolve_metric(metric_path)
+            bound_args = _bind_metric_clients(func, mgr, ce)
+            if async_func is not None:
+                result = await async_func(*bound_args, **(params or {}))
             else:
-                point["value"] = result
-        except Exception as exc:  # noqa: BLE001
-            logger.debug(f"overview_metrics metric_trend: snapshot {i} of {metric_path} failed: {exc}")
-            point["value"] = None
-        series.append(point)
-    return series
+                result = await asyncio.to_thread(func, *bound_args, **(params or {}))
+        except Exception as exc:  # noqa: BLE001 -- one failing KPI mustn't lose the others
+            logger.debug(f"overview_metrics collector: {metric_path} failed: {exc}")
+            return metric_path, None
+        store.record(_cache_scope(*bound_args), metric_path, params, result, taken_at)
+        return metric_path, result
+
+    results = await _gather_bounded([collect(entry) for entry in (metrics or DEFAULT_COLLECTED_METRICS)],
+                                    concurrency)
+    return dict(results)
+
+
+def collect_metric_snapshots(
+    mgr,
+    ce,
+    metrics: Optional[Sequence[Any]] = None,
+    store=None,
+    concurrency: int = DEFAULT_COUNT_CONCURRENCY,
+) -> Dict[str, Any]:
+    """
+    Run each KPI once, now, and record its result in the local
+    MetricSnapshotStore -- the periodic collector whose recordings
+    `metric_trend` reads instead of re-querying Egeria with `asOfTime`.
+    Schedule it (cron, a timer) at least once per trend step; in-process,
+    `run_metric_collector` does the scheduling.
+
+    Parameters
+    ----------
+    mgr : MetadataExpert (or compatible client)
+    ce : ClassificationExplorer (or compatible client)
+    metrics : the KPIs to record -- function names in this module or dotted
+        paths, each optionally as a (name, params) pair of keyword arguments.
+        Defaults to DEFAULT_COLLECTED_METRICS.
+    store : the MetricSnapshotStore to record into; defaults to the one on
+        `metric_snapshot_store_path`
+    concurrency : cap on metrics run at once
+
+    Returns {metric_path: result} for this run; a metric that raised maps to
+    None and is not recorded. Raises ValueError if no store is configured.
+    """
+    return _run(async_collect_metric_snapshots(mgr, ce, metrics, store, concurrency))
+
+
+async def run_metric_collector(
+    mgr,
+    ce,
+    interval: float,
+    metrics: Optional[Sequence[Any]] = None,
+    store=None,
+    iterations: Optional[int] = None,
+) -> None:
+    """
+    Call `async_collect_metric_snapshots` every `interval` seconds -- for an
+    app that hosts the collector on its own event loop (cancel the task to
+    stop it). `iterations` bounds the number of runs (None = forever).
+    """
+    runs = 0
+    while iterations is None or runs < iterations:
+        started = time.monotonic()
+        try:
+            await async_collect_metric_snapshots(mgr, ce, metrics, store)
+        except ValueError:
+            raise
+        except Exception as exc:  # noqa: BLE001 -- keep collecting on the next tick
+            logger.warning(f"overview_metrics collector run failed: {exc}")
+        runs += 1
+        if iterations is None or runs < iterations:
+            await asyncio.sleep(max(0.0, interval - (time.monotonic() - started)))
 
 
 def term_definition_completeness(mgr, as_of: Optional[str] = None) -> Dict[str, Any]:
@@ -2,6 +2,8 @@
 Minimal pytest configuration for framework validation tests.
 """
 
+import asyncio
+
 import pytest
 from md_processing.md_processing_utils.md_processing_constants import load_commands
 
@@ -33,3 +35,45 @@ def test_params():
     }
 
 
+class CountingExpert:
+    """Stand-in MetadataExpert for overview_metrics tests: its async native count
+    records every asOfTime it is asked for and the peak number of calls in flight.
+    `value` is the count returned, or a dict of counts by metadataElementTypeName."""
+    platform_url, view_server, user_id = "https://example", "vs", "u"
+
+    def __init__(self, value: int | dict = 10, delay: float = 0.0):
+        self.calls = []
+        self.in_flight = self.peak = 0
+        self.value = value
+        self.delay = delay
+
+    def count_metadata_elements(self, body):   # the sync wrapper; never used on the async path
+        raise AssertionError("sync count called")
+
+    async def _async_count_metadata_elements(self, body):
+        self.calls.append(body.get("asOfTime"))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if isinstance(self.value, dict):
+            return self.value.get(body.get("metadataElementTypeName"), 0)
+        return self.value
+
+
+@pytest.fixture
+def counting_expert():
+    """The CountingExpert class, to build stand-in clients with."""
+    return CountingExpert
+
+
+@pytest.fixture
+def reset_seam_caches():
+    """Clear the count-cap and native-count probes overview_metrics keeps per server."""
+    from pyegeria.view import overview_metrics as om
+
+    om._count_caps.clear()
+    om._native_server_ok.clear()
+    yield
+    om._count_caps.clear()
+    om._native_server_ok.clear()
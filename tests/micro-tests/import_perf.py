@@ -0,0 +1,35 @@
+"""
+Performance check for `import pyegeria` (see pyegeria/_lazy.py).
+Times the import in fresh interpreters and reports the best run; run by hand,
+it is not part of the micro-test suite.
+
+`import pyegeria` takes ~0.3 s (config + pydantic-settings); the eager package took ~2 s.
+"""
+
+import json
+import subprocess
+import sys
+
+IMPORT_BUDGET_SECONDS = 1.0
+
+_MEASURE = """
+import json, time
+start = time.perf_counter()
+import pyegeria
+print(json.dumps({"elapsed": time.perf_counter() - start}))
+"""
+
+
+def run_perf_tests(runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _MEASURE], capture_output=True, text=True, check=True)
+        timings.append(json.loads(out.stdout.strip().splitlines()[-1])["elapsed"])
+    best = min(timings)
+    print(f"import pyegeria: best {best:.3f}s of {runs} runs "
+          f"(all: {', '.join(f'{t:.3f}' for t in timings)}; budget {IMPORT_BUDGET_SECONDS}s)")
+    return best
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_perf_tests() < IMPORT_BUDGET_SECONDS else 1)
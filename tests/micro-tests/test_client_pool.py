@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the pooled, authenticated clients reused across report runs
+(pyegeria.core._client_pool).
+
+No live server: a stand-in client class counts constructions, logins and closes.
+"""
+import asyncio
+
+from pyegeria.core._client_pool import ClientPool
+
+
+class FakeClient:
+    created = 0
+
+    def __init__(self, view_server, platform_url, user_id=None, user_pwd=None):
+        FakeClient.created += 1
+        self.view_server, self.user_id, self.user_pwd = view_server, user_id, user_pwd
+        self.logins = 0
+        self.closed = False
+
+    def create_egeria_bearer_token(self, user_id=None, password=None):
+        self.logins += 1
+        return f"token-{self.logins}"
+
+    async def _async_create_egeria_bearer_token(self, user_id=None, password=None):
+        return self.create_egeria_bearer_token(user_id, password)
+
+    def close_session(self):
+        self.closed = True
+
+
+def test_repeated_gets_reuse_client_and_token():
+    FakeClient.created = 0
+    pool = ClientPool()
+    clients = [pool.get(FakeClient, "vs", "https://localhost:9443", "erin", "secret") for _ in range(12)]
+    assert FakeClient.created == 1
+    assert all(c is clients[0] for c in clients)
+    assert clients[0].logins == 1
+
+
+def test_token_recreated_after_ttl_and_async_path():
+    pool = ClientPool(token_ttl=0)
+    client = pool.get(FakeClient, "vs", "https://localhost:9443", "erin", "secret")
+    again = asyncio.run(pool.aget(FakeClient, "vs", "https://localhost:9443", "erin", "secret"))
+    assert again is client
+    assert client.logins == 2
+
+
+def test_failed_login_is_retried_on_next_get():
+    class Flaky(FakeClient):
+        def create_egeria_bearer_token(self, user_id=None, password=None):
+            self.logins += 1
+            return "FAILED" if self.logins == 1 else "token"
+
+    pool = ClientPool()
+    client = pool.get(Flaky, "vs", "https://localhost:9443", "erin", "secret")
+    pool.get(Flaky, "vs", "https://localhost:9443", "erin", "secret")
+    pool.get(Flaky, "vs", "https://localhost:9443", "erin", "secret")
+    assert client.logins == 2
+
+
+def test_password_change_replaces_client_and_lru_eviction_closes():
+    pool = ClientPool(max_clients=2)
+    first = pool.get(FakeClient, "vs", "https://localhost:9443", "erin", "secret")
+    replaced = pool.get(FakeClient, "vs", "https://localhost:9443", "erin", "other")
+    assert replaced is not first and first.closed
+
+    pool.get(FakeClient, "vs", "https://localhost:9443", "peter", "secret")
+    pool.get(FakeClient, "vs", "https://localhost:9443", "gary", "secret")
+    assert len(pool) == 2 and replaced.closed
+
+
+def test_discard_drops_client():
+    pool = ClientPool()
+    client = pool.get(FakeClient, "vs", "https://localhost:9443", "erin", "secret")
+    pool.discard(client)
+    assert client.closed and len(pool) == 0
+    assert pool.get(FakeClient, "vs", "https://localhost:9443", "erin", "secret") is not client
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for CollectionManager.walk_collection_hierarchy.
+
+No live server: `_async_get_collection_members` is replaced by a fake, paged hierarchy
+that records each request and how many were in flight together.
+"""
+import asyncio
+
+from pyegeria.core._globals import max_paging_size
+from pyegeria.omvs.collection_manager import CollectionManager
+
+# root -> a, b;  a -> c, term;  b -> c, root (a cycle);  c -> d;  big -> more members than one page
+HIERARCHY = {"root": ["a", "b"], "a": ["c", "term"], "b": ["c", "root"], "c": ["d"], "d": [],
+             "big": [f"leaf-{i}" for i in range(max_paging_size + 3)]}
+
+
+def _member(guid: str) -> dict:
+    leaf = guid == "term" or guid.startswith("leaf-")
+    type_name = "GlossaryTerm" if leaf else "Folder"
+    supertypes = ["Referenceable"] if leaf else ["Collection", "Referenceable"]
+    return {"elementHeader": {"guid": guid, "type": {"typeName": type_name, "superTypeNames": supertypes}},
+            "properties": {"displayName": guid.upper(), "qualifiedName": f"Collection::{guid}"}}
+
+
+def _client(calls: list, stats: dict) -> CollectionManager:
+    client = CollectionManager(view_server="vs", platform_url="https://localhost:9443", user_id="u", user_pwd="p")
+
+    async def members(collection_guid=None, collection_name=None, collection_qname=None, body=None,
+                      start_from=0, page_size=0, output_format="JSON", **kwargs):
+        calls.append(collection_guid)
+        stats["in_flight"] = stats.get("in_flight", 0) + 1
+        stats["peak"] = max(stats.get("peak", 0), stats["in_flight"])
+        await asyncio.sleep(0.01)
+        stats["in_flight"] -= 1
+        children = HIERARCHY[collection_guid][start_from:start_from + page_size]
+        return [_member(g) for g in children] if children else "No elements found"
+
+    client._async_get_collection_members = members
+    return client
+
+
+def test_walk_expands_each_collection_once():
+    calls, stats = [], {}
+    tree = _client(calls, stats).walk_collection_hierarchy("root")
+    assert sorted(set(calls)) == ["a", "b", "c", "d", "root"]     # "term" is not a collection
+    assert tree["children"]["b"] == ["c", "root"]                  # shared/cyclic edges are kept
+    assert tree["nodes"]["c"]["depth"] == 2 and tree["nodes"]["a"]["displayName"] == "A"
+    assert stats["peak"] == 2 and not tree["truncated"]
+
+
+def test_walk_honours_depth_and_node_budgets():
+    calls, stats = [], {}
+    shallow = _client(calls, stats).walk_collection_hierarchy("root", max_depth=1)
+    assert set(calls) == {"root"} and set(shallow["nodes"]) == {"root", "a", "b"} and shallow["truncated"]
+
+    small = _client([], {}).walk_collection_hierarchy("root", max_nodes=3)
+    assert len(small["nodes"]) == 4 and small["truncated"]
+
+
+def test_walk_pages_through_large_collections():
+    calls = []
+    tree = _client(calls, {}).walk_collection_hierarchy("big")
+    assert len(tree["children"]["big"]) == max_paging_size + 3
+    assert calls == ["big"] * 3 and not tree["errors"]
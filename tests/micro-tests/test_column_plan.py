@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the compiled column plans used by output_formatter's entity renderers.
+
+A ColumnPlan is compiled once per report spec and output format and reused for every row;
+the extractors must produce the same values they did with per-row lookups.
+"""
+from pyegeria.view._column_plan import PLAN_KEY, compile_columns, dot_path_steps, plan_for, resolve_steps
+from pyegeria.view.output_formatter import generate_output, populate_columns_from_properties
+
+
+def _columns_struct():
+    return {
+        "_report_spec_name": "Column-Plan-Test",
+        "heading": "Column Plan Test",
+        "formats": {
+            "attributes": [
+                {"name": "Display Name", "key": "display_name"},
+                {"name": "GUID", "key": "guid"},
+                {"name": "Status", "key": "status", "valid_values": {"0": "DRAFT", "1": "ACTIVE"}},
+                {"name": "Level", "key": "level", "valid_values": ["LOW", "HIGH"]},
+                {"name": "Type", "key": "elementHeader.type.typeName"},
+            ]
+        },
+    }
+
+
+def _element(i):
+    return {
+        "elementHeader": {"guid": f"guid-{i}", "type": {"typeName": "Asset"}},
+        "properties": {"displayName": f"Asset {i}", "status": 1, "level": 0},
+    }
+
+
+def test_plan_is_cached_per_spec_and_output_format():
+    first = compile_columns(_columns_struct(), "DICT")
+    assert compile_columns(_columns_struct(), "DICT") is first
+    assert compile_columns(_columns_struct(), "MD") is not first
+    changed = _columns_struct()
+    changed["formats"]["attributes"][0]["key"] = "qualified_name"
+    assert compile_columns(changed, "DICT") is not first
+
+
+def test_plan_precomputes_candidates_steps_and_enums():
+    plan = compile_columns(_columns_struct(), "DICT")
+    display, guid, status, level, type_col = plan.columns
+    assert display.candidates == ("display_name", "displayName", "DISPLAY_NAME")
+    assert guid.is_guid
+    assert status.map_enum(1) == "ACTIVE" and status.map_enum(7) == 7
+    assert level.map_enum(1) == "HIGH"
+    assert type_col.steps == dot_path_steps("elementHeader.type.typeName")
+    assert resolve_steps(_element(0), type_col.steps) == "Asset"
+
+
+def test_bound_plan_survives_reshaped_attributes():
+    struct = compile_columns(_columns_struct(), "DICT").bind(_columns_struct())
+    assert plan_for(struct) is struct[PLAN_KEY]
+    struct["formats"]["attributes"].insert(0, {"name": "Qualified Name", "key": "qualified_name"})
+    element = {"properties": {"qualifiedName": "qn", "displayName": "dn"}}
+    populate_columns_from_properties(element, struct)
+    values = {c["key"]: c.get("value") for c in struct["formats"]["attributes"]}
+    assert values["qualified_name"] == "qn" and values["display_name"] == "dn"
+
+
+def test_generate_output_dict_uses_compiled_columns():
+    out = generate_output(
+        elements=[_element(i) for i in range(3)],
+        search_string="*",
+        entity_type="Asset",
+        output_format="DICT",
+        extract_properties_func=populate_columns_from_properties,
+        columns_struct=_columns_struct(),
+    )
+    assert isinstance(out, list) and len(out) == 3
+    row = out[1]
+    assert row["Display Name"] == "Asset 1"
+    assert row["GUID"] == "guid-1"
+    assert row["Status"] == "ACTIVE"
+    assert row["Level"] == "LOW"
+    assert PLAN_KEY not in row
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the Dr.Egeria command spec cache
+(md_processing.md_processing_utils.command_spec_cache) behind load_commands().
+"""
+import json
+import os
+import pickle
+
+import pytest
+
+from md_processing.md_processing_utils import command_spec_cache
+from md_processing.md_processing_utils import md_processing_constants as constants
+from pyegeria.core.config import settings
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    path = tmp_path / "specs.json"
+    monkeypatch.setattr(settings.Runtime, "command_spec_cache_path", str(path))
+    command_spec_cache.clear()
+    yield path
+    command_spec_cache.clear()
+
+
+def test_new_process_loads_the_cached_specs(cache_file, monkeypatch):
+    constants.load_commands()
+    built_specs, built_commands = constants.COMMAND_DEFINITIONS, constants.command_list
+    assert json.loads(cache_file.read_text())["payload"]["command_list"] == built_commands
+
+    command_spec_cache.clear()                                   # as if in a new process
+    monkeypatch.setattr(constants, "_build_command_payload",
+                        lambda *a: pytest.fail("specs rebuilt despite an up-to-date cache"))
+    constants.load_commands()
+    assert constants.command_list == built_commands
+    assert constants.COMMAND_DEFINITIONS == built_specs
+    assert constants.COMMAND_DEFINITIONS is not built_specs      # callers get their own copy
+
+
+def test_cached_alias_index_matches_a_full_scan(cache_file):
+    constants.load_commands()
+    specs, index = constants._alias_index
+    assert index, "the persisted payload carries the alternate-name index"
+    for command, canonical in index.items():
+        assert constants.find_alternate_names(command) == canonical
+        assert constants.resolve_command_spec(command)[0] == (canonical if canonical in specs else None)
+
+
+def test_changed_source_rebuilds(tmp_path, cache_file):
+    compact_dir = tmp_path / "compact"
+    compact_dir.mkdir()
+    spec_file = compact_dir / "commands_x.json"
+    spec_file.write_text("{}")
+    key = command_spec_cache.source_key(None, str(compact_dir))
+    command_spec_cache.store(key, {"command_list": ["Provenance"]})
+    assert command_spec_cache.load(key) == {"command_list": ["Provenance"]}
+
+    spec_file.write_text('{"commands": {}}')
+    os.utime(spec_file, ns=(0, 10**18))
+    assert command_spec_cache.load(command_spec_cache.source_key(None, str(compact_dir))) is None
+
+
+def test_file_cache_is_off_by_default():
+    assert type(settings.Runtime).model_fields["command_spec_cache_path"].default == ""
+
+
+def test_a_pickle_in_the_cache_file_is_never_unpickled(cache_file, monkeypatch):
+    key = command_spec_cache.source_key(None, None)
+    cache_file.write_bytes(pickle.dumps((key, pickle.dumps({"command_list": []}))))
+    monkeypatch.setattr(pickle, "load", lambda *a: pytest.fail("cache file unpickled"))
+    monkeypatch.setattr(pickle, "loads", lambda *a: pytest.fail("cache file unpickled"))
+    assert command_spec_cache.load(key) is None
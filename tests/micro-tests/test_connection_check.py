@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for deferred connectivity validation (BaseServerClient
+`connection_check` modes, `aconnect()`, and the per-platform reachability
+cache kept by SessionPool).
+
+No live server: the pool's sessions are built on an httpx.MockTransport that
+counts hits on the platform-origin endpoint (/api/about) and answers every
+other request with an empty Egeria-style 200 response.
+"""
+import asyncio
+
+import httpx
+
+from pyegeria.core._session_pool import SessionPool
+from pyegeria.omvs.metadata_expert import MetadataExpert
+
+
+def _pool(hits: dict) -> SessionPool:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/about":
+            hits["about"] = hits.get("about", 0) + 1
+            return httpx.Response(200, text="Egeria OMAG Server Platform (version 6.1)")
+        hits["other"] = hits.get("other", 0) + 1
+        return httpx.Response(200, json={"class": "CountResponse", "relatedHTTPCode": 200, "count": 3})
+
+    pool = SessionPool()
+    pool._new_session = lambda key: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return pool
+
+
+def test_lazy_is_default_and_does_not_probe():
+    hits = {}
+    pool = _pool(hits)
+    client = MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool)
+    assert client.connection_check == "lazy"
+    assert hits == {}
+
+
+def test_eager_probes_once_per_platform_within_ttl():
+    hits = {}
+    pool = _pool(hits)
+    MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool, connection_check="eager")
+    MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool, connection_check="eager")
+    assert hits["about"] == 1
+
+
+def test_eager_probes_again_after_ttl_expires():
+    hits = {}
+    pool = _pool(hits)
+    pool.connection_check_ttl = 0
+    MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool, connection_check="eager")
+    MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool, connection_check="eager")
+    assert hits["about"] == 2
+
+
+def test_real_request_marks_platform_reachable():
+    hits = {}
+    pool = _pool(hits)
+    client = MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool)
+
+    async def run():
+        assert await client._async_count_metadata_elements({"class": "FindRequestBody"}) == 3
+        # The request already proved the platform is up - no probe needed.
+        await client.aconnect()
+
+    asyncio.run(run())
+    assert hits == {"other": 1}
+
+
+def test_aconnect_force_probes_and_returns_origin():
+    hits = {}
+    pool = _pool(hits)
+    client = MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool)
+
+    async def run():
+        first = await client.aconnect()
+        second = await client.aconnect(force=True)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second == "Egeria OMAG Server Platform (version 6.1)"
+    assert hits["about"] == 2
@@ -79,7 +79,7 @@ async def test_delete_element_request_no_body_path_sends_cascade_delete():
     )
 
     assert cap["body"] is not None
-    assert '"cascadeDelete": true' in cap["body"]
+    assert '"cascadeDelete":true' in cap["body"]
 
 
 async def test_delete_element_request_forwards_caller_dict_body():
@@ -93,4 +93,4 @@ async def test_delete_element_request_forwards_caller_dict_body():
     )
 
     assert cap["body"] is not None
-    assert '"deleteMethod": "SOFT_DELETE"' in cap["body"]
+    assert '"deleteMethod":"SOFT_DELETE"' in cap["body"]
@@ -0,0 +1,117 @@
+"""
+Tests for dependency-aware concurrent execution in V2Dispatcher.dispatch_batch:
+commands that don't name each other's elements run concurrently (up to the
+concurrency limit), while dependent commands keep their file order.
+
+Like test_dispatcher_forward_references.py, these register a minimal fake
+processor against the real "Create Project" spec so no live server is needed.
+"""
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from md_processing.v2.extraction import DrECommand
+from md_processing.v2.processors import AsyncBaseCommandProcessor
+from md_processing.v2.dispatcher import CommandFootprint, V2Dispatcher
+from md_processing.md_processing_utils.md_processing_constants import load_commands
+
+
+class _FakeClient:
+    pass
+
+
+class _TrackingProcessor(AsyncBaseCommandProcessor):
+    """Records how many commands are in apply_changes() at once, and in what order they finish."""
+
+    async def apply_changes(self) -> str:
+        qn = self.parsed_output["qualified_name"]
+        store = self.context.setdefault("_store", {"active": 0, "peak": 0, "finished": []})
+        store["active"] += 1
+        store["peak"] = max(store["peak"], store["active"])
+        await asyncio.sleep(0.01)
+        store["active"] -= 1
+        store["finished"].append(self.parsed_output.get("display_name"))
+        self.parsed_output["guid"] = f"guid::{qn}"
+        return f"created {qn}"
+
+
+def _create(name: str, **attributes: str) -> DrECommand:
+    attributes = {"Display Name": name, **attributes}
+    raw = "## Create Project\n" + "".join(f"### {k}\n{v}\n" for k, v in attributes.items())
+    return DrECommand(verb="Create", object_type="Project", attributes=attributes, raw_block=raw)
+
+
+def _dispatcher() -> V2Dispatcher:
+    load_commands()
+    dispatcher = V2Dispatcher(_FakeClient())
+    dispatcher.register("Create Project", _TrackingProcessor)
+    return dispatcher
+
+
+@pytest.mark.asyncio
+async def test_independent_commands_run_concurrently_and_keep_their_order():
+    commands = [_create(f"Concurrency Project {i}") for i in range(12)]
+    context: Dict[str, Any] = {"directive": "process"}
+    results = await _dispatcher().dispatch_batch(commands, context, max_concurrency=4)
+
+    assert [r["display_name"] for r in results] == [f"Concurrency Project {i}" for i in range(12)]
+    assert all(r["status"] == "success" for r in results)
+    assert context["_store"]["peak"] == 4
+
+
+@pytest.mark.asyncio
+async def test_limit_of_one_runs_sequentially():
+    commands = [_create(f"Sequential Project {i}") for i in range(5)]
+    context: Dict[str, Any] = {"directive": "process"}
+    await _dispatcher().dispatch_batch(commands, context, max_concurrency=1)
+
+    assert context["_store"]["peak"] == 1
+    assert context["_store"]["finished"] == [f"Sequential Project {i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_a_command_naming_an_earlier_element_waits_for_it():
+    commands = [
+        _create("Concurrency Child"),
+        _create("Unrelated Project"),
+        _create("Concurrency Parent", **{"Sub-Projects": "Concurrency Child"}),
+    ]
+    context: Dict[str, Any] = {"directive": "process"}
+    results = await _dispatcher().dispatch_batch(commands, context, max_concurrency=8)
+
+    assert all(r["status"] == "success" and not r.get("deferred") for r in results)
+    finished = context["_store"]["finished"]
+    assert finished.index("Concurrency Child") < finished.index("Concurrency Parent")
+    assert context["_store"]["peak"] == 2
+
+
+def test_dependency_graph_edges_and_barriers():
+    fps = [
+        CommandFootprint(targets=frozenset({"G"}), names=frozenset({"G"})),           # 0 Create Glossary G
+        CommandFootprint(targets=frozenset({"T1"}), names=frozenset({"T1", "G"})),    # 1 Create Term T1 in G
+        CommandFootprint(targets=frozenset({"T2"}), names=frozenset({"T2", "G"})),    # 2 Create Term T2 in G
+        CommandFootprint(names=frozenset({"T1", "X"})),                               # 3 Link T1 to X
+        CommandFootprint(names=frozenset({"X"})),                                     # 4 Unlink X
+        CommandFootprint(barrier=True),                                               # 5 View
+        CommandFootprint(targets=frozenset({"T3"}), names=frozenset({"T3"})),         # 6 Create Term T3
+    ]
+    graph = V2Dispatcher.dependency_graph(list(range(len(fps))), fps)
+
+    assert graph[0] == set()
+    assert graph[1] == {0} and graph[2] == {0}      # sibling terms are independent
+    assert graph[3] == {1}
+    assert graph[4] == {3}                          # target-less writes naming X stay ordered
+    assert graph[5] == {0, 1, 2, 3, 4}
+    assert graph[6] == {5}
+
+
+def test_footprint_ignores_scalar_values_and_splits_name_lists():
+    load_commands()
+    command = DrECommand(
+        verb="Link", object_type="Project Hierarchy",
+        attributes={"Parent Project": "P", "Child Project": "A, B\n- C", "Merge Update": "True"},
+    )
+    footprint = V2Dispatcher(_FakeClient()).command_footprint(command)
+    assert {"P", "A", "B", "C"} <= footprint.names and "True" not in footprint.names
+    assert not footprint.targets and not footprint.barrier
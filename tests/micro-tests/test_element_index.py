@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for Dr.Egeria's indexed, run-scoped element dictionary
+(md_processing.md_processing_utils.element_index).
+"""
+import asyncio
+
+from md_processing.md_processing_utils.common_md_utils import (find_key_with_value, get_element_dictionary,
+                                                               is_present, update_element_dictionary)
+from md_processing.md_processing_utils.element_index import ElementIndex, element_dictionary_scope
+
+
+def test_find_key_by_qualified_name_display_name_and_guid():
+    index = ElementIndex()
+    index["Glossary::Sales"] = {"guid": "g-1", "display_name": "Sales"}
+    assert index.find_key("Glossary::Sales") == "Glossary::Sales"
+    assert index.find_key("Sales") == "Glossary::Sales"
+    assert index.find_key("g-1") == "Glossary::Sales"
+    assert index.find_key("Marketing") is None
+    assert index.contains("g-1") and not index.contains("g-2")
+
+
+def test_earliest_key_wins_for_shared_values():
+    index = ElementIndex()
+    index["Term::A"] = {"display_name": "Revenue"}
+    index["Term::B"] = {"display_name": "Revenue"}
+    index["Term::A"] = {"display_name": "Revenue", "guid": "g-a"}   # re-set keeps insertion order
+    assert index.find_key("Revenue") == "Term::A"
+
+
+def test_reindexed_on_update_and_delete():
+    index = ElementIndex({"Term::A": {"guid": "old"}})
+    index["Term::A"] = {"guid": "new"}
+    assert index.find_key("old") is None
+    assert index.find_key("new") == "Term::A"
+    del index["Term::A"]
+    assert index.find_key("new") is None and len(index) == 0
+
+
+def test_unhashable_values_fall_back_to_scan():
+    index = ElementIndex({"Term::A": {"guid": "g", "tags": ["x"]}})
+    assert index.find_key(["x"]) == "Term::A"
+
+
+def test_scopes_isolate_runs_and_nest():
+    with element_dictionary_scope() as outer:
+        update_element_dictionary("Project::P", {"guid": "p-1"})
+        assert get_element_dictionary() is outer
+        with element_dictionary_scope() as inner:          # e.g. a file within a folder batch
+            assert inner is outer
+            assert find_key_with_value("p-1") == "Project::P"
+    with element_dictionary_scope():
+        assert not is_present("p-1")
+
+
+def test_scope_propagates_into_asyncio_run():
+    async def lookup():
+        return find_key_with_value("Sales")
+
+    with element_dictionary_scope():
+        update_element_dictionary("Glossary::Sales", {"display_name": "Sales"})
+        assert asyncio.run(lookup()) == "Glossary::Sales"
@@ -95,6 +95,20 @@ def test_env_settings():
     print("Loading and using environment variables test passed!")
 
 
+
+def test_runtime_settings_have_their_own_section(tmp_path, monkeypatch):
+    """Performance tuning settings load into, and are reported under, the Runtime section."""
+    from pyegeria.core import config
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("PYEGERIA_HTTP_MAX_CONNECTIONS", "7")
+    monkeypatch.setattr(config, "_app_config", None)
+    cfg = config.load_app_config()
+    assert cfg.Runtime.http_max_connections == 7 and cfg.Runtime.retry_max_attempts == 3
+    assert "http_max_connections" not in cfg.Debug.model_dump()
+    report = config.pretty_print_config(to_console=False)
+    assert report["Runtime"]["http_max_connections"] == {"value": 7, "source": "env"}
+
 if __name__ == "__main__":
     test_env_settings()
     print("\nAll environment settings tests passed!")
\ No newline at end of file
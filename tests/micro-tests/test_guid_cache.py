@@ -0,0 +1,129 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the name -> GUID resolution cache behind ServerClient.__async_get_guid__
+(pyegeria.core._guid_cache).
+
+No live server: the client's SessionPool hands out httpx sessions on a MockTransport that
+answers guid-by-unique-name lookups from a dict, acknowledges every other request, and
+records the URLs it was sent.
+"""
+import asyncio
+import json
+import time
+
+import httpx
+
+from pyegeria.core._globals import NO_ELEMENTS_FOUND
+from pyegeria.core._guid_cache import GuidCache
+from pyegeria.core._session_pool import SessionPool
+from pyegeria.omvs.collection_manager import CollectionManager
+
+KEY = ("https://localhost:9443/servers/vs", "u", "qualifiedName", "", "Collection::A")
+
+
+def _client(names: dict, calls: list, cache: GuidCache = None, user_id: str = "u") -> CollectionManager:
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        calls.append(url)
+        if url.endswith("guid-by-unique-name"):
+            guid = names.get(json.loads(request.content)["propertyValue"])
+            return httpx.Response(200, json={"relatedHTTPCode": 200, **({"guid": guid} if guid else {})})
+        return httpx.Response(200, json={"relatedHTTPCode": 200, "guid": "new-guid"})
+
+    pool = SessionPool()
+    pool._new_session = lambda key: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = CollectionManager(view_server="vs", platform_url="https://localhost:9443", user_id=user_id, user_pwd="p")
+    client.use_session_pool(pool)
+    client._guid_cache = cache if cache is not None else GuidCache()     # keep tests off the shared cache
+    return client
+
+
+def test_repeat_lookups_served_from_cache():
+    calls = []
+    client = _client({"Collection::A": "g-a"}, calls)
+    for _ in range(3):
+        assert client.__get_guid__(qualified_name="Collection::A") == "g-a"
+    assert len(calls) == 1
+    assert client.guid_cache.stats()["hits"] == 2
+
+
+def test_misses_cached_for_negative_ttl_only():
+    calls = []
+    client = _client({}, calls, GuidCache(negative_ttl=0.05))
+    assert client.__get_guid__(display_name="Nope", property_name="displayName") == NO_ELEMENTS_FOUND
+    assert client.__get_guid__(display_name="Nope", property_name="displayName") == NO_ELEMENTS_FOUND
+    assert len(calls) == 1
+    time.sleep(0.06)
+    client.__get_guid__(display_name="Nope", property_name="displayName")
+    assert len(calls) == 2
+
+
+def test_create_drops_misses_and_delete_drops_guid():
+    calls, names = [], {}
+    client = _client(names, calls)
+    assert client.__get_guid__(qualified_name="Collection::A", display_name="Collection::A") == NO_ELEMENTS_FOUND
+
+    names["Collection::A"] = "g-a"
+    asyncio.run(client._async_create_collection(display_name="A"))
+    assert client.__get_guid__(qualified_name="Collection::A") == "g-a"
+
+    asyncio.run(client._async_delete_element_request(f"{client.command_root}collection-manager/collections/g-a/delete"))
+    names.clear()
+    assert client.__get_guid__(qualified_name="Collection::A", display_name="Collection::A") == NO_ELEMENTS_FOUND
+
+
+def test_any_write_through_make_request_invalidates():
+    calls, names = [], {}
+    client = _client(names, calls)
+    assert client.__get_guid__(qualified_name="Collection::A", display_name="Collection::A") == NO_ELEMENTS_FOUND
+    client.guid_cache.store(KEY[:4] + ("Collection::B",), "g-b")
+
+    names["Collection::A"] = "g-a"
+    url = f"{client.collection_command_root}/g-b/from-template"
+    asyncio.run(client._async_make_request("POST", url, {"class": "TemplateRequestBody"}))
+    assert client.__get_guid__(qualified_name="Collection::A") == "g-a"      # the miss was dropped
+    assert client.guid_cache.lookup(KEY[:4] + ("Collection::B",)) is None    # and so was g-b, named in the URL
+
+    lookups = len(calls)
+    asyncio.run(client._async_make_request("POST", url, {}, idempotent=True))   # read-only POST
+    assert client.__get_guid__(qualified_name="Collection::A") == "g-a"
+    assert len(calls) == lookups + 1
+
+
+def test_answers_are_not_shared_between_users():
+    calls, cache = [], GuidCache()
+    alice = _client({}, calls, cache, user_id="alice")
+    bob = _client({"Collection::A": "g-a"}, calls, cache, user_id="bob")
+    assert alice.__get_guid__(qualified_name="Collection::A", display_name="Collection::A") == NO_ELEMENTS_FOUND
+    assert bob.__get_guid__(qualified_name="Collection::A") == "g-a"
+    assert alice.__get_guid__(qualified_name="Collection::A", display_name="Collection::A") == NO_ELEMENTS_FOUND
+
+
+def test_lru_eviction_and_guid_cache_disabled():
+    cache = GuidCache(maxsize=2)
+    for i in range(3):
+        cache.store(KEY[:4] + (f"Collection::{i}",), f"g-{i}")
+    assert cache.lookup(KEY[:4] + ("Collection::0",)) is None
+    assert cache.lookup(KEY[:4] + ("Collection::2",)) == "g-2"
+
+    calls = []
+    client = _client({"Collection::A": "g-a"}, calls, cache=False)
+    assert client.guid_cache is None
+    client.__get_guid__(qualified_name="Collection::A")
+    client.__get_guid__(qualified_name="Collection::A")
+    assert len(calls) == 2
+
+
+def test_sqlite_backing_shared_between_caches(tmp_path):
+    path = str(tmp_path / "guids.db")
+    first = GuidCache(path=path)
+    first.store(KEY, "g-a")
+    first.store(KEY[:4] + ("Missing",), None)
+    first.close()
+
+    second = GuidCache(path=path)
+    assert second.lookup(KEY) == "g-a"
+    assert second.lookup(KEY[:4] + ("Missing",)) is None      # misses are not persisted
+    second.invalidate_guids_in("https://localhost:9443/servers/vs/api/open-metadata/x/g-a/delete")
+    assert GuidCache(path=path).lookup(KEY) is None
@@ -0,0 +1,76 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the pluggable JSON backend (pyegeria.core._json) used for request
+and response bodies.
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from pyegeria.core import _json
+from pyegeria.core._exceptions import PyegeriaNotFoundException
+from pyegeria.core._session_pool import SessionPool
+from pyegeria.core.config import settings
+from pyegeria.omvs.metadata_expert import MetadataExpert
+
+ENVELOPE = {"class": "OpenMetadataElementsResponse", "relatedHTTPCode": 200, "startFrom": 0,
+            "elements": [{"elementHeader": {"guid": "g1"}, "properties": {"displayName": "Ä"}}]}
+
+
+@pytest.fixture(params=["json", "orjson", "msgspec"])
+def backend(request, monkeypatch):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    monkeypatch.setattr(settings.Runtime, "json_backend", request.param, raising=False)
+    _json.reset()
+    yield request.param
+    _json.reset()
+
+
+def test_round_trip_is_compact(backend):
+    assert _json.backend() == backend
+    data = _json.dumps(ENVELOPE)
+    assert isinstance(data, bytes) and b", " not in data and b"\n" not in data
+    assert _json.loads(data) == ENVELOPE
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads(b'{"elements": [')
+
+
+def test_subtree_keeps_only_the_result_members(backend):
+    doc = _json.loads_subtree(_json.dumps(ENVELOPE))
+    assert doc == {"relatedHTTPCode": 200, "elements": ENVELOPE["elements"]}
+    assert doc.get("element", "absent") == "absent"
+    assert _json.loads_subtree(b"[1, 2]") == [1, 2]
+
+
+def test_response_is_decoded_once(backend):
+    response = httpx.Response(200, content=_json.dumps(ENVELOPE))
+    doc = _json.decode_response(response, _json.RESULT_KEYS)
+    assert response.json() is doc and "startFrom" not in doc
+
+
+def test_unknown_backend_falls_back_to_the_standard_library(monkeypatch):
+    monkeypatch.setattr(settings.Runtime, "json_backend", "simdjson", raising=False)
+    _json.reset()
+    try:
+        assert _json.backend() == "json"
+    finally:
+        _json.reset()
+
+
+def test_wrapped_error_is_raised_when_a_subtree_is_requested():
+    body = {"class": "VoidResponse", "relatedHTTPCode": 404, "exceptionErrorMessage": "not found"}
+    pool = SessionPool()
+    pool._new_session = lambda key: httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body)))
+    client = MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool)
+
+    async def run():
+        await client._async_make_request("POST", "https://localhost:9443/x", {"class": "FilterRequestBody"},
+                                         json_subtree=_json.RESULT_KEYS)
+
+    with pytest.raises(PyegeriaNotFoundException):
+        asyncio.run(run())
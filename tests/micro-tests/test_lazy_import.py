@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the deferred package imports (pyegeria._lazy).
+
+Each check runs in a fresh interpreter so modules already imported by other tests
+do not hide an eager import. The import time itself is measured by import_perf.py.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> dict:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_defers_clients():
+    result = _run("""
+import json, sys
+import pyegeria
+print(json.dumps({"loaded": [m for m in sys.modules if m.startswith(("pyegeria.omvs.", "pyegeria.view."))],
+                  "server_client": "pyegeria.core._server_client" in sys.modules}))
+""")
+    assert result == {"loaded": [], "server_client": False}
+
+
+def test_names_resolve_on_first_use():
+    result = _run("""
+import asyncio, json, sys
+import pyegeria
+from pyegeria import CollectionManager, PyegeriaException
+from pyegeria.omvs import TimeKeeper
+print(json.dumps({
+    "collection": CollectionManager.__module__,
+    "time_keeper": "pyegeria.omvs.time_keeper" in sys.modules,
+    "glossary": "pyegeria.omvs.glossary_manager" in sys.modules,
+    "exception": issubclass(PyegeriaException, Exception),
+    "all": all(hasattr(pyegeria, name) for name in pyegeria.__all__),
+    "dir": "EgeriaTech" in dir(pyegeria),
+    "submodule": pyegeria.view.__name__,
+    "nested": getattr(asyncio, "_nest_patched", False),
+}))
+""")
+    assert result == {"collection": "pyegeria.omvs.collection_manager", "time_keeper": True, "glossary": False,
+                      "exception": True, "all": True, "dir": True, "submodule": "pyegeria.view", "nested": False}
+
+
+def test_egeria_tech_imports_sub_clients_on_demand():
+    result = _run("""
+import json, sys
+from pyegeria import EgeriaTech
+tech = EgeriaTech("vs", "https://localhost:9443", "u", "p")
+before = "pyegeria.omvs.time_keeper" in sys.modules
+client = tech.time_keeper
+print(json.dumps({"before": before, "client": type(client).__name__,
+                  "collections": "pyegeria.omvs.collection_manager" in sys.modules}))
+""")
+    assert result == {"before": False, "client": "TimeKeeper", "collections": False}
+
+
+def test_unknown_names_still_raise():
+    import pyegeria
+    with pytest.raises(AttributeError):
+        pyegeria.NotAPyegeriaName
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the native asyncio run_report path used by the MCP server
+(pyegeria.core.mcp_adapter.async_run_report).
+
+No live server: the report executor is replaced by a coroutine that sleeps, so
+the tests observe concurrency, time limits and cancellation directly.
+"""
+import asyncio
+import subprocess
+import sys
+
+import pytest
+
+from pyegeria.core import mcp_adapter
+from pyegeria.core.config import settings
+
+
+@pytest.fixture
+def slow_reports(monkeypatch):
+    state = {"running": 0, "peak": 0, "cancelled": 0}
+
+    async def fake_run_report(report, egeria_client, output_format="DICT", params=None, **kwargs):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            await asyncio.sleep(params.get("delay", 0.02))
+            return {"kind": "json", "data": [report]}
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        finally:
+            state["running"] -= 1
+
+    monkeypatch.setattr(mcp_adapter, "_async_run_report", fake_run_report)
+    monkeypatch.setattr(settings.Runtime, "mcp_max_concurrent_reports", 3)
+    return state
+
+
+async def test_parallel_calls_run_concurrently_up_to_limit(slow_reports):
+    results = await asyncio.gather(*(
+        mcp_adapter.async_run_report(report=f"R{i}", params={}, egeria_client=object()) for i in range(7)))
+    assert [r["data"] for r in results] == [[f"R{i}"] for i in range(7)]
+    assert slow_reports["peak"] == 3
+
+
+async def test_timeout_cancels_report(slow_reports):
+    with pytest.raises(TimeoutError, match="did not complete"):
+        await mcp_adapter.async_run_report(report="Slow", params={"delay": 5}, egeria_client=object(), timeout=0.05)
+    assert slow_reports["cancelled"] == 1
+
+
+async def test_caller_cancellation_propagates(slow_reports):
+    task = asyncio.ensure_future(
+        mcp_adapter.async_run_report(report="Slow", params={"delay": 5}, egeria_client=object()))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert slow_reports["cancelled"] == 1 and slow_reports["running"] == 0
+
+
+def test_server_process_never_applies_nest_asyncio():
+    # A fresh interpreter, so a patch applied by another test cannot mask one applied here.
+    out = subprocess.run([sys.executable, "-c", """
+import asyncio
+import pyegeria.core.mcp_server
+import pyegeria.view.mermaid_utilities, pyegeria.view.output_formatter
+print(getattr(asyncio, "_nest_patched", False))
+"""], capture_output=True, text=True, check=True)
+    assert out.stdout.strip().splitlines()[-1] == "False"
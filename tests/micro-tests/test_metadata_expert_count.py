@@ -9,6 +9,8 @@ the endpoint URL, POST method, body slimming, asOfTime pass-through, and count p
 """
 from unittest.mock import MagicMock, patch
 
+import httpx
+
 from pyegeria.omvs.metadata_expert import MetadataExpert
 
 
@@ -78,3 +80,91 @@ def test_sync_wrappers_delegate_to_async():
     me._async_make_request = _mock_request(cap, {"count": 5})
     assert me.count_metadata_elements({"class": "FindRequestBody"}) == 5
     assert me.count_relationships_between_elements({"class": "FindRelationshipRequestBody"}) == 5
+
+
+async def test_count_batch_native_counts_every_body():
+    me = _client()
+    counts = iter([3, 4, 5])
+
+    async def fake(method, url, body=None, **kwargs):
+        assert url.endswith("/count")
+        resp = MagicMock()
+        resp.json = MagicMock(return_value={"count": next(counts)})
+        return resp
+
+    me._async_make_request = fake
+    bodies = [{"class": "FindRequestBody", "metadataElementTypeName": t} for t in ("Asset", "Person", "Team")]
+    results = await me._async_count_metadata_elements_batch(bodies)
+    assert [r["count"] for r in results] == [3, 4, 5]
+    assert all(r["exact"] and r["native"] for r in results)
+
+
+async def test_count_batch_pages_headers_only_without_native_count():
+    from pyegeria.core._exceptions import PyegeriaException
+
+    me = _client()
+    seen = []
+
+    async def fake(method, url, body=None, **kwargs):
+        if url.endswith("/count"):
+            raise PyegeriaException(httpx.Response(404, request=httpx.Request("POST", url)),
+                                    context={"reason": "no count endpoint"})
+        seen.append(body)
+        catalog = [{"elementHeader": {"guid": f"g{i}"}} for i in range(4)]
+        resp = MagicMock()
+        resp.json = MagicMock(return_value={"elements": catalog[body["startFrom"]:body["startFrom"] + body["pageSize"]]})
+        return resp
+
+    me._async_make_request = fake
+    body = {"class": "FindRequestBody", "metadataElementTypeName": "Asset", "graphQueryDepth": 3}
+    (exact,) = await me._async_count_metadata_elements_batch([body])
+    assert exact == {"count": 4, "exact": True, "native": False}
+    assert all(b["graphQueryDepth"] == 0 for b in seen)
+    assert me._native_count_supported is False
+
+    (capped,) = await me._async_count_metadata_elements_batch([body], max_count=2)
+    assert capped == {"count": 3, "exact": False, "native": False}
+    (at_cap,) = await me._async_count_metadata_elements_batch([body], max_count=4)
+    assert at_cap == {"count": 4, "exact": True, "native": False}
+
+
+async def test_count_batch_can_isolate_a_failing_body():
+    from pyegeria.core._exceptions import PyegeriaException
+
+    me = _client()
+    me._native_count_supported = True
+
+    async def fake(method, url, body=None, **kwargs):
+        if body["metadataElementTypeName"] == "Bogus":
+            raise PyegeriaException(context={"reason": "unknown type"})
+        resp = MagicMock()
+        resp.json = MagicMock(return_value={"count": 2})
+        return resp
+
+    me._async_make_request = fake
+    bodies = [{"class": "FindRequestBody", "metadataElementTypeName": t} for t in ("Asset", "Bogus", "Person")]
+    asset, bogus, person = await me._async_count_metadata_elements_batch(bodies, return_exceptions=True)
+    assert asset["count"] == person["count"] == 2
+    assert isinstance(bogus, PyegeriaException)
+
+
+async def test_count_batch_bad_body_does_not_disable_native_count():
+    from pyegeria.core._exceptions import PyegeriaException
+
+    me = _client()
+
+    async def fake(method, url, body=None, **kwargs):
+        assert url.endswith("/count")
+        if body["metadataElementTypeName"] == "Bogus":
+            raise PyegeriaException(context={"reason": "OMAG-COMMON-400-018 unknown type"},
+                                    additional_info={"relatedHTTPCode": 400})
+        resp = MagicMock()
+        resp.json = MagicMock(return_value={"count": 2})
+        return resp
+
+    me._async_make_request = fake
+    bodies = [{"class": "FindRequestBody", "metadataElementTypeName": t} for t in ("Bogus", "Asset", "Person")]
+    bogus, asset, person = await me._async_count_metadata_elements_batch(bodies, return_exceptions=True)
+    assert isinstance(bogus, PyegeriaException)
+    assert asset == person == {"count": 2, "exact": True, "native": True}
+    assert me._native_count_supported is True
@@ -43,7 +43,7 @@ def test_delete_related_elements_uses_delete_relationship_request_body():
     me.delete_related_elements("rel-guid", {"class": "DeleteRelationshipRequestBody", "deleteMethod": "SOFT_DELETE"})
 
     assert cap["url"].endswith("/related-elements/rel-guid/delete")
-    assert '"deleteMethod": "SOFT_DELETE"' in cap["body"]
+    assert '"deleteMethod":"SOFT_DELETE"' in cap["body"]
 
 
 def test_delete_related_elements_no_body_sends_no_request_body():
@@ -69,8 +69,8 @@ def test_delete_metadata_element_uses_delete_element_request_body():
     me.delete_metadata_element("element-guid", {"class": "DeleteElementRequestBody", "deleteMethod": "PURGE", "cascadeDelete": True})
 
     assert cap["url"].endswith("/metadata-elements/element-guid/delete")
-    assert '"deleteMethod": "PURGE"' in cap["body"]
-    assert '"cascadeDelete": true' in cap["body"]
+    assert '"deleteMethod":"PURGE"' in cap["body"]
+    assert '"cascadeDelete":true' in cap["body"]
 
 
 def test_delete_metadata_element_cascade_delete_param_flows_through_no_body():
@@ -81,7 +81,7 @@ def test_delete_metadata_element_cascade_delete_param_flows_through_no_body():
     me.delete_metadata_element("element-guid", cascade_delete=True)
 
     assert cap["url"].endswith("/metadata-elements/element-guid/delete")
-    assert '"cascadeDelete": true' in cap["body"]
+    assert '"cascadeDelete":true' in cap["body"]
 
 
 def test_delete_relationship_request_body_still_preserves_delete_method():
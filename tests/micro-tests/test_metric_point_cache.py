@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the historical metric point cache used by overview_metrics'
+growth_series and metric_trend (pyegeria.view._metric_point_cache).
+
+No live server: the client is a stand-in whose async native count records
+every asOfTime it is asked for.
+"""
+import pytest
+
+from pyegeria.core.config import settings
+from pyegeria.view import overview_metrics as om
+from pyegeria.view._metric_point_cache import MetricPointCache, metric_point_key, set_metric_point_cache
+
+
+pytestmark = pytest.mark.usefixtures("reset_seam_caches")
+
+
+@pytest.fixture
+def point_cache(monkeypatch):
+    monkeypatch.setattr(settings.Runtime, "metric_point_cache_enabled", True)
+    cache = MetricPointCache(path="")
+    set_metric_point_cache(cache)
+    yield cache
+    set_metric_point_cache(None)
+
+
+async def test_growth_grid_evaluated_concurrently_within_cap(counting_expert):
+    expert = counting_expert(delay=0.01)
+    series = await om.async_growth_series(expert, window="1y", points=4, concurrency=5)
+    assert len(series) == 4 and all(p["assets"] == 10 for p in series)
+    assert len(expert.calls) == 16 and expert.peak == 5
+
+
+async def test_refresh_only_recomputes_the_newest_point(point_cache, counting_expert):
+    expert = counting_expert()
+    first = await om.async_growth_series(expert, window="1y", points=12, type_map=[("assets", "Asset", None)])
+    assert len(expert.calls) == 12
+
+    expert.calls.clear()
+    again = await om.async_growth_series(expert, window="1y", points=12, type_map=[("assets", "Asset", None)])
+    assert expert.calls == [None] and again == first
+
+    expert.calls.clear()
+    await om.async_growth_series(expert, window="1y", points=12, type_map=[("assets", "Asset", None)],
+                                 use_cache=False)
+    assert len(expert.calls) == 12
+
+
+def test_metric_trend_reuses_historical_points(point_cache, counting_expert):
+    expert = counting_expert()
+    om.metric_trend(expert, None, "pyegeria.view.overview_metrics.people_counts", window="7d", points=3)
+    assert len(expert.calls) == 15
+    expert.calls.clear()
+    series = om.metric_trend(expert, None, "pyegeria.view.overview_metrics.people_counts", window="7d", points=3)
+    assert expert.calls == [None] * 5 and all(p["persons"] == 10 for p in series)
+
+
+def test_failed_points_are_not_cached():
+    cache = MetricPointCache(path="")
+    key = metric_point_key("scope", "count_elements", {"type_name": "Asset"}, "2026-01-01T00:00:00+00:00")
+    cache.store(key, None)
+    assert cache.lookup(key) is None and len(cache) == 0
+
+
+def test_points_persist_in_sqlite_between_caches(tmp_path):
+    path = str(tmp_path / "points.db")
+    key = metric_point_key("scope", "pyegeria.view.overview_metrics.people_counts", None, "2026-01-01T00:00:00+00:00")
+    first = MetricPointCache(path=path)
+    first.store(key, {"persons": 3})
+    first.close()
+
+    second = MetricPointCache(path=path)
+    assert second.lookup(key) == {"persons": 3}
+    assert second.invalidate(metric="pyegeria.view.overview_metrics.people_counts") == 1
+    assert MetricPointCache(path=path).lookup(key) is None
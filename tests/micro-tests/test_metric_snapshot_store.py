@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the local KPI snapshot store (pyegeria.view._metric_snapshot_store)
+and the overview_metrics collector / metric_trend reads that use it.
+
+No live server: the client is a stand-in whose async native count records
+every asOfTime it is asked for.
+"""
+import threading
+import time
+
+import pytest
+
+from pyegeria.view import overview_metrics as om
+from pyegeria.view._metric_snapshot_store import MetricSnapshotStore, set_metric_snapshot_store
+
+PEOPLE = "pyegeria.view.overview_metrics.people_counts"
+
+
+def sync_only_kpi(mgr, as_of=None):
+    return {"thread": threading.current_thread().name}
+
+
+pytestmark = pytest.mark.usefixtures("reset_seam_caches")
+
+
+@pytest.fixture
+def store():
+    snapshots = MetricSnapshotStore(":memory:")
+    set_metric_snapshot_store(snapshots)
+    yield snapshots
+    set_metric_snapshot_store(None)
+
+
+def test_value_at_returns_latest_recording_within_tolerance():
+    snapshots = MetricSnapshotStore(":memory:")
+    snapshots.record("s", "m", {"a": 1}, {"v": 1}, taken_at=100)
+    snapshots.record("s", "m", {"a": 1}, {"v": 2}, taken_at=200)
+    snapshots.record("s", "m", None, None, taken_at=300)      # failed runs are not recorded
+
+    assert snapshots.value_at("s", "m", {"a": 1}, at=250) == {"v": 2}
+    assert snapshots.value_at("s", "m", {"a": 1}, at=150) == {"v": 1}
+    assert snapshots.value_at("s", "m", {"a": 1}, at=50) is None
+    assert snapshots.value_at("s", "m", {"a": 1}, at=350, tolerance=100) is None
+    assert snapshots.value_at("s", "m", None, at=350) is None
+    assert snapshots.series("s", "m", {"a": 1}) == [(100.0, {"v": 1}), (200.0, {"v": 2})]
+    assert snapshots.prune(before=150) == 1 and len(snapshots) == 1
+
+
+def test_collector_records_each_metric(store, counting_expert):
+    expert = counting_expert(value=4)
+    results = om.collect_metric_snapshots(expert, None, metrics=["people_counts"])
+    assert results[PEOPLE]["persons"] == 4
+    assert store.metrics() == [PEOPLE]
+    assert store.value_at(om._cache_scope(expert), PEOPLE, None, at=time.time())["persons"] == 4
+
+
+def test_collector_requires_a_store(counting_expert):
+    with pytest.raises(ValueError):
+        om.collect_metric_snapshots(counting_expert(), None, metrics=["people_counts"], store=None)
+
+
+def test_metric_trend_reads_history_from_store(store, counting_expert):
+    expert = counting_expert(value=10)
+    _, grid = om._snapshot_grid("7d", 3)
+    scope = om._cache_scope(expert)
+    for d, as_of in grid[:-1]:
+        store.record(scope, PEOPLE, None, {"persons": 7}, taken_at=d.timestamp() - 60)
+
+    series = om.metric_trend(expert, None, PEOPLE, window="7d", points=3)
+    assert expert.calls == [None] * 5                          # only the "now" point hit Egeria
+    assert [p["persons"] for p in series] == [7, 7, 10]
+
+    expert.calls.clear()
+    om.metric_trend(expert, None, PEOPLE, window="7d", points=3, use_store=False, use_cache=False)
+    assert len(expert.calls) == 15
+
+
+async def test_collector_runs_sync_only_metrics_off_the_event_loop(store, counting_expert):
+    metric = f"{__name__}.sync_only_kpi"
+    results = await om.async_collect_metric_snapshots(counting_expert(), None, metrics=[metric])
+    assert results[metric]["thread"] != threading.current_thread().name
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the streaming output renderers in output_formatter.
+
+iter_output/aiter_output must produce exactly what generate_output returns, while reading the
+elements lazily from any (async) iterable.
+"""
+import io
+import json
+
+import pytest
+
+from pyegeria.view.output_formatter import (aiter_output, async_write_output, generate_output, iter_output,
+                                            populate_columns_from_properties, write_output)
+
+
+def _columns_struct():
+    return {
+        "heading": "Streaming Test",
+        "target_type": "Asset",
+        "formats": {
+            "attributes": [
+                {"name": "Display Name", "key": "display_name"},
+                {"name": "Qualified Name", "key": "qualified_name"},
+            ]
+        },
+    }
+
+
+def _elements(n=5):
+    return [
+        {"elementHeader": {"guid": f"guid-{i}"},
+         "properties": {"displayName": f"Asset {i}", "qualifiedName": f"Asset::{i}"}}
+        for i in range(n)
+    ]
+
+
+def _kwargs(output_format):
+    return dict(search_string="*", entity_type="Asset", output_format=output_format,
+                extract_properties_func=populate_columns_from_properties, columns_struct=_columns_struct())
+
+
+@pytest.mark.parametrize("output_format", ["REPORT", "MD", "LIST"])
+def test_iter_output_text_matches_generate_output(output_format):
+    expected = generate_output(elements=_elements(), **_kwargs(output_format))
+    assert "".join(iter_output(iter(_elements()), **_kwargs(output_format))) == expected
+
+
+def test_iter_output_dict_is_lazy():
+    consumed = []
+
+    def source():
+        for element in _elements():
+            consumed.append(element)
+            yield element
+
+    stream = iter_output(source(), **_kwargs("DICT"))
+    first = next(stream)
+    assert first["Display Name"] == "Asset 0" and len(consumed) == 1
+    assert [first, *stream] == generate_output(elements=_elements(), **_kwargs("DICT"))
+
+
+def test_write_output_dict_writes_json_array():
+    out = io.StringIO()
+    write_output(_elements(3), out, **_kwargs("DICT"))
+    assert json.loads(out.getvalue()) == generate_output(elements=_elements(3), **_kwargs("DICT"))
+
+
+async def _aelements(n=5):
+    for element in _elements(n):
+        yield element
+
+
+async def test_aiter_output_from_async_source():
+    chunks = [chunk async for chunk in aiter_output(_aelements(), **_kwargs("REPORT"))]
+    assert "".join(chunks) == generate_output(elements=_elements(), **_kwargs("REPORT"))
+
+
+async def test_aiter_output_stops_early_without_hanging():
+    stream = aiter_output(_aelements(200), queue_size=1, **_kwargs("DICT"))
+    first = await stream.__anext__()
+    await stream.aclose()
+    assert first["Qualified Name"] == "Asset::0"
+
+
+async def test_async_write_output_matches_sync_writer():
+    sync_out, async_out = io.StringIO(), io.StringIO()
+    write_output(_elements(), sync_out, **_kwargs("LIST"))
+    await async_write_output(_aelements(), async_out, **_kwargs("LIST"))
+    assert async_out.getvalue() == sync_out.getvalue()
@@ -116,6 +116,40 @@ def test_counts_by_type_composes_count_elements():
     ]
 
 
+def test_counts_use_the_clients_batched_count_when_available():
+    seen = []
+
+    async def batch(bodies, max_count=None, concurrency=8, return_exceptions=False):
+        seen.append((bodies, max_count))
+        return [{"count": 10 + i, "exact": i == 0, "native": False} for i in range(len(bodies))]
+
+    mgr = _mgr(_async_count_metadata_elements_batch=batch)
+    rows = om.count_elements_batch(mgr, [("DataStore", None), (None, ["ZoneMembership"])], as_of="2026-01-01")
+    assert rows == [{"count": 10, "exact": True}, {"count": 11, "exact": False}]
+    (bodies, max_count), = seen
+    assert max_count == om.FALLBACK_COUNT_CAP and all(b["asOfTime"] == "2026-01-01" for b in bodies)
+    assert om.people_counts(mgr)["persons"] == 10
+    mgr.find_metadata_elements.assert_not_called()
+
+
+def test_one_failing_body_does_not_zero_the_batch():
+    async def batch(bodies, max_count=None, concurrency=8, return_exceptions=False):
+        assert return_exceptions
+        return [ValueError("unknown type") if b["metadataElementTypeName"] == "Bogus"
+                else {"count": 7, "exact": True, "native": True} for b in bodies]
+
+    mgr = _mgr(_async_count_metadata_elements_batch=batch)
+    rows = om.count_elements_batch(mgr, [("Asset", None), ("Bogus", None), ("Person", None)])
+    assert rows == [{"count": 7, "exact": True}, {"count": 0, "exact": False}, {"count": 7, "exact": True}]
+
+
+def test_count_elements_batch_flags_capped_fallback_counts():
+    mgr = _mgr()
+    mgr.find_metadata_elements.side_effect = [[{"a": 1}] * om.DEFAULT_CAP, [{"a": 1}] * 2]
+    rows = om.count_elements_batch(mgr, [("Asset", None), ("Person", None)])
+    assert rows == [{"count": om.DEFAULT_CAP, "exact": False}, {"count": 2, "exact": True}]
+
+
 # ── sum_counts / sum_type_counts (BACKLOG.md NEXT-18) ────────────────────────
 
 def test_sum_counts_totals_a_counts_by_type_result():
@@ -707,3 +741,35 @@ def test_contextualised_coverage_zero_asset_total_yields_none_pct_not_zero_divis
     assert result["contextualisedCount"] == 0
     assert result["assetTotal"] is None
     assert result["contextualisedPct"] is None
+
+
+# ── async_* variants: concurrent fan-out ─────────────────────────────────
+
+async def test_async_counts_by_type_runs_counts_concurrently_in_order(counting_expert):
+    # CountingExpert's sync count raises, so the async method must be awaited directly.
+    mgr = counting_expert({"DataStore": 3, "DataSet": 5, "Process": 7}, delay=0.01)
+    rows = await om.async_counts_by_type(mgr, [("Stores", "DataStore"), ("Sets", "DataSet"), ("Procs", "Process")])
+    assert [r["count"] for r in rows] == [3, 5, 7]
+    assert mgr.peak == 3
+
+
+async def test_async_people_counts_respects_concurrency_cap(counting_expert):
+    mgr = counting_expert({"Person": 4, "Team": 2}, delay=0.01)
+    result = await om.async_people_counts(mgr, concurrency=2)
+    assert result == {"persons": 4, "teams": 2, "organizations": 0, "itProfiles": 0, "communities": 0}
+    assert mgr.peak == 2
+
+
+def test_sync_counts_by_type_delegates_to_async_variant(counting_expert):
+    mgr = counting_expert({"DataStore": 3, "DataSet": 5}, delay=0.01)
+    rows = om.counts_by_type(mgr, [("Stores", "DataStore"), ("Sets", "DataSet")])
+    assert [r["count"] for r in rows] == [3, 5]
+    assert mgr.peak == 2
+
+
+async def test_async_context_readiness_funnel_matches_sync_shape():
+    mgr = _mgr()
+    mgr.find_metadata_elements.return_value = [{}] * 5
+    ce = MagicMock()
+    ce.get_relationships.return_value = [{}] * 3
+    assert await om.async_context_readiness_funnel(mgr, ce) == om.context_readiness_funnel(mgr, ce)
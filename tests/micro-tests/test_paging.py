@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the generic pager behind ServerClient.aiter_find/iter_find
+(pyegeria.core._paging).
+
+No live server: `_async_make_request` is replaced by a fake catalog that
+serves pages by the startFrom/pageSize in the request body. Some pages are
+deliberately short, as Egeria's server-side filtering can make them, to
+check that only an empty page ends the iteration, including when several
+pages are fetched concurrently.
+"""
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyegeria.core._exceptions import PyegeriaInvalidParameterException
+from pyegeria.core._paging import aiter_pages, page_fetcher
+from pyegeria.omvs.collection_manager import CollectionManager
+from pyegeria.omvs.metadata_expert import MetadataExpert
+
+
+def _element(i: int) -> dict:
+    return {"elementHeader": {"guid": f"g-{i}"}, "properties": {"qualifiedName": f"Collection::{i}"}}
+
+
+def _catalog(total: int, requests: list, short_every: int = 0):
+    """Fake _async_make_request paging over `total` elements, dropping one element from every
+    `short_every`-th page to simulate a filtered (short but not last) page."""
+    async def fake(method, url, body=None, **kwargs):
+        b = json.loads(body) if isinstance(body, str) else body
+        start, size = b.get("startFrom", 0), b.get("pageSize", 0)
+        requests.append((start, size))
+        elements = [_element(i) for i in range(start, min(start + size, total))]
+        if short_every and elements and (start // size) % short_every == 0:
+            elements = elements[:-1]
+        resp = MagicMock()
+        resp.json = MagicMock(return_value={"elements": elements} if elements else {})
+        return resp
+    return fake
+
+
+def _collections(total: int, requests: list, short_every: int = 0) -> CollectionManager:
+    client = CollectionManager(view_server="vs", platform_url="https://localhost:9443", user_id="u", user_pwd="p")
+    client._async_make_request = _catalog(total, requests, short_every)
+    return client
+
+
+async def test_aiter_find_streams_all_pages_past_short_pages():
+    requests = []
+    client = _collections(25, requests, short_every=2)
+    guids = [el["elementHeader"]["guid"] async for el in client.aiter_find("find_collections", page_size=10)]
+    # Pages at 0 and 20 each lost one element to "filtering"; iteration still reached the end.
+    assert len(guids) == 23
+    assert "g-10" in guids and "g-23" in guids
+    assert requests == [(0, 10), (10, 10), (20, 10), (30, 10)]
+
+
+async def test_aiter_find_stops_early_at_max_elements():
+    requests = []
+    client = _collections(100, requests)
+    found = [el async for el in client.aiter_find("find_collections", page_size=10, max_elements=15,
+                                                  prefetch=False)]
+    assert len(found) == 15
+    assert requests == [(0, 10), (10, 10)]
+
+
+def test_iter_find_sync_and_page_size_capped():
+    requests = []
+    client = _collections(7, requests)
+    found = list(client.iter_find(client._async_find_collections, page_size=10 ** 6))
+    assert len(found) == 7
+    assert all(size <= 500 for _, size in requests)
+
+
+async def test_body_paging_channel_used_for_find_metadata_elements():
+    requests = []
+    client = MetadataExpert("vs", "https://localhost:9443", "u", "p")
+    client._async_make_request = _catalog(12, requests)
+    body = {"class": "FindRequestBody", "metadataElementTypeName": "Asset"}
+    found = [el async for el in client.aiter_find("find_metadata_elements", body, page_size=5)]
+    assert len(found) == 12
+    assert requests == [(0, 5), (5, 5), (10, 5), (15, 5)]
+    assert "startFrom" not in body            # caller's body is not mutated
+
+
+async def test_repeated_page_stops_iteration():
+    calls = []
+
+    async def fetch(start, size):
+        calls.append(start)
+        return [_element(0), _element(1)]        # server ignoring startFrom
+
+    pages = [page async for page in aiter_pages(fetch, page_size=2, prefetch=False)]
+    assert len(pages) == 1
+    assert calls == [0, 2]
+
+
+def test_method_without_paging_is_rejected():
+    async def get_one(guid: str):
+        return {}
+
+    with pytest.raises(TypeError):
+        page_fetcher(get_one, "guid")
+
+
+async def test_concurrent_pages_keeps_window_in_flight_and_preserves_order():
+    in_flight, peak, calls = 0, 0, []
+
+    async def fetch(start, size):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        calls.append(start)
+        await asyncio.sleep(0.01 if start % 20 else 0.03)   # earlier pages finish last
+        in_flight -= 1
+        return [_element(i) for i in range(start, min(start + size, 45))]
+
+    pages = [page async for page in aiter_pages(fetch, page_size=10, concurrency=3)]
+    guids = [el["elementHeader"]["guid"] for page in pages for el in page]
+    assert guids == [f"g-{i}" for i in range(45)]
+    assert peak == 3
+    assert max(calls) <= 70                      # at most concurrency-1 requests past the end
+
+
+async def test_find_collections_concurrent_pages_returns_full_result_set():
+    requests = []
+    client = _collections(95, requests, short_every=3)
+    found = await client._async_find_collections(page_size=10, concurrent_pages=4)
+    assert len(found) == 95 - 4                  # pages 0, 30, 60, 90 each filtered by one
+    assert found[0]["elementHeader"]["guid"] == "g-0"
+    assert sorted(start for start, _ in requests)[:10] == list(range(0, 100, 10))
+
+
+async def test_concurrent_pages_with_body_and_paging_keywords():
+    requests = []
+    client = _collections(35, requests)
+    body = {"class": "SearchStringRequestBody", "searchString": "*"}
+    found = await client._async_find_collections(body=body, start_from=0, page_size=10, concurrent_pages=3)
+    assert [el["elementHeader"]["guid"] for el in found] == [f"g-{i}" for i in range(35)]
+    assert all(size == 10 for _, size in requests)
+
+
+def test_find_metadata_elements_concurrent_pages_sync():
+    requests = []
+    client = MetadataExpert("vs", "https://localhost:9443", "u", "p")
+    client._async_make_request = _catalog(23, requests)
+    found = client.find_metadata_elements({"class": "FindRequestBody", "pageSize": 5}, concurrent_pages=3)
+    assert [el["elementHeader"]["guid"] for el in found] == [f"g-{i}" for i in range(23)]
+
+
+async def test_concurrent_pages_requires_json_output():
+    client = _collections(5, [])
+    with pytest.raises(PyegeriaInvalidParameterException):
+        await client._async_find_collections(output_format="TABLE", concurrent_pages=2)
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the opt-in report result cache used by format_set_executor
+(pyegeria.view._report_cache).
+
+No live server: the report spec lookup is patched to a fixed spec whose action
+resolves to a stand-in client that counts its queries.
+"""
+import time
+from typing import Any, cast
+
+import pytest
+
+from pyegeria.core.config import settings
+from pyegeria.view import format_set_executor as fse
+from pyegeria.view._report_cache import ReportResultCache, report_cache_key, set_report_cache
+
+
+class _FakeClient:
+    def __init__(self, user_id="u"):
+        self.view_server, self.platform_url = "vs", "https://example"
+        self.user_id, self.user_pwd, self.token = user_id, "p", "token"
+        self.queries = 0
+
+    def get_token(self):
+        return self.token
+
+    async def _async_find_things(self, search_string=None, output_format="JSON", report_spec=None, **kwargs):
+        self.queries += 1
+        return [{"guid": f"g-{self.queries}", "displayName": search_string}]
+
+
+def _spec(cache_ttl):
+    return {
+        "action": {"function": "Fake.find_things", "required_params": ["search_string"],
+                   "optional_params": [], "spec_params": {}, "cache_ttl": cache_ttl},
+        "target_type": "Referenceable",
+        "_report_spec_name": "Things",
+    }
+
+
+@pytest.fixture
+def report_cache(monkeypatch):
+    monkeypatch.setattr(settings.Runtime, "report_cache_enabled", True)
+    monkeypatch.setattr(settings.Runtime, "report_cache_default_ttl", 0.0)
+    monkeypatch.setattr(fse, "_resolve_client_and_method", lambda decl: (_FakeClient, "_async_find_things"))
+    cache = ReportResultCache()
+    set_report_cache(cache)
+    yield cache
+    set_report_cache(None)
+
+
+async def _run(client, params, **kwargs):
+    return await fse._async_run_report("Things", cast(Any, client), output_format="DICT", params=params, **kwargs)
+
+
+async def test_repeat_run_served_from_cache_and_bypass(report_cache, monkeypatch):
+    monkeypatch.setattr(fse, "select_report_spec", lambda name, out: _spec(60))
+    client = _FakeClient()
+    first = await _run(client, {"search_string": "Sales", "page_size": 10})
+    again = await _run(client, {"page_size": 10, "search_string": "Sales"})
+    assert again == first and client.queries == 1
+
+    fresh = await _run(client, {"search_string": "Sales", "page_size": 10}, use_cache=False)
+    assert client.queries == 2 and fresh["data"][0]["guid"] == "g-2"
+    assert (await _run(client, {"search_string": "Sales", "page_size": 10}))["data"][0]["guid"] == "g-2"
+
+    await _run(client, {"search_string": "Other"})
+    await _run(_FakeClient(user_id="someone-else"), {"search_string": "Sales", "page_size": 10})
+    assert client.queries == 3 and len(report_cache) == 3
+
+
+async def test_specs_without_ttl_or_with_cache_disabled_always_query(report_cache, monkeypatch):
+    monkeypatch.setattr(fse, "select_report_spec", lambda name, out: _spec(None))
+    client = _FakeClient()
+    await _run(client, {"search_string": "Sales"})
+    await _run(client, {"search_string": "Sales"})
+    assert client.queries == 2
+
+    monkeypatch.setattr(fse, "select_report_spec", lambda name, out: _spec(60))
+    monkeypatch.setattr(settings.Runtime, "report_cache_enabled", False)
+    await _run(client, {"search_string": "Sales"})
+    await _run(client, {"search_string": "Sales"})
+    assert client.queries == 4 and len(report_cache) == 0
+
+
+async def test_invalidate_drops_matching_entries(report_cache, monkeypatch):
+    monkeypatch.setattr(fse, "select_report_spec", lambda name, out: _spec(60))
+    client = _FakeClient()
+    await _run(client, {"search_string": "Sales"})
+    assert report_cache.invalidate(report="Other") == 0
+    assert report_cache.invalidate(report="Things") == 1
+    await _run(client, {"search_string": "Sales"})
+    assert client.queries == 2
+
+
+def test_entries_expire_and_lru_evicts():
+    cache = ReportResultCache(maxsize=2)
+    keys = [report_cache_key("Things", "DICT", {"search_string": str(i)}, "vs", "https://example", "u")
+            for i in range(3)]
+    cache.put(keys[0], {"kind": "empty"}, ttl=0.05)
+    time.sleep(0.06)
+    assert cache.get(keys[0]) is None
+
+    for key in keys:
+        cache.put(key, {"kind": "json", "data": key[-1]}, ttl=60)
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2])["data"] == keys[2][-1]
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the cached, indexed report-spec registry returned by
+base_report_formats.get_report_registry().
+
+The combined registry is built once and reused until a tier changes; name,
+alias, family and perspective lookups go through its precomputed indexes.
+"""
+import pytest
+
+from pyegeria.view import base_report_formats as brf
+from pyegeria.view._output_format_models import Column, Format, FormatSet, QuestionSpec
+
+
+def _spec(alias=None, family="TestFamily", perspective="Test Steward"):
+    return FormatSet(
+        heading="Cache Test", description="Registry cache test spec", family=family,
+        aliases=[alias] if alias else [],
+        formats=[Format(types=["ALL"], attributes=[Column(name="Display Name", key="display_name")])],
+        question_spec=[QuestionSpec(perspectives=[perspective], questions=["Which cache tests exist?"])],
+    )
+
+
+@pytest.fixture
+def runtime_spec():
+    brf.register_report_specs({"Registry-Cache-Test": _spec(alias="Cache Test Alias")})
+    yield "Registry-Cache-Test"
+    brf.unregister_report_spec("Registry-Cache-Test")
+
+
+def test_registry_snapshot_reused_until_a_tier_changes(runtime_spec):
+    first = brf.get_report_registry()
+    assert brf.get_report_registry() is first
+    version = brf.report_registry_version()
+
+    brf.register_report_specs({"Registry-Cache-Test-2": _spec()})
+    try:
+        second = brf.get_report_registry()
+        assert second is not first and "Registry-Cache-Test-2" in second
+        assert brf.report_registry_version() > version
+    finally:
+        brf.unregister_report_spec("Registry-Cache-Test-2")
+    assert "Registry-Cache-Test-2" not in brf.get_report_registry()
+
+
+def test_alias_and_space_lookups_use_index(runtime_spec):
+    registry = brf.get_report_registry()
+    assert registry.label_for("Cache Test Alias") == runtime_spec
+    assert registry.label_for("Registry Cache Test") == runtime_spec
+    assert registry.label_for("No Such Spec") is None
+    assert registry.labels_matching("  cache test alias ") == [runtime_spec]
+    assert brf.select_report_spec("Cache Test Alias", "ANY")["_report_spec_name"] == runtime_spec
+
+
+def test_family_and_perspective_indexes(runtime_spec):
+    registry = brf.get_report_registry()
+    assert list(registry.filter_by_family("testfamily")) == [runtime_spec]
+    found = brf.find_report_specs_by_perspective("test steward")
+    assert [r["report_spec"] for r in found] == [runtime_spec]
+    assert [r["report_spec"] for r in brf.find_report_specs(report_spec="CACHE TEST ALIAS")] == [runtime_spec]
+
+
+def test_duplicate_registration_still_rejected(runtime_spec):
+    with pytest.raises(brf.ReportFormatCollision):
+        brf.register_report_specs({runtime_spec: _spec()})
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the retry policy and per-platform circuit breaker applied by
+BaseServerClient._async_make_request (pyegeria.core._retry).
+
+No live server: the pool's sessions are built on an httpx.MockTransport that
+replays a scripted sequence of responses/exceptions, and backoff delays are
+zeroed so the tests don't sleep.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from pyegeria.core._exceptions import PyegeriaClientException, PyegeriaConnectionException, PyegeriaTimeoutException
+from pyegeria.core._retry import CircuitBreaker, RetryPolicy, send_with_retry
+from pyegeria.core._session_pool import SessionPool
+from pyegeria.omvs.metadata_expert import MetadataExpert
+
+URL = "https://localhost:9443/servers/vs/api/open-metadata/metadata-expert/x"
+OK = {"class": "VoidResponse", "relatedHTTPCode": 200}
+
+
+def _client(script: list, hits: list, **policy) -> MetadataExpert:
+    def handler(request: httpx.Request) -> httpx.Response:
+        hits.append(request.method)
+        step = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+    pool = SessionPool()
+    pool._new_session = lambda key: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return MetadataExpert("vs", "https://localhost:9443", "u", "p", session_pool=pool,
+                          retry_policy=RetryPolicy(backoff_base=0, **policy))
+
+
+def test_get_retries_503_then_succeeds():
+    hits = []
+    client = _client([httpx.Response(503), httpx.Response(200, json=OK)], hits)
+    response = asyncio.run(client._async_make_request("GET", URL))
+    assert response.status_code == 200
+    assert hits == ["GET", "GET"]
+
+
+def test_post_read_timeout_not_retried_unless_idempotent():
+    hits = []
+    client = _client([httpx.ReadTimeout("slow")], hits)
+    with pytest.raises(PyegeriaTimeoutException):
+        asyncio.run(client._async_make_request("POST", URL, {"class": "X"}))
+    assert len(hits) == 1
+
+    hits.clear()
+    client = _client([httpx.ReadTimeout("slow"), httpx.Response(200, json=OK)], hits)
+    asyncio.run(client._async_make_request("POST", URL, {"class": "X"}, idempotent=True))
+    assert len(hits) == 2
+
+
+def test_connect_error_retried_for_any_method():
+    hits = []
+    client = _client([httpx.ConnectError("refused"), httpx.Response(200, json=OK)], hits)
+    asyncio.run(client._async_make_request("POST", URL, {"class": "X"}))
+    assert len(hits) == 2
+
+
+def test_exhausted_retries_raise_last_error():
+    hits = []
+    client = _client([httpx.Response(502)], hits, max_attempts=3)
+    with pytest.raises(PyegeriaClientException):
+        asyncio.run(client._async_make_request("GET", URL))
+    assert len(hits) == 3
+
+
+def test_retry_after_header_is_honoured_and_capped():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    assert policy.backoff(0, "2") == 2
+    assert policy.backoff(0, "120") == 5
+    assert 0 <= policy.backoff(3) <= 5
+
+
+def test_circuit_opens_and_fails_fast():
+    hits = []
+    client = _client([httpx.Response(503)], hits, max_attempts=1)
+    breaker = client._session_pool.circuit_breaker(client._session_key)
+    breaker.failure_threshold = 2
+    for _ in range(2):
+        with pytest.raises(PyegeriaClientException):
+            asyncio.run(client._async_make_request("GET", URL))
+    with pytest.raises(PyegeriaConnectionException) as exc:
+        asyncio.run(client._async_make_request("GET", URL))
+    assert exc.value.additional_info["error_kind"] == "circuit_open"
+    assert len(hits) == 2
+
+
+def test_half_open_admits_one_trial_and_closes_on_success():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()          # only one trial in flight
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_trial_releases_the_half_open_slot():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def run():
+        task = asyncio.create_task(send_with_retry(hang, RetryPolicy(), breaker, idempotent=True,
+                                                   endpoint=URL, context={}))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow()
+
+
+def test_client_is_reusable_after_close_session():
+    hits = []
+    client = _client([httpx.Response(200, json=OK)], hits)
+    client.close_session()
+    assert asyncio.run(client._async_make_request("GET", URL)).status_code == 200
+    assert client._session_key is not None
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for pyegeria.core._session_pool.SessionPool - the shared httpx
+connection pool that every BaseServerClient / BasePlatformClient borrows its
+session from.
+
+No live server: check_connection is patched out during client construction
+(same as the other micro-tests) and nothing here sends a request - the tests
+only look at which httpx.AsyncClient each client resolves to.
+"""
+import asyncio
+from unittest.mock import patch
+
+from pyegeria.core._session_pool import SessionPool
+from pyegeria.egeria_tech_client import EgeriaTech
+from pyegeria.omvs.collection_manager import CollectionManager
+from pyegeria.omvs.glossary_manager import GlossaryManager
+
+
+def _client(cls, pool, platform_url="https://localhost:9443"):
+    with patch("pyegeria.core._base_server_client.BaseServerClient.check_connection", return_value=""):
+        client = cls(view_server="vs", platform_url=platform_url, user_id="u", user_pwd="p")
+    client.use_session_pool(pool)
+    return client
+
+
+def test_clients_for_same_platform_share_one_session():
+    pool = SessionPool()
+    a = _client(CollectionManager, pool)
+    b = _client(GlossaryManager, pool)
+
+    async def sessions():
+        return a.session, b.session
+
+    sa, sb = asyncio.run(sessions())
+    assert sa is sb
+    assert pool.stats()["https://localhost:9443"] == {"clients": 2, "sessions": 1}
+
+
+def test_different_origins_get_different_sessions():
+    pool = SessionPool()
+    a = _client(CollectionManager, pool, "https://localhost:9443")
+    b = _client(CollectionManager, pool, "https://other-host:9443")
+
+    async def sessions():
+        return a.session, b.session
+
+    sa, sb = asyncio.run(sessions())
+    assert sa is not sb
+
+
+def test_origin_ignores_path_and_case():
+    pool = SessionPool()
+    k1 = pool.acquire("https://LocalHost:9443/servers/x")
+    k2 = pool.acquire("https://localhost:9443")
+    assert k1 == k2
+
+
+def test_last_release_closes_session():
+    pool = SessionPool()
+    a = _client(CollectionManager, pool)
+    b = _client(GlossaryManager, pool)
+
+    async def run():
+        session = a.session
+        await a._async_close_session()
+        assert not session.is_closed          # b still holds it
+        await b._async_close_session()
+        assert session.is_closed              # last one out closes it
+        return session
+
+    asyncio.run(run())
+    assert pool.stats() == {}
+
+
+def test_session_reopens_after_close():
+    pool = SessionPool()
+    a = _client(CollectionManager, pool)
+
+    async def run():
+        first = a.session
+        await a._async_close_session()
+        second = a.session
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is not second
+    assert not second.is_closed
+
+
+def test_egeria_tech_subclients_share_supplied_pool():
+    pool = SessionPool()
+    tech = EgeriaTech("vs", "https://localhost:9443", "u", "p", session_pool=pool)
+    with patch("pyegeria.core._base_server_client.BaseServerClient.check_connection", return_value=""):
+        collections = tech.collections
+        glossary = tech.glossary
+
+    async def sessions():
+        return collections.session, glossary.session
+
+    sc, sg = asyncio.run(sessions())
+    assert sc is sg
+    assert collections._session_pool is pool
+    tech.close_session()
+    assert pool.stats() == {}
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for ServerClient's class-level request-body TypeAdapters.
+
+The adapters are built once per process on first use and shared by every client
+instance and subclass, rather than compiled again in each client's __init__.
+"""
+from unittest.mock import patch
+
+from pydantic import TypeAdapter
+
+from pyegeria.core._server_client import ServerClient
+from pyegeria.omvs.collection_manager import CollectionManager
+from pyegeria.omvs.time_keeper import TimeKeeper
+
+
+def _client(cls):
+    with patch("pyegeria.core._base_server_client.BaseServerClient.check_connection", return_value=""):
+        return cls(view_server="vs", platform_url="https://localhost:9443", user_id="u", user_pwd="p")
+
+
+def test_construction_builds_no_adapters():
+    with patch("pyegeria.core._server_client.TypeAdapter") as build:
+        _client(TimeKeeper)
+    build.assert_not_called()
+    assert "_archive_request_adapter" not in vars(_client(TimeKeeper))
+
+
+def test_adapters_are_shared_across_instances_and_subclasses():
+    a, b = _client(TimeKeeper), _client(CollectionManager)
+    adapter = a._search_string_request_adapter
+    assert isinstance(adapter, TypeAdapter) and adapter is b._search_string_request_adapter
+    assert vars(ServerClient)["_search_string_request_adapter"] is adapter     # the descriptor is replaced
+
+
+def test_shared_adapter_still_validates():
+    body = _client(TimeKeeper)._filter_request_adapter.validate_python(
+        {"class": "FilterRequestBody", "filter": "Egeria"})
+    assert body.filter_string == "Egeria"
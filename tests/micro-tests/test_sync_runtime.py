@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for the background event loop (pyegeria.core._sync_runtime) that runs the
+coroutines behind the synchronous client methods.
+"""
+import asyncio
+import contextvars
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pyegeria.core._sync_runtime import SyncRuntime
+from pyegeria.omvs.time_keeper import TimeKeeper
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def runtime():
+    rt = SyncRuntime(name="pyegeria-sync-test")
+    yield rt
+    rt.close()
+
+
+async def _where(value=None):
+    await asyncio.sleep(0)
+    return threading.current_thread().name, asyncio.get_running_loop(), request_id.get()
+
+
+def test_calls_reuse_one_loop_and_thread(runtime):
+    first, second = runtime.run(_where()), runtime.run(_where())
+    assert first[0] == "pyegeria-sync-test" and first[1] is second[1]
+    assert runtime.is_running()
+
+
+def test_runs_from_inside_a_running_loop(runtime):
+    async def caller():
+        return runtime.run(_where()), asyncio.get_running_loop()
+
+    (thread_name, loop, _), outer_loop = asyncio.run(caller())
+    assert thread_name == "pyegeria-sync-test" and loop is not outer_loop
+
+
+def test_context_variables_travel_with_the_call(runtime):
+    token = request_id.set("r-42")
+    try:
+        assert runtime.run(_where())[2] == "r-42"
+    finally:
+        request_id.reset(token)
+
+
+def test_sync_call_from_the_runtime_loop_fails_instead_of_blocking_it(runtime):
+    async def outer():
+        return runtime.run(_where())
+
+    with pytest.raises(RuntimeError, match="asyncio.to_thread"):
+        runtime.run(outer())
+    assert runtime.run(_where())[0] == "pyegeria-sync-test"
+
+
+def test_exceptions_propagate(runtime):
+    async def boom():
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError, match="bad request"):
+        runtime.run(boom())
+    assert runtime.run(_where())[0] == "pyegeria-sync-test"
+
+
+def test_close_and_restart(runtime):
+    loop = runtime.run(_where())[1]
+    runtime.close()
+    assert not runtime.is_running() and loop.is_closed()
+    assert runtime.run(_where())[1] is not loop
+
+
+def test_client_sync_methods_use_the_runtime(runtime):
+    with patch("pyegeria.core._base_server_client.BaseServerClient.check_connection", return_value=""):
+        client = TimeKeeper(view_server="vs", platform_url="https://localhost:9443", user_id="u", user_pwd="p")
+    client.use_sync_runtime(runtime)
+
+    async def fake_request(*args, **kwargs):
+        return threading.current_thread().name
+
+    with patch.object(client, "_async_make_request", side_effect=fake_request):
+        assert client.make_request("GET", "https://localhost:9443/x") == "pyegeria-sync-test"
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright Contributors to the ODPi Egeria project.
+"""
+Unit tests for chunked tabular data set reading (pyegeria.core._tabular and the
+DataEngineer methods built on it).
+
+No live server: `_async_make_request` is replaced by a fake data set that serves
+report windows by the startFromRow/maxRowCount in the URL.
+"""
+import io
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pyegeria.core._tabular import build_frame
+from pyegeria.omvs.data_engineer import DataEngineer
+
+
+def _data_set(total: int, requests: list):
+    async def fake(method, url, body=None, **kwargs):
+        query = parse_qs(urlparse(url).query)
+        start, size = int(query["startFromRow"][0]), int(query["maxRowCount"][0])
+        requests.append((start, size))
+        rows = range(start, min(start + size, total))
+        resp = MagicMock()
+        resp.json = MagicMock(return_value={"tabularDataSetReport": {
+            "tableName": "people",
+            "columnDescriptions": [{"columnName": "id"}, {"columnName": "name"}],
+            "dataRecords": {str(i - start): [i, f"n{i}"] for i in rows},
+        }})
+        return resp
+    return fake
+
+
+def _engineer(total: int, requests: list) -> DataEngineer:
+    with patch("pyegeria.core._base_server_client.BaseServerClient.check_connection", return_value=""):
+        client = DataEngineer(view_server="vs", platform_url="https://localhost:9443", user_id="u", user_pwd="p")
+    client._async_make_request = _data_set(total, requests)
+    return client
+
+
+async def test_chunks_walk_the_whole_data_set():
+    requests = []
+    client = _engineer(25, requests)
+    chunks = [c async for c in client.aiter_tabular_data_set_chunks("g", chunk_rows=10)]
+    assert [c.start_row for c in chunks] == [0, 10, 20]
+    assert chunks[0].columns == ("id", "name") and chunks[2].rows[-1] == (24, "n24")
+    assert requests == [(0, 10), (10, 10), (20, 10)]     # the short window is the last one
+
+
+def test_sync_rows_respect_max_rows():
+    requests = []
+    client = _engineer(25, requests)
+    rows = list(client.iter_tabular_data_set_rows("g", chunk_rows=10, start_from_row=5, max_rows=12))
+    assert rows[0] == (5, "n5") and rows[-1] == (16, "n16") and len(rows) == 12
+    assert requests == [(5, 10), (15, 2)]
+
+
+def test_sync_rows_cross_into_the_runtime_once_per_window():
+    client = _engineer(25, [])
+    run_sync = client._run_sync
+    calls = []
+    client._run_sync = lambda coro: calls.append(coro) or run_sync(coro)
+    assert len(list(client.iter_tabular_data_set_rows("g", chunk_rows=10))) == 25
+    assert len(calls) == 5      # three windows, the end of the data set, and aclose()
+
+
+def test_csv_is_written_incrementally():
+    client = _engineer(3, [])
+    out = io.StringIO()
+    assert client.write_tabular_data_set_csv("g", out, chunk_rows=2) == 3
+    assert out.getvalue().splitlines() == ["id,name", "0,n0", "1,n1", "2,n2"]
+
+
+def test_frames_are_built_column_by_column():
+    pd = pytest.importorskip("pandas")
+    client = _engineer(7, [])
+    frame = client.get_tabular_data_set_frame("g", chunk_rows=3)
+    assert isinstance(frame, pd.DataFrame) and list(frame.columns) == ["id", "name"]
+    assert frame["id"].tolist() == list(range(7))
+    arrays = client.get_tabular_data_set_frame("g", kind="numpy", chunk_rows=3)
+    assert arrays["name"].tolist()[-1] == "n6"
+
+
+async def test_unknown_frame_kind_is_rejected():
+    async def no_chunks():
+        return
+        yield
+
+    with pytest.raises(ValueError):
+        await build_frame(no_chunks(), kind="excel")